@@ -27,10 +27,14 @@ Usage:
 """
 
 import argparse
-import os
 import sys
 from pathlib import Path
 
+try:
+    from dw_davinci import project_index
+except ImportError:
+    import project_index  # run as a script from dw_davinci/
+
 DEFAULT_ROOTS = [
     r"D:\dw_workspace\davinci",
     r"D:\dw_workspace\davinci_workspace",
@@ -52,7 +56,7 @@ def find_libraries(root: Path):
         print(f"  [!] Root does not exist, skipping: {root}", file=sys.stderr)
         return
 
-    for dirpath, dirnames, _filenames in os.walk(root):
+    for dirpath, dirnames, _filenames in project_index.walk(root):
         for d in dirnames:
             if d.lower() == RESOLVE_PROJECTS_DIRNAME:
                 lib_root = Path(dirpath)
@@ -67,7 +71,7 @@ def find_orphan_project_dbs(root: Path, known_lib_roots):
 
     known_prefixes = [str(r).lower() for r in known_lib_roots]
 
-    for dirpath, _dirnames, filenames in os.walk(root):
+    for dirpath, _dirnames, filenames in project_index.walk(root):
         for fname in filenames:
             if fname.lower() == PROJECT_DB_FILENAME:
                 full = Path(dirpath) / fname
@@ -78,12 +82,21 @@ def find_orphan_project_dbs(root: Path, known_lib_roots):
 def list_projects_under(resolve_projects_dir: Path):
     """Walk a 'Resolve Projects' folder and return list of (project_name, project_db_path)."""
     projects = []
-    for dirpath, _dirnames, filenames in os.walk(resolve_projects_dir):
+    for dirpath, _dirnames, filenames in project_index.walk(resolve_projects_dir):
         for fname in filenames:
             if fname.lower() == PROJECT_DB_FILENAME:
                 project_folder = Path(dirpath)
                 projects.append((project_folder.name, project_folder / fname))
     return projects
+
+
+def find_empty_folders(resolve_projects_dir: Path):
+    """Top-most folders under a 'Resolve Projects' folder with no file anywhere
+    inside (left behind by deleted or failed projects), from the index's
+    empty-folder flags."""
+    return [Path(p) for p in project_index.empty_folders(resolve_projects_dir)]
+
+
 def str2bool(v):
     if isinstance(v, bool):
         return v
@@ -100,6 +113,8 @@ def main(execute=False):
                          help="Root folders to scan (default: the two dw_workspace paths).")
     parser.add_argument("--out", default=None,
                          help="Report output file. Default: <script_dir>/report/davinci_libraries_report.txt")
+    parser.add_argument("--rescan", action="store_true",
+                         help="Re-list every folder instead of reusing the project index.")
     parser.add_argument("--execute", type=str2bool, default=execute)
     args = parser.parse_args()
 
@@ -112,8 +127,15 @@ def main(execute=False):
         out_path = Path(args.out)
         out_path.parent.mkdir(parents=True, exist_ok=True)
 
+    # One crawl per root: every pass below is answered from the index
+    for root_str in args.roots:
+        if Path(root_str).exists():
+            project_index.refresh(Path(root_str).resolve(), full=args.rescan)
+    project_index.save()
+
     report_lines = []
     all_lib_roots = []
+    all_empty = []
 
     for root_str in args.roots:
         root = Path(root_str)
@@ -131,6 +153,12 @@ def main(execute=False):
             report_lines.append(f"  Projects found ({len(projects)}):")
             for name, dbpath in sorted(projects):
                 report_lines.append(f"    - {name}   ({dbpath})")
+            empty = find_empty_folders(resolve_projects_dir)
+            all_empty.extend(empty)
+            if empty:
+                report_lines.append(f"  Empty folders, no file inside ({len(empty)}):")
+                for folder in sorted(empty):
+                    report_lines.append(f"    - {folder}")
             report_lines.append("")
 
         if not found_any:
@@ -149,6 +177,13 @@ def main(execute=False):
             report_lines.append(f"  - {p}")
         report_lines.append("")
 
+    report_lines.append("=== EMPTY FOLDERS (no file anywhere inside -- safe candidates to delete) ===")
+    for folder in sorted(all_empty):
+        report_lines.append(f"  - {folder}")
+    if not all_empty:
+        report_lines.append("  (none found)")
+    report_lines.append("")
+
     report_text = "\n".join(report_lines)
     with open(out_path, "w", encoding="utf-8") as f:
         f.write(report_text)
@@ -27,10 +27,14 @@ Usage:
 """
 
 import argparse
-import os
 import sys
 from pathlib import Path
 
+try:
+    from dw_davinci import project_index
+except ImportError:
+    import project_index  # run as a script from dw_davinci/
+
 DEFAULT_ROOTS = [
     r"D:\dw_workspace\davinci",
     r"D:\dw_workspace\davinci_workspace",
@@ -52,7 +56,7 @@ def find_libraries(root: Path):
         print(f"  [!] Root does not exist, skipping: {root}", file=sys.stderr)
         return
 
-    for dirpath, dirnames, _filenames in os.walk(root):
+    for dirpath, dirnames, _filenames in project_index.walk(root):
         for d in dirnames:
             if d.lower() == RESOLVE_PROJECTS_DIRNAME:
                 lib_root = Path(dirpath)
@@ -67,7 +71,7 @@ def find_orphan_project_dbs(root: Path, known_lib_roots):
 
     known_prefixes = [str(r).lower() for r in known_lib_roots]
 
-    for dirpath, _dirnames, filenames in os.walk(root):
+    for dirpath, _dirnames, filenames in project_index.walk(root):
         for fname in filenames:
             if fname.lower() == PROJECT_DB_FILENAME:
                 full = Path(dirpath) / fname
@@ -78,7 +82,7 @@ def find_orphan_project_dbs(root: Path, known_lib_roots):
 def list_projects_under(resolve_projects_dir: Path):
     """Walk a 'Resolve Projects' folder and return list of (project_name, project_db_path)."""
     projects = []
-    for dirpath, _dirnames, filenames in os.walk(resolve_projects_dir):
+    for dirpath, _dirnames, filenames in project_index.walk(resolve_projects_dir):
         for fname in filenames:
             if fname.lower() == PROJECT_DB_FILENAME:
                 project_folder = Path(dirpath)
@@ -97,19 +101,14 @@ def find_wrapper_folders(root: Path):
     root = root.resolve()
     if not root.exists():
         return
-    for dirpath, dirnames, _filenames in os.walk(root):
+    for dirpath, dirnames, _filenames in project_index.walk(root):
         for d in dirnames:
             if d.lower().startswith(WRAPPER_NAME_PREFIX):
                 yield Path(dirpath) / d
 
 
 def count_projects_anywhere_under(folder: Path) -> int:
-    count = 0
-    for _dirpath, _dirnames, filenames in os.walk(folder):
-        for fname in filenames:
-            if fname.lower() == PROJECT_DB_FILENAME:
-                count += 1
-    return count
+    return project_index.count_files(folder, PROJECT_DB_FILENAME)
 
 
 HOWTO_TEXT = """\
@@ -141,6 +140,8 @@ def main():
                          help="Root folders to scan (default: the two dw_workspace paths).")
     parser.add_argument("--out", default=None,
                          help="Report output file. Default: <script_dir>/report/davinci_libraries_report.txt")
+    parser.add_argument("--rescan", action="store_true",
+                         help="Re-list every folder instead of reusing the project index.")
     args = parser.parse_args()
 
     if args.out is None:
@@ -152,6 +153,12 @@ def main():
         out_path = Path(args.out)
         out_path.parent.mkdir(parents=True, exist_ok=True)
 
+    # One crawl per root: every pass below is answered from the index
+    for root_str in args.roots:
+        if Path(root_str).exists():
+            project_index.refresh(Path(root_str).resolve(), full=args.rescan)
+    project_index.save()
+
     report_lines = [HOWTO_TEXT]
     all_lib_roots = []
 
@@ -0,0 +1,249 @@
+"""
+project_index.py
+
+Persistent index of the folders under the Resolve workspace roots, shared by
+project_finder.py and cleanup_empty_project_folder.py.
+
+Both scripts used to os.walk every root several times (libraries, orphan
+Project.db files, wrapper folders, then once more per wrapper to count its
+projects). On a large shared library that is the whole runtime. Here the
+tree is crawled once with os.scandir and each folder's listing (sub folders,
+file sizes and mtimes) is stored with the folder's own mtime. The next run
+only re-lists folders whose mtime changed -- a folder's mtime moves whenever
+an entry is added, removed or renamed in it -- and every other query is
+answered from memory.
+
+Sizes and mtimes of files are as of the last listing of their folder (a file
+rewritten in place does not touch its folder's mtime).
+
+Usage:
+    import project_index
+
+    for dirpath, dirnames, filenames in project_index.walk(root):   # like os.walk
+        ...
+    project_index.count_files(folder, "project.db")
+    project_index.is_empty(folder)
+    for folder in project_index.empty_folders(root):               # no file inside
+        ...
+    project_index.save()
+"""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+DEFAULT_INDEX_PATH = SCRIPT_DIR / "report" / "project_index.json"
+
+INDEX_VERSION = 1
+
+# A folder modified this close to its listing may change again within the
+# same timestamp tick (coarse network filesystems): never trust that listing.
+RACY_WINDOW = 2.0
+
+
+class ProjectIndex:
+    """Folder listings keyed by absolute path, refreshed incrementally.
+
+    Each record is {"mtime": ns, "listed": epoch seconds,
+    "dirs": [names], "files": {name: [size, mtime_ns]}}.
+    Symlinked folders are skipped.
+    """
+
+    def __init__(self, index_path=DEFAULT_INDEX_PATH):
+        self.index_path = Path(index_path)
+        self.dirs = {}
+        self.refreshed = set()   # roots already refreshed in this process
+        self.listed = 0          # folders (re)listed by the last refreshes
+        self.reused = 0          # folders reused from the index
+        self._empty = {}         # folder -> no file anywhere under it
+        self._dirty = False
+
+    # ------------------------------------------------------------------
+    # Persistence
+
+    def load(self):
+        """Read the index file; a missing or unreadable file starts empty."""
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == INDEX_VERSION:
+            self.dirs = data.get("dirs", {})
+
+    def save(self):
+        """Write the index back (atomically) if a refresh changed it."""
+        if not self._dirty:
+            return
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": INDEX_VERSION, "dirs": self.dirs}, f)
+        os.replace(tmp_path, self.index_path)
+        self._dirty = False
+
+    # ------------------------------------------------------------------
+    # Crawl
+
+    @staticmethod
+    def _list(path, mtime_ns):
+        dirs, files = [], {}
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        dirs.append(entry.name)
+                    elif entry.is_file():
+                        st = entry.stat()
+                        files[entry.name] = [st.st_size, st.st_mtime_ns]
+                except OSError:
+                    continue   # vanished mid-listing
+        return {"mtime": mtime_ns, "listed": time.time(), "dirs": dirs, "files": files}
+
+    def refresh(self, root, full=False):
+        """Bring the subtree under root up to date.
+
+        Args:
+            root: Folder to crawl.
+            full: Re-list every folder, ignoring the stored listings.
+        """
+        root = os.path.abspath(str(root))
+        prefix = os.path.join(root, "")
+        self._empty.clear()   # flags of the parents depend on this subtree
+        old = {path: record for path, record in self.dirs.items()
+               if path == root or path.startswith(prefix)}
+        for path in old:
+            del self.dirs[path]
+
+        stack = [root]
+        while stack:
+            path = stack.pop()
+            try:
+                mtime_ns = os.stat(path).st_mtime_ns
+            except OSError:
+                continue   # gone since its parent was listed
+            record = None if full else old.get(path)
+            if (record is None or record["mtime"] != mtime_ns
+                    or record["listed"] - mtime_ns / 1e9 < RACY_WINDOW):
+                try:
+                    record = self._list(path, mtime_ns)
+                except OSError as e:
+                    print(f"  [!] Cannot list {path}: {e}", file=sys.stderr)
+                    continue
+                self.listed += 1
+                self._dirty = True
+            else:
+                self.reused += 1
+            self.dirs[path] = record
+            stack.extend(os.path.join(path, name) for name in reversed(record["dirs"]))
+
+        if set(old) - set(self.dirs):
+            self._dirty = True   # folders removed since the last crawl
+        self.refreshed.add(root)
+
+    def _ensure(self, path):
+        """Refresh path's root once per process, unless a parent already was."""
+        path = os.path.abspath(str(path))
+        for root in self.refreshed:
+            if path == root or path.startswith(os.path.join(root, "")):
+                return path
+        self.refresh(path)
+        return path
+
+    # ------------------------------------------------------------------
+    # Queries
+
+    def walk(self, top):
+        """os.walk(top) (top-down) answered from the index."""
+        stack = [self._ensure(top)]
+        while stack:
+            path = stack.pop()
+            record = self.dirs.get(path)
+            if record is None:
+                continue
+            dirnames = list(record["dirs"])
+            yield path, dirnames, list(record["files"])
+            # Callers may prune dirnames in place, like with os.walk
+            stack.extend(os.path.join(path, name) for name in reversed(dirnames))
+
+    def count_files(self, top, name):
+        """How many files called name (case-insensitive) sit under top."""
+        name = name.lower()
+        return sum(
+            1
+            for _dirpath, _dirnames, filenames in self.walk(top)
+            for filename in filenames
+            if filename.lower() == name
+        )
+
+    def _is_empty(self, path):
+        """Empty flag of an indexed folder, computed bottom-up once per refresh.
+
+        A folder that could not be listed counts as not empty.
+        """
+        stack = [(path, False)]
+        while stack:
+            current, children_done = stack.pop()
+            if current in self._empty:
+                continue
+            record = self.dirs.get(current)
+            if record is None or record["files"]:
+                self._empty[current] = False
+                continue
+            children = [os.path.join(current, name) for name in record["dirs"]]
+            if children_done:
+                self._empty[current] = all(self._empty[child] for child in children)
+            else:
+                stack.append((current, True))
+                stack.extend((child, False) for child in children)
+        return self._empty[path]
+
+    def is_empty(self, top):
+        """True when no file exists anywhere under top (empty sub folders allowed)."""
+        return self._is_empty(self._ensure(top))
+
+    def empty_folders(self, top):
+        """Top-most folders under top (top included) with no file anywhere inside."""
+        for dirpath, dirnames, _filenames in self.walk(top):
+            if self._is_empty(dirpath):
+                dirnames.clear()   # its sub folders are empty too
+                yield dirpath
+
+
+_INDEX = None
+
+
+def get_index():
+    """The process-wide index, loaded from DEFAULT_INDEX_PATH on first use."""
+    global _INDEX
+    if _INDEX is None:
+        _INDEX = ProjectIndex()
+        _INDEX.load()
+    return _INDEX
+
+
+def walk(top):
+    return get_index().walk(top)
+
+
+def count_files(top, name):
+    return get_index().count_files(top, name)
+
+
+def is_empty(top):
+    return get_index().is_empty(top)
+
+
+def empty_folders(top):
+    return get_index().empty_folders(top)
+
+
+def refresh(root, full=False):
+    get_index().refresh(root, full=full)
+
+
+def save():
+    get_index().save()
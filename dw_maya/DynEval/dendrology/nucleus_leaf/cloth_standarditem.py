@@ -8,6 +8,7 @@ except ImportError:
 from maya import cmds
 from .base_standarditem import BaseSimulationItem
 from dw_maya.DynEval import sim_cmds
+from dw_maya.DynEval.sim_cmds import cache_catalog
 from dw_logger import get_logger
 
 from dw_maya.dw_maya_utils import lsTr
@@ -107,20 +108,11 @@ class ClothTreeItem(BaseSimulationItem):
 
     def get_cache_list(self):
         """List all available cache files."""
-        path = Path(self.cache_dir())
-        return sorted([file.stem for file in path.glob('*.xml')]) if path.exists() else []
+        return cache_catalog.cache_names(self.cache_dir())
 
     def get_iter(self):
         """Determine current cache iteration/version."""
-        path = Path(self.cache_dir())
-        if not path.exists():
-            return 0
-        versions = []
-        for file in path.glob('*.xml'):
-            tail = file.stem.rsplit('_v', 1)[-1]
-            if tail.isdigit():
-                versions.append(int(tail))
-        return max(versions, default=0)
+        return cache_catalog.latest_version(self.cache_dir())
 
     def get_maps(self):
         """Retrieve available vertex maps for the node."""
@@ -63,7 +63,7 @@ except Exception:
 
 import dw_maya.DynEval.sim_registry  # noqa: F401
 from dw_maya.DynEval.sim_registry import (
-    discover_all, build_solver_item, get_system, all_sim_node_types,
+    build_solver_item, diff_solvers, get_system, all_sim_node_types, stop_watching,
 )
 from dw_maya.DynEval.sim_widget import SimulationTreeView
 from dw_maya.DynEval.sim_widget.wgt_base import DynEvalMainWindow, DynEvalWidgetBase
@@ -303,6 +303,8 @@ class DynEvalUI(DynEvalMainWindow):
 
     def closeEvent(self, event):
         self._save_settings()
+        # DG / scene callbacks would otherwise outlive the window
+        stop_watching()
         super().closeEvent(event)
 
     # ------------------------------------------------------------------
@@ -397,13 +399,17 @@ class SimTreePanel(DynEvalWidgetBase):
 
         self._btn_refresh = QtWidgets.QPushButton("Refresh")
         self._btn_refresh.setToolTip(
-            "Rebuild the tree from the scene (keeps expansion state)."
+            "Update the tree from the scene: only solvers that changed are "
+            "rebuilt (keeps expansion state)."
         )
         self._btn_refresh.clicked.connect(self.refresh_tree)
         filter_row.addWidget(self._btn_refresh)
 
         layout.addLayout(filter_row)
 
+        # solver node -> its column-0 item, for patching single rows
+        self._solver_items: dict[str, QtGui.QStandardItem] = {}
+
         self.tree = SimulationTreeView()
         self.tree.setMinimumWidth(260)
         self.tree.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
@@ -425,22 +431,30 @@ class SimTreePanel(DynEvalWidgetBase):
     # Tree building
     # ------------------------------------------------------------------
 
-    def build_tree(self):
+    def build_tree(self, diff=None):
+        """Rebuild every solver row from scratch.
+
+        diff: a full SolverDiff already computed by the caller (refresh_tree),
+        so discovery does not run twice.
+        """
         self._status.show_loading("Building...")
         self.tree.clear()
+        self._solver_items.clear()
 
         try:
-            systems = discover_all()   # {system_name: [solver_node, ...]}
-            if not systems:
+            if diff is None or not diff.full:
+                diff = diff_solvers(force=True)
+            if not diff.solvers:
                 self._status.show_message("No simulation nodes found.")
                 return
 
             visible = self._visible_types()
-            for _system_name, solver_nodes in systems.items():
-                for solver_node in solver_nodes:
-                    solver_item = build_solver_item(solver_node, visible_types=visible)
-                    if solver_item:
-                        self.tree.model().invisibleRootItem().appendRow(solver_item)
+            root = self.tree.model().invisibleRootItem()
+            for solver_node in diff.solvers:
+                row = build_solver_item(solver_node, visible_types=visible)
+                if row:
+                    root.appendRow(row)
+                    self._solver_items[solver_node] = row[0]
 
             self._expand_top_level()
             self._status.hide()
@@ -450,11 +464,79 @@ class SimTreePanel(DynEvalWidgetBase):
             self._status.show_error(str(e))
 
     def refresh_tree(self):
-        """Rebuild while preserving expansion state."""
+        """Patch the solvers that changed while preserving expansion state."""
         saved = self._collect_expanded_paths()
-        self.build_tree()
+        diff = diff_solvers()
+        if diff.full:
+            self.build_tree(diff)
+        else:
+            try:
+                self._patch_tree(diff)
+            except Exception as e:
+                logger.error(f"refresh_tree failed, rebuilding: {e}")
+                self.build_tree()
         self._restore_expanded_paths(saved)
 
+    def _patch_tree(self, diff):
+        """Drop removed solver rows and rebuild dirty ones in place.
+
+        Clean rows keep their items; only the state column is re-read, since
+        toggling isDynamic / enable (or undoing it) fires no structural
+        callback.
+        """
+        root = self.tree.model().invisibleRootItem()
+        for solver_node in diff.removed:
+            item = self._solver_items.pop(solver_node, None)
+            if item is not None:
+                root.removeRow(item.row())
+
+        visible = self._visible_types()
+        expanded = []
+        position = 0   # row the next solver belongs at (skips unbuildable ones)
+        for solver_node in diff.solvers:
+            item = self._solver_items.get(solver_node)
+            if item is not None and solver_node not in diff.dirty:
+                if item.row() != position:
+                    root.insertRow(position, root.takeRow(item.row()))
+                self._sync_states(item)
+                position += 1
+                continue
+
+            if item is not None:
+                root.removeRow(item.row())
+                del self._solver_items[solver_node]
+            else:
+                expanded.append(solver_node)   # new solver: expand like build_tree
+
+            row = build_solver_item(solver_node, visible_types=visible)
+            if row:
+                root.insertRow(position, row)
+                self._solver_items[solver_node] = row[0]
+                position += 1
+
+        for solver_node in expanded:
+            item = self._solver_items.get(solver_node)
+            if item is not None:
+                self.tree.expand(item.index())
+
+        if self._solver_items:
+            self._status.hide()
+        else:
+            self._status.show_message("No simulation nodes found.")
+
+    def _sync_states(self, parent: QtGui.QStandardItem):
+        """Re-read the state column below parent (and of parent itself)."""
+        model = self.tree.model()
+        state = getattr(parent, "state", None)
+        if state is not None:
+            parent_index = parent.parent().index() if parent.parent() else QtCore.QModelIndex()
+            model.setData(model.index(parent.row(), 1, parent_index),
+                          state, QtCore.Qt.UserRole + 3)
+        for row in range(parent.rowCount()):
+            child = parent.child(row, 0)
+            if child is not None:
+                self._sync_states(child)
+
     # ------------------------------------------------------------------
     # Leaf-type filter
     # ------------------------------------------------------------------
@@ -465,7 +547,10 @@ class SimTreePanel(DynEvalWidgetBase):
     def _on_type_filter_changed(self, _checked: bool):
         hidden = {t for t, check in self._type_checks.items() if not check.isChecked()}
         dyn_prefs.set_hidden_node_types(hidden)
-        self.refresh_tree()
+        # Visibility changes every row's nesting: rebuild, not patch.
+        saved = self._collect_expanded_paths()
+        self.build_tree()
+        self._restore_expanded_paths(saved)
 
     # ------------------------------------------------------------------
     # Selection
@@ -0,0 +1,505 @@
+"""
+sim_cmds/cache_catalog.py — in-memory index of cache directories.
+
+The cache panels refresh on every selection change. Without an index each
+refresh re-globbed the versioned dir, re-parsed every nCache XML with
+ElementTree, re-read metadata.json once per version and ran a
+listConnections/getAttr pass per (node, version) pair for the attached state. This module
+keeps those answers in memory and only recomputes what actually changed.
+
+Invalidation
+------------
+Directory listing  the dir's mtime (any create / delete / rename in it).
+XML header facts   each XML's (mtime, size); only changed files are reparsed.
+Validity / tags    metadata.json goes through json_utils' (path, mtime, size)
+                   document cache, so an unchanged file is never reparsed.
+Attachments       one scene-wide sweep over every cacheFile / Alembic node,
+                   patched from DG callbacks (connection change, attribute
+                   set, node removal) and dropped on scene new / open / import.
+
+Writers in this package call invalidate() after touching a cache dir, which
+also covers filesystems with coarse directory timestamps.
+
+Functions
+---------
+list_caches(cache_dir, node)   CacheInfo per XML, sorted by file name.
+cache_info(xml_path, node)     CacheInfo of one XML (None when unparseable).
+cache_names(cache_dir)         Sorted XML stems.
+latest_version(cache_dir)      Highest _vNNN among the stems (0 when none).
+attachment_snapshot()          Scene-wide AttachmentSnapshot (node -> caches).
+attached_caches(node)          cacheName of every cacheFile driving node.
+cache_validity(metadata_path)  The metadata "isvalid" map.
+invalidate(cache_dir=None)     Force a rescan of one (or every) directory.
+clear_attachments()            Drop the snapshot (next query re-sweeps).
+"""
+
+from __future__ import annotations
+
+import os
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+
+import maya.cmds as cmds
+import maya.api.OpenMaya as om2
+
+from dw_logger import get_logger
+from json_utils.core import read_json_cached
+from ..dendrology.cache_leaf import CacheInfo, CacheType
+
+logger = get_logger()
+
+
+class _XmlHeader(NamedTuple):
+    """Facts read once per XML revision; ``valid`` is False when unparseable."""
+    mtime: int
+    size: int
+    valid: bool
+    start: int = 0
+    end: int = 0
+    version: int = 0
+    date: str = ""
+
+
+# abs dir -> (dir mtime_ns, {stem: _XmlHeader})
+_DIRS: Dict[str, Tuple[int, Dict[str, _XmlHeader]]] = {}
+_CALLBACKS: list = []
+
+
+# ---------------------------------------------------------------------------
+# XML headers
+# ---------------------------------------------------------------------------
+
+def _version_of(stem: str) -> int:
+    """"cloth_v003" -> 3; 0 when the "_v" separator or digits are absent."""
+    version_tag = stem.rsplit("_v", 1)[-1] if "_v" in stem else ""
+    return int(version_tag) if version_tag.isdigit() else 0
+
+
+def _read_header(xml_path: Path, st: os.stat_result) -> _XmlHeader:
+    """
+    Parse an nCache XML descriptor.
+
+    nCache XML stores times in ticks:
+        <time Range="250-1250"/>
+        <cacheTimePerFrame TimePerFrame="250"/>
+    frames = ticks / TimePerFrame. Falls back to channel0's StartTime/EndTime
+    attributes (also ticks) when <time> is absent.
+    """
+    try:
+        root = ET.parse(xml_path).getroot()
+
+        tpf_el = root.find("cacheTimePerFrame")
+        ticks_per_frame = (
+            float(tpf_el.get("TimePerFrame", 250)) if tpf_el is not None else 250.0
+        ) or 250.0
+
+        start_ticks, end_ticks = None, None
+        time_el = root.find("time")
+        if time_el is not None and time_el.get("Range"):
+            parts = time_el.get("Range").split("-")
+            if len(parts) == 2:
+                start_ticks = float(parts[0])
+                end_ticks   = float(parts[1])
+
+        if start_ticks is None:
+            ch = root.find("Channels/channel0")
+            if ch is not None and ch.get("EndTime"):
+                start_ticks = float(ch.get("StartTime", 0))
+                end_ticks   = float(ch.get("EndTime"))
+
+        start, end = 0, 0
+        if start_ticks is not None:
+            start = int(round(start_ticks / ticks_per_frame))
+            end   = int(round(end_ticks / ticks_per_frame))
+
+        date = datetime.fromtimestamp(st.st_mtime).strftime("%Y-%m-%d %H:%M")
+        return _XmlHeader(st.st_mtime_ns, st.st_size, True,
+                          start, end, _version_of(xml_path.stem), date)
+
+    except Exception as e:
+        logger.warning(f"cache_catalog: could not parse {xml_path.name!r}: {e}")
+        return _XmlHeader(st.st_mtime_ns, st.st_size, False)
+
+
+def _headers(cache_dir) -> Dict[str, _XmlHeader]:
+    """{stem: header} of every XML in cache_dir, rescanned only when it changed."""
+    key = os.path.abspath(str(cache_dir))
+    try:
+        dir_mtime = os.stat(key).st_mtime_ns
+    except (OSError, ValueError):
+        # missing dir, or an invalid path (e.g. a stray ':' on Windows)
+        _DIRS.pop(key, None)
+        return {}
+
+    entry = _DIRS.get(key)
+    if entry is not None and entry[0] == dir_mtime:
+        return entry[1]
+
+    previous = entry[1] if entry is not None else {}
+    headers = {}
+    with os.scandir(key) as it:
+        for dir_entry in it:
+            name = dir_entry.name
+            if not name.lower().endswith(".xml") or not dir_entry.is_file():
+                continue
+            st = dir_entry.stat()
+            stem = name[:-4]
+            header = previous.get(stem)
+            if header is None or header.mtime != st.st_mtime_ns or header.size != st.st_size:
+                header = _read_header(Path(dir_entry.path), st)
+            headers[stem] = header
+
+    _DIRS[key] = (dir_mtime, headers)
+    return headers
+
+
+def _to_info(cache_dir, stem: str, header: _XmlHeader, node: str) -> CacheInfo:
+    return CacheInfo(
+        node       = node,
+        name       = stem,       # matches Maya's cacheFile.cacheName
+        version    = header.version,
+        path       = Path(cache_dir) / f"{stem}.xml",
+        start      = header.start,
+        end        = header.end,
+        date       = header.date,
+        cache_type = CacheType.NCACHE,
+    )
+
+
+def list_caches(cache_dir, node: str) -> List[CacheInfo]:
+    """
+    One CacheInfo per parseable XML in cache_dir, sorted by file name
+    (= version order). Each call returns fresh CacheInfo objects, so callers
+    may flip is_attached & co. without touching the index.
+    """
+    headers = _headers(cache_dir)
+    return [_to_info(cache_dir, stem, headers[stem], node)
+            for stem in sorted(headers) if headers[stem].valid]
+
+
+def cache_info(xml_path, node: str) -> Optional[CacheInfo]:
+    """CacheInfo of one XML, None when it is missing or unparseable."""
+    xml_path = Path(xml_path)
+    header = _headers(xml_path.parent).get(xml_path.stem)
+    if header is None:
+        # not listed yet: the dir mtime may not have ticked since the write
+        invalidate(xml_path.parent)
+        header = _headers(xml_path.parent).get(xml_path.stem)
+    if header is None or not header.valid:
+        return None
+    return _to_info(xml_path.parent, xml_path.stem, header, node)
+
+
+def cache_names(cache_dir) -> List[str]:
+    """Sorted stems of every XML in cache_dir."""
+    return sorted(_headers(cache_dir))
+
+
+def latest_version(cache_dir) -> int:
+    """Highest _vNNN version among the XML stems (0 when there is none)."""
+    return max((_version_of(stem) for stem in _headers(cache_dir)), default=0)
+
+
+def invalidate(cache_dir=None) -> None:
+    """
+    Force a rescan of cache_dir (of every directory when None). Parsed
+    headers are kept: they are still checked against each file's mtime/size.
+    """
+    keys = list(_DIRS) if cache_dir is None else [os.path.abspath(str(cache_dir))]
+    for key in keys:
+        if key in _DIRS:
+            _DIRS[key] = (-1, _DIRS[key][1])
+
+
+# ---------------------------------------------------------------------------
+# Validity
+# ---------------------------------------------------------------------------
+
+def cache_validity(metadata_path) -> Dict[str, bool]:
+    """
+    The "isvalid" map of a metadata.json ({} when missing or unreadable).
+    Shared with the document cache: treat it as read-only.
+    """
+    try:
+        data = read_json_cached(str(metadata_path), copy=False)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.warning(f"cache_catalog: cannot read {metadata_path}: {e}")
+        return {}
+    validity = data.get("isvalid", {}) if isinstance(data, dict) else {}
+    return validity if isinstance(validity, dict) else {}
+
+
+# ---------------------------------------------------------------------------
+# Attachment snapshot
+# ---------------------------------------------------------------------------
+
+_NUCLEUS_TYPES = ('nCloth', 'hairSystem')
+_ALEMBIC_TYPES = ('AlembicNode', 'rfxAlembicCacheDeformer')
+_ALEMBIC_FILE_ATTRS = ('abc_File', 'filename')
+_SWEEP_TYPES = ('cacheFile',) + _ALEMBIC_TYPES
+
+
+# Nodes are filed under MObjectHandle.hashCode(), which is not unique: two
+# live nodes may share it and a deleted node's hash can be reused. Each
+# bucket therefore keeps (handle, value) pairs and a lookup only matches the
+# very same, still valid node (as dw_node_registry does).
+_Buckets = Dict[int, List[Tuple[om2.MObjectHandle, object]]]
+
+
+def _handle(obj: om2.MObject) -> om2.MObjectHandle:
+    """Identity of a node that survives renames and reparenting."""
+    return om2.MObjectHandle(obj)
+
+
+def _bucket_get(table: _Buckets, handle: om2.MObjectHandle, default=None):
+    for stored, value in table.get(handle.hashCode(), ()):
+        if stored == handle and stored.isValid():
+            return value
+    return default
+
+
+def _bucket_set(table: _Buckets, handle: om2.MObjectHandle, value) -> None:
+    key = handle.hashCode()
+    bucket = [(stored, old) for stored, old in table.get(key, ()) if stored != handle]
+    bucket.append((handle, value))
+    table[key] = bucket
+
+
+def _bucket_pop(table: _Buckets, handle: om2.MObjectHandle, default=None):
+    key = handle.hashCode()
+    bucket = table.get(key)
+    if not bucket:
+        return default
+    for i, (stored, value) in enumerate(bucket):
+        if stored == handle:
+            del bucket[i]
+            if not bucket:
+                del table[key]
+            return value
+    return default
+
+
+def _bucket_values(table: _Buckets):
+    for bucket in table.values():
+        for _stored, value in bucket:
+            yield value
+
+
+def _plug_string(fn: om2.MFnDependencyNode, attr: str) -> str:
+    try:
+        return fn.findPlug(attr, False).asString()
+    except RuntimeError:
+        return ""
+
+
+class AttachmentSnapshot:
+    """
+    Scene-wide map of cache attachments.
+
+    Built in one sweep over every cacheFile and Alembic node, then patched
+    from DG callbacks: a connection or attribute change only marks its
+    cache node stale, and stale nodes are re-read on the next query. Nodes
+    are keyed by MObjectHandle, so renames and reparenting need no update.
+    """
+
+    def __init__(self):
+        # cacheFile -> (cacheName, xml path, handles of the driven sim nodes)
+        self._cache_files: _Buckets = {}
+        # Alembic node -> file paths
+        self._alembic: _Buckets = {}
+        self._stale: _Buckets = {}
+        # sim node -> {cacheName: xml path}
+        self._by_node: Optional[_Buckets] = None
+
+    @classmethod
+    def sweep(cls) -> "AttachmentSnapshot":
+        snapshot = cls()
+        names = cmds.ls(type=list(_SWEEP_TYPES)) or []
+        if names:
+            sel = om2.MSelectionList()
+            for name in names:
+                sel.add(name)
+            for i in range(sel.length()):
+                snapshot._read(sel.getDependNode(i))
+        return snapshot
+
+    def _read(self, obj: om2.MObject) -> None:
+        handle = _handle(obj)
+        fn = om2.MFnDependencyNode(obj)
+        if fn.typeName == 'cacheFile':
+            targets = {}
+            for plug in fn.getConnections():
+                for other in plug.connectedTo(True, True):
+                    other_obj = other.node()
+                    if om2.MFnDependencyNode(other_obj).typeName in _NUCLEUS_TYPES:
+                        target = _handle(other_obj)
+                        _bucket_set(targets, target, target)
+            cache_name = _plug_string(fn, 'cacheName')
+            xml_path = os.path.join(_plug_string(fn, 'cachePath'), f"{cache_name}.xml")
+            _bucket_set(self._cache_files, handle,
+                        (cache_name, xml_path, tuple(_bucket_values(targets))))
+        else:
+            _bucket_set(self._alembic, handle, tuple(
+                path for path in (_plug_string(fn, attr) for attr in _ALEMBIC_FILE_ATTRS
+                                  if fn.hasAttribute(attr)) if path))
+        _watch_node(obj, handle)
+        self._by_node = None
+
+    def mark_stale(self, obj: om2.MObject) -> None:
+        handle = _handle(obj)
+        _bucket_set(self._stale, handle, handle)
+
+    def forget(self, obj: om2.MObject) -> None:
+        handle = _handle(obj)
+        _bucket_pop(self._stale, handle)
+        if _bucket_pop(self._cache_files, handle) is not None:
+            self._by_node = None
+        _bucket_pop(self._alembic, handle)
+
+    def _refresh(self) -> None:
+        stale, self._stale = self._stale, {}
+        for handle in _bucket_values(stale):
+            if handle.isAlive() and handle.isValid():
+                self._read(handle.object())
+            else:
+                _bucket_pop(self._cache_files, handle)
+                _bucket_pop(self._alembic, handle)
+                self._by_node = None
+
+    def _nucleus_map(self) -> _Buckets:
+        self._refresh()
+        if self._by_node is None:
+            by_node: _Buckets = {}
+            for cache_name, xml_path, targets in _bucket_values(self._cache_files):
+                for target in targets:
+                    caches = _bucket_get(by_node, target)
+                    if caches is None:
+                        caches = {}
+                        _bucket_set(by_node, target, caches)
+                    caches[cache_name] = xml_path
+            self._by_node = by_node
+        return self._by_node
+
+    def caches(self, node: str) -> Dict[str, str]:
+        """
+        {cacheName: xml path} of every cacheFile driving an nCloth / hairSystem.
+
+        Raises:
+            ValueError: If node does not exist or is not an nCloth / hairSystem.
+        """
+        sel = om2.MSelectionList()
+        try:
+            sel.add(node)
+        except (RuntimeError, TypeError):
+            raise ValueError(f"Invalid node: '{node}'. Node does not exist.")
+        obj = sel.getDependNode(0)
+        if om2.MFnDependencyNode(obj).typeName not in _NUCLEUS_TYPES:
+            raise ValueError(f"'{node}' is not an nCloth or hairSystem node.")
+        return dict(_bucket_get(self._nucleus_map(), _handle(obj), {}))
+
+    def alembic_files(self, node: str) -> Tuple[str, ...]:
+        """File paths of an Alembic node (empty for any other / missing node)."""
+        self._refresh()
+        sel = om2.MSelectionList()
+        try:
+            sel.add(node)
+        except (RuntimeError, TypeError):
+            return ()
+        return _bucket_get(self._alembic, _handle(sel.getDependNode(0)), ())
+
+
+_SNAPSHOT: Optional[AttachmentSnapshot] = None
+_NODE_CALLBACKS: _Buckets = {}   # cache node -> attributeChanged callback id
+
+
+def _watch_node(obj: om2.MObject, handle: om2.MObjectHandle) -> None:
+    """Mark a cache node stale when one of its attributes is set."""
+    if _bucket_get(_NODE_CALLBACKS, handle) is not None or not _CALLBACKS:
+        return
+    try:
+        _bucket_set(_NODE_CALLBACKS, handle,
+                    om2.MNodeMessage.addAttributeChangedCallback(obj, _on_attribute_changed))
+    except RuntimeError:
+        pass
+
+
+def _on_attribute_changed(msg, plug, other_plug, client_data=None) -> None:
+    if _SNAPSHOT is not None and msg & om2.MNodeMessage.kAttributeSet:
+        _SNAPSHOT.mark_stale(plug.node())
+
+
+def _on_connection(src_plug, dst_plug, made, client_data=None) -> None:
+    if _SNAPSHOT is None:
+        return
+    for plug in (src_plug, dst_plug):
+        obj = plug.node()
+        if om2.MFnDependencyNode(obj).typeName in _SWEEP_TYPES:
+            _SNAPSHOT.mark_stale(obj)
+
+
+def _on_node_removed(obj, client_data=None) -> None:
+    if _SNAPSHOT is None or om2.MFnDependencyNode(obj).typeName not in _SWEEP_TYPES:
+        return
+    _SNAPSHOT.forget(obj)
+    callback_id = _bucket_pop(_NODE_CALLBACKS, _handle(obj))
+    if callback_id is not None:
+        om2.MMessage.removeCallback(callback_id)
+
+
+def clear_attachments(*args) -> None:
+    """Drop the snapshot: the next query sweeps the scene again."""
+    global _SNAPSHOT
+    _SNAPSHOT = None
+    if _NODE_CALLBACKS:
+        try:
+            om2.MMessage.removeCallbacks(list(_bucket_values(_NODE_CALLBACKS)))
+        except RuntimeError:
+            pass   # nodes already deleted with their scene
+        _NODE_CALLBACKS.clear()
+
+
+def _watch_scene() -> bool:
+    """Install the scene callbacks the snapshot relies on; False if impossible."""
+    if _CALLBACKS:
+        return True
+    try:
+        _CALLBACKS.extend([
+            om2.MDGMessage.addConnectionCallback(_on_connection),
+            om2.MDGMessage.addNodeRemovedCallback(_on_node_removed, "dependNode"),
+            om2.MSceneMessage.addCallback(om2.MSceneMessage.kBeforeNew, clear_attachments),
+            om2.MSceneMessage.addCallback(om2.MSceneMessage.kBeforeOpen, clear_attachments),
+            om2.MSceneMessage.addCallback(om2.MSceneMessage.kAfterImport, clear_attachments),
+        ])
+        return True
+    except RuntimeError as e:
+        logger.warning(f"cache_catalog: cannot watch the scene, attachment "
+                       f"snapshots are not cached: {e}")
+        if _CALLBACKS:
+            om2.MMessage.removeCallbacks(_CALLBACKS)
+            del _CALLBACKS[:]
+        return False
+
+
+def attachment_snapshot() -> AttachmentSnapshot:
+    """The current scene-wide attachment snapshot (swept on first use)."""
+    global _SNAPSHOT
+    if _SNAPSHOT is not None:
+        return _SNAPSHOT
+    if not _watch_scene():
+        return AttachmentSnapshot.sweep()   # uncached: nothing would keep it fresh
+    _SNAPSHOT = AttachmentSnapshot.sweep()
+    return _SNAPSHOT
+
+
+def attached_caches(node: str) -> FrozenSet[str]:
+    """
+    cacheName of every cacheFile connected to an nCloth / hairSystem node.
+
+    Raises:
+        ValueError: If node does not exist or is not an nCloth / hairSystem.
+    """
+    return frozenset(attachment_snapshot().caches(node))
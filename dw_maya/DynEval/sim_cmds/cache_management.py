@@ -11,6 +11,7 @@ import dw_maya.dw_duplication as dwdup
 import dw_maya.dw_maya_nodes as dwnn
 from dw_maya.dw_decorators import acceptString
 from dw_logger import get_logger
+from . import cache_catalog as _catalog
 
 logger = get_logger()
 
@@ -105,6 +106,8 @@ def attach_ncache(filename: str, ncloth: str):
 def cache_is_attached(nxnode: str, cache_name: str) -> bool:
     """
     Check if the specified cache file is connected to the given nCloth or hairSystem node.
+    Answered from cache_catalog's scene-wide attachment snapshot: one sweep
+    over every cacheFile node, kept up to date by DG callbacks.
 
     Args:
         nxnode (str): The name of the nCloth or hairSystem node to check.
@@ -115,23 +118,10 @@ def cache_is_attached(nxnode: str, cache_name: str) -> bool:
     Raises:
         ValueError: If nxnode is not a valid nCloth or hairSystem node.
     """
-    if not isinstance(nxnode, str) or not cmds.objExists(nxnode):
-        raise ValueError(f"Invalid node: '{nxnode}'. Node does not exist.")
     if not isinstance(cache_name, str) or not cache_name:
         raise ValueError("Invalid cache name. Must be a non-empty string.")
 
-    nnode = cmds.ls(nxnode, type=['nCloth', 'hairSystem'])
-    if not nnode:
-        raise ValueError(f"'{nxnode}' is not an nCloth or hairSystem node.")
-
-    # Get cache file connections and check for matching cache name
-    cache_connections = cmds.listConnections(nnode, type='cacheFile') or []
-    for cache in set(cache_connections):
-        cache_attr = f"{cache}.cacheName"
-        if cmds.objExists(cache_attr) and cmds.getAttr(cache_attr) == cache_name:
-            return True
-
-    return False
+    return cache_name in _catalog.attached_caches(nxnode)
 
 
 def create_cache(ncloth_shapes: list, cache_dir: str, time_range: list = None, **kwargs) -> list:
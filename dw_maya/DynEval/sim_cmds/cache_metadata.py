@@ -20,7 +20,8 @@ published — the single version tagged for publish. After a scene rebuild,
 reattaches every tagged version.
 
 Writes are immediate (no defer) so the cache panel can reread the file right
-after a save without racing a deferred idle-time write.
+after a save without racing a deferred idle-time write. Reads go through the
+json_utils document cache: an unchanged file is not reparsed per refresh.
 """
 
 from __future__ import annotations
@@ -30,6 +31,7 @@ from typing import Optional
 
 from dw_logger import get_logger
 from dw_maya.dw_presets_io import dw_json
+from json_utils.core import read_json_cached
 
 logger = get_logger()
 
@@ -49,14 +51,22 @@ def _metadata_path(item) -> Optional[Path]:
         return None
 
 
-def _load(item) -> dict:
-    """Load the whole metadata document ({} when missing/unreadable)."""
+def _load(item, shared: bool = False) -> dict:
+    """Load the whole metadata document ({} when missing/unreadable).
+
+    Args:
+        item: Sim tree item.
+        shared: Return the cached document itself (read-only) instead of a
+            private copy - for readers that never mutate it.
+    """
     path = _metadata_path(item)
     if path is None:
         return {}
     try:
         if not path.exists():
             return {}
+        if shared:
+            return read_json_cached(str(path), copy=False) or {}
         return dw_json.load_json(str(path)) or {}
     except Exception as e:
         logger.warning(f"cache_metadata: load failed for {path}: {e}")
@@ -92,11 +102,11 @@ def get_tags(item) -> dict:
          "favorites": [version(int), ...],
          "published": version(int) | None}
     """
-    data = _load(item)
+    data = _load(item, shared=True)
     key = _item_key(item)
     return {
-        "comments": data.get("comments", {}).get(key, {}),
-        "favorites": data.get("favorites", {}).get(key, []),
+        "comments": dict(data.get("comments", {}).get(key, {})),
+        "favorites": list(data.get("favorites", {}).get(key, [])),
         "published": data.get("published", {}).get(key),
     }
 
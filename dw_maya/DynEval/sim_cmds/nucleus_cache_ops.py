@@ -24,14 +24,13 @@ attach_ncache()  takes a full XML path string and a shape node name
 from __future__ import annotations
 
 import shutil
-import xml.etree.ElementTree as ET
-from datetime import datetime
 from pathlib import Path
 
 import maya.cmds as cmds
 
 from dw_logger import get_logger
-from ..dendrology.cache_leaf import CacheInfo, CacheType
+from ..dendrology.cache_leaf import CacheInfo
+from . import cache_catalog
 from . import cache_management
 from . import dyn_prefs
 
@@ -47,32 +46,20 @@ class NucleusCacheOps:
     @staticmethod
     def list_caches(item) -> list[CacheInfo]:
         """
-        Scan item.cache_dir() for .xml files and return one CacheInfo each.
-        Result is sorted by file name (= version order).
+        One CacheInfo per .xml in item.cache_dir(), sorted by file name
+        (= version order). Served by cache_catalog: the dir is rescanned only
+        when its mtime changes and each XML is parsed once per revision.
         """
         if not hasattr(item, "cache_dir"):
             logger.debug(f"list_caches: {item.node!r} has no cache_dir(), skipping")
             return []
 
-        # exists()/glob() stay inside the try: on Windows an invalid path
-        # (e.g. a stray ':' component) raises OSError from exists() itself.
         try:
-            cache_dir = Path(item.cache_dir())
-            if not cache_dir.exists():
-                return []
-            xml_paths = sorted(cache_dir.glob("*.xml"))
+            return cache_catalog.list_caches(item.cache_dir(), item.node)
         except Exception as e:
             logger.warning(f"list_caches: cache scan failed for {item.node!r}: {e}")
             return []
 
-        result = []
-        for xml_path in xml_paths:
-            info = NucleusCacheOps._info_from_xml(xml_path, item.node)
-            if info:
-                result.append(info)
-
-        return result
-
     # ──────────────────────────────────────────────────────────────────
     # CREATE
     # ──────────────────────────────────────────────────────────────────
@@ -220,6 +207,7 @@ class NucleusCacheOps:
                 f"No files starting with {raw_stem!r} found in {work_dir}"
             )
 
+        cache_catalog.invalidate(target_xml.parent)
         cache_management.attach_ncache(str(target_xml), item.node)
         logger.debug(f"Created and attached: {target_xml.name!r} -> {item.node!r}")
         return NucleusCacheOps._info_from_xml(target_xml, item.node)
@@ -285,6 +273,7 @@ class NucleusCacheOps:
             except OSError as e:
                 logger.warning(f"Could not remove {path}: {e}")
 
+        cache_catalog.invalidate(xml_path.parent)
         logger.debug(f"Deleted {deleted} file(s) for {stem!r}")
 
     # ──────────────────────────────────────────────────────────────────
@@ -313,6 +302,7 @@ class NucleusCacheOps:
                 except OSError as e:
                     logger.warning(f"Could not remove {path}: {e}")
 
+        cache_catalog.invalidate(cache_dir)
         logger.debug(f"Deleted {deleted} file(s) in {cache_dir}")
 
     # ──────────────────────────────────────────────────────────────────
@@ -322,66 +312,8 @@ class NucleusCacheOps:
     @staticmethod
     def _info_from_xml(xml_path: Path, node: str) -> CacheInfo | None:
         """
-        Parse an nCache XML descriptor and return a CacheInfo.
-
-        Frame range strategy
-        ────────────────────
-        nCache XML stores times in ticks:
-            <time Range="250-1250"/>
-            <cacheTimePerFrame TimePerFrame="250"/>
-        frames = ticks / TimePerFrame. Falls back to channel0's
-        StartTime/EndTime attributes (also ticks) when <time> is absent.
-
-        Version
-        ───────
-        Extracted from the file stem: "cloth_v003" → 3 (int).
-        Falls back to 0 if the "_v" separator or digits are absent.
+        CacheInfo of an nCache XML descriptor (frame range from its ticks,
+        version from the "_vNNN" stem). Parsed once per file revision by
+        cache_catalog.
         """
-        try:
-            root = ET.parse(xml_path).getroot()
-
-            tpf_el = root.find("cacheTimePerFrame")
-            ticks_per_frame = (
-                float(tpf_el.get("TimePerFrame", 250)) if tpf_el is not None else 250.0
-            ) or 250.0
-
-            start_ticks, end_ticks = None, None
-            time_el = root.find("time")
-            if time_el is not None and time_el.get("Range"):
-                parts = time_el.get("Range").split("-")
-                if len(parts) == 2:
-                    start_ticks = float(parts[0])
-                    end_ticks   = float(parts[1])
-
-            if start_ticks is None:
-                ch = root.find("Channels/channel0")
-                if ch is not None and ch.get("EndTime"):
-                    start_ticks = float(ch.get("StartTime", 0))
-                    end_ticks   = float(ch.get("EndTime"))
-
-            start, end = 0, 0
-            if start_ticks is not None:
-                start = int(round(start_ticks / ticks_per_frame))
-                end   = int(round(end_ticks / ticks_per_frame))
-
-            stem = xml_path.stem
-            version_tag = stem.rsplit("_v", 1)[-1] if "_v" in stem else ""
-            version = int(version_tag) if version_tag.isdigit() else 0
-            date    = datetime.fromtimestamp(
-                xml_path.stat().st_mtime
-            ).strftime("%Y-%m-%d %H:%M")
-
-            return CacheInfo(
-                node       = node,
-                name       = stem,       # matches Maya's cacheFile.cacheName
-                version    = version,
-                path       = xml_path,
-                start      = start,
-                end        = end,
-                date       = date,
-                cache_type = CacheType.NCACHE,
-            )
-
-        except Exception as e:
-            logger.warning(f"_info_from_xml: could not parse {xml_path.name!r}: {e}")
-            return None
\ No newline at end of file
+        return cache_catalog.cache_info(xml_path, node)
@@ -1,5 +1,9 @@
+from typing import Callable, Optional, Sequence, Union
+
+import numpy as np
 import maya.cmds as cmds
 import maya.mel as mel
+import maya.api.OpenMaya as om2
 import dw_maya.dw_maya_utils as dwu
 from dw_maya.dw_paint import guess_if_component_sel
 from dw_maya.dw_decorators import acceptString
@@ -145,7 +149,7 @@ def get_vtx_map_data(cloth_node: str, vtx_map: str) -> list:
 
     # Retrieve and return the influence values
     try:
-        return cmds.getAttr(map_attr) or []
+        return _plug_values(_map_plug(cloth_node, vtx_map)).tolist()
     except Exception as e:
         cmds.warning(f"Failed to retrieve vertex map data for '{map_attr}': {e}")
         return []
@@ -158,7 +162,7 @@ def set_vtx_map_data(cloth_node: str, vtx_map: str, values: list, refresh: bool
     Args:
         cloth_node (str): The name of the cloth or rigid node.
         vtx_map (str): The name of the vertex map attribute (must end with 'PerVertex').
-        values (list): The influence values per vertex.
+        values (list | np.ndarray): The influence values per vertex.
         refresh (bool): Whether to refresh the Maya UI after setting the value.
 
     Returns:
@@ -184,9 +188,9 @@ def set_vtx_map_data(cloth_node: str, vtx_map: str, values: list, refresh: bool
         cmds.warning(f"Vertex map attribute '{map_attr}' does not exist.")
         return False
 
-    # Set the attribute value and optionally refresh the UI
+    # Set the attribute value (undoable) and optionally refresh the UI
     try:
-        cmds.setAttr(map_attr, values, type='doubleArray')
+        _write_plug(_map_plug(cloth_node, vtx_map), np.asarray(values, dtype=np.float64).ravel())
         if refresh:
             cmds.refresh()
         return True
@@ -194,6 +198,245 @@ def set_vtx_map_data(cloth_node: str, vtx_map: str, values: list, refresh: bool
         cmds.warning(f"Failed to set vertex map data for '{map_attr}': {e}")
         return False
 
+# ---------------------------------------------------------------------------
+# numpy map service
+#
+# Maps move as float32 arrays through the plug's MFnDoubleArrayData (one C
+# call each way) and every edit below is a single undoable write: no Artisan
+# context, no deferred main-thread loop, no viewport round trip.
+# ---------------------------------------------------------------------------
+
+VertexIds = Optional[Union[Sequence[int], np.ndarray]]
+
+
+def _validate_vtx_map(cloth_node: str, vtx_map: str) -> None:
+    """Raise ValueError unless cloth_node.vtx_map is an nCloth / nRigid PerVertex map."""
+    if not cmds.objExists(cloth_node):
+        raise ValueError(f"Node '{cloth_node}' does not exist.")
+    if cmds.nodeType(cloth_node) not in ['nCloth', 'nRigid']:
+        raise ValueError(f"Node '{cloth_node}' is not of type 'nCloth' or 'nRigid'.")
+    if not vtx_map.endswith("PerVertex"):
+        raise ValueError(f"Vertex map '{vtx_map}' must end with 'PerVertex'.")
+    if not cmds.attributeQuery(vtx_map, node=cloth_node, exists=True):
+        raise ValueError(f"Vertex map attribute '{cloth_node}.{vtx_map}' does not exist.")
+
+
+def _map_plug(cloth_node: str, vtx_map: str) -> om2.MPlug:
+    sel = om2.MSelectionList()
+    sel.add(f"{cloth_node}.{vtx_map}")
+    return sel.getPlug(0)
+
+
+def _plug_values(plug: om2.MPlug) -> np.ndarray:
+    """float64 content of a doubleArray plug (empty when never painted)."""
+    try:
+        data = plug.asMObject()
+    except RuntimeError:
+        return np.zeros(0)  # no data object until the map is first written
+    if data.isNull():
+        return np.zeros(0)
+    return np.array(om2.MFnDoubleArrayData(data).array(), dtype=np.float64)
+
+
+def _set_plug_values(plug: om2.MPlug, values: np.ndarray) -> None:
+    data = om2.MFnDoubleArrayData().create(om2.MDoubleArray(values.tolist()))
+    plug.setMObject(data)
+
+
+def _write_plug(plug: om2.MPlug, values: np.ndarray) -> None:
+    """Write float64 values to a doubleArray plug as one undoable step."""
+    from dw_maya.dw_decorators.dw_generic_undo import push_undo
+
+    previous = _plug_values(plug)
+    push_undo(lambda: _set_plug_values(plug, values),
+              lambda: _set_plug_values(plug, previous))
+
+
+def _map_mesh(cloth_node: str) -> str:
+    """Mesh feeding cloth_node.inputMesh (same topology as the cloth output)."""
+    meshes = cmds.listConnections(f"{cloth_node}.inputMesh", s=True, d=False, sh=True) or []
+    if not meshes:
+        raise ValueError(f"No input mesh connected to '{cloth_node}'.")
+    return meshes[0]
+
+
+def _vertex_count(mesh: str) -> int:
+    sel = om2.MSelectionList()
+    sel.add(mesh)
+    return om2.MFnMesh(sel.getDagPath(0)).numVertices
+
+
+def read_vtx_map(cloth_node: str, vtx_map: str, fill: Optional[float] = 1.0,
+                 mesh: Optional[str] = None) -> np.ndarray:
+    """
+    Per-vertex map as a float32 array.
+
+    Args:
+        cloth_node: nCloth / nRigid node.
+        vtx_map: Map attribute, ending with 'PerVertex'.
+        fill: Value of a never-painted (empty) map - nCloth maps scale their
+            attribute, so 1.0 matches what the solver uses. None returns the
+            empty array instead.
+        mesh: Mesh giving the vertex count for ``fill`` (input mesh by default).
+
+    Returns:
+        np.ndarray: (N,) float32 values.
+
+    Raises:
+        ValueError: If the node or map is invalid.
+    """
+    _validate_vtx_map(cloth_node, vtx_map)
+    values = _plug_values(_map_plug(cloth_node, vtx_map))
+    if not values.size and fill is not None:
+        values = np.full(_vertex_count(mesh or _map_mesh(cloth_node)), fill)
+    return values.astype(np.float32)
+
+
+def write_vtx_map(cloth_node: str, vtx_map: str, values) -> None:
+    """
+    Write a whole per-vertex map in one undoable call.
+
+    Raises:
+        ValueError: If the node or map is invalid.
+    """
+    _validate_vtx_map(cloth_node, vtx_map)
+    _write_plug(_map_plug(cloth_node, vtx_map), np.asarray(values, dtype=np.float64).ravel())
+
+
+def _vertex_weights(count: int, vertex_ids: VertexIds, weight: float) -> Union[float, np.ndarray]:
+    """``weight`` everywhere, or only on vertex_ids (0 elsewhere)."""
+    if vertex_ids is None:
+        return weight
+    weights = np.zeros(count, dtype=np.float32)
+    weights[np.asarray(vertex_ids, dtype=np.int64)] = weight
+    return weights
+
+
+def laplacian_smooth(values: np.ndarray, indptr: np.ndarray, neighbours: np.ndarray,
+                     iterations: int = 1, strength: float = 1.0,
+                     vertex_ids: VertexIds = None) -> np.ndarray:
+    """
+    Move every value toward the mean of its neighbours, ``iterations`` times.
+
+    Args:
+        values: (N,) per-vertex values.
+        indptr, neighbours: Vertex -> neighbour CSR (see dwu vertex_neighbours).
+        iterations: Number of passes.
+        strength: Fraction of the way to the neighbour mean per pass (0-1).
+        vertex_ids: Only these vertices move; the others still feed the means.
+
+    Returns:
+        np.ndarray: Smoothed float32 copy.
+    """
+    values = np.array(values, dtype=np.float32)
+    count = values.size
+    degree = np.diff(indptr)
+    owner = np.repeat(np.arange(count), degree)
+    inv_degree = np.zeros(count, dtype=np.float32)
+    np.divide(1.0, degree, out=inv_degree, where=degree > 0)
+    # isolated vertices keep their value
+    step = _vertex_weights(count, vertex_ids, strength) * (degree > 0)
+    for _ in range(max(0, int(iterations))):
+        mean = np.bincount(owner, weights=values[neighbours], minlength=count) * inv_degree
+        values += step * (mean.astype(np.float32) - values)
+    return values
+
+
+def clamp_values(values: np.ndarray, low: float = 0.0, high: float = 1.0) -> np.ndarray:
+    """float32 copy of values clipped to [low, high]."""
+    return np.clip(np.asarray(values, dtype=np.float32), low, high)
+
+
+def remap_values(values: np.ndarray, old_min: float, old_max: float,
+                 new_min: float = 0.0, new_max: float = 1.0, clamp: bool = True) -> np.ndarray:
+    """
+    Linearly map [old_min, old_max] onto [new_min, new_max] (float32).
+    A zero-width source range maps everything to new_min.
+    """
+    values = np.asarray(values, dtype=np.float32)
+    span = old_max - old_min
+    t = (values - old_min) / span if span else np.zeros_like(values)
+    if clamp:
+        t = np.clip(t, 0.0, 1.0)
+    return (new_min + t * (new_max - new_min)).astype(np.float32)
+
+
+def blend_values(current: np.ndarray, target: np.ndarray, weight: float = 1.0,
+                 vertex_ids: VertexIds = None) -> np.ndarray:
+    """current * (1 - weight) + target * weight, optionally on vertex_ids only."""
+    current = np.asarray(current, dtype=np.float32)
+    target = np.asarray(target, dtype=np.float32)
+    if current.shape != target.shape:
+        raise ValueError(f"Cannot blend {current.size} values with {target.size}.")
+    return current + _vertex_weights(current.size, vertex_ids, weight) * (target - current)
+
+
+def _edit_vtx_map(cloth_node: str, vtx_map: str,
+                  edit: Callable[[np.ndarray], np.ndarray],
+                  vertex_ids: VertexIds = None, mesh: Optional[str] = None) -> np.ndarray:
+    """Read, edit and write back a map; vertices outside vertex_ids are left bit-exact."""
+    _validate_vtx_map(cloth_node, vtx_map)
+    plug = _map_plug(cloth_node, vtx_map)
+    original = _plug_values(plug)
+    if not original.size:
+        original = np.full(_vertex_count(mesh or _map_mesh(cloth_node)), 1.0)
+    edited = edit(original.astype(np.float32))
+    result = edited.astype(np.float64)
+    if vertex_ids is not None:
+        result = original.copy()
+        ids = np.asarray(vertex_ids, dtype=np.int64)
+        result[ids] = edited[ids]
+    _write_plug(plug, result)
+    return result.astype(np.float32)   # what was written, not the raw edit
+
+
+def smooth_vtx_map(cloth_node: str, vtx_map: str, iterations: int = 1, strength: float = 1.0,
+                   vertex_ids: VertexIds = None, mesh: Optional[str] = None) -> np.ndarray:
+    """
+    Headless Laplacian smooth of a per-vertex map (replaces the Artisan
+    smooth-flood loop of smooth_pervtx_map). Adjacency comes from the cached
+    topology of ``mesh`` (the cloth's input mesh by default).
+
+    Returns:
+        np.ndarray: The new float32 map.
+
+    Raises:
+        ValueError: If the node or map is invalid.
+    """
+    from dw_maya.dw_maya_utils.dw_component_set import vertex_neighbours
+
+    mesh = mesh or _map_mesh(cloth_node)
+    indptr, neighbours = vertex_neighbours(mesh)
+    return _edit_vtx_map(
+        cloth_node, vtx_map,
+        lambda values: laplacian_smooth(values, indptr, neighbours, iterations, strength, vertex_ids),
+        vertex_ids, mesh)
+
+
+def clamp_vtx_map(cloth_node: str, vtx_map: str, low: float = 0.0, high: float = 1.0,
+                  vertex_ids: VertexIds = None) -> np.ndarray:
+    """Clip a per-vertex map to [low, high] in one undoable write."""
+    return _edit_vtx_map(cloth_node, vtx_map,
+                         lambda values: clamp_values(values, low, high), vertex_ids)
+
+
+def remap_vtx_map(cloth_node: str, vtx_map: str, old_min: float, old_max: float,
+                  new_min: float = 0.0, new_max: float = 1.0, clamp: bool = True,
+                  vertex_ids: VertexIds = None) -> np.ndarray:
+    """Linearly remap a per-vertex map in one undoable write."""
+    return _edit_vtx_map(
+        cloth_node, vtx_map,
+        lambda values: remap_values(values, old_min, old_max, new_min, new_max, clamp),
+        vertex_ids)
+
+
+def blend_vtx_map(cloth_node: str, vtx_map: str, target, weight: float = 1.0,
+                  vertex_ids: VertexIds = None) -> np.ndarray:
+    """Blend a per-vertex map toward ``target`` values in one undoable write."""
+    return _edit_vtx_map(cloth_node, vtx_map,
+                         lambda values: blend_values(values, target, weight), vertex_ids)
+
+
 @acceptString("cloth_mesh")
 def paint_vtx_map(map_attr, cloth_mesh=None, nucleus=None):
     """Enables Maya's vertex paint tool on the specified map attribute.
@@ -264,6 +507,7 @@ def smooth_artisan(context):
 
 def smooth_pervtx_map(iteration:int =1):
     """ Enable maya vertex paint tool and launch smooth
+        (interactive Artisan path - see smooth_vtx_map for the headless one)
         :param clothNode: Cloth node name
         :type clothNode: str
         :param mapName: Vertex map name
@@ -33,6 +33,7 @@ from pathlib import Path
 import dw_maya.dw_alembic_utils as dwabc
 import dw_maya.dw_presets_io as dw_json
 import dw_maya.dw_ziva_utils as dwziva
+from . import cache_catalog
 #----------------------------------------------------------------------------#
 #--------------------------------------------------------------- FUNCTIONS --#
 
@@ -128,18 +129,12 @@ def cache_is_attached(cache_node: str, cache_name: str) -> bool:
     Returns:
         bool: True if the cache is attached, False otherwise.
     """
-    # Ensure cache node exists and is of the correct type
-    nnode = cmds.ls(cache_node, type=['AlembicNode', 'rfxAlembicCacheDeformer'])
-    if not nnode:
-        return False
-
-    # Attributes to check
-    filename_extensions = ['abc_File', 'filename']
-    attrs = [f"{n}.{ext}" for ext in filename_extensions for n in nnode]
-    attrs = cmds.ls(attrs)
+    # File paths of the node (AlembicNode / rfxAlembicCacheDeformer only),
+    # from the scene-wide attachment snapshot
+    files = cache_catalog.attachment_snapshot().alembic_files(cache_node)
 
     # Check if the cache_name is in any attribute's value
-    return any(cache_name in cmds.getAttr(a) for a in attrs)
+    return any(cache_name in f for f in files)
 
 
 def assign_cache(abc_target: str, file: str) -> bool:
@@ -7,12 +7,19 @@ uses the registry functions without knowing any specific sim system.
 
 Registration is triggered by importing the systems package:
     from .systems import *   # or explicit: from .systems import nucleus_system
+
+Incremental refresh
+-------------------
+diff_solvers() keeps the previous discovery result and a DG callback watch
+(node add / remove / rename, connection change) that marks the solvers whose
+subtree changed. The tree panel rebuilds only those rows instead of running
+discover_all + build_solver_item for every solver on each refresh.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Callable
+from dataclasses import dataclass, field
+from typing import Callable, NamedTuple
 
 try:
     from PySide6 import QtCore, QtGui, QtWidgets
@@ -25,6 +32,7 @@ except ImportError:
     from shiboken2 import wrapInstance
     
 import maya.cmds as cmds
+import maya.api.OpenMaya as om2
 
 from dw_logger import get_logger
 
@@ -56,6 +64,9 @@ class SimSystem:
     get_links       optional (solver_node) -> {child: parent_child} — children
                     mapped here are nested under the other child instead of
                     the solver (e.g. nRigid under the nCloth it constrains)
+    link_node_types optional node types behind get_links — a connection change
+                    on one of them dirties every solver of the system, since
+                    links are not owned by a single solver
     """
     name:           str
     solver_types:   list[str]
@@ -65,6 +76,7 @@ class SimSystem:
     get_children:   Callable[[str], list[str]]
     cache_ops:      type | None = None
     get_links:      Callable[[str], dict[str, str]] | None = None
+    link_node_types: list[str] = field(default_factory=list)
 
 
 # ============================================================================
@@ -202,11 +214,14 @@ def build_solver_item(solver_node: str,
 
     # Build items first so filtering and nesting can use the resolved
     # item.node / node_type (get_children may hand out transforms).
+    members = {_short_name(solver_node), _short_name(getattr(solver_item, "node", ""))}
     child_items = []
     for child_node in children:
+        members.add(_short_name(child_node))
         child_item = system.make_item(child_node)
         if not child_item:
             continue
+        members.add(_short_name(getattr(child_item, "node", "")))
         if visible_types is not None:
             if getattr(child_item, "node_type", None) not in visible_types:
                 continue
@@ -225,6 +240,7 @@ def build_solver_item(solver_node: str,
         else:
             solver_item.appendRow(_make_row(item))
 
+    _remember_members(solver_node, system, members)
     return _make_row(solver_item)
 
 
@@ -242,4 +258,201 @@ def _make_row(item: QtGui.QStandardItem) -> list[QtGui.QStandardItem]:
     state = getattr(item, "state", None)
     if state is not None:
         state_item.setData(state, QtCore.Qt.UserRole + 3)
-    return [item, state_item]
\ No newline at end of file
+    return [item, state_item]
+
+
+# ============================================================================
+# INCREMENTAL REFRESH
+# ============================================================================
+
+class SolverDiff(NamedTuple):
+    """
+    What changed in the scene since the previous diff_solvers() call.
+
+    solvers   every solver currently in the scene, discover_all order
+    dirty     solvers whose rows must be (re)built — changed or new
+    removed   solvers from the previous result that are gone (or renamed)
+    full      True when the whole tree must be rebuilt (first call, scene
+              new / open / import / reference edit, or no callback watch)
+    """
+    solvers: list[str]
+    dirty:   set[str]
+    removed: set[str]
+    full:    bool
+
+
+_solvers:   list[str] = []              # previous discovery, flattened
+_system_of: dict[str, str] = {}         # solver -> system name
+_members:   dict[str, set[str]] = {}    # solver -> short names in its subtree
+_owner:     dict[str, str] = {}         # short name -> owning solver
+_dirty:     set[str] = set()
+_rescan = True                          # solver set may have changed
+_full   = True                          # everything must be rebuilt
+_CALLBACKS: list[int] = []
+
+
+def _remember_members(solver_node: str, system: SimSystem, members: set[str]) -> None:
+    """Record which nodes a freshly built solver row depends on."""
+    for name in _members.pop(solver_node, ()):
+        if _owner.get(name) == solver_node:
+            del _owner[name]
+    members.discard("")
+    _members[solver_node] = members
+    _system_of[solver_node] = system.name
+    for name in members:
+        _owner[name] = solver_node
+
+
+def _forget_solver(solver_node: str) -> None:
+    _system_of.pop(solver_node, None)
+    for name in _members.pop(solver_node, ()):
+        if _owner.get(name) == solver_node:
+            del _owner[name]
+
+
+def _mark_node(obj: om2.MObject, name: str | None = None) -> None:
+    """Dirty whatever solver the node belongs to (or request a rescan)."""
+    fn = om2.MFnDependencyNode(obj)
+    name = name or fn.name()
+    solver = _owner.get(name)
+    if solver is not None:
+        _dirty.add(solver)
+        return
+
+    global _rescan
+    if _is_solver_type(fn.typeName):
+        _rescan = True
+        return
+    for system in _by_name.values():
+        if fn.typeName in system.link_node_types:
+            _dirty.update(s for s, n in _system_of.items() if n == system.name)
+
+
+def _is_solver_type(node_type: str) -> bool:
+    system = _by_node_type.get(node_type)
+    return system is not None and node_type in system.solver_types
+
+
+def _on_node_added(obj, client_data=None) -> None:
+    global _rescan
+    if _is_solver_type(om2.MFnDependencyNode(obj).typeName):
+        _rescan = True
+
+
+def _on_node_removed(obj, client_data=None) -> None:
+    global _rescan
+    if om2.MFnDependencyNode(obj).name() in _system_of:
+        _rescan = True
+    _mark_node(obj)
+
+
+def _on_name_changed(obj, prev_name, client_data=None) -> None:
+    # Rows are keyed by name: a renamed solver is removed + re-added.
+    global _rescan
+    if prev_name in _system_of:
+        _rescan = True
+    _mark_node(obj, _short_name(prev_name) or None)
+
+
+def _on_connection(src_plug, dst_plug, made, client_data=None) -> None:
+    for plug in (src_plug, dst_plug):
+        _mark_node(plug.node())
+
+
+def _on_scene_changed(*args) -> None:
+    """Scene new / open / import / reference edit: rebuild from scratch."""
+    global _rescan, _full
+    _rescan = _full = True
+
+
+def _watch_scene() -> bool:
+    """Install the DG callbacks the diff relies on; False if impossible."""
+    if _CALLBACKS:
+        return True
+    scene_events = (
+        om2.MSceneMessage.kBeforeNew,
+        om2.MSceneMessage.kBeforeOpen,
+        om2.MSceneMessage.kAfterImport,
+        om2.MSceneMessage.kAfterCreateReference,
+        om2.MSceneMessage.kAfterRemoveReference,
+        om2.MSceneMessage.kAfterLoadReference,
+        om2.MSceneMessage.kAfterUnloadReference,
+    )
+    try:
+        _CALLBACKS.extend([
+            om2.MDGMessage.addNodeAddedCallback(_on_node_added, "dependNode"),
+            om2.MDGMessage.addNodeRemovedCallback(_on_node_removed, "dependNode"),
+            om2.MNodeMessage.addNameChangedCallback(om2.MObject.kNullObj, _on_name_changed),
+            om2.MDGMessage.addConnectionCallback(_on_connection),
+        ])
+        _CALLBACKS.extend(om2.MSceneMessage.addCallback(event, _on_scene_changed)
+                          for event in scene_events)
+        return True
+    except RuntimeError as e:
+        logger.warning(f"sim_registry: cannot watch the scene, every refresh "
+                       f"rebuilds the whole tree: {e}")
+        if _CALLBACKS:
+            om2.MMessage.removeCallbacks(_CALLBACKS)
+            del _CALLBACKS[:]
+        return False
+
+
+def stop_watching() -> None:
+    """Remove the DG callbacks; the next diff_solvers() is a full rebuild."""
+    global _rescan, _full
+    if _CALLBACKS:
+        try:
+            om2.MMessage.removeCallbacks(_CALLBACKS)
+        except RuntimeError:
+            pass
+        del _CALLBACKS[:]
+    _rescan = _full = True
+
+
+def diff_solvers(force: bool = False) -> SolverDiff:
+    """
+    Compare the scene against the previous call.
+
+    discover_all only runs when a solver may have been added, removed or
+    renamed; otherwise the previous list is reused and only the solvers
+    touched by a DG callback come back dirty. Callers must rebuild every
+    dirty solver with build_solver_item (which refreshes the bookkeeping).
+
+    Parameters
+    ----------
+    force   ignore the tracked changes and report a full rebuild.
+
+    Usage in SimTreePanel
+    ---------------------
+        diff = diff_solvers()
+        if diff.full:
+            ...rebuild every row in diff.solvers...
+        else:
+            ...drop diff.removed rows, rebuild diff.dirty rows...
+    """
+    global _solvers, _rescan, _full
+
+    full = force or _full or not _watch_scene()
+    if full or _rescan:
+        solvers = [s for nodes in discover_all().values() for s in nodes]
+    else:
+        solvers = list(_solvers)
+
+    previous = set(_solvers)
+    current = set(solvers)
+    removed = previous - current
+    for solver in removed:
+        _forget_solver(solver)
+
+    if full:
+        dirty = set(current)
+        _members.clear()
+        _owner.clear()
+        _system_of.clear()
+    else:
+        dirty = (_dirty & current) | (current - previous)
+
+    _solvers = solvers
+    _dirty.clear()
+    _rescan = _full = False
+    return SolverDiff(solvers, dirty, removed, full)
@@ -227,8 +227,13 @@ class CacheTreeWidget(DynEvalWidget):
 
             caches = dyn_item.get_cache_list()
 
+            # One metadata / attachment lookup per refresh, not per version
+            validity = self._cache_validity(dyn_item)
+            attached = self._attached_caches(dyn_item)
+
             for cache_name in caches:
-                cache_info = self._create_cache_info(dyn_item, cache_name, cache_type)
+                cache_info = self._create_cache_info(dyn_item, cache_name, cache_type,
+                                                     validity, attached)
                 if cache_info:
                     cache_items.append(CacheItem(cache_info))
 
@@ -245,8 +250,10 @@ class CacheTreeWidget(DynEvalWidget):
             return CacheType.ALEMBIC
         return None
 
-    def _create_cache_info(self, dyn_item, cache_name: str, cache_type: CacheType) -> Optional[CacheInfo]:
-        """Create cache info object."""
+    def _create_cache_info(self, dyn_item, cache_name: str, cache_type: CacheType,
+                           validity: Optional[Dict[str, bool]] = None,
+                           attached: Optional[frozenset] = None) -> Optional[CacheInfo]:
+        """Create cache info object (validity / attached looked up when not given)."""
         try:
             # Get cache path
             cache_dir = Path(dyn_item.cache_dir())
@@ -258,8 +265,14 @@ class CacheTreeWidget(DynEvalWidget):
             version = int(version_match.group(1)) if version_match else 0
 
             # Check validity and attachment
-            is_valid = self._check_cache_validity(dyn_item, cache_name)
-            is_attached = self._check_cache_attachment(dyn_item, cache_name)
+            if validity is None:
+                is_valid = self._check_cache_validity(dyn_item, cache_name)
+            else:
+                is_valid = validity.get(cache_name, True)
+            if attached is None:
+                is_attached = self._check_cache_attachment(dyn_item, cache_name)
+            else:
+                is_attached = cache_name in attached
 
             return CacheInfo(
                 name=cache_name,
@@ -276,33 +289,35 @@ class CacheTreeWidget(DynEvalWidget):
             logger.error(f"Failed to create cache info for {cache_name}: {e}")
             return None
 
-    def _check_cache_validity(self, dyn_item, cache_name: str) -> bool:
-        """Check if cache is valid based on metadata."""
+    def _cache_validity(self, dyn_item) -> Dict[str, bool]:
+        """Metadata 'isvalid' map of the item ({} = every cache valid)."""
         try:
             if not hasattr(dyn_item, 'metadata'):
-                return True  # Assume valid if no metadata method
-
-            metadata_path = Path(dyn_item.metadata())
-            if not metadata_path.exists():
-                return True  # Assume valid if no metadata file
+                return {}  # Assume valid if no metadata method
 
-            from dw_maya.dw_presets_io import dw_json
-            metadata = dw_json.load_json(str(metadata_path))
-
-            return metadata.get('isvalid', {}).get(cache_name, True)
+            from ..sim_cmds import cache_catalog
+            return cache_catalog.cache_validity(dyn_item.metadata())
 
         except Exception as e:
             logger.warning(f"Failed to check cache validity: {e}")
-            return True
+            return {}
 
-    def _check_cache_attachment(self, dyn_item, cache_name: str) -> bool:
-        """Check if cache is currently attached."""
+    def _attached_caches(self, dyn_item) -> frozenset:
+        """Names of the caches currently attached to the item's node."""
         try:
-            from ..sim_cmds import cache_management
-            return cache_management.cache_is_attached(dyn_item.node, cache_name)
+            from ..sim_cmds import cache_catalog
+            return cache_catalog.attached_caches(dyn_item.node)
         except Exception as e:
             logger.warning(f"Failed to check cache attachment: {e}")
-            return False
+            return frozenset()
+
+    def _check_cache_validity(self, dyn_item, cache_name: str) -> bool:
+        """Check if cache is valid based on metadata."""
+        return self._cache_validity(dyn_item).get(cache_name, True)
+
+    def _check_cache_attachment(self, dyn_item, cache_name: str) -> bool:
+        """Check if cache is currently attached."""
+        return cache_name in self._attached_caches(dyn_item)
 
     # ========================================================================
     # SELECTION HANDLING
@@ -508,6 +523,7 @@ class CacheTreeWidget(DynEvalWidget):
         )
 
         if reply == QtWidgets.QMessageBox.Yes:
+            from ..sim_cmds import cache_catalog
             for cache_info in selected:
                 try:
                     # Delete all files matching the cache name
@@ -516,6 +532,7 @@ class CacheTreeWidget(DynEvalWidget):
 
                     for f in cache_dir.glob(f"{base_name}.*"):
                         f.unlink()
+                    cache_catalog.invalidate(cache_dir)
 
                 except Exception as e:
                     logger.error(f"Failed to delete {cache_info.name}: {e}")
@@ -567,13 +567,29 @@ class VertexMapEditor(DynEvalWidget):
         self._smooth_flood(iterations)
 
     def _smooth_flood(self, iterations: int):
-        """Apply smooth operation."""
-        from ..sim_cmds.vtx_map_management import smooth_pervtx_map
+        """Apply smooth operation (headless on the selected vertices, or the whole map)."""
+        from ..sim_cmds.vtx_map_management import smooth_pervtx_map, smooth_vtx_map
 
         logger.debug(f"Smooth flood: {iterations} iterations")
-        smooth_pervtx_map(iterations)
+        nucx, map_name, mesh = self.get_combo_data()
+        if nucx and map_name and mesh and cmds.nodeType(nucx) in ('nCloth', 'nRigid'):
+            try:
+                smooth_vtx_map(nucx, f"{map_name}PerVertex", iterations,
+                               vertex_ids=self._selected_vertex_ids(mesh), mesh=mesh)
+            except Exception as e:
+                logger.error(f"Smooth failed on {nucx}.{map_name}PerVertex: {e}")
+        else:
+            smooth_pervtx_map(iterations)
         self.smoothRequested.emit(iterations)
 
+    @staticmethod
+    def _selected_vertex_ids(mesh: str):
+        """Selected vertex ids of mesh, None when none are selected (whole map)."""
+        from dw_maya.dw_maya_utils.dw_component_set import ComponentSet, shape_key
+
+        ids = ComponentSet.from_selection('vtx').indices(shape_key(mesh))
+        return ids if ids.size else None
+
     # ========================================================================
     # SELECTION OPERATIONS
     # ========================================================================
@@ -653,7 +669,7 @@ class VertexMapEditor(DynEvalWidget):
 
     def _recall_weights(self):
         """Recall stored weights with blend."""
-        from ..sim_cmds.vtx_map_management import set_vtx_map_data
+        from ..sim_cmds.vtx_map_management import set_vtx_map_data, blend_values
         from ..sim_cmds import get_vtx_map_data
 
         if not hasattr(self, '_stored_weights') or not self._stored_weights:
@@ -673,10 +689,7 @@ class VertexMapEditor(DynEvalWidget):
             # Blend with current
             current = get_vtx_map_data(nucx, f"{map_name}PerVertex")
             if current and len(current) == len(self._stored_weights):
-                blended = [
-                    c * (1 - blend) + s * blend
-                    for c, s in zip(current, self._stored_weights)
-                ]
+                blended = blend_values(current, self._stored_weights, blend)
                 set_vtx_map_data(nucx, f"{map_name}PerVertex", blended)
 
         logger.info(f"Recalled weights at {blend * 100}% blend")
@@ -234,4 +234,7 @@ register(SimSystem(
     get_children   = _get_nucleus_children,
     cache_ops      = NucleusCacheOps,
     get_links      = _get_rigid_links,
+    # _get_rigid_links walks constraints scene-wide: rewiring one can move
+    # a rigid under any solver's cloth.
+    link_node_types = ['dynamicConstraint', 'nComponent'],
 ))
\ No newline at end of file
@@ -11,14 +11,20 @@ A "gizmo" is a plain poly primitive transform used purely as a volume:
     capsule  polyCylinder r=1 h=2 cap   -> radius 1, body y in [-1, 1]
 The artist moves / rotates / scales it; point-in-volume tests run in the
 gizmo's local space (via its world-inverse matrix), so scale is respected.
+
+Volume tests run on numpy point arrays, optionally with a soft falloff band
+outside the volume. Per-mesh skin weights are cached as (verts, influences)
+arrays - invalidated when the skinCluster changes - so re-ranking while the
+gizmo is dragged (watch_gizmo) never re-reads the skinCluster.
 """
 
 from __future__ import annotations
 
 import json
 import math
-from typing import Optional
+from typing import Callable, Dict, Optional, Tuple
 
+import numpy as np
 import maya.cmds as cmds
 import maya.api.OpenMaya as om2
 import maya.api.OpenMayaAnim as oma2
@@ -100,92 +106,217 @@ def create_gizmo(shape:  str = "box",
     return node
 
 
-def _point_in_shape(p:     om2.MPoint,
-                    shape: str,) -> bool:
-    """Point-in-volume test in the gizmo's local space."""
+def _shape_distance(local: np.ndarray,
+                    shape: str,) -> np.ndarray:
+    """
+    Normalized distance of (N, 3) gizmo-local points to the volume: <= 1 inside,
+    1 on the surface, growing outward (radius units, half-extents for the box).
+    """
     if shape == "sphere":
-        return (p.x * p.x + p.y * p.y + p.z * p.z) <= 1.0
+        return np.linalg.norm(local, axis=1)
     if shape == "capsule":
-        cy = max(-1.0, min(1.0, p.y))   # nearest point on the local Y axis segment
-        dx, dy, dz = p.x, p.y - cy, p.z
-        return (dx * dx + dy * dy + dz * dz) <= 1.0
-    return abs(p.x) <= 0.5 and abs(p.y) <= 0.5 and abs(p.z) <= 0.5   # box
+        offset = local.copy()
+        offset[:, 1] -= np.clip(local[:, 1], -1.0, 1.0)   # nearest point on the Y axis segment
+        return np.linalg.norm(offset, axis=1)
+    return np.abs(local).max(axis=1) / 0.5   # box
 
 
-def vertices_in_gizmo(mesh:  str,
-                      gizmo: str,
-                      shape: str,) -> list:
-    """Return the indices of `mesh` vertices that fall inside `gizmo`."""
+def _smoothstep(t: np.ndarray) -> np.ndarray:
+    return t * t * (3.0 - 2.0 * t)
+
+
+def _gizmo_local_points(mesh:  str,
+                        gizmo: str,) -> np.ndarray:
+    """(N, 3) world points of `mesh` expressed in the gizmo's local space."""
     sel = om2.MSelectionList()
     sel.add(gizmo)
-    world_inv = sel.getDagPath(0).inclusiveMatrixInverse()
+    world_inv = np.array(list(sel.getDagPath(0).inclusiveMatrixInverse())).reshape(4, 4)
 
     sel2 = om2.MSelectionList()
     sel2.add(mesh)
     mesh_dag = sel2.getDagPath(0)
     mesh_dag.extendToShape()
-    points = om2.MFnMesh(mesh_dag).getPoints(om2.MSpace.kWorld)
+    points = np.array(om2.MFnMesh(mesh_dag).getPoints(om2.MSpace.kWorld),
+                      dtype=np.float64).reshape(-1, 4)
+    # row vectors, like MPoint * MMatrix
+    return (points @ world_inv)[:, :3]
+
+
+def gizmo_weights(mesh:     str,
+                  gizmo:    str,
+                  shape:    str,
+                  softness: float = 0.0,
+                  falloff:  Optional[Callable[[np.ndarray], np.ndarray]] = None,) -> np.ndarray:
+    """
+    Per-vertex membership of `mesh` in `gizmo`, as a float array in [0, 1].
+
+    Vertices inside the volume weigh 1. With `softness` > 0, vertices up to
+    `softness` (in normalized distance: radii, half-extents) outside it fade
+    out through `falloff`, a vectorized curve mapping 0 (surface) .. 1 (outer
+    edge of the band) to 1 .. 0 (default: smoothstep).
+    """
+    dist = _shape_distance(_gizmo_local_points(mesh, gizmo), shape.lower())
+    weights = (dist <= 1.0).astype(np.float64)
+    if softness > 0.0:
+        band = (dist > 1.0) & (dist < 1.0 + softness)
+        t = (dist[band] - 1.0) / softness
+        weights[band] = np.clip(falloff(t) if falloff else 1.0 - _smoothstep(t), 0.0, 1.0)
+    return weights
 
-    shape = shape.lower()
-    return [i for i, p in enumerate(points)
-            if _point_in_shape(p * world_inv, shape)]
+
+def vertices_in_gizmo(mesh:  str,
+                      gizmo: str,
+                      shape: str,) -> list:
+    """Return the indices of `mesh` vertices that fall inside `gizmo`."""
+    dist = _shape_distance(_gizmo_local_points(mesh, gizmo), shape.lower())
+    return np.flatnonzero(dist <= 1.0).tolist()
+
+
+def watch_gizmo(gizmo:    str,
+                callback: Callable[[], None],) -> int:
+    """
+    Call `callback()` whenever `gizmo` moves (world matrix change, including
+    while dragging). Returns the callback id for unwatch_gizmo.
+    """
+    sel = om2.MSelectionList()
+    sel.add(gizmo)
+    return om2.MDagMessage.addWorldMatrixModifiedCallback(
+        sel.getDagPath(0), lambda *args: callback())
+
+
+def unwatch_gizmo(callback_id: int) -> None:
+    """Remove a callback registered by watch_gizmo."""
+    try:
+        om2.MMessage.removeCallback(callback_id)
+    except RuntimeError:
+        pass   # node already deleted
 
 
 # ----------------------------------------------------------------------------
-# Participation
+# Weight cache
 # ----------------------------------------------------------------------------
 
-def _influence_totals(skin:     str,
-                      mesh:     str,
-                      vert_ids: list,):
-    """Return (per-influence summed weight over vert_ids, influence names)."""
+# (skin, mesh shape path) -> ((verts, influences) weights, influence names)
+_WEIGHT_CACHE: Dict[Tuple[str, str], Tuple[np.ndarray, list]] = {}
+# skin -> attribute-changed callback id invalidating its entries
+_SKIN_CALLBACKS: Dict[str, int] = {}
+_SCENE_CALLBACKS: list = []
+
+_SKIN_DIRTY_MSG = (om2.MNodeMessage.kAttributeSet
+                   | om2.MNodeMessage.kConnectionMade
+                   | om2.MNodeMessage.kConnectionBroken
+                   | om2.MNodeMessage.kAttributeArrayAdded
+                   | om2.MNodeMessage.kAttributeArrayRemoved)
+
+
+def clear_weight_cache(skin: Optional[str] = None) -> None:
+    """Drop cached weights of `skin`, or of every skinCluster when None."""
+    for key in [k for k in _WEIGHT_CACHE if skin is None or k[0] == skin]:
+        del _WEIGHT_CACHE[key]
+    if skin is None:
+        if _SKIN_CALLBACKS:
+            om2.MMessage.removeCallbacks(list(_SKIN_CALLBACKS.values()))
+            _SKIN_CALLBACKS.clear()
+
+
+def _on_skin_changed(msg, plug, other_plug, skin) -> None:
+    if msg & _SKIN_DIRTY_MSG:
+        clear_weight_cache(skin)
+
+
+def _watch_skin(skin: str, skin_obj: om2.MObject) -> None:
+    """Invalidate `skin`'s cache entries on any edit (weights, influences)."""
+    if skin in _SKIN_CALLBACKS:
+        return
+    try:
+        _SKIN_CALLBACKS[skin] = om2.MNodeMessage.addAttributeChangedCallback(
+            skin_obj, _on_skin_changed, skin)
+        if not _SCENE_CALLBACKS:
+            _SCENE_CALLBACKS.extend([
+                om2.MSceneMessage.addCallback(om2.MSceneMessage.kBeforeNew,
+                                              lambda *args: clear_weight_cache()),
+                om2.MSceneMessage.addCallback(om2.MSceneMessage.kBeforeOpen,
+                                              lambda *args: clear_weight_cache()),
+            ])
+    except RuntimeError:
+        pass   # no callbacks (batch): entries still cleared by the write helpers
+
+
+def mesh_weights(skin: str,
+                 mesh: str,) -> Tuple[np.ndarray, list]:
+    """
+    Return ((verts, influences) weight array, influence names) of `mesh`,
+    read once from `skin` and cached until the skinCluster changes.
+    """
     sel = om2.MSelectionList()
     sel.add(skin)
-    skin_fn = oma2.MFnSkinCluster(sel.getDependNode(0))
-
-    sel2 = om2.MSelectionList()
-    sel2.add(mesh)
-    mesh_dag = sel2.getDagPath(0)
+    sel.add(mesh)
+    skin_obj = sel.getDependNode(0)
+    mesh_dag = sel.getDagPath(1)
     mesh_dag.extendToShape()
 
+    key = (skin, mesh_dag.fullPathName())
+    n_verts = om2.MFnMesh(mesh_dag).numVertices
+    cached = _WEIGHT_CACHE.get(key)
+    if cached is not None and cached[0].shape[0] == n_verts:
+        return cached
+
+    skin_fn = oma2.MFnSkinCluster(skin_obj)
     comp_fn = om2.MFnSingleIndexedComponent()
     comp = comp_fn.create(om2.MFn.kMeshVertComponent)
-    comp_fn.addElements(vert_ids)
-
+    comp_fn.setCompleteData(n_verts)
     weights, n_inf = skin_fn.getWeights(mesh_dag, comp)
     names = [d.partialPathName() for d in skin_fn.influenceObjects()]
 
-    totals = [0.0] * n_inf
-    for v in range(len(vert_ids)):
-        base = v * n_inf
-        for j in range(n_inf):
-            totals[j] += weights[base + j]
+    entry = (np.array(weights, dtype=np.float64).reshape(n_verts, n_inf), names)
+    _watch_skin(skin, skin_obj)
+    _WEIGHT_CACHE[key] = entry
+    return entry
+
+
+# ----------------------------------------------------------------------------
+# Participation
+# ----------------------------------------------------------------------------
+
+def _influence_totals(skin:     str,
+                      mesh:     str,
+                      vert_ids,
+                      falloff:  Optional[np.ndarray] = None,):
+    """
+    Return (per-influence summed weight over vert_ids, influence names).
+    `falloff`, aligned with vert_ids, scales each vertex's contribution.
+    """
+    weights, names = mesh_weights(skin, mesh)
+    rows = weights[np.asarray(vert_ids, dtype=np.int64)]
+    totals = rows.sum(axis=0) if falloff is None else falloff @ rows
     return totals, names
 
 
-def analyze_participation(skin:   str,
-                          meshes: list,
-                          gizmo:  str,
-                          shape:  str,) -> list:
+def analyze_participation(skin:     str,
+                          meshes:   list,
+                          gizmo:    str,
+                          shape:    str,
+                          softness: float = 0.0,) -> list:
     """
     Rank the skinCluster influences by their participation (% of total weight)
     over every vertex of `meshes` inside `gizmo`. Returns [(influence, pct)]
-    sorted high -> low, dropping zero contributors.
+    sorted high -> low, dropping zero contributors. With `softness` > 0,
+    vertices in the falloff band around the gizmo count partially.
     """
     totals: dict = {}
-    grand = 0.0
     for mesh in meshes:
         if not cmds.objExists(mesh):
             continue
-        vert_ids = vertices_in_gizmo(mesh, gizmo, shape)
-        if not vert_ids:
+        member = gizmo_weights(mesh, gizmo, shape, softness)
+        vert_ids = np.flatnonzero(member)
+        if not vert_ids.size:
             continue
-        infl_totals, names = _influence_totals(skin, mesh, vert_ids)
-        for name, total in zip(names, infl_totals):
+        infl_totals, names = _influence_totals(skin, mesh, vert_ids,
+                                               member[vert_ids] if softness > 0.0 else None)
+        for name, total in zip(names, infl_totals.tolist()):
             totals[name] = totals.get(name, 0.0) + total
-            grand += total
 
-    grand = grand or 1.0
+    grand = sum(totals.values()) or 1.0
     ranked = [(name, 100.0 * total / grand)
               for name, total in totals.items() if total > 1e-9]
     ranked.sort(key=lambda item: item[1], reverse=True)
@@ -330,6 +461,7 @@ def restore_skin(skin: str) -> None:
             cmds.setAttr(f"{skin}.{attr}", value)
         except Exception:
             pass
+    clear_weight_cache(skin)
     logger.info(f"DynForge: restored {skin!r} from backup.")
 
 
@@ -453,5 +585,6 @@ def install_chain(skin:             str,
 
         skin_fn.setWeights(mdag, comp, logical, weights, False)
 
+    clear_weight_cache(skin)
     logger.info(f"DynForge: installed chain on {skin!r} - {edited} vert(s) transferred.")
     return edited
\ No newline at end of file
@@ -433,6 +433,8 @@ class DynForgeUI(DynForgeMainWindow):
 
     def closeEvent(self, event):
         self._save_defaults()
+        # Child panels get no closeEvent of their own when the window closes
+        self.skin_panel.cleanup()
         super().closeEvent(event)
 
 
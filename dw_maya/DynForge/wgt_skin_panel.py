@@ -5,13 +5,16 @@ Per the selected guide: register its skinCluster, drop a region gizmo on the
 _PIN joint, and rank the current influences by participation inside the gizmo.
 Nothing writes weights here - that happens on Install (later phase). The picked
 donor influences, parent bone and falloff power are stored on the guide.
+With "Live" on, the ranking refreshes while the gizmo is dragged (weights come
+from the skin_ops cache, so only the volume test reruns).
 """
 
 from __future__ import annotations
 
 from functools import partial
 
-from dw_maya.DynForge.forge_cmds.compat import QtWidgets, Qt
+from dw_maya.DynForge.forge_cmds import skin_ops
+from dw_maya.DynForge.forge_cmds.compat import QtCore, QtWidgets, Qt
 from dw_maya.DynForge.wgt_base import DynForgeWidgetBase
 from dw_logger import get_logger
 
@@ -20,6 +23,7 @@ logger = get_logger()
 
 _SHAPES = ("Box", "Sphere", "Capsule")
 _INFL_ROLE = Qt.UserRole + 1
+_LIVE_DELAY_MS = 30   # coalesces the burst of matrix callbacks of one drag step
 
 
 class SkinPanel(DynForgeWidgetBase):
@@ -30,6 +34,10 @@ class SkinPanel(DynForgeWidgetBase):
                  parent=None,) -> None:
         super().__init__(hub, parent)
         self._guide = None
+        self._gizmo_cb = None
+        self._live_timer = QtCore.QTimer(self)
+        self._live_timer.setSingleShot(True)
+        self._live_timer.setInterval(_LIVE_DELAY_MS)
         self._build_ui()
 
     # -- UI ---------------------------------------------------------------
@@ -75,8 +83,13 @@ class SkinPanel(DynForgeWidgetBase):
         # Participation
         part_box = QtWidgets.QGroupBox("Influence participation (inside gizmo)")
         part_layout = QtWidgets.QVBoxLayout(part_box)
+        analyze_row = QtWidgets.QHBoxLayout()
         self._analyze_btn = QtWidgets.QPushButton("Analyze")
-        part_layout.addWidget(self._analyze_btn)
+        analyze_row.addWidget(self._analyze_btn, stretch=1)
+        self._live_check = QtWidgets.QCheckBox("Live")
+        self._live_check.setToolTip("Re-rank while the gizmo is moved.")
+        analyze_row.addWidget(self._live_check)
+        part_layout.addLayout(analyze_row)
 
         self._tree = QtWidgets.QTreeWidget()
         self._tree.setColumnCount(2)
@@ -127,6 +140,8 @@ class SkinPanel(DynForgeWidgetBase):
         self._gizmo_btn.clicked.connect(self._on_create_gizmo)
         self._shape_combo.currentIndexChanged.connect(self._on_shape_changed)
         self._analyze_btn.clicked.connect(self._on_analyze)
+        self._live_check.toggled.connect(self._on_live_toggled)
+        self._live_timer.timeout.connect(self._on_live_refresh)
         self._tree.itemClicked.connect(self._on_row_clicked)
         self._tree.itemSelectionChanged.connect(self._on_selection_changed)
         self._parent_btn.clicked.connect(self._on_pick_parent)
@@ -142,6 +157,7 @@ class SkinPanel(DynForgeWidgetBase):
                    guide,) -> None:
         """Show the panel for `guide`, or the placeholder when None."""
         self._guide = None   # mute handlers while populating
+        self._live_check.setChecked(False)
         if guide is None:
             self._tree.clear()
             self._stack.setCurrentIndex(0)
@@ -206,6 +222,9 @@ class SkinPanel(DynForgeWidgetBase):
             self._guide.make_gizmo(self._shape_combo.currentText().lower())
         except Exception as e:
             self._warn(f"Create gizmo failed:\n{e}")
+            return
+        if self._live_check.isChecked():
+            self._watch_gizmo()   # the old gizmo (and its callback) is gone
 
     def _on_analyze(self) -> None:
         if self._guide is None:
@@ -215,13 +234,62 @@ class SkinPanel(DynForgeWidgetBase):
         except Exception as e:
             self._warn(f"Analyze failed:\n{e}")
             return
+        self._fill_ranking(ranked)
+        if not ranked:
+            self._warn("No influences found inside the gizmo.")
+
+    def _fill_ranking(self,
+                      ranked: list,) -> None:
+        """Show `ranked`, keeping the donor selection across refreshes."""
+        selected = {it.data(0, _INFL_ROLE) for it in self._tree.selectedItems()}
+        guide, self._guide = self._guide, None   # mute selection handler
         self._tree.clear()
         for name, pct in ranked:
             item = QtWidgets.QTreeWidgetItem([name.split("|")[-1], f"{pct:.1f}"])
             item.setData(0, _INFL_ROLE, name)
             self._tree.addTopLevelItem(item)
-        if not ranked:
-            self._warn("No influences found inside the gizmo.")
+            item.setSelected(name in selected)
+        self._guide = guide
+
+    # -- Live ranking -------------------------------------------------------
+
+    def _watch_gizmo(self) -> None:
+        self._unwatch_gizmo()
+        gizmo = getattr(self._guide, "gizmo", None)
+        if gizmo:
+            try:
+                self._gizmo_cb = skin_ops.watch_gizmo(gizmo, self._live_timer.start)
+            except Exception as e:
+                logger.warning(f"DynForge: cannot watch gizmo {gizmo!r}: {e}")
+        self._live_timer.start()
+
+    def _unwatch_gizmo(self) -> None:
+        self._live_timer.stop()
+        if self._gizmo_cb is not None:
+            skin_ops.unwatch_gizmo(self._gizmo_cb)
+            self._gizmo_cb = None
+
+    def cleanup(self) -> None:
+        """Drop the gizmo callback too: it would outlive a closed window."""
+        self._unwatch_gizmo()
+        super().cleanup()
+
+    def _on_live_toggled(self,
+                         checked: bool,) -> None:
+        if checked and self._guide is not None:
+            self._watch_gizmo()
+        else:
+            self._unwatch_gizmo()
+
+    def _on_live_refresh(self) -> None:
+        if self._guide is None:
+            return
+        try:
+            ranked = self._guide.analyze()
+        except Exception as e:
+            logger.debug(f"DynForge: live analyze skipped: {e}")
+            return
+        self._fill_ranking(ranked)
 
     def _on_row_clicked(self,
                         item,
@@ -2,7 +2,12 @@ import sys
 import maya.cmds as cmds
 from functools import partial
 import maya.OpenMaya as om
+import maya.api.OpenMaya as om2
+import maya.api.OpenMayaAnim as oma
 import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 import dw_maya.dw_maya_utils as dwu
 
@@ -231,20 +236,10 @@ def delete_keys_on_vtx(mesh: str, *args):
     Raises:
         RuntimeError: If the mesh is invalid or if no animation keys are found.
     """
-    if not cmds.objExists(mesh):
-        raise RuntimeError(f"The specified mesh '{mesh}' does not exist.")
-
-    if cmds.nodeType(mesh) != 'mesh':
-        raise RuntimeError(f"The specified object '{mesh}' is not a valid mesh.")
-
-    # Get all vertex components of the mesh
-    vertex_components = cmds.ls(f"{mesh}.pnts[:]", flatten=True)
-
-    # Build a list of .pntx, .pnty, .pntz attributes for all vertices
-    vertex_attributes = [f"{vtx}.pnt{x}" for vtx in vertex_components for x in "xyz"]
-
-    # Find all connected animation curve nodes
-    anim_curve_nodes = cmds.listConnections(vertex_attributes, type="animCurve")
+    # Find all connected animation curve nodes (shape pnts and tweak node)
+    index = build_keyed_index(mesh)
+    anim_curve_nodes = sorted({om2.MFnDependencyNode(curve).name()
+                               for pairs in index.curves.values() for curve, _ in pairs})
 
     if not anim_curve_nodes:
         cmds.warning(f"No animation keys found on the vertices of '{mesh}'.")
@@ -255,12 +250,202 @@ def delete_keys_on_vtx(mesh: str, *args):
 
     # Notify the user (optional: play an audio file if process is slow)
     cmds.inViewMessage(
-        message=f"Animation keys deleted for {len(vertex_components)} vertices on '{mesh}'.",
+        message=f"Animation keys deleted for {index.keyed.size} vertices on '{mesh}'.",
         position='midCenter',
         fade=True
     )
 
 
+# ---------------------------------------------------------------------------
+# Keyed-vertex index
+# ---------------------------------------------------------------------------
+
+class KeyedVertexIndex:
+    """
+    Tweaked and keyed vertices of one mesh, read in bulk.
+
+    Tweaks are the ``pnts`` offsets of the shape plus the ``vlist`` offsets of
+    the tweak node feeding it (when the mesh has history). Keyed vertices are
+    the ones with an anim curve on one of those offsets.
+
+    Attributes:
+        mesh: Shape name.
+        tweaked: Sorted vertex ids with a non-zero offset.
+        keyed: Sorted vertex ids with at least one anim curve.
+        curves: Vertex id -> [(anim curve MObject, keyed MPlug), ...].
+    """
+
+    def __init__(self, mesh: str, tweaked: np.ndarray,
+                 curves: Dict[int, List[Tuple[om2.MObject, om2.MPlug]]]):
+        self.mesh = mesh
+        self.tweaked = tweaked
+        self.curves = curves
+        self.keyed = np.array(sorted(curves), dtype=np.int64)
+
+    def fully_keyed(self) -> np.ndarray:
+        """Vertex ids with a curve on all three axes."""
+        return np.array(sorted(vid for vid, pairs in self.curves.items() if len(pairs) >= 3),
+                        dtype=np.int64)
+
+    def __repr__(self):
+        return f"KeyedVertexIndex('{self.mesh}', tweaked={self.tweaked.size}, keyed={self.keyed.size})"
+
+
+def _check_mesh(mesh: str) -> None:
+    if not cmds.objExists(mesh):
+        raise RuntimeError(f"The specified mesh '{mesh}' does not exist.")
+
+    if cmds.nodeType(mesh) != 'mesh':
+        raise RuntimeError(f"The specified object '{mesh}' is not a valid mesh.")
+
+
+def _depend_node(node: str) -> om2.MObject:
+    sel = om2.MSelectionList()
+    sel.add(node)
+    return sel.getDependNode(0)
+
+
+def _tweak_list(mesh: str) -> Optional[str]:
+    """Tweak node list feeding the mesh ('tweak1.vlist[0]'), or None without history."""
+    plugs = cmds.listConnections(f"{mesh}.tweakLocation", s=True, d=False, plugs=True) or []
+    return plugs[0].rsplit('.', 1)[0] if plugs else None
+
+
+def _read_offsets(array_attr: str, count: int) -> np.ndarray:
+    """(count, 3) values of a float3 multi, read with one ranged getAttr."""
+    offsets = np.zeros((count, 3), dtype=np.float64)
+    indices = cmds.getAttr(array_attr, multiIndices=True) or []
+    if not indices or not count:
+        return offsets
+    indices = np.asarray(indices, dtype=np.int64)
+    indices = indices[indices < count]
+    if not indices.size:
+        return offsets
+    # A ranged getAttr returns the existing elements only, in index order:
+    # scatter them back onto their ids (the multi may be sparse).
+    last = int(indices.max())
+    values = np.asarray(cmds.getAttr(f"{array_attr}[0:{last}]"), dtype=np.float64).reshape(-1, 3)
+    if len(values) == len(indices):
+        offsets[np.sort(indices)] = values
+    else:
+        for i in indices:
+            offsets[i] = cmds.getAttr(f"{array_attr}[{i}]")[0]
+    return offsets
+
+
+def _keyed_plugs(node: om2.MObject, element_attr: str,
+                 curves: Dict[int, List[Tuple[om2.MObject, om2.MPlug]]]) -> None:
+    """Collect anim-curve driven children of ``element_attr[i]`` into ``curves``."""
+    for plug in om2.MFnDependencyNode(node).getConnections():
+        if not plug.isDestination or not plug.isChild:
+            continue
+        element = plug.parent()
+        if not element.isElement or om2.MFnAttribute(element.attribute()).name != element_attr:
+            continue
+        source = plug.source().node()
+        if source.hasFn(om2.MFn.kAnimCurve):
+            curves.setdefault(element.logicalIndex(), []).append((source, plug))
+
+
+def build_keyed_index(mesh: str, tolerance: float = 0.0) -> KeyedVertexIndex:
+    """
+    Index the tweaked and keyed vertices of a mesh.
+
+    One ranged read of the tweak arrays and one connection sweep per node,
+    instead of a getAttr per ``pnts[i]`` and a listConnections per curve.
+
+    Args:
+        mesh (str): Mesh shape.
+        tolerance (float): Offsets at or below this are not tweaks.
+
+    Returns:
+        KeyedVertexIndex: Tweaked / keyed vertex ids and their anim curves.
+    """
+    _check_mesh(mesh)
+    count = cmds.polyEvaluate(mesh, vertex=True)
+    offsets = _read_offsets(f"{mesh}.pnts", count)
+    curves: Dict[int, List[Tuple[om2.MObject, om2.MPlug]]] = {}
+    _keyed_plugs(_depend_node(mesh), 'pnts', curves)
+
+    tweak = _tweak_list(mesh)
+    if tweak:
+        offsets += _read_offsets(f"{tweak}.vertex", count)
+        _keyed_plugs(_depend_node(tweak.split('.')[0]), 'vertex', curves)
+
+    tweaked = np.flatnonzero(np.abs(offsets).max(axis=1) > tolerance) if count else np.zeros(0, dtype=np.int64)
+    return KeyedVertexIndex(mesh, tweaked, curves)
+
+
+def _key_curves(pairs: Sequence[Tuple[om2.MObject, om2.MPlug]], key_time: om2.MTime) -> None:
+    """Key every curve at ``key_time`` with its plug's current value, as one undo step."""
+    from dw_maya.dw_decorators.dw_generic_undo import push_undo
+
+    fns = [oma.MFnAnimCurve(curve) for curve, _ in pairs]
+    # read every value before the first key dirties anything
+    values = [plug.asDouble() for _, plug in pairs]
+    previous = []
+    for fn in fns:
+        index = fn.find(key_time)
+        previous.append(None if index is None else fn.value(index))
+
+    def _redo():
+        for fn, value in zip(fns, values):
+            index = fn.find(key_time)
+            if index is None:
+                fn.addKey(key_time, value)
+            else:
+                fn.setValue(index, value)
+
+    def _undo():
+        for fn, value in zip(fns, previous):
+            index = fn.find(key_time)
+            if index is None:
+                continue
+            if value is None:
+                fn.remove(index)
+            else:
+                fn.setValue(index, value)
+
+    push_undo(_redo, _undo)
+
+
+def key_vertices(mesh: str, vertex_ids: Sequence[int],
+                 index: Optional[KeyedVertexIndex] = None) -> int:
+    """
+    Key the offsets of ``vertex_ids`` at the current time.
+
+    Vertices already keyed on all three axes get their keys straight through
+    MFnAnimCurve. The others go through one ranged ``setKeyframe``, which
+    creates their curves on the right plug (shape or tweak node).
+
+    Args:
+        mesh (str): Mesh shape.
+        vertex_ids: Vertex ids to key.
+        index (KeyedVertexIndex): Index of ``mesh``, built when omitted.
+
+    Returns:
+        int: Number of vertices keyed.
+    """
+    ids = np.unique(np.asarray(vertex_ids, dtype=np.int64))
+    if not ids.size:
+        return 0
+    if index is None:
+        index = build_keyed_index(mesh)
+
+    on_curves = np.isin(ids, index.fully_keyed())
+    cmds.undoInfo(openChunk=True)
+    try:
+        if on_curves.any():
+            pairs = [pair for vid in ids[on_curves].tolist() for pair in index.curves[vid]]
+            _key_curves(pairs, oma.MAnimControl.currentTime())
+        if not on_curves.all():
+            to_key = [f"{mesh}.pt[{rng}]" for rng in dwu.create_maya_ranges(ids[~on_curves].tolist())]
+            cmds.setKeyframe(to_key, attribute=['px', 'py', 'pz'])
+    finally:
+        cmds.undoInfo(closeChunk=True)
+    return int(ids.size)
+
+
 def set_key_on_already_keyed(mesh: str, *args):
     """
     Sets keys on vertices that already have animation curves connected.
@@ -272,48 +457,23 @@ def set_key_on_already_keyed(mesh: str, *args):
     Raises:
         RuntimeError: If the mesh does not exist or is not valid.
     """
-    if not cmds.objExists(mesh):
-        raise RuntimeError(f"The specified mesh '{mesh}' does not exist.")
-
-    if cmds.nodeType(mesh) != 'mesh':
-        raise RuntimeError(f"The specified object '{mesh}' is not a valid mesh.")
-
-    # Get transform and tweak node
-    mesh_transform = cmds.listRelatives(mesh, parent=True)[0]
-    tweak_node = cmds.listConnections(mesh, type='tweak')
+    _check_mesh(mesh)
 
     # Timing for performance measurements
     time_start = time.time()
 
-    # Collect vertices and ranges based on tweak or direct connections
-    if not tweak_node:
-        vertex_components = cmds.ls(f"{mesh}_pnts_*__pntx", flatten=True)
-        vtx_indices = [
-            int(vtx.split('_')[-3])
-            for vtx in vertex_components
-            if cmds.listConnections(vtx) == [mesh_transform]
-        ]
-    else:
-        vertex_components = cmds.ls("tweak*_vlist_*__xVertex", flatten=True)
-        anim_curves = cmds.listConnections(tweak_node, type='animCurve')
-        vtx_indices = [int(anim.split('_')[-3]) for anim in anim_curves][0::3]
-
-    # Optimize vertex ranges
-    vtx_ranges = dwu.create_maya_ranges(vtx_indices)
-
-    # Generate the list of vertex attributes to key
-    list_to_key = [f"{mesh}.pt[{index}]" for index in vtx_ranges]
+    index = build_keyed_index(mesh)
 
     connection_check_time = round(time.time() - time_start, 3)
 
     # Set keyframes for the positions
-    cmds.setKeyframe(list_to_key, attribute=['px', 'py', 'pz'])
+    keyed = key_vertices(mesh, index.keyed, index)
 
     time_elapsed = round(time.time() - time_start, 3)
 
     # Display timing and performance metrics
     message = (
-        f"Number of vertices keyed: {len(list_to_key)} // "
+        f"Number of vertices keyed: {keyed} // "
         f"Connection check time: {connection_check_time} sec // "
         f"Total time elapsed: {time_elapsed} sec"
     )
@@ -329,58 +489,44 @@ def set_key_on_point_with_value(mesh, *args):
     Sets keyframes on vertices of a mesh with non-zero coordinates.
 
     Args:
-        mesh (str): The name of the mesh whose vertices will be keyed.
+        mesh (str): The name of the mesh whose vertices will be keyed. A
+            component name ('meshShape.vtx[...]') restricts keying to the
+            selected vertices.
         *args: Additional arguments (not used).
 
     Raises:
         RuntimeError: If the mesh is invalid or does not exist.
     """
-    if not cmds.objExists(mesh):
-        raise RuntimeError(f"The specified mesh '{mesh}' does not exist.")
+    # Specific selection: restrict to the selected vertices of the mesh
+    selection = None
+    if '.' in mesh:
+        from dw_maya.dw_maya_utils.dw_component_set import shape_key
 
-    if cmds.nodeType(mesh) != 'mesh':
-        raise RuntimeError(f"The specified object '{mesh}' is not a valid mesh.")
+        mesh = mesh.split('.')[0]
+        # ComponentSet files single-shape meshes under their transform
+        selection = dwu.ComponentSet.from_selection('vtx').indices(shape_key(mesh))
 
-    # Get the transform and shape nodes
-    mesh_transform = cmds.listRelatives(mesh, parent=True)[0]
+    _check_mesh(mesh)
 
     # Timing for performance measurement
     time_start = time.time()
 
-    # Determine points to process
-    if '.' not in mesh:
-        # Full mesh: select all points
-        points = cmds.ls(f"{mesh}.pnts[:]", flatten=True)
-        selection = None
-    else:
-        # Specific selection
-        selection = cmds.ls(sl=True)
-        points = [sel.replace('vtx', 'pnts') for sel in selection]
-        points = cmds.ls(points, flatten=True)
-
     # Extract non-zero vertex values
-    non_zero_indices = []
-    for i, point in enumerate(points):
-        value = cmds.getAttr(point)
-        if value != (0, 0, 0):
-            non_zero_indices.append(i)
-
-    # Optimize vertex ranges
-    vtx_ranges = dwu.create_maya_ranges(non_zero_indices)
-
-    # Generate the list of vertex attributes to key
-    list_to_key = [f"{mesh}.pt[{index}]" for index in vtx_ranges]
+    index = build_keyed_index(mesh)
+    to_key = index.tweaked
+    if selection is not None:
+        to_key = np.intersect1d(to_key, selection, assume_unique=True)
 
     connection_check_time = round(time.time() - time_start, 3)
 
     # Set keyframes for the positions
-    cmds.setKeyframe(list_to_key, attribute=['px', 'py', 'pz'])
+    keyed = key_vertices(mesh, to_key, index)
 
     time_elapsed = round(time.time() - time_start, 3)
 
     # Display performance metrics
     message = (
-        f"Number of vertices keyed: {len(list_to_key)} // "
+        f"Number of vertices keyed: {keyed} // "
         f"Coord check time: {connection_check_time} sec // "
         f"Total time elapsed: {time_elapsed} sec"
     )
@@ -1,9 +1,172 @@
+"""
+Edge length visualization tool
+
+Measures every edge of a mesh, paints vertices by their longest edge and
+selects edges inside a length range - built to find degenerate / tiny edges
+on production meshes.
+
+The analysis is vectorized: one MFnMesh.getPoints, the cached edge -> vertex
+index array of dw_component_set, numpy lengths / percentiles / histogram,
+and one MFnMesh.setVertexColors call for the whole mesh.
+
+Functions:
+    edge_lengths       : (edges (E, 2), lengths (E,)) of a mesh.
+    vertex_max_lengths : Longest connected edge per vertex.
+    percentile_range   : Length thresholds from percentiles.
+    edges_in_range     : Edge ids whose length lies in [low, high].
+    length_histogram   : Counts and bin edges of the edge lengths.
+    ramp_colors        : Red ramp colors for per-vertex values.
+    apply_vertex_colors: Write per-vertex colors into a color set at once.
+
+Example:
+    >>> edges, lengths = edge_lengths("pSphere1")
+    >>> low, high = percentile_range(lengths, 0, 1)      # shortest 1%
+    >>> select_edges("pSphere1", edges_in_range(lengths, low, high))
+
+Author: DrWeeny
+"""
+
+from typing import Sequence, Tuple
+
+import numpy as np
 import maya.cmds as cmds
 import maya.api.OpenMaya as om
 from PySide6 import QtWidgets, QtCore, QtGui
 import maya.OpenMayaUI as omui
 from shiboken6 import wrapInstance
 
+from dw_maya.dw_maya_utils.dw_component_set import ComponentSet, edge_vertices
+
+COLOR_SET = "edgeLength"
+
+
+# ---------------------------------------------------------------------------
+# Analysis (headless)
+# ---------------------------------------------------------------------------
+
+def _mesh_fn(mesh: str) -> om.MFnMesh:
+    sel = om.MSelectionList()
+    sel.add(mesh)
+    return om.MFnMesh(sel.getDagPath(0))
+
+
+def edge_lengths(mesh: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the (E, 2) edge -> vertex ids and the (E,) object-space edge lengths."""
+    points = np.array(_mesh_fn(mesh).getPoints(om.MSpace.kObject), dtype=np.float64).reshape(-1, 4)[:, :3]
+    edges = edge_vertices(mesh)
+    lengths = np.linalg.norm(points[edges[:, 1]] - points[edges[:, 0]], axis=1)
+    return edges, lengths
+
+
+def vertex_max_lengths(edges: np.ndarray, lengths: np.ndarray, vertex_count: int) -> np.ndarray:
+    """Longest connected edge per vertex (0.0 for isolated vertices)."""
+    result = np.zeros(vertex_count, dtype=np.float64)
+    np.maximum.at(result, edges[:, 0], lengths)
+    np.maximum.at(result, edges[:, 1], lengths)
+    return result
+
+
+def percentile_range(lengths: np.ndarray, low: float = 0.0, high: float = 100.0) -> Tuple[float, float]:
+    """Length thresholds matching the ``low`` / ``high`` percentiles."""
+    if not lengths.size:
+        return 0.0, 0.0
+    low_value, high_value = np.percentile(lengths, [low, high])
+    return float(low_value), float(high_value)
+
+
+def edges_in_range(lengths: np.ndarray, low: float, high: float) -> np.ndarray:
+    """Ids of the edges whose length lies in ``[low, high]``."""
+    return np.flatnonzero((lengths >= low) & (lengths <= high))
+
+
+def length_histogram(lengths: np.ndarray, bins: int = 64) -> Tuple[np.ndarray, np.ndarray]:
+    """Edge count per length bin, and the ``bins + 1`` bin edges."""
+    if not lengths.size:
+        return np.zeros(bins, dtype=np.int64), np.zeros(bins + 1)
+    return np.histogram(lengths, bins=bins)
+
+
+def ramp_colors(values: np.ndarray, low: float, high: float, power: float = 1.0) -> np.ndarray:
+    """
+    Red ramp (N, 3): short values bright red, ``high`` black, out of range black.
+    """
+    colors = np.zeros((values.size, 3), dtype=np.float64)
+    inside = (values >= low) & (values <= high)
+    span = high - low
+    normalized = (values[inside] - low) / span if span > 0 else np.zeros(int(inside.sum()))
+    colors[inside, 0] = 1.0 - np.power(normalized, power)
+    return colors
+
+
+def apply_vertex_colors(mesh: str, colors: np.ndarray, color_set: str = COLOR_SET) -> None:
+    """Write one RGB color per vertex into ``color_set`` with a single setVertexColors."""
+    existing = cmds.polyColorSet(mesh, q=True, allColorSets=True) or []
+    if color_set not in existing:
+        cmds.polyColorSet(mesh, create=True, colorSet=color_set, representation="RGB")
+    cmds.polyColorSet(mesh, currentColorSet=True, colorSet=color_set)
+
+    rgba = np.ones((len(colors), 4), dtype=np.float64)
+    rgba[:, :3] = colors
+    fn = _mesh_fn(mesh)
+    fn.setVertexColors(om.MColorArray(rgba.tolist()), om.MIntArray(range(len(colors))))
+    cmds.setAttr(f"{mesh}.displayColors", 1)
+
+
+def select_edges(mesh: str, edge_ids: Sequence[int]) -> None:
+    """Replace the selection with ``edge_ids`` of ``mesh`` (one MSelectionList)."""
+    if not len(edge_ids):
+        cmds.select(clear=True)
+        return
+    ComponentSet("e", {mesh: edge_ids}).select()
+
+
+# ---------------------------------------------------------------------------
+# UI
+# ---------------------------------------------------------------------------
+
+
+
+def maya_main_window():
+    """Return Maya's main window"""
+    main_window = omui.MQtUtil.mainWindow()
+    return wrapInstance(int(main_window), QtWidgets.QWidget)
+
+
+class QHistogram(QtWidgets.QWidget):
+    """Bar chart of the edge length distribution, range highlighted."""
+
+    def __init__(self, parent=None):
+        super(QHistogram, self).__init__(parent)
+        self.counts = np.zeros(0)
+        self.bin_edges = np.zeros(0)
+        self.low = 0.0
+        self.high = 0.0
+        self.margin = 10
+        self.setFixedHeight(60)
+
+    def setData(self, counts, bin_edges):
+        self.counts = np.asarray(counts, dtype=np.float64)
+        self.bin_edges = np.asarray(bin_edges, dtype=np.float64)
+        self.update()
+
+    def setHighlight(self, low, high):
+        self.low, self.high = low, high
+        self.update()
+
+    def paintEvent(self, event):
+        if not self.counts.size or self.counts.max() <= 0:
+            return
+        painter = QtGui.QPainter(self)
+        painter.setPen(QtCore.Qt.NoPen)
+        width = (self.width() - 2 * self.margin) / self.counts.size
+        # log scale keeps the tiny-edge bins visible next to the main peak
+        heights = np.log1p(self.counts) / np.log1p(self.counts.max()) * (self.height() - 2)
+        for i, h in enumerate(heights):
+            inside = self.bin_edges[i + 1] >= self.low and self.bin_edges[i] <= self.high
+            color = QtGui.QColor(100, 150, 255) if inside else QtGui.QColor(120, 120, 120)
+            painter.setBrush(QtGui.QBrush(color))
+            painter.drawRect(QtCore.QRectF(self.margin + i * width, self.height() - h, max(width - 1, 1), h))
+
 
 class QRangeSlider(QtWidgets.QWidget):
     """Custom range slider with two handles"""
@@ -136,17 +299,18 @@ class QRangeSlider(QtWidgets.QWidget):
 
 
 class EdgeLengthTool(QtWidgets.QDialog):
-    def __init__(self, parent=maya_main_window()):
-        super(EdgeLengthTool, self).__init__(parent)
+    def __init__(self, parent=None):
+        super(EdgeLengthTool, self).__init__(parent or maya_main_window())
 
         self.setWindowTitle("Edge Length Visualization Tool")
         self.setMinimumWidth(300)
         self.setWindowFlags(self.windowFlags() ^ QtCore.Qt.WindowContextHelpButtonHint)
-        # Add dictionary to store edge lengths
-        self.edge_lengths = {}
 
-        # Store mesh data
-        self.vertex_max_lengths = {}
+        # Mesh data (numpy, one entry per edge / vertex)
+        self.mesh_name = None
+        self.edges = None
+        self.edge_lengths = np.zeros(0)
+        self.vertex_max_lengths = np.zeros(0)
         self.min_length = 0
         self.max_length = 0
 
@@ -165,14 +329,23 @@ class EdgeLengthTool(QtWidgets.QDialog):
         # Create ramp button
         self.create_ramp_btn = QtWidgets.QPushButton("Create Color Ramp")
 
-        # Length range slider
+        # Length distribution + range slider
         self.length_label = QtWidgets.QLabel("Edge Length Range:")
+        self.histogram = QHistogram()
         self.length_slider = QRangeSlider()
 
         # Min/Max labels
         self.min_length_label = QtWidgets.QLabel("Min: 0.0")
         self.max_length_label = QtWidgets.QLabel("Max: 0.0")
 
+        # Percentile shortcut: range = shortest N% of the edges
+        self.percentile_label = QtWidgets.QLabel("Shortest %:")
+        self.percentile_spinbox = QtWidgets.QDoubleSpinBox()
+        self.percentile_spinbox.setRange(0.01, 100.0)
+        self.percentile_spinbox.setValue(1.0)
+        self.percentile_spinbox.setSingleStep(0.5)
+        self.percentile_btn = QtWidgets.QPushButton("Set Range")
+
         self.select_edges_btn = QtWidgets.QPushButton("Select Red Edges")
 
     def create_layouts(self):
@@ -191,23 +364,32 @@ class EdgeLengthTool(QtWidgets.QDialog):
         range_layout.addWidget(self.min_length_label)
         range_layout.addWidget(self.max_length_label)
         slider_layout.addLayout(range_layout)
+        slider_layout.addWidget(self.histogram)
         slider_layout.addWidget(self.length_slider)
 
+        percentile_layout = QtWidgets.QHBoxLayout()
+        percentile_layout.addWidget(self.percentile_label)
+        percentile_layout.addWidget(self.percentile_spinbox)
+        percentile_layout.addWidget(self.percentile_btn)
+
         # Add all to main layout
         main_layout.addLayout(power_layout)
         main_layout.addWidget(self.create_ramp_btn)
         main_layout.addLayout(slider_layout)
+        main_layout.addLayout(percentile_layout)
         main_layout.addWidget(self.select_edges_btn)
 
     def create_connections(self):
         self.create_ramp_btn.clicked.connect(self.create_color_ramp)
         self.length_slider.sliderReleased.connect(self.update_colors_from_range)
         self.length_slider.valueChanged.connect(self.update_range_labels)
-        self.select_edges_btn.clicked.connect(self.select_red_edges)  # Moved here
+        self.percentile_btn.clicked.connect(self.set_percentile_range)
+        self.select_edges_btn.clicked.connect(self.select_red_edges)
 
     def update_range_labels(self, min_val, max_val):
         self.min_length_label.setText(f"Min: {min_val:.3f}")
         self.max_length_label.setText(f"Max: {max_val:.3f}")
+        self.histogram.setHighlight(min_val, max_val)
 
     def create_color_ramp(self):
         selection = cmds.ls(selection=True, o=True)
@@ -215,146 +397,55 @@ class EdgeLengthTool(QtWidgets.QDialog):
             QtWidgets.QMessageBox.warning(self, "Warning", "Please select a mesh")
             return
 
-        mesh_name = selection[0]
-
-        # Get mesh data
-        sel_list = om.MSelectionList()
-        sel_list.add(mesh_name)
-        dag_path = sel_list.getDagPath(0)
-        mesh = om.MFnMesh(dag_path)
-
-        # Calculate edge lengths
-        self.vertex_max_lengths.clear()
-        self.edge_lengths.clear()
-
-        for i in range(mesh.numEdges):
-            vtx1, vtx2 = mesh.getEdgeVertices(i)
-            point1 = mesh.getPoint(vtx1)
-            point2 = mesh.getPoint(vtx2)
-            length = om.MVector(point2 - point1).length()
-
-            # Store edge length
-            self.edge_lengths[i] = length
-
-            # Update vertex max lengths
-            self.vertex_max_lengths[vtx1] = max(self.vertex_max_lengths.get(vtx1, 0), length)
-            self.vertex_max_lengths[vtx2] = max(self.vertex_max_lengths.get(vtx2, 0), length)
+        self.mesh_name = selection[0]
+        self.edges, self.edge_lengths = edge_lengths(self.mesh_name)
+        if not self.edge_lengths.size:
+            QtWidgets.QMessageBox.warning(self, "Warning", f"{self.mesh_name} has no edges")
+            return
+        vertex_count = _mesh_fn(self.mesh_name).numVertices
+        self.vertex_max_lengths = vertex_max_lengths(self.edges, self.edge_lengths, vertex_count)
 
-        edge_min_max = [y for x, y in self.edge_lengths.items()]
-        # Calculate overall min/max
-        self.min_length = min(edge_min_max)
-        self.max_length = max(edge_min_max)
+        self.min_length = float(self.edge_lengths.min())
+        self.max_length = float(self.edge_lengths.max())
 
         # Update UI with correct values
-        self.min_length_label.setText(f"Min: {self.min_length:.3f}")
-        self.max_length_label.setText(f"Max: {self.max_length:.3f}")
         self.length_slider.setRange(self.min_length, self.max_length)
+        self.histogram.setData(*length_histogram(self.edge_lengths))
+        self.update_range_labels(self.min_length, self.max_length)
 
-        # Create color set
-        color_set_name = "edgeLength"
-        if not cmds.polyColorSet(mesh_name, q=True, allColorSets=True) or color_set_name not in cmds.polyColorSet(
-                mesh_name, q=True, allColorSets=True):
-            cmds.polyColorSet(mesh_name, create=True, colorSet=color_set_name, representation="RGB")
-
-        cmds.polyColorSet(mesh_name, currentColorSet=True, colorSet=color_set_name)
-
-        # Apply initial colors
-        self.update_vertex_colors(mesh_name)
+        self.update_vertex_colors(self.mesh_name)
 
-        # Enable display
-        cmds.setAttr(f"{mesh_name}.displayColors", 1)
-
-    def update_colors_from_range(self):
-        selection = cmds.ls(selection=True, o=True)
-        if not selection:
+    def set_percentile_range(self):
+        if not self.edge_lengths.size:
             return
+        low, high = percentile_range(self.edge_lengths, 0.0, self.percentile_spinbox.value())
+        self.length_slider.setMinimum(low)
+        self.length_slider.setMaximum(high)
+        self.update_range_labels(*self.length_slider.getRange())
+        self.update_colors_from_range()
 
-        self.update_vertex_colors(selection[0])
+    def update_colors_from_range(self):
+        if self.mesh_name and cmds.objExists(self.mesh_name):
+            self.update_vertex_colors(self.mesh_name)
 
     def select_red_edges(self):
-
-        selection = cmds.ls(selection=True, o=True)
-        if not selection or not self.edge_lengths:
+        if not self.mesh_name or not self.edge_lengths.size:
             return
 
-        mesh_name = selection[0]
         min_threshold, max_threshold = self.length_slider.getRange()
-
-        # Create list of edge indices that fall within range
-        edge_indices = [i for i, length in self.edge_lengths.items()
-                        if min_threshold <= length <= max_threshold]
-        print(self.edge_lengths.items())
-
-        if edge_indices:
-            # Clear current selection
-            cmds.select(clear=True)
-
-            # Select edges all at once using Maya's range syntax when possible
-            try:
-                # Try to create ranges of consecutive indices
-                ranges = []
-                current_range = [edge_indices[0]]
-
-                for idx in edge_indices[1:]:
-                    if idx == current_range[-1] + 1:
-                        current_range.append(idx)
-                    else:
-                        if len(current_range) > 1:
-                            ranges.append(f"{mesh_name}.e[{current_range[0]}:{current_range[-1]}]")
-                        else:
-                            ranges.append(f"{mesh_name}.e[{current_range[0]}]")
-                        current_range = [idx]
-
-                # Add the last range
-                if len(current_range) > 1:
-                    ranges.append(f"{mesh_name}.e[{current_range[0]}:{current_range[-1]}]")
-                else:
-                    ranges.append(f"{mesh_name}.e[{current_range[0]}]")
-
-                cmds.select(ranges)
-
-            except:
-                # Fallback: select edges one by one
-                for edge_id in edge_indices:
-                    try:
-                        cmds.select(f"{mesh_name}.e[{edge_id}]", add=True)
-                    except:
-                        continue
-
-            print(
-                f"Selected {len(edge_indices)} edges with lengths between {min_threshold:.3f} and {max_threshold:.3f}")
+        edge_ids = edges_in_range(self.edge_lengths, min_threshold, max_threshold)
+        select_edges(self.mesh_name, edge_ids)
+        if edge_ids.size:
+            print(f"Selected {edge_ids.size} edges with lengths between "
+                  f"{min_threshold:.3f} and {max_threshold:.3f}")
         else:
-            cmds.select(clear=True)
             print("No edges found within the selected length range")
 
     def update_vertex_colors(self, mesh_name):
         min_threshold, max_threshold = self.length_slider.getRange()
-        power = self.power_spinbox.value()
-
-        # Process each vertex only once
-        for vertex_id, max_length in self.vertex_max_lengths.items():
-            # Calculate color
-            if min_threshold <= max_length <= max_threshold:
-                normalized_length = (max_length - min_threshold) / (max_threshold - min_threshold)
-                normalized_length = pow(normalized_length, power)
-                red = 1.0 - normalized_length
-                color = [red, 0.0, 0.0]
-            else:
-                color = [0.0, 0.0, 0.0]  # Black for vertices outside range
-
-            try:
-                cmds.polyColorPerVertex(f"{mesh_name}.vtx[{vertex_id}]", rgb=color)
-            except:
-                # If single vertex fails, try updating all vertices at once
-                all_vertices = [f"{mesh_name}.vtx[{i}]" for i in range(len(self.vertex_max_lengths))]
-                cmds.polyColorPerVertex(all_vertices, rgb=color)
-                break
-
-
-def maya_main_window():
-    """Return Maya's main window"""
-    main_window = omui.MQtUtil.mainWindow()
-    return wrapInstance(int(main_window), QtWidgets.QWidget)
+        colors = ramp_colors(self.vertex_max_lengths, min_threshold, max_threshold,
+                             self.power_spinbox.value())
+        apply_vertex_colors(mesh_name, colors)
 
 
 def show():
@@ -370,4 +461,5 @@ def show():
     edge_length_tool.show()
 
 
-show()
\ No newline at end of file
+if __name__ == "__main__":
+    show()
@@ -1,7 +1,7 @@
 """Maya logic for the Maya Map Transfer widget (wgt_maya_transfer).
 
-Snapshots every paintable weight map on a mesh into a self-contained,
-JSON-serializable payload (weights + world vertex positions), so a storage
+Snapshots every paintable weight map on a mesh into a self-contained
+payload (weights + world vertex positions as numpy arrays), so a storage
 saved in one Maya session can be loaded in another and applied onto a new
 target mesh - even when source and target have different topology.
 
@@ -13,18 +13,25 @@ Features:
     - list_target_maps:     resolve live WeightSources of a target mesh
     - copy_weights:         same-topology index copy
     - transfer_weights:     nearest-neighbour cross-topology transfer
-    - save_storage/load_storage: JSON round-trip for cross-Maya exchange
+    - save_storage/load_storage: binary (``.dww``) or JSON round-trip for
+      cross-Maya exchange
+    - open_storage:         lazy binary storage, contents listed from the
+      header, map arrays decoded on demand (LRU + background prefetch)
+    - convert_storage:      JSON <-> binary storage conversion
+
+Classes:
+    StorageReader, StoredArray
 
 Functions:
     selected_mesh, map_identity, get_world_positions, snapshot_mesh,
     list_target_maps, copy_weights, transfer_weights,
-    save_storage, load_storage
+    save_storage, load_storage, open_storage, convert_storage
 
 Example::
 
     from dw_maya.Slimfast import transfer_cmds
     snap = transfer_cmds.snapshot_mesh('shirt_geo')
-    transfer_cmds.save_storage('C:/tmp/shirt_maps.json', [snap])
+    transfer_cmds.save_storage('C:/tmp/shirt_maps.dww', [snap])
 
 Author:
     DrWeeny
@@ -32,11 +39,17 @@ Author:
 
 from __future__ import annotations
 
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 from maya import cmds
 
 import dw_maya.dw_presets_io.dw_json as dw_json
+import dw_maya.dw_presets_io.dw_weight_store as dw_weight_store
 from dw_logger import get_logger
 
 logger = get_logger()
@@ -45,6 +58,7 @@ logger = get_logger()
 # envelope convention and stay clear of the `das` library's schema vocabulary.
 FORMAT = "maya_map_transfer"
 FORMAT_VERSION = 1
+STORAGE_EXTENSION = dw_weight_store.EXTENSION
 
 # Deformer maps that are implicit (one per geometry) carry no meaningful map
 # name, so the deformer node itself is the matching identity instead.
@@ -120,14 +134,14 @@ def _mesh_shape(mesh: str) -> str:
     return shapes[0] if shapes else mesh
 
 
-def get_world_positions(mesh: str) -> List[List[float]]:
-    """Return per-vertex world-space positions of *mesh* as nested lists."""
+def get_world_positions(mesh: str) -> np.ndarray:
+    """Return per-vertex world-space positions of *mesh* as an (N, 3) array."""
     import maya.api.OpenMaya as om2
     sel = om2.MSelectionList()
     sel.add(_mesh_shape(mesh))
     fn = om2.MFnMesh(sel.getDagPath(0))
     pts = fn.getPoints(om2.MSpace.kWorld)
-    return [[round(p.x, 5), round(p.y, 5), round(p.z, 5)] for p in pts]
+    return np.array(pts, dtype=np.float64).reshape(-1, 4)[:, :3]
 
 
 def strip_namespace(name: str) -> str:
@@ -179,15 +193,16 @@ def _resolve_sources(mesh: str) -> list:
 
 
 def snapshot_mesh(mesh: str) -> Dict[str, Any]:
-    """Capture every paintable weight map on *mesh* into a JSON-ready dict.
+    """Capture every paintable weight map on *mesh* into a storage dict.
 
     Args:
         mesh: Mesh transform (or shape) name.
 
     Returns:
-        Dict with ``mesh``, ``vtx_count``, ``vtx_positions`` (world space,
-        shared by all maps) and a ``maps`` list, each entry holding
-        ``node_name`` / ``node_type`` / ``map_name`` / ``key`` / ``weights``.
+        Dict with ``mesh``, ``vtx_count``, ``vtx_positions`` (world space
+        (N, 3) array, shared by all maps) and a ``maps`` list, each entry
+        holding ``node_name`` / ``node_type`` / ``map_name`` / ``key`` /
+        ``weights`` (float32 array).
     """
     positions = get_world_positions(mesh)
     maps: List[Dict[str, Any]] = []
@@ -218,7 +233,7 @@ def snapshot_mesh(mesh: str) -> Dict[str, Any]:
                 "type_name": type_name,
                 "map_name": map_name,
                 "key": map_identity(node_name, node_type, map_name),
-                "weights": [round(float(w), 6) for w in weights],
+                "weights": np.asarray(weights, dtype=np.float32),
             })
 
     return {
@@ -286,6 +301,7 @@ def copy_weights(src_weights: List[float],
     """
     if target_map:
         target_source.use_map(target_map)
+    src_weights = np.asarray(src_weights, dtype=np.float64)
     n = target_source.vtx_count
     src_n = len(src_weights)
     overlap = min(n, src_n)
@@ -303,10 +319,10 @@ def copy_weights(src_weights: List[float],
         return overlap
 
     if src_n == n:
-        target_source.set_weights([float(w) for w in src_weights])
+        target_source.set_weights(src_weights.tolist())
         return n
 
-    head = [float(w) for w in src_weights[:overlap]]
+    head = src_weights[:overlap].tolist()
     if preserve_unmapped:
         result = list(target_source.get_weights())
         result[:overlap] = head
@@ -343,14 +359,12 @@ def transfer_weights(src_weights: List[float],
                            written; every other vertex keeps its original
                            weight.
     """
-    import numpy as np
-
     if target_map:
         target_source.use_map(target_map)
 
-    src_pos = np.array(src_positions, dtype=np.float64)
-    tgt_pos = np.array(get_world_positions(target_source.mesh_name), dtype=np.float64)
-    src_arr = np.array(src_weights, dtype=np.float64)
+    src_pos = np.asarray(src_positions, dtype=np.float64)
+    tgt_pos = get_world_positions(target_source.mesh_name)
+    src_arr = np.asarray(src_weights, dtype=np.float64)
     tgt_arr = np.array(target_source.get_weights(), dtype=np.float64)
 
     try:
@@ -387,19 +401,271 @@ def transfer_weights(src_weights: List[float],
 
 
 # ---------------------------------------------------------------------------
-# JSON round-trip
+# Storage round-trip
 # ---------------------------------------------------------------------------
 
-def save_storage(path: str, meshes: List[Dict[str, Any]]) -> bool:
-    """Write a storage (list of snapshot dicts) to *path*."""
-    data = {"format": FORMAT, "version": FORMAT_VERSION, "meshes": meshes}
-    return dw_json.save_json(path, data)
+def _to_json_meshes(meshes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Arrays as rounded float lists, the version 1 JSON layout."""
+    out = []
+    for snap in meshes:
+        kept = dict(snap)
+        kept["vtx_positions"] = np.round(np.asarray(snap["vtx_positions"], dtype=np.float64), 5).tolist()
+        kept["maps"] = [dict(entry, weights=np.round(np.asarray(entry["weights"], dtype=np.float64), 6).tolist())
+                        for entry in snap["maps"]]
+        out.append(kept)
+    return out
+
+
+def save_storage(path: str,
+                 meshes: List[Dict[str, Any]],
+                 precision: str = "float32",
+                 compression: Optional[str] = None) -> bool:
+    """Write a storage (list of snapshot dicts) to *path*.
+
+    ``.json`` paths get the legacy float-list JSON; anything else is written
+    as a binary weight store (one array per map plus one per mesh for the
+    positions, metadata in the header).
+
+    Args:
+        path: Destination file.
+        meshes: Snapshot dicts (see :func:`snapshot_mesh`).
+        precision: Stored weight precision for binary files ('float32',
+            'float16', 'uint16', 'uint8'). Positions are always float32.
+        compression: 'zstd', 'zlib' or 'none' (default: zstd if available).
+    """
+    if path.lower().endswith(".json"):
+        data = {"format": FORMAT, "version": FORMAT_VERSION, "meshes": _to_json_meshes(meshes)}
+        return dw_json.save_json(path, data)
+
+    header: List[Dict[str, Any]] = []
+    try:
+        with dw_weight_store.WeightStoreWriter(path, compression=compression) as writer:
+            for m, snap in enumerate(meshes):
+                pos_name = f"{m}/positions"
+                writer.add(pos_name, snap["vtx_positions"], precision="float32")
+                entries = []
+                for i, entry in enumerate(snap["maps"]):
+                    map_name = f"{m}/maps/{i}"
+                    writer.add(map_name, entry["weights"], precision=precision)
+                    entries.append(dict(entry, weights=map_name))
+                header.append(dict(snap, vtx_positions=pos_name, maps=entries))
+            writer.meta.update({"format": FORMAT, "version": FORMAT_VERSION, "meshes": header})
+    except (OSError, ValueError, ImportError) as e:
+        logger.error(f"save_storage: failed to write '{path}': {e}")
+        return False
+    return True
+
+
+class StoredArray:
+    """Array proxy backed by a :class:`StorageReader`.
+
+    Shape and length come from the store header, so listing a storage never
+    decodes anything. The data is decoded (through the reader's LRU) the first
+    time it is used as an array: ``np.asarray``, indexing or iteration.
+    """
+
+    __slots__ = ("_reader", "name", "shape", "dtype")
+
+    def __init__(self, reader: "StorageReader", name: str):
+        info = reader.store.info(name)
+        self._reader = reader
+        self.name = name
+        self.shape = tuple(info["shape"])
+        self.dtype = np.dtype(info["dtype"])
+
+    @property
+    def loaded(self) -> bool:
+        """True when the decoded array is currently in the reader's LRU."""
+        return self._reader.is_cached(self.name)
+
+    def __len__(self) -> int:
+        return self.shape[0] if self.shape else 1
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        arr = self._reader.get(self.name)
+        return arr if dtype is None else arr.astype(dtype, copy=False)
+
+    def __getitem__(self, index):
+        return self._reader.get(self.name)[index]
+
+    def __iter__(self):
+        return iter(self._reader.get(self.name))
+
+    def __repr__(self) -> str:
+        return f"StoredArray({self.name!r}, shape={self.shape}, loaded={self.loaded})"
+
+
+class StorageReader:
+    """Lazy view over a binary storage file.
+
+    Opening only parses the header, which doubles as the index
+    (mesh -> maps -> array offsets), so the transfer UI can list a storage of
+    any size instantly. ``meshes`` holds the usual snapshot dicts with
+    :class:`StoredArray` proxies in ``vtx_positions`` / ``weights``.
+
+    Decoded arrays are kept in an LRU bounded by ``cache_bytes``;
+    :meth:`prefetch` decodes a mesh's arrays on a background thread so they
+    are warm by the time the artist applies them.
+
+    Args:
+        path: Binary storage written by :func:`save_storage`.
+        cache_bytes: LRU budget for decoded arrays.
+
+    Raises:
+        ValueError: When *path* is not a binary map storage.
+    """
+
+    def __init__(self, path: str, cache_bytes: int = 512 * 1024 * 1024):
+        self.path = path
+        self.store = dw_weight_store.WeightStore(path)
+        if self.store.meta.get("format") != FORMAT:
+            self.store.close()
+            raise ValueError(f"'{path}' is not a {FORMAT} storage")
+        self.cache_bytes = cache_bytes
+        self._cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._cached_bytes = 0
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._prefetch: Optional[Future] = None
+
+        self.meshes: List[Dict[str, Any]] = []
+        for snap in self.store.meta.get("meshes", []):
+            maps = [dict(entry, weights=StoredArray(self, entry["weights"])) for entry in snap["maps"]]
+            self.meshes.append(dict(snap, vtx_positions=StoredArray(self, snap["vtx_positions"]),
+                                    maps=maps))
+
+    def index(self) -> List[Dict[str, Any]]:
+        """Return ``[{mesh, vtx_count, positions, maps: [{key, ..., offset, nbytes}]}]``."""
+        out = []
+        for snap in self.store.meta.get("meshes", []):
+            maps = [dict(entry, **{k: self.store.info(entry["weights"])[k] for k in ("offset", "nbytes")})
+                    for entry in snap["maps"]]
+            out.append(dict(snap, maps=maps))
+        return out
+
+    # -- LRU ---------------------------------------------------------------
+
+    def is_cached(self, name: str) -> bool:
+        with self._lock:
+            return name in self._cache
+
+    def get(self, name: str) -> np.ndarray:
+        """Decoded array *name*, from the LRU or the file."""
+        with self._lock:
+            arr = self._cache.get(name)
+            if arr is not None:
+                self._cache.move_to_end(name)
+                return arr
+        arr = self.store.load(name, mmap=False)
+        arr.flags.writeable = False
+        with self._lock:
+            if name not in self._cache:
+                self._cache[name] = arr
+                self._cached_bytes += arr.nbytes
+                while self._cached_bytes > self.cache_bytes and len(self._cache) > 1:
+                    _, dropped = self._cache.popitem(last=False)
+                    self._cached_bytes -= dropped.nbytes
+        return arr
+
+    def prefetch(self, snap: Dict[str, Any]) -> Optional[Future]:
+        """Decode every array of *snap* on a background thread.
+
+        A pending prefetch for another mesh is cancelled first, so following
+        the UI highlight never queues more than one mesh.
+        """
+        names = [a.name for a in [snap.get("vtx_positions")] + [e.get("weights") for e in snap.get("maps", [])]
+                 if isinstance(a, StoredArray) and a._reader is self]
+        if not names or self.store.closed:
+            return None
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dw_storage_prefetch")
+        if self._prefetch is not None:
+            self._prefetch.cancel()
+
+        def _warm():
+            for name in names:
+                if self.store.closed:
+                    return
+                self.get(name)
+
+        self._prefetch = self._executor.submit(_warm)
+        return self._prefetch
+
+    # -- lifetime ----------------------------------------------------------
+
+    def detach(self) -> None:
+        """Decode everything still on disk, then release the file.
+
+        Call before overwriting the file the storage was opened from.
+        """
+        for snap in self.meshes:
+            snap["vtx_positions"] = np.asarray(snap["vtx_positions"])
+            for entry in snap["maps"]:
+                entry["weights"] = np.asarray(entry["weights"])
+        self.close()
+
+    def close(self) -> None:
+        if self._prefetch is not None:
+            self._prefetch.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self.store.close()
+
+    def __enter__(self) -> "StorageReader":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def open_storage(path: str, cache_bytes: int = 512 * 1024 * 1024) -> Optional[StorageReader]:
+    """Open a binary storage lazily. Returns None when *path* is not one."""
+    if not dw_weight_store.is_weight_store(path):
+        return None
+    try:
+        return StorageReader(path, cache_bytes=cache_bytes)
+    except ValueError as e:
+        logger.warning(f"open_storage: {e}")
+        return None
 
 
 def load_storage(path: str) -> Optional[Dict[str, Any]]:
-    """Load a storage file, validating its format. Returns None on mismatch."""
+    """Load a whole storage file (binary or JSON), validating its format.
+
+    Returns None on mismatch. Binary stores come back with numpy arrays in
+    ``vtx_positions`` / ``weights``; JSON stores with float lists. Use
+    :func:`open_storage` to list a binary storage without decoding it.
+    """
+    if dw_weight_store.is_weight_store(path):
+        reader = open_storage(path)
+        if reader is None:
+            return None
+        reader.detach()
+        return {"format": FORMAT, "version": reader.store.meta.get("version"), "meshes": reader.meshes}
+
     data = dw_json.load_json(path)
     if not data or data.get("format") != FORMAT:
         logger.warning(f"load_storage: '{path}' is not a {FORMAT} file.")
         return None
-    return data
\ No newline at end of file
+    return data
+
+
+def convert_storage(src: str, dst: Optional[str] = None, **options) -> Optional[str]:
+    """Convert a storage between JSON and binary, following *src*'s format.
+
+    Args:
+        src: Existing storage file.
+        dst: Output path, defaults to *src* with the other extension.
+        **options: ``precision`` / ``compression`` forwarded to save_storage.
+
+    Returns:
+        The written path, or None when *src* is not a storage or the write failed.
+    """
+    data = load_storage(src)
+    if data is None:
+        return None
+    if not dst:
+        ext = ".json" if dw_weight_store.is_weight_store(src) else STORAGE_EXTENSION
+        dst = os.path.splitext(src)[0] + ext
+    return dst if save_storage(dst, data.get("meshes", []), **options) else None
@@ -25,6 +25,7 @@ Author:
 
 from __future__ import annotations
 
+import os
 from typing import Any, Dict, List, Optional, Tuple
 from functools import partial
 
@@ -52,6 +53,8 @@ _ROLE_DATA = Qt.UserRole + 1
 # Parent rows in the store tree reflect / drive their children's checkboxes.
 _TRISTATE_FLAG = getattr(Qt, "ItemIsAutoTristate", getattr(Qt, "ItemIsTristate", 0))
 ICON_PATH = get_resource_path("Feedbin-Icon-left-arrow.svg.png")
+# Binary weight store first (default), legacy JSON still readable / writable.
+_STORAGE_FILTER = f"Map storage (*{transfer_cmds.STORAGE_EXTENSION});;JSON (*.json)"
 
 def _entry_type(entry: dict) -> str:
     """Return a map entry's grouping type, robust to older saved files."""
@@ -73,6 +76,10 @@ def _backfill_type_names(meshes: list) -> None:
                     entry["type_name"] = type_colors.type_for_node_type(node_type)
 
 
+def _same_path(a: str, b: str) -> bool:
+    return os.path.normcase(os.path.abspath(a)) == os.path.normcase(os.path.abspath(b))
+
+
 def _color_for(entry: dict) -> "QtGui.QColor":
     """Return the row colour for a map entry.
 
@@ -150,6 +157,9 @@ class MayaMapTransferWidget(QtWidgets.QWidget):
         # Each map entry additionally carries a UI-only "enabled" key (saved
         # files never include it) backing the store-tree checkboxes.
         self._storage: List[Dict[str, Any]] = []
+        # Lazy reader behind a loaded binary storage: its map arrays stay on
+        # disk until used (see transfer_cmds.StorageReader).
+        self._reader: Optional[transfer_cmds.StorageReader] = None
         # Live target maps (transfer_cmds.list_target_maps) + the target mesh
         self._target_maps: List[Dict[str, Any]] = []
         self._target_mesh: Optional[str] = None
@@ -339,11 +349,16 @@ class MayaMapTransferWidget(QtWidgets.QWidget):
         self._load_btn.clicked.connect(self._on_load)
         self._store_tree.itemChanged.connect(self._on_store_item_changed)
         self._store_tree.customContextMenuRequested.connect(self._on_store_menu)
+        self._store_tree.currentItemChanged.connect(self._on_store_current_changed)
         self._pick_target_btn.clicked.connect(self._on_pick_target)
         self._target_edit.returnPressed.connect(self._on_target_typed)
         self._match_tree.customContextMenuRequested.connect(self._on_match_menu)
         self._apply_btn.clicked.connect(self._on_apply)
 
+    def closeEvent(self, event: "QtGui.QCloseEvent") -> None:
+        self._close_reader()
+        super().closeEvent(event)
+
     # ------------------------------------------------------------------
     # Storage tree
     # ------------------------------------------------------------------
@@ -411,6 +426,14 @@ class MayaMapTransferWidget(QtWidgets.QWidget):
         finally:
             self._store_tree.blockSignals(False)
 
+    def _on_store_current_changed(self, current: Optional[QtWidgets.QTreeWidgetItem], _previous) -> None:
+        """Warm the highlighted mesh's arrays in the background (lazy storages)."""
+        if self._reader is None or current is None:
+            return
+        m_idx = self._selected_store_index()
+        if 0 <= m_idx < len(self._storage):
+            self._reader.prefetch(self._storage[m_idx])
+
     def _selected_store_index(self) -> int:
         item = self._store_tree.currentItem()
         if item is None:
@@ -968,10 +991,17 @@ class MayaMapTransferWidget(QtWidgets.QWidget):
             self._warn("Nothing to save - store a mesh and check at least one map.")
             return
         path, _ = QtWidgets.QFileDialog.getSaveFileName(
-            self, "Save map storage", "", "JSON (*.json)"
+            self, "Save map storage", "", _STORAGE_FILTER
         )
         if not path:
             return
+        if not path.lower().endswith((transfer_cmds.STORAGE_EXTENSION, ".json")):
+            path += transfer_cmds.STORAGE_EXTENSION
+        if self._reader is not None and _same_path(self._reader.path, path):
+            # Overwriting the open storage: pull the remaining maps into memory first.
+            self._reader.detach()
+            self._reader = None
+            payload = self._checked_storage()
         if transfer_cmds.save_storage(path, payload):
             n_maps = sum(len(s["maps"]) for s in payload)
             self._set_status(f"Saved {len(payload)} mesh(es) / {n_maps} map(s) to {path}.")
@@ -980,15 +1010,23 @@ class MayaMapTransferWidget(QtWidgets.QWidget):
 
     def _on_load(self) -> None:
         path, _ = QtWidgets.QFileDialog.getOpenFileName(
-            self, "Load map storage", "", "JSON (*.json)"
+            self, "Load map storage", "", _STORAGE_FILTER
         )
         if not path:
             return
-        data = transfer_cmds.load_storage(path)
-        if data is None:
-            self._warn(f"'{path}' is not a valid map storage file.")
-            return
-        meshes = list(data.get("meshes", []))
+        # Binary storages are listed from their header only; map arrays are
+        # decoded when applied (or prefetched when their mesh is highlighted).
+        reader = transfer_cmds.open_storage(path)
+        if reader is not None:
+            meshes = list(reader.meshes)
+        else:
+            data = transfer_cmds.load_storage(path)
+            if data is None:
+                self._warn(f"'{path}' is not a valid map storage file.")
+                return
+            meshes = list(data.get("meshes", []))
+        self._close_reader()
+        self._reader = reader
         _backfill_type_names(meshes)
         for snap in meshes:
             for entry in snap.get("maps", []):
@@ -1002,6 +1040,11 @@ class MayaMapTransferWidget(QtWidgets.QWidget):
     # Helpers
     # ------------------------------------------------------------------
 
+    def _close_reader(self) -> None:
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+
     def _set_status(self, text: str) -> None:
         self._status.setText(text)
 
@@ -0,0 +1,488 @@
+"""Parallel multi-asset Alembic / geometry cache export orchestration.
+
+Splits a shot publish into one job per asset and runs the jobs in parallel
+``mayapy`` worker processes. Each worker opens the saved shot scene, runs
+``dw_alembic_utils.exportAbc`` (or ``dw_doCreateGeometryCache``) on its
+asset only and streams progress back on stdout. Failed jobs are retried and
+every result is merged into one JSON manifest next to the caches.
+
+The orchestration side never imports maya, so it can run from the
+interactive session, from a farm wrapper or from plain Python (tests use
+StubRunner instead of a real mayapy).
+
+Features:
+    - Dry-run planner: cost estimated as vertex count x frame count.
+    - Local process pool (one mayapy per slot), heaviest jobs first.
+    - Streamed progress callback: (job name, fraction, message).
+    - Per-job retries, merged manifest with timings and attempts.
+    - Alembic or Maya geometry cache (mcx) per job.
+
+Classes:
+    CacheJob: One asset export (roots, output path, frame range, options).
+    JobResult: Outcome of one job, as stored in the manifest.
+    MayapyRunner: Runs a job in a mayapy subprocess.
+    StubRunner: In-process fake runner used by tests and dry runs.
+
+Functions:
+    estimate_cost: Vertex count x frame count.
+    plan_shot_export: Build one CacheJob per asset.
+    format_plan: Human readable dry-run summary.
+    run_jobs: Execute jobs in parallel with retries and progress.
+    write_manifest: Merge results into a manifest JSON.
+    export_shot: plan + run + manifest in one call (needs a saved scene).
+
+Example:
+    >>> import dw_maya.dw_alembic_batch as dwabc_batch
+    >>> jobs = dwabc_batch.plan_shot_export(
+    ...     {"charA": ["charA:geo_grp"], "charB": ["charB:geo_grp"]},
+    ...     "/shots/sh010/cache", frame_range=(1001, 1100))
+    >>> print(dwabc_batch.format_plan(jobs))
+    >>> results = dwabc_batch.run_jobs(jobs, dwabc_batch.MayapyRunner(), max_workers=4)
+    >>> dwabc_batch.write_manifest(results, "/shots/sh010/cache/manifest.json")
+
+TODO:
+    - Submit jobs to the farm instead of the local pool.
+    - Batch small assets together in one worker to amortize scene load.
+
+Author: DrWeeny
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from dw_logger import get_logger
+
+logger = get_logger()
+
+MANIFEST_VERSION = 1
+
+# Stdout line prefixes used by the worker to talk to the orchestrator
+_PROGRESS_TAG = "DW_ABC_PROGRESS"
+_RESULT_TAG = "DW_ABC_RESULT"
+
+ProgressCallback = Callable[[str, float, str], None]
+
+
+@dataclass
+class CacheJob:
+    """One asset export handled by a single worker.
+
+    Attributes:
+        name: Asset / job name, used as manifest key.
+        scene: Saved scene opened by the worker.
+        roots: Nodes to export.
+        output: Output .abc file (or cache directory for ``kind='mcx'``).
+        frame_range: (start, end) frames.
+        kind: 'abc' for Alembic, 'mcx' for Maya geometry cache.
+        options: Extra keyword arguments for exportAbc / doCreateGeometryCache.
+        vertex_count: Vertices under the roots, used by the planner.
+    """
+    name: str
+    scene: str
+    roots: List[str]
+    output: str
+    frame_range: Tuple[float, float]
+    kind: str = "abc"
+    options: Dict = field(default_factory=dict)
+    vertex_count: int = 0
+
+    @property
+    def frame_count(self) -> int:
+        return int(self.frame_range[1] - self.frame_range[0]) + 1
+
+    @property
+    def cost(self) -> int:
+        return estimate_cost(self.vertex_count, self.frame_count)
+
+
+@dataclass
+class JobResult:
+    """Outcome of one CacheJob, one entry of the manifest."""
+    name: str
+    output: str
+    success: bool
+    attempts: int = 0
+    duration: float = 0.0
+    error: str = ""
+    files: List[str] = field(default_factory=list)
+
+
+def estimate_cost(vertex_count: int, frame_count: int) -> int:
+    """Relative export cost of an asset (vertices written over the range)."""
+    return max(int(vertex_count), 1) * max(int(frame_count), 1)
+
+
+# ---------------------------------------------------------------------------
+# Planning
+# ---------------------------------------------------------------------------
+
+def _scene_vertex_count(roots: Sequence[str]) -> int:
+    """Vertices under *roots* in the current Maya session."""
+    from maya import cmds
+    meshes = cmds.ls(roots, dag=True, type='mesh', ni=True)
+    if not meshes:
+        return 0
+    return int(cmds.polyEvaluate(meshes, vertex=True))
+
+
+def plan_shot_export(assets: Dict[str, Sequence[str]], output_dir: str,
+                     frame_range: Tuple[float, float], scene: str = "",
+                     kind: str = "abc", vertex_counts: Optional[Dict[str, int]] = None,
+                     **options) -> List[CacheJob]:
+    """Split a shot export into one CacheJob per asset.
+
+    Args:
+        assets: Asset name -> export roots.
+        output_dir: Directory receiving one cache per asset.
+        frame_range: (start, end) frames.
+        scene: Saved scene path the workers open. Defaults to the current scene.
+        kind: 'abc' or 'mcx'.
+        vertex_counts: Precomputed vertex count per asset. When omitted the
+            counts are queried from the current Maya session.
+        **options: Forwarded to exportAbc / doCreateGeometryCache.
+
+    Returns:
+        List[CacheJob]: Jobs sorted by decreasing estimated cost.
+    """
+    if kind not in ("abc", "mcx"):
+        raise ValueError(f"Unknown cache kind '{kind}', expected 'abc' or 'mcx'")
+
+    if not scene:
+        from maya import cmds
+        scene = cmds.file(q=True, sceneName=True)
+    if not scene:
+        raise RuntimeError("Save the scene first: workers reopen it from disk")
+
+    jobs = []
+    for name, roots in assets.items():
+        if vertex_counts is not None:
+            count = vertex_counts.get(name, 0)
+        else:
+            count = _scene_vertex_count(roots)
+        if kind == "abc":
+            output = os.path.join(output_dir, f"{name}.abc").replace('\\', '/')
+        else:
+            output = os.path.join(output_dir, name).replace('\\', '/')
+        jobs.append(CacheJob(name=name, scene=scene, roots=list(roots), output=output,
+                             frame_range=(frame_range[0], frame_range[1]), kind=kind,
+                             options=dict(options), vertex_count=count))
+
+    # Heaviest first so the longest job never starts last
+    jobs.sort(key=lambda j: j.cost, reverse=True)
+    return jobs
+
+
+def format_plan(jobs: Sequence[CacheJob], max_workers: int = 4) -> str:
+    """Dry-run summary: per-job cost share and an ideal parallel makespan.
+
+    Args:
+        jobs: Planned jobs.
+        max_workers: Worker slots used for the makespan estimate.
+
+    Returns:
+        str: Multi-line report.
+    """
+    total = sum(j.cost for j in jobs) or 1
+    lines = [f"{len(jobs)} jobs, {max_workers} workers"]
+    for job in jobs:
+        lines.append(f"  {job.name:<32} {job.vertex_count:>10} vtx x {job.frame_count:>5} frm"
+                     f"  {100.0 * job.cost / total:5.1f}%  -> {job.output}")
+
+    # Greedy longest-processing-time schedule, same order run_jobs submits in
+    slots = [0] * max(1, max_workers)
+    for job in jobs:
+        slots[slots.index(min(slots))] += job.cost
+    lines.append(f"  estimated speed-up: {total / max(max(slots), 1):.2f}x")
+    return "\n".join(lines)
+
+
+# ---------------------------------------------------------------------------
+# Runners
+# ---------------------------------------------------------------------------
+
+def _default_mayapy() -> str:
+    """mayapy next to the running Maya executable, or on PATH."""
+    exe_dir = os.path.dirname(sys.executable)
+    name = "mayapy.exe" if os.name == "nt" else "mayapy"
+    candidate = os.path.join(exe_dir, name)
+    return candidate if os.path.isfile(candidate) else name
+
+
+class MayapyRunner:
+    """Run a CacheJob in a ``mayapy`` subprocess.
+
+    The job is passed as JSON on the command line; the worker prints
+    ``DW_ABC_PROGRESS <fraction> <message>`` lines that are forwarded to the
+    progress callback as they arrive.
+
+    Args:
+        mayapy: mayapy executable. Defaults to the one next to Maya.
+        timeout: Seconds before a worker is killed (None = no limit).
+        env: Extra environment variables for the worker.
+    """
+
+    def __init__(self, mayapy: str = "", timeout: Optional[float] = None,
+                 env: Optional[Dict[str, str]] = None):
+        self.mayapy = mayapy or _default_mayapy()
+        self.timeout = timeout
+        self.env = env or {}
+
+    def command(self, job: CacheJob) -> List[str]:
+        return [self.mayapy, os.path.abspath(__file__), "--worker", json.dumps(asdict(job))]
+
+    def __call__(self, job: CacheJob, progress: ProgressCallback) -> List[str]:
+        env = dict(os.environ)
+        # Workers must import dw_maya from the same location as this session
+        package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [package_root, env.get("PYTHONPATH", "")]))
+        env.update(self.env)
+
+        proc = subprocess.Popen(self.command(job), stdout=subprocess.PIPE,
+                                stderr=subprocess.STDOUT, env=env,
+                                universal_newlines=True, bufsize=1)
+        timer = None
+        if self.timeout:
+            timer = threading.Timer(self.timeout, proc.kill)
+            timer.start()
+
+        files = []
+        tail = []
+        try:
+            for line in proc.stdout:
+                line = line.rstrip()
+                if line.startswith(_PROGRESS_TAG):
+                    parts = line.split(" ", 2)
+                    progress(job.name, float(parts[1]), parts[2] if len(parts) > 2 else "")
+                elif line.startswith(_RESULT_TAG):
+                    files = json.loads(line[len(_RESULT_TAG):])
+                else:
+                    tail = (tail + [line])[-20:]
+            proc.wait()
+        finally:
+            if timer:
+                timer.cancel()
+
+        if proc.returncode != 0:
+            raise RuntimeError(f"mayapy exited with {proc.returncode}:\n" + "\n".join(tail))
+        return files
+
+
+class StubRunner:
+    """In-process stand-in for MayapyRunner.
+
+    Writes a small placeholder file per job, reports a few progress steps,
+    and can be told to fail a job a number of times to exercise retries.
+
+    Args:
+        fail_times: Job name -> number of attempts that raise before success.
+        delay: Seconds slept per progress step.
+    """
+
+    def __init__(self, fail_times: Optional[Dict[str, int]] = None, delay: float = 0.0):
+        self.fail_times = dict(fail_times or {})
+        self.delay = delay
+        self.calls: List[str] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, job: CacheJob, progress: ProgressCallback) -> List[str]:
+        with self._lock:
+            self.calls.append(job.name)
+            remaining = self.fail_times.get(job.name, 0)
+            if remaining:
+                self.fail_times[job.name] = remaining - 1
+        if remaining:
+            raise RuntimeError(f"stub failure for {job.name}")
+
+        for step in range(1, 4):
+            if self.delay:
+                time.sleep(self.delay)
+            progress(job.name, step / 3.0, f"step {step}")
+
+        os.makedirs(os.path.dirname(job.output) or ".", exist_ok=True)
+        with open(job.output, "w") as f:
+            json.dump({"roots": job.roots, "frame_range": list(job.frame_range)}, f)
+        return [job.output]
+
+
+# ---------------------------------------------------------------------------
+# Execution
+# ---------------------------------------------------------------------------
+
+def _run_one(job: CacheJob, runner: Callable, retries: int,
+             progress: ProgressCallback) -> JobResult:
+    result = JobResult(name=job.name, output=job.output, success=False)
+    start = time.time()
+    for attempt in range(1, retries + 2):
+        result.attempts = attempt
+        try:
+            result.files = list(runner(job, progress) or [])
+            result.success = True
+            result.error = ""
+            break
+        except Exception as e:
+            result.error = str(e)
+            logger.warning(f"[{job.name}] attempt {attempt} failed: {e}")
+            progress(job.name, 0.0, f"retry {attempt}/{retries}" if attempt <= retries else "failed")
+    result.duration = time.time() - start
+    return result
+
+
+def run_jobs(jobs: Sequence[CacheJob], runner: Optional[Callable] = None,
+             max_workers: int = 4, retries: int = 1,
+             progress: Optional[ProgressCallback] = None) -> List[JobResult]:
+    """Run *jobs* in parallel and return their results in submission order.
+
+    Each pool slot drives one worker process, so *max_workers* is the number
+    of concurrent mayapy instances.
+
+    Args:
+        jobs: Jobs to run (see plan_shot_export).
+        runner: Callable(job, progress) -> files. Defaults to MayapyRunner().
+        max_workers: Concurrent workers.
+        retries: Extra attempts for a failed job.
+        progress: Callable(job_name, fraction, message). Called from pool
+            threads, marshal to the UI thread before touching widgets.
+
+    Returns:
+        List[JobResult]
+    """
+    runner = runner or MayapyRunner()
+    lock = threading.Lock()
+
+    def _progress(name: str, fraction: float, message: str = ""):
+        if progress is None:
+            return
+        with lock:
+            progress(name, fraction, message)
+
+    results: Dict[str, JobResult] = {}
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        futures = {pool.submit(_run_one, job, runner, retries, _progress): job for job in jobs}
+        for future in as_completed(futures):
+            res = future.result()
+            results[res.name] = res
+            status = "done" if res.success else "FAILED"
+            logger.info(f"[{res.name}] {status} in {res.duration:.1f}s ({res.attempts} attempt(s))")
+
+    return [results[job.name] for job in jobs]
+
+
+def write_manifest(results: Sequence[JobResult], path: str,
+                   jobs: Optional[Sequence[CacheJob]] = None) -> Dict:
+    """Merge job results into a manifest JSON, updating an existing one.
+
+    Entries from a previous run are kept unless the same asset was re-run,
+    so a partial re-export only replaces the assets it touched.
+
+    Args:
+        results: Results from run_jobs.
+        path: Manifest file.
+        jobs: Optional jobs, adds frame range and roots to each entry.
+
+    Returns:
+        dict: The manifest written to disk.
+    """
+    manifest = {"version": MANIFEST_VERSION, "assets": {}}
+    if os.path.isfile(path):
+        with open(path, "r") as f:
+            previous = json.load(f)
+        manifest["assets"].update(previous.get("assets", {}))
+
+    job_map = {j.name: j for j in jobs or []}
+    for res in results:
+        entry = asdict(res)
+        job = job_map.get(res.name)
+        if job:
+            entry.update(roots=job.roots, frame_range=list(job.frame_range), kind=job.kind)
+        manifest["assets"][res.name] = entry
+
+    manifest["updated"] = time.strftime("%Y-%m-%d %H:%M:%S")
+    manifest["failed"] = sorted(k for k, v in manifest["assets"].items() if not v["success"])
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(manifest, f, indent=4)
+    os.replace(tmp, path)
+    return manifest
+
+
+def export_shot(assets: Dict[str, Sequence[str]], output_dir: str,
+                frame_range: Tuple[float, float], max_workers: int = 4,
+                retries: int = 1, dry_run: bool = False, runner: Optional[Callable] = None,
+                progress: Optional[ProgressCallback] = None, **options):
+    """Plan, run and publish a multi-asset shot export.
+
+    Args:
+        assets: Asset name -> export roots.
+        output_dir: Cache directory, also receives ``manifest.json``.
+        frame_range: (start, end) frames.
+        max_workers: Concurrent mayapy workers.
+        retries: Extra attempts per failed asset.
+        dry_run: Only print and return the plan.
+        runner: Runner override (StubRunner in tests).
+        progress: Progress callback, see run_jobs.
+        **options: Forwarded to plan_shot_export.
+
+    Returns:
+        List[CacheJob] on dry run, otherwise the manifest dict.
+    """
+    jobs = plan_shot_export(assets, output_dir, frame_range, **options)
+    logger.info(format_plan(jobs, max_workers))
+    if dry_run:
+        return jobs
+
+    results = run_jobs(jobs, runner=runner, max_workers=max_workers,
+                       retries=retries, progress=progress)
+    return write_manifest(results, os.path.join(output_dir, "manifest.json"), jobs)
+
+
+# ---------------------------------------------------------------------------
+# Worker side (runs inside mayapy)
+# ---------------------------------------------------------------------------
+
+def _emit(fraction: float, message: str) -> None:
+    print(f"{_PROGRESS_TAG} {fraction:.3f} {message}", flush=True)
+
+
+def _worker_main(job_data: Dict) -> List[str]:
+    """Open the scene and export one job. Runs inside a mayapy process."""
+    import maya.standalone
+    maya.standalone.initialize(name="python")
+    from maya import cmds
+
+    job = CacheJob(**job_data)
+    _emit(0.0, f"opening {job.scene}")
+    cmds.file(job.scene, open=True, force=True, prompt=False)
+    _emit(0.2, "scene loaded")
+
+    if job.kind == "abc":
+        import dw_maya.dw_alembic_utils as dwabc
+        if not cmds.pluginInfo("AbcExport", q=True, loaded=True):
+            cmds.loadPlugin("AbcExport")
+        os.makedirs(os.path.dirname(job.output), exist_ok=True)
+        dwabc.exportAbc(job.output, job.roots, frameRange=list(job.frame_range), **job.options)
+        files = [job.output]
+    else:
+        import dw_maya.dw_doCreateGeometryCache as dwgeocache
+        files = dwgeocache.doCreateGeometryCache(selection=job.roots, cacheDirectory=job.output,
+                                                 timeRange=list(job.frame_range), action='export',
+                                                 force=1, **job.options) or []
+
+    _emit(1.0, "exported")
+    print(f"{_RESULT_TAG}{json.dumps(files)}", flush=True)
+    return files
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3 and sys.argv[1] == "--worker":
+        _worker_main(json.loads(sys.argv[2]))
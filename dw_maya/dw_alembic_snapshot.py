@@ -0,0 +1,340 @@
+"""Connection and static-value snapshots for Alembic shot re-import.
+
+Replaces the attribute-by-attribute capture/reapply of
+``dw_alembic_utils.getAbcConnections / getAbcStatic / setAbcStatic /
+setAbcConnections`` with three phases:
+
+    capture  : one listConnections sweep on the AlembicNode plus one MPlug
+               read per static channel, stored as compact aligned arrays.
+    diff     : compare the snapshot against the current scene and keep only
+               the plugs whose value or incoming connection differs.
+    apply    : push the diff through a single MDGModifier, registered on the
+               undo queue as one entry.
+
+Every phase is timed (``AbcSnapshot.timings``, milliseconds).
+
+Features:
+    - Static channels (t/r/s xyz + visibility) as float64 arrays.
+    - Connections as aligned (source plug, target plug) string arrays.
+    - Plugs already matching are never touched.
+    - JSON round trip (to_dict / from_dict) for debugging and reuse.
+    - Legacy dict views matching getAbcStatic / getAbcConnections output.
+
+Classes:
+    AbcSnapshot: Captured connections and static values.
+    SnapshotDiff: Plugs to set / connect, resolved to MPlugs.
+
+Functions:
+    capture_snapshot: Build an AbcSnapshot from an imported AlembicNode.
+    diff_snapshot: Compare an AbcSnapshot with the scene.
+    apply_diff: Apply a SnapshotDiff through one MDGModifier.
+    reapply_snapshot: capture -> diff -> apply in one call.
+
+Example:
+    >>> import dw_maya.dw_alembic_snapshot as dwabc_snap
+    >>> snap = dwabc_snap.capture_snapshot("anim:AlembicNode", "anim",
+    ...                                    target_ns=["charA"], topnodes=top_grp)
+    >>> diff = dwabc_snap.diff_snapshot(snap)
+    >>> dwabc_snap.apply_diff(diff)
+    >>> print(snap.timings)
+
+TODO:
+    - Extend static capture to user-defined keyable attributes.
+
+Author: DrWeeny
+"""
+
+from __future__ import annotations
+
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import maya.api.OpenMaya as om
+from maya import cmds
+
+from dw_maya.dw_decorators.dw_generic_undo import push_undo
+from dw_logger import get_logger
+
+logger = get_logger()
+
+# AlembicNode outputs reconnected on the target asset
+ABC_OUT_ATTRS = ('outPolyMesh', 'outLoc', 'outSubDMesh', 'outNCurveGrp', 'transOp', 'prop', 'outCamera')
+# Channels captured as static values on every matched transform
+STATIC_CHANNELS = ('tx', 'ty', 'tz', 'rx', 'ry', 'rz', 'sx', 'sy', 'sz', 'visibility')
+_BOOL_CHANNELS = ('visibility',)
+_TOLERANCE = 1e-6
+
+
+@contextmanager
+def _timed(timings: Dict[str, float], phase: str):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[phase] = (time.perf_counter() - start) * 1000.0
+
+
+def _strip_namespace(name: str, namespace: str) -> str:
+    """Remove the Alembic import namespace from a node or plug name."""
+    ns = namespace.strip(':')
+    return name.split(f'{ns}:')[-1] if ns else name
+
+
+def _target_names(short: str, target_ns: Optional[Sequence[str]]) -> List[str]:
+    """Counterpart(s) of a namespace-free name in the target namespaces."""
+    if not target_ns:
+        return [short]
+    return [f'{ns}:{short}'.replace('::', ':').lstrip(':') for ns in target_ns]
+
+
+def _resolve_plugs(names: Sequence[str]) -> Tuple[List[om.MPlug], np.ndarray]:
+    """Resolve plug names to MPlugs; returns plugs and a found mask."""
+    plugs = []
+    found = np.zeros(len(names), dtype=bool)
+    for i, name in enumerate(names):
+        sel = om.MSelectionList()
+        try:
+            sel.add(name)
+            plugs.append(sel.getPlug(0))
+            found[i] = True
+        except (RuntimeError, TypeError):
+            plugs.append(None)
+    return plugs, found
+
+
+def _read_values(plugs: Sequence[om.MPlug]) -> np.ndarray:
+    return np.array([p.asDouble() if p is not None else np.nan for p in plugs], dtype=np.float64)
+
+
+def _settable(plug: om.MPlug) -> bool:
+    return plug.isFreeToChange() == om.MPlug.kFreeToChange
+
+
+@dataclass
+class AbcSnapshot:
+    """Captured state to re-apply on the target asset.
+
+    Attributes:
+        abc_node: AlembicNode the connections come from.
+        static_plugs: Target plugs (``ns:node.tx``) for static values.
+        static_values: float64 values aligned with static_plugs (internal units).
+        con_src: AlembicNode output plugs.
+        con_dst: Target plugs, aligned with con_src.
+        timings: Milliseconds per phase (capture_*, diff, apply).
+    """
+    abc_node: str = ""
+    static_plugs: List[str] = field(default_factory=list)
+    static_values: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.float64))
+    con_src: List[str] = field(default_factory=list)
+    con_dst: List[str] = field(default_factory=list)
+    timings: Dict[str, float] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict:
+        return {
+            'abc_node': self.abc_node,
+            'static_plugs': list(self.static_plugs),
+            'static_values': self.static_values.tolist(),
+            'con_src': list(self.con_src),
+            'con_dst': list(self.con_dst),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'AbcSnapshot':
+        return cls(abc_node=data.get('abc_node', ''),
+                   static_plugs=list(data.get('static_plugs', [])),
+                   static_values=np.asarray(data.get('static_values', []), dtype=np.float64),
+                   con_src=list(data.get('con_src', [])),
+                   con_dst=list(data.get('con_dst', [])))
+
+    def connection_dict(self) -> Dict[str, List[str]]:
+        """Legacy ``getAbcConnections`` layout: source plug -> target plugs."""
+        con_dic = defaultdict(list)
+        for src, dst in zip(self.con_src, self.con_dst):
+            con_dic[src].append(dst)
+        return con_dic
+
+    def static_dict(self) -> Dict[str, List]:
+        """Legacy ``getAbcStatic`` layout (per channel, user units)."""
+        value_dic = defaultdict(list)
+        for plug, value in zip(self.static_plugs, self.static_values):
+            if plug.endswith(('.rx', '.ry', '.rz')):
+                value = om.MAngle(value).asDegrees()
+            elif plug.endswith(_BOOL_CHANNELS):
+                value = bool(value)
+            value_dic[plug].append(value)
+        return value_dic
+
+
+@dataclass
+class SnapshotDiff:
+    """Changes needed to bring the scene in line with an AbcSnapshot.
+
+    Attributes:
+        set_plugs: Target MPlugs whose value differs.
+        set_values: New values aligned with set_plugs.
+        connect: (source MPlug, target MPlug) pairs not yet connected.
+        skipped: Target plug names that differ but cannot be set.
+    """
+    set_plugs: List[om.MPlug] = field(default_factory=list)
+    set_values: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.float64))
+    connect: List[Tuple[om.MPlug, om.MPlug]] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.set_plugs) + len(self.connect)
+
+
+def capture_snapshot(abc_node: str, namespace: str = ':', target_ns: Optional[Sequence[str]] = None,
+                     topnodes: Optional[Sequence[str]] = None,
+                     filter: Optional[Sequence[str]] = None) -> AbcSnapshot:
+    """Capture AlembicNode connections and static channels of the imported hierarchy.
+
+    Args:
+        abc_node: Imported AlembicNode.
+        namespace: Namespace of the imported Alembic nodes.
+        target_ns: Namespaces of the asset(s) receiving the cache.
+        topnodes: Top nodes of the imported hierarchy (static values).
+        filter: AlembicNode outputs to ignore.
+
+    Returns:
+        AbcSnapshot
+    """
+    snap = AbcSnapshot(abc_node=abc_node)
+    out_attrs = set(ABC_OUT_ATTRS) - set(filter or [])
+
+    with _timed(snap.timings, 'capture_connections'):
+        pairs = cmds.listConnections(abc_node, plugs=True, connections=True,
+                                     source=False, destination=True, scn=True) or []
+        src, dst = [], []
+        for abc_plug, imported_plug in zip(pairs[0::2], pairs[1::2]):
+            if abc_plug.split('.', 1)[-1].split('[')[0] not in out_attrs:
+                continue
+            for target in _target_names(_strip_namespace(imported_plug, namespace), target_ns):
+                src.append(abc_plug)
+                dst.append(target)
+        # Keep only targets that exist in the scene
+        _, found = _resolve_plugs(dst)
+        snap.con_src = [s for s, ok in zip(src, found) if ok]
+        snap.con_dst = [d for d, ok in zip(dst, found) if ok]
+
+    with _timed(snap.timings, 'capture_static'):
+        transforms = cmds.ls(topnodes, dag=True, type='transform') if topnodes else []
+        src_names, dst_names = [], []
+        for node in transforms:
+            targets = _target_names(node.rsplit('|', 1)[-1].rsplit(':', 1)[-1], target_ns)
+            for ch in STATIC_CHANNELS:
+                for target in targets:
+                    src_names.append(f'{node}.{ch}')
+                    dst_names.append(f'{target}.{ch}')
+
+        src_plugs, src_found = _resolve_plugs(src_names)
+        _, dst_found = _resolve_plugs(dst_names)
+        # Animated (cache driven) channels are not static: only free plugs are kept
+        keep = src_found & dst_found
+        keep &= np.array([p is not None and _settable(p) for p in src_plugs], dtype=bool)
+        kept_src = [p for p, k in zip(src_plugs, keep) if k]
+        snap.static_plugs = [n for n, k in zip(dst_names, keep) if k]
+        snap.static_values = _read_values(kept_src)
+
+    logger.debug(f"AbcSnapshot {abc_node}: {len(snap.con_dst)} connections, "
+                 f"{len(snap.static_plugs)} static channels")
+    return snap
+
+
+def diff_snapshot(snap: AbcSnapshot, connections: bool = True) -> SnapshotDiff:
+    """Keep only the snapshot entries that differ from the current scene.
+
+    Args:
+        snap: Snapshot from capture_snapshot (or from_dict).
+        connections: Include connections, False diffs static values only.
+
+    Returns:
+        SnapshotDiff
+    """
+    diff = SnapshotDiff()
+    with _timed(snap.timings, 'diff'):
+        dst_plugs, found = _resolve_plugs(snap.static_plugs)
+        current = _read_values(dst_plugs)
+        changed = found & ~np.isclose(current, snap.static_values, atol=_TOLERANCE, equal_nan=True)
+        set_idx = []
+        for i in np.flatnonzero(changed):
+            if _settable(dst_plugs[i]):
+                set_idx.append(i)
+            else:
+                diff.skipped.append(snap.static_plugs[i])
+        diff.set_plugs = [dst_plugs[i] for i in set_idx]
+        diff.set_values = snap.static_values[np.asarray(set_idx, dtype=np.int64)]
+
+        if connections:
+            src_plugs, src_found = _resolve_plugs(snap.con_src)
+            con_plugs, con_found = _resolve_plugs(snap.con_dst)
+            for src, dst, ok in zip(src_plugs, con_plugs, src_found & con_found):
+                if not ok:
+                    continue
+                existing = dst.source()
+                if not existing.isNull and existing == src:
+                    continue
+                diff.connect.append((src, dst))
+
+    if diff.skipped:
+        logger.warning(f"{len(diff.skipped)} static plug(s) not settable: {diff.skipped[:10]}")
+    return diff
+
+
+def apply_diff(diff: SnapshotDiff, snap: Optional[AbcSnapshot] = None) -> int:
+    """Apply a SnapshotDiff with one MDGModifier (one undo entry).
+
+    Args:
+        diff: Result of diff_snapshot.
+        snap: Optional snapshot receiving the 'apply' timing.
+
+    Returns:
+        int: Number of plugs touched.
+    """
+    timings = snap.timings if snap is not None else {}
+    with _timed(timings, 'apply'):
+        if not len(diff):
+            return 0
+
+        modifier = om.MDGModifier()
+        for plug, value in zip(diff.set_plugs, diff.set_values):
+            if plug.partialName(useLongNames=True) in _BOOL_CHANNELS:
+                modifier.newPlugValueBool(plug, bool(value))
+            else:
+                modifier.newPlugValueDouble(plug, float(value))
+
+        unlocked = []
+        for src, dst in diff.connect:
+            if dst.isLocked:
+                unlocked.append(dst)
+            existing = dst.source()
+            if not existing.isNull:
+                modifier.disconnect(existing, dst)
+            modifier.connect(src, dst)
+
+        def _redo():
+            for plug in unlocked:
+                plug.isLocked = False
+            modifier.doIt()
+
+        def _undo():
+            modifier.undoIt()
+            for plug in unlocked:
+                plug.isLocked = True
+
+        push_undo(_redo, _undo)
+    return len(diff)
+
+
+def reapply_snapshot(abc_node: str, namespace: str = ':', target_ns: Optional[Sequence[str]] = None,
+                     topnodes: Optional[Sequence[str]] = None) -> AbcSnapshot:
+    """Capture, diff and apply in one call; returns the snapshot with timings."""
+    snap = capture_snapshot(abc_node, namespace, target_ns, topnodes)
+    touched = apply_diff(diff_snapshot(snap), snap)
+    phases = ', '.join(f'{k} {v:.1f}ms' for k, v in snap.timings.items())
+    logger.info(f"AbcSnapshot {abc_node}: {touched} plug(s) updated ({phases})")
+    return snap
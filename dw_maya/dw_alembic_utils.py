@@ -16,6 +16,8 @@ Connection Management:
     cleanAbcConnections: Remove unwanted connections
     setBsConnections: Create blendShape connections
 
+    See dw_alembic_snapshot for the batched capture/diff/apply used by importShotAbc.
+
 Features:
     - Namespace support for import/export
     - Static attribute preservation
@@ -38,6 +40,7 @@ import dw_maya.dw_maya_utils as dwu
 from dw_maya.dw_maya_utils import flags
 from dw_maya.dw_decorators import acceptString
 import dw_maya.dw_yeti as dwpgy
+import dw_maya.dw_alembic_snapshot as dwabc_snap
 from collections import defaultdict
 from itertools import chain
 import os
@@ -591,6 +594,8 @@ def importShotAbc(path, target_namespace=':', alembic_namespace='anim', **kwargs
             - debug (bool): Return debug information like Alembic connections, static values, etc. Defaults to False.
             - delete (bool): Delete the imported Alembic nodes after processing. Defaults to True.
             - connectMode (int): Connection mode. Defaults to 0 (standard connection).
+            - legacy (bool): Use the per-attribute cmds capture/reapply instead of
+              the dw_alembic_snapshot diff. Defaults to False.
 
     Returns:
         dict: A dictionary containing the Alembic nodes and related information, depending on the debug flag.
@@ -617,6 +622,7 @@ def importShotAbc(path, target_namespace=':', alembic_namespace='anim', **kwargs
     debug = flags(kwargs, False, 'debug')
     delete = flags(kwargs, True, 'delete')
     directConnect = flags(kwargs, 0, 'connectMode')
+    legacy = flags(kwargs, False, 'legacy')
 
     # the name for the abc namespace
     if target_namespace == ':':
@@ -630,11 +636,19 @@ def importShotAbc(path, target_namespace=':', alembic_namespace='anim', **kwargs
     # AlembicNode name
     abc = list(abc_geos.keys())[0]
 
-    # Queries Direct Connections
-    con_dic = getAbcConnections(abc, ns, [target_namespace])
-    # Query the value on all nodes
     topGrp = list(abc_geos.values())[0]
-    static_dic = getAbcStatic(topGrp, [target_namespace])
+    face_set = None
+    if legacy:
+        # Queries Direct Connections
+        con_dic = getAbcConnections(abc, ns, [target_namespace])
+        # Query the value on all nodes
+        static_dic = getAbcStatic(topGrp, [target_namespace])
+    else:
+        # Connections and static values captured as arrays, only the
+        # plugs differing from the scene are touched in one MDGModifier
+        snapshot = dwabc_snap.capture_snapshot(abc, ns, [target_namespace], topGrp)
+        con_dic = snapshot.connection_dict()
+        static_dic = snapshot.static_dict()
     # This Query is for yeti, during the connection, it lost face in sets
     # We Should disconnect and reconnect the yeti nodes from geometries
     if face:
@@ -642,9 +656,17 @@ def importShotAbc(path, target_namespace=':', alembic_namespace='anim', **kwargs
     # re-fork everything
     # TODO : should we refork if a node as a certain pattern (for example for cfx)
     # TODO : add also namespace to those
-    setAbcStatic(static_dic)
+    if legacy:
+        setAbcStatic(static_dic)
+        if not directConnect:
+            setAbcConnections(con_dic)
+    else:
+        # blendShape mode (connectMode=1) only takes the static values from the snapshot
+        diff = dwabc_snap.diff_snapshot(snapshot, connections=not directConnect)
+        dwabc_snap.apply_diff(diff, snapshot)
+        phases = ', '.join(f'{k} {v:.1f}ms' for k, v in snapshot.timings.items())
+        logger.info(f'importShotAbc {abc}: {len(diff)} plug(s) updated ({phases})')
     if not directConnect:
-        setAbcConnections(con_dic)
         cleanAbcConnections(abc, con_dic)
     elif directConnect == 1:
         print('direct connect')
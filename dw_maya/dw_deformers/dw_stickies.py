@@ -276,6 +276,26 @@ def create_follicle_constraint(ctrl_zro, mesh_shape, uv, base_name, in_mesh_con)
     return follicle
 
 
+def _positions_by_name(components, kind, returnMPoints=False):
+    """{'<shape>.<kind>[i]': position} from one bulk geometry query per mesh.
+
+    Keys use the shape's partial path, like MDagPath.partialPathName().
+    """
+    from dw_maya.dw_maya_utils.dw_component_geometry import component_geometry
+    from dw_maya.dw_maya_utils.dw_component_set import _dag_path
+
+    positions = {}
+    if not components:
+        return positions
+    # ranged strings: far fewer selection list entries than a flat list
+    for shape, geo in component_geometry(cmds.ls(components), kind=kind, uvs=False).items():
+        partialPath = _dag_path(shape).partialPathName()
+        for index, pos in zip(geo.indices.tolist(), geo.positions.tolist()):
+            key = f'{partialPath}.{kind}[{index}]'
+            positions[key] = om.MPoint(*pos) if returnMPoints else pos
+    return positions
+
+
 def getFaceCenterPositions(meshFaces, returnMPoints=False):
     """
     Returns the center position of faces in world space for the given mesh faces.
@@ -287,41 +307,7 @@ def getFaceCenterPositions(meshFaces, returnMPoints=False):
     Returns:
         dict: A dictionary where keys are face components and values are either MPoints or lists of world coordinates.
     """
-    dFaceVsFacePosition = {}
-    selMSelectionList = om.MSelectionList()
-
-    # Add each face to the MSelectionList
-    for face in meshFaces:
-        selMSelectionList.add(face)
-
-    dagPathMDagPath = om.MDagPath()
-    componentMObject = om.MObject()
-
-    # Iterate over the selection list (mesh polygon components)
-    iterSel = om.MItSelectionList(selMSelectionList, om.MFn.kMeshPolygonComponent)
-    while not iterSel.isDone():
-        iterSel.getDagPath(dagPathMDagPath, componentMObject)
-        partialPath = dagPathMDagPath.partialPathName()  # Mesh name without the full DAG path
-
-        # Iterator for the mesh polygons
-        polyIter = om.MItMeshPolygon(dagPathMDagPath, componentMObject)
-        while not polyIter.isDone():
-            index = polyIter.index()
-            centerMPoint = polyIter.center(om.MSpace.kWorld)  # Get center of the face in world space
-
-            key = f'{partialPath}.f[{index}]'  # Create a key for the face
-
-            # Store the center position either as an MPoint or a list of [x, y, z]
-            if returnMPoints:
-                dFaceVsFacePosition[key] = centerMPoint
-            else:
-                dFaceVsFacePosition[key] = [centerMPoint.x, centerMPoint.y, centerMPoint.z]
-
-            polyIter.next()  # Move to the next face
-
-        iterSel.next()  # Move to the next selected item
-
-    return dFaceVsFacePosition
+    return _positions_by_name(meshFaces, 'f', returnMPoints)
 
 
 def getVertexPositions(meshVerts, returnMPoints=False):
@@ -335,41 +321,7 @@ def getVertexPositions(meshVerts, returnMPoints=False):
     Returns:
         dict: A dictionary where keys are vertex components and values are either MPoints or lists of world coordinates.
     """
-    dVertexPosition = {}
-    selMSelectionList = om.MSelectionList()
-
-    # Add each vertex to the MSelectionList
-    for vtx in meshVerts:
-        selMSelectionList.add(vtx)
-
-    dagPathMDagPath = om.MDagPath()
-    componentMObject = om.MObject()
-
-    # Iterate over the selection list (mesh vertex components)
-    iterSel = om.MItSelectionList(selMSelectionList, om.MFn.kMeshVertComponent)
-    while not iterSel.isDone():
-        iterSel.getDagPath(dagPathMDagPath, componentMObject)
-        partialPath = dagPathMDagPath.partialPathName()  # Mesh name without the full DAG path
-
-        # Iterator for the mesh vertices
-        vtxIter = om.MItMeshVertex(dagPathMDagPath, componentMObject)
-        while not vtxIter.isDone():
-            index = vtxIter.index()
-            posMPoint = vtxIter.position(om.MSpace.kWorld)  # World-space position of the vertex
-
-            key = f'{partialPath}.vtx[{index}]'  # Create a key for the vertex
-
-            # Store the position either as an MPoint or a list of [x, y, z]
-            if returnMPoints:
-                dVertexPosition[key] = posMPoint
-            else:
-                dVertexPosition[key] = [posMPoint.x, posMPoint.y, posMPoint.z]
-
-            vtxIter.next()  # Move to the next vertex
-
-        iterSel.next()  # Move to the next selected item
-
-    return dVertexPosition
+    return _positions_by_name(meshVerts, 'vtx', returnMPoints)
 
 
 def getUniqueBaseName(srcObjName, dstSuffixes=[]):
@@ -494,10 +446,11 @@ def createStickyControls(driverComponents=[], componentType='f', createControlPa
 
     mask = 31 if componentType == 'vtx' else 34
     mesh_components = cmds.filterExpand(driverComponents, expand=True, selectionMask=mask)
-    if componentType == 'vtx':
-        d_component_position = getVertexPositions(mesh_components, returnMPoints=True)
-    else:
-        d_component_position = getFaceCenterPositions(mesh_components, returnMPoints=True)
+    # Positions + closest UVs of every driver in one query per mesh
+    # delay import to avoid circular call
+    from dw_maya.dw_maya_utils.dw_component_geometry import component_geometry
+    from dw_maya.dw_maya_utils.dw_component_set import shape_key
+    geometry = component_geometry(cmds.ls(mesh_components), kind=componentType)
 
     for driver in mesh_components:
         geo_name, comp_num = driver.split(".")
@@ -531,11 +484,8 @@ def createStickyControls(driverComponents=[], componentType='f', createControlPa
         in_mesh_con, temp_cluster = _resolve_history_source(mesh_shape, before)
 
         # Get UVs and setup follicle or pointOnPoly constraint
-        sh_only = mesh_shape.split("|")[-1]  # key is only the shape's short name (matches partialPathName())
-        component_m_point = d_component_position[f'{sh_only}.{comp_num}']
-        # delay import to avoid circular call
-        from dw_maya.dw_maya_utils import closest_uv_on_mesh
-        uv = closest_uv_on_mesh(mesh_shape, position=component_m_point)
+        geo = geometry[shape_key(mesh_shape)]
+        uv = geo.uvs[geo.row(int(re.search(r'\[(\d+)\]', comp_num).group(1)))].tolist()
 
         if constrainViaFollicles:
             follicle = create_follicle_constraint(ctrl_zero, mesh_shape, uv, base_name, in_mesh_con)
@@ -25,6 +25,7 @@ import maya.mel as mel
 from collections import defaultdict
 import re
 from dw_maya.dw_decorators import acceptString
+from dw_maya.dw_maya_utils import dw_proximity
 
 
 def get_root_tip(sel: list, mode=1):
@@ -48,26 +49,18 @@ def get_root_tip(sel: list, mode=1):
         >>> get_root_tip(["curve1", "curve2"], mode=1)
         ['curve1.cv[3]', 'curve2.cv[5]']
     """
-    # Ensure we are only working with NURBS curves
-    sel = cmds.ls(sel, dag=True, type='nurbsCurve')
+    # CV counts are read in one API pass instead of flattening every cv[*]
+    shapes, counts = dw_proximity.curve_cv_counts(sel)
     output = []
 
-    for s in sel:
-        cvs = cmds.ls(s + '.cv[*]', flatten=True)  # Get all CVs of the curve
-
-        if not cvs:
+    for s, num_cvs in zip(shapes, counts):
+        if not num_cvs:
             cmds.warning(f"No CVs found for curve: {s}")
             continue
 
         # Pick the tip (last) or root (first) CV depending on the mode
-        if mode:
-            # Mode 1: Tip (last CV)
-            index = len(cvs) - 1
-        else:
-            # Mode 0: Root (first CV)
-            index = 0
-
-        output.append('{}.cv[{}]'.format(s, index))
+        index = num_cvs - 1 if mode else 0
+        output.append(f'{s}.cv[{index}]')
 
     return output
 
@@ -345,7 +338,7 @@ def recursive_name(name: str) -> str:
         str: A unique name with an incremented number inserted into the placeholder.
     """
     # Regular expression to check for the '{}' placeholder
-    pattern = r'\{\}'
+    pattern = r'\{[^{}]*\}'
 
     # Ensure the placeholder '{}' exists in the provided name
     if not re.search(pattern, name):
@@ -358,6 +351,8 @@ def recursive_name(name: str) -> str:
         if iteration > 10000:
             raise RuntimeError("Exceeded maximum iterations. Could not find a unique name.")
 
+    return name.format(iteration)
+
 
 def mag(p1, p2):
     """
@@ -471,25 +466,8 @@ def sel_curves_by_component(sel, curves, threshold=0.1):
         cmds.warning("No selection or curves provided.")
         return []
 
-    # Convert selected components to vertices and get their positions
-    sel_vtx = cmds.polyListComponentConversion(sel, tv=True)
-    sel_vtx_fl = cmds.ls(sel_vtx, fl=True)
-    sel_pos = [cmds.pointPosition(p) for p in sel_vtx_fl]
-
-    # Get root CVs (cv[0]) of the provided curves
-    crv_roots = list_cv_index(curves, 0)
-
-    # Initialize a set to avoid duplicates
-    result = set()
-
-    # Calculate distance between each vertex and curve root, compare to threshold
-    for vertex_pos in sel_pos:
-        for root_cv in crv_roots:
-            root_pos = cmds.pointPosition(root_cv)
-            if mag(vertex_pos, root_pos) < threshold:
-                result.add(root_cv.split('.')[0])  # Add curve transform node
-
-    return list(result)
+    # Roots and vertices are read in bulk, then matched through one KD-tree
+    return dw_proximity.curves_near_components(sel, curves, threshold, cv_index=0)
 
 
 def create_single_crv_by_vtx(sel_component, curves, threshold=0.1):
@@ -508,33 +486,8 @@ def create_single_crv_by_vtx(sel_component, curves, threshold=0.1):
         cmds.warning("No selection or curves provided.")
         return []
 
-    # Get root CVs (cv[0]) of the provided curves
-    crv_roots = list_cv_index(curves, 0)
-
-    # Convert the selected component to faces
-    sel_faces = cmds.polyListComponentConversion(sel_component, tf=True)
-    sel_faces_fl = cmds.ls(sel_faces, fl=True)
-
-    result = []
-    for face in sel_faces_fl:
-        # Get centroid of the face component
-        face_centroid = get_centroid(face)
-
-        # Find closest curve within threshold
-        candidates = []
-        for root in crv_roots:
-            root_pos = cmds.pointPosition(root)
-            distance = mag(face_centroid, root_pos)
-            if distance < threshold:
-                candidates.append((root, distance))
-
-        # If there are any candidates, pick the closest one
-        if candidates:
-            closest_curve = min(candidates, key=lambda x: x[1])[0]
-            result.append(closest_curve.split('.')[0])  # Add the curve transform
-
-    # Return only unique curve transforms
-    return list(set(result))
+    # Face centroids and curve roots are read in bulk, one nearest query per face
+    return dw_proximity.closest_curve_per_face(sel_component, curves, threshold, cv_index=0)
 
 
 def group_curves_by_proximity(threshold=0.1):
@@ -551,17 +504,26 @@ def group_curves_by_proximity(threshold=0.1):
     Returns:
         None
     """
-    sel = cmds.ls(sl=True, fl=True)
+    sel = cmds.ls(sl=True)
     component = sel[:-1]
     curve_grp = sel[-1]
-    crv = sel_curves_by_component(component, curve_grp, threshold)
-    name = '{}_subguides_{{:03d}}_grp'.format(curve_grp.split('_')[1])
-    new_name = recursive_name(name)
+    prefix = curve_grp.split('_')[1]
+
+    # Roots, vertices and face centroids are each read once; both passes
+    # below query KD-trees instead of calling pointPosition per pair
+    shapes, roots = dw_proximity.get_curve_cv_positions(curve_grp, 0)
+    index = dw_proximity.ProximityIndex(roots, labels=shapes)
+    near = index.within(dw_proximity.get_component_positions(component), threshold)
+    crv = [shapes[i] for i in near]
+
+    new_name = recursive_name(f'{prefix}_subguides_{{:03d}}_grp')
     grp = cmds.group(crv, n=new_name)
-    single = create_single_crv_by_vtx(component, grp, threshold)
-    grp = cmds.group([i.split('.')[0] for i in single],
-                     n='{}_loopguides_{}_grp'.format(curve_grp.split('_')[1],
-                                                     grp.split('_')[-2]))
+
+    # Single closest grouped curve per face
+    sub_index = dw_proximity.ProximityIndex(roots[near], labels=crv)
+    single = sub_index.closest_labels(dw_proximity.get_face_centroids(component), threshold)
+    grp = cmds.group(single,
+                     n=f"{prefix}_loopguides_{grp.split('_')[-2]}_grp")
     if not cmds.objExists('guide_loop_set'):
         loop_set = cmds.sets(n='guide_loop_set', em=True)
     else:
@@ -29,7 +29,7 @@ from maya import cmds
 
 from dw_maya.dw_maya_nodes import MayaNode
 
-from dw_maya.dw_node_registry import resolve
+from dw_maya.dw_node_registry import resolve_many
 # import important pour declencher le registry
 import dw_maya.dw_deformers.dw_deformer_class        # noqa: F401
 import dw_maya.dw_nucleus_utils.dw_nconstraint_class  # noqa: F401
@@ -44,8 +44,8 @@ def lsNode(*args, **kwargs) -> List:
         return []
 
     result = []
-    for node in nodes:
-        cls = resolve(node)  # ← tout est délégué ici
+    # one cmds.ls(showType=True) for the whole list, resolution cached per type
+    for node, cls in zip(nodes, resolve_many(nodes)):
         try:
             result.append(cls(node))
         except Exception as e:
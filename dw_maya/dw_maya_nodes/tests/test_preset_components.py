@@ -28,6 +28,8 @@ from maya import cmds
 from dw_maya.dw_maya_nodes import MayaNode
 from dw_maya.dw_maya_utils.mesh_class import Mesh
 import dw_maya.dw_presets_io.preset_components as pcomp
+import dw_maya.dw_presets_io.preset_bulk as preset_bulk
+import dw_maya.dw_presets_io.dw_preset as dw_preset
 
 # ---------------------------------------------------------------------------
 # Minimal in-Maya test runner
@@ -587,6 +589,37 @@ def test_clipboard_roundtrip():
             os.environ[clip.CLIPBOARD_ENV] = keep
 
 
+def test_bulk_capture_matches_cmds():
+    """MPlug capture returns the same values as the cmds.getAttr path."""
+    with _tmp_nodes(lambda: _make_cube("dw_bulk_cube")) as nodes:
+        cmds.setAttr(f"{nodes[0]}.rotateY", 33.0)
+        cmds.setAttr(f"{nodes[0]}.visibility", False)
+        legacy = dw_preset.createAttrPreset(nodes[0], bulk=False)
+        bulk = dw_preset.createAttrPreset(nodes[0])
+        for node, attrs in legacy.items():
+            for attr, value in attrs.items():
+                _assert(attr in bulk[node], f"{node}.{attr} missing from bulk capture")
+                if isinstance(value, float):
+                    _assert(_close(value, bulk[node][attr]),
+                            f"{node}.{attr}: {value} != {bulk[node][attr]}")
+                else:
+                    _assert(value == bulk[node][attr],
+                            f"{node}.{attr}: {value!r} != {bulk[node][attr]!r}")
+
+
+def test_bulk_apply_skips_unchanged():
+    """Unchanged plugs are not written; one call is one undo entry."""
+    with _tmp_nodes(lambda: _make_cube("dw_bulk_apply")) as nodes:
+        tr = nodes[0]
+        report = preset_bulk.apply_values({tr: {"translateX": 0.0, "translateY": 2.0,
+                                                "rotateZ": 90.0, "visibility": True}})
+        _assert(report.changed == 2 and report.unchanged == 2, str(report))
+        _assert(_close(cmds.getAttr(f"{tr}.rotateZ"), 90.0), "rotateZ not set in degrees")
+        cmds.undo()
+        _assert(_close(cmds.getAttr(f"{tr}.translateY"), 0.0), "undo did not revert translateY")
+        _assert(_close(cmds.getAttr(f"{tr}.rotateZ"), 0.0), "undo did not revert rotateZ")
+
+
 _ALL_TESTS = [
     ("createPreset shape (transform+shape roles)", test_create_preset_shape),
     ("applyPreset round-trip",                     test_apply_preset_roundtrip),
@@ -605,6 +638,8 @@ _ALL_TESTS = [
     ("Connection recursive_namespace mode",        test_connection_recursive_namespace),
     ("duplicate_nodes with constraint",            test_duplicate_with_constraint),
     ("Preset clipboard round-trip",                test_clipboard_roundtrip),
+    ("Bulk capture matches cmds capture",          test_bulk_capture_matches_cmds),
+    ("Bulk apply skips unchanged / one undo",      test_bulk_apply_skips_unchanged),
 ]
 
 
@@ -1,37 +1,197 @@
-# Explicit imports for clarity and maintainability
-from dw_maya.dw_maya_utils.dw_maya_attrs import get_type_io, add_attr, lock_attr, infer_attr_type
-from dw_maya.dw_maya_utils.dw_maya_data import flags, unique_name, convert_list_to_mel_str, merge_two_dicts
-from dw_maya.dw_maya_utils.dw_lsTr import lsTr
-from dw_maya.dw_maya_utils.dw_maya_components import (component_in_list, chunks, mag, get_next_free_multi_index,
-                                 create_maya_ranges, get_vtx_pos, invert_selection, extract_id,
-                                 grow_component_selection, grow_component_selection_max)
-from dw_maya.dw_maya_utils.dw_maya_time import current_timerange
-from dw_maya.dw_maya_utils.dw_maya_message import message, warning, error
-from dw_maya.dw_maya_utils.dw_maya_prefs import (MayaVersionInfo,
-                                                 get_scene_name,
-                                                 make_project_dir,
-                                                 set_project,
-                                                 get_project_from_scene,
-                                                 set_project_from_scene,
-                                                 get_current_project,
-                                                 get_project_history,
-                                                 restore_previous_project,
-                                                 clear_project_history)
-from dw_maya.dw_maya_utils.dw_uv import closest_uv_on_mesh, nearest_uv_on_mesh, get_uv_from_vtx
-from dw_maya.dw_maya_utils.dw_mesh_utils import extract_faces, separate_mesh
-from dw_maya.dw_maya_utils.dw_vtx import change_curve_pivot, get_common_roots
-from dw_maya.dw_maya_utils.dw_maya_hierarchy import (
-    get_dirty_reasons,
-    build_dirty_cache,
-    get_subtree,
-    dirty_in_subtree,
-    unlocked_attrs,
-    is_constrained,
-    get_fixable_dirty,
-    freeze_node,
-    reset_node_pivot,
-    fix_node,
-    fix_constrained_node,
-    fix_hierarchy,
+"""General Maya utilities (attributes, components, hierarchy, project, UVs...).
+
+The package is a lazy facade: ``dwu.<name>`` works exactly as before, but the
+submodule defining ``<name>`` is only imported the first time it is accessed.
+A tool needing ``create_maya_ranges`` no longer pays for the raycast,
+hierarchy or project helpers at shelf-click time.
+
+Submodules are reachable the same way (``dwu.dw_maya_hierarchy``) and through
+regular imports (``from dw_maya.dw_maya_utils import dw_proximity``).
+
+Functions:
+    import_report: Import every submodule and report the cost of each one
+        against an import-time budget (run it in a fresh session).
+
+Example:
+    >>> import dw_maya.dw_maya_utils as dwu
+    >>> dwu.create_maya_ranges([0, 1, 2, 5])     # imports dw_maya_components only
+    >>> dwu.import_report(budget_ms=30)
+
+Author: DrWeeny
+"""
+
+import importlib
+import math
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+# Public name -> submodule defining it
+_LAZY_ATTRS: Dict[str, str] = {
+    # dw_maya_attrs
+    'get_type_io': 'dw_maya_attrs',
+    'add_attr': 'dw_maya_attrs',
+    'lock_attr': 'dw_maya_attrs',
+    'infer_attr_type': 'dw_maya_attrs',
+    # dw_maya_data
+    'flags': 'dw_maya_data',
+    'unique_name': 'dw_maya_data',
+    'convert_list_to_mel_str': 'dw_maya_data',
+    'merge_two_dicts': 'dw_maya_data',
+    # dw_lsTr
+    'lsTr': 'dw_lsTr',
+    # dw_maya_components
+    'component_in_list': 'dw_maya_components',
+    'chunks': 'dw_maya_components',
+    'mag': 'dw_maya_components',
+    'get_next_free_multi_index': 'dw_maya_components',
+    'create_maya_ranges': 'dw_maya_components',
+    'get_vtx_pos': 'dw_maya_components',
+    'invert_selection': 'dw_maya_components',
+    'extract_id': 'dw_maya_components',
+    'grow_component_selection': 'dw_maya_components',
+    'grow_component_selection_max': 'dw_maya_components',
+    # dw_component_set
+    'ComponentSet': 'dw_component_set',
+    # dw_component_geometry
+    'component_geometry': 'dw_component_geometry',
+    'ComponentGeometry': 'dw_component_geometry',
+    # dw_maya_time
+    'current_timerange': 'dw_maya_time',
+    # dw_maya_message
+    'message': 'dw_maya_message',
+    'warning': 'dw_maya_message',
+    'error': 'dw_maya_message',
+    # dw_maya_prefs
+    'MayaVersionInfo': 'dw_maya_prefs',
+    'get_scene_name': 'dw_maya_prefs',
+    'make_project_dir': 'dw_maya_prefs',
+    'set_project': 'dw_maya_prefs',
+    'get_project_from_scene': 'dw_maya_prefs',
+    'set_project_from_scene': 'dw_maya_prefs',
+    'get_current_project': 'dw_maya_prefs',
+    'get_project_history': 'dw_maya_prefs',
+    'restore_previous_project': 'dw_maya_prefs',
+    'clear_project_history': 'dw_maya_prefs',
+    # dw_uv
+    'closest_uv_on_mesh': 'dw_uv',
+    'nearest_uv_on_mesh': 'dw_uv',
+    'get_uv_from_vtx': 'dw_uv',
+    # dw_mesh_utils
+    'extract_faces': 'dw_mesh_utils',
+    'separate_mesh': 'dw_mesh_utils',
+    # dw_vtx
+    'change_curve_pivot': 'dw_vtx',
+    'get_common_roots': 'dw_vtx',
+    # dw_maya_hierarchy
+    'get_dirty_reasons': 'dw_maya_hierarchy',
+    'build_dirty_cache': 'dw_maya_hierarchy',
+    'scan_hierarchy': 'dw_maya_hierarchy',
+    'apply_scan_fixes': 'dw_maya_hierarchy',
+    'DirtyScan': 'dw_maya_hierarchy',
+    'get_subtree': 'dw_maya_hierarchy',
+    'dirty_in_subtree': 'dw_maya_hierarchy',
+    'unlocked_attrs': 'dw_maya_hierarchy',
+    'is_constrained': 'dw_maya_hierarchy',
+    'get_fixable_dirty': 'dw_maya_hierarchy',
+    'freeze_node': 'dw_maya_hierarchy',
+    'reset_node_pivot': 'dw_maya_hierarchy',
+    'fix_node': 'dw_maya_hierarchy',
+    'fix_constrained_node': 'dw_maya_hierarchy',
+    'fix_hierarchy': 'dw_maya_hierarchy',
+}
+
+# Every submodule, including the ones without re-exported names
+_SUBMODULES = (
+    'dw_component_geometry', 'dw_component_set', 'dw_lsTr', 'dw_maya_attrs', 'dw_maya_clean',
+    'dw_maya_components', 'dw_maya_data', 'dw_maya_flush', 'dw_maya_hierarchy', 'dw_maya_layer', 'dw_maya_message',
+    'dw_maya_outliner', 'dw_maya_prefs', 'dw_maya_raycast', 'dw_maya_time',
+    'dw_mesh_utils', 'dw_proximity', 'dw_uv', 'dw_vtx', 'mesh_class',
 )
 
+# Default per-submodule import budget used by import_report (milliseconds)
+IMPORT_BUDGET_MS = 50.0
+
+# Submodule -> first import duration (ms), inclusive of what it imports
+_IMPORT_TIMES: Dict[str, float] = {}
+
+__all__ = sorted(_LAZY_ATTRS) + ['import_report']
+
+
+def _load(module_name: str):
+    """Import ``module_name`` from this package, timing the first import."""
+    full_name = f'{__name__}.{module_name}'
+    module = sys.modules.get(full_name)
+    if module is not None:
+        return module
+    start = time.perf_counter()
+    module = importlib.import_module(full_name)
+    _IMPORT_TIMES.setdefault(module_name, (time.perf_counter() - start) * 1000.0)
+    return module
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is not None:
+        value = getattr(_load(module_name), name)
+    elif name in _SUBMODULES:
+        value = _load(name)
+    else:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    # Cache on the package so the next access is a plain attribute lookup
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS) | set(_SUBMODULES))
+
+
+def import_report(budget_ms: Optional[float] = None,
+                  modules: Optional[List[str]] = None,
+                  log: bool = True) -> List[Tuple[str, float, bool]]:
+    """Import submodules and report each one's first-import cost.
+
+    Modules already imported keep the duration measured when they were first
+    loaded through this package, or report 0.0 when something imported them
+    directly. Durations are inclusive: a submodule importing a heavy
+    dependency carries its cost. Run it in a fresh session (e.g.
+    ``mayapy -c "import dw_maya.dw_maya_utils as d; d.import_report()"``)
+    to measure cold-start cost.
+
+    Args:
+        budget_ms: Per-module budget, defaults to ``IMPORT_BUDGET_MS``.
+        modules: Submodules to check, defaults to all of them.
+        log: Log the report (over-budget modules as warnings).
+
+    Returns:
+        list: ``(module, milliseconds, over_budget)`` sorted slowest first,
+        modules failing to import reported as ``inf``.
+    """
+    budget = IMPORT_BUDGET_MS if budget_ms is None else budget_ms
+    rows = []
+    for module_name in modules or _SUBMODULES:
+        try:
+            _load(module_name)
+        except Exception as e:
+            rows.append((module_name, float('inf'), True))
+            if log:
+                from dw_logger import get_logger
+                get_logger().error(f"import_report: '{module_name}' failed to import: {e}")
+            continue
+        ms = _IMPORT_TIMES.get(module_name, 0.0)
+        rows.append((module_name, ms, ms > budget))
+    rows.sort(key=lambda row: -row[1])
+
+    if log:
+        from dw_logger import get_logger
+        logger = get_logger()
+        total = sum(ms for _, ms, _ in rows if math.isfinite(ms))
+        logger.info(f"dw_maya_utils import report: {total:.1f} ms total, budget {budget:.0f} ms/module")
+        for module_name, ms, over in rows:
+            line = f"  {module_name:<22} {ms:8.1f} ms"
+            if over:
+                logger.warning(line + "  OVER BUDGET")
+            else:
+                logger.info(line)
+    return rows
@@ -1,5 +1,4 @@
 import re
-import itertools
 import math
 from typing import Iterable, List, Generator, Tuple, Optional, Set
 
@@ -8,6 +7,7 @@ from dw_maya.dw_constants.node_re_mappings import COMPONENT_PATTERN
 from maya import cmds  # legacy alias kept for existing functions
 
 from dw_maya.dw_decorators import acceptString
+from dw_maya.dw_maya_utils.dw_component_set import ComponentSet, maya_ranges
 
 # Regex to detect any Maya component type from a component string (vtx, f, e, cv, …)
 _COMP_TYPE_RE = re.compile(r'\.(\w+)\[')
@@ -43,15 +43,9 @@ def select_border(selection:list=None, mode="outer", select=True)->list:
         cmds.warning("Wrong selection. (Must be a components selection.)")
         return []
 
-    if mode == "outer":
-        grow_sel = grow_component_selection(sel)
-        sel_flat = cmds.ls(sel, flatten=True)
-        border = list(set(grow_sel) - set(sel_flat))
-
-    if mode == "inner":
-        inv = invert_selection(sel, select=False, range_opti=False)
-        grow_sel = grow_component_selection(inv, select=False)
-        border = list(set(grow_sel) & set(sel))
+    if mode in ("outer", "inner"):
+        # outer: grown ring minus the selection / inner: selection minus its shrink
+        border = ComponentSet.from_strings(sel).border(mode).to_strings(flatten=True)
 
     if select:
         cmds.select(border)
@@ -296,16 +290,7 @@ def create_maya_ranges(indices: List[ComponentID]) -> List[ComponentRange]:
         >>> create_maya_ranges([0, 1, 2, 3, 5, 6, 7])
         ['0:3', '5:7']
     """
-    ranges = []
-    for _, group in itertools.groupby(enumerate(sorted(indices)), lambda x: x[1] - x[0]):
-        group = list(group)
-        start = group[0][1]
-        end = group[-1][1]
-
-        ranges.append(
-            f"{start}" if start == end else f"{start}:{end}")
-
-    return ranges
+    return maya_ranges(indices)
 
 def invert_selection(sel=None, select=True, range_opti=True):
     """
@@ -333,6 +318,13 @@ def invert_selection(sel=None, select=True, range_opti=True):
         return []
 
     compo_type = COMPONENT_PATTERN.match(sel[0]).group(2)
+    if compo_type in ('vtx', 'e', 'f', 'cv'):
+        inverted = ComponentSet.from_strings(sel, kind=compo_type).invert()
+        new_list = inverted.to_strings(flatten=not range_opti)
+        if select:
+            cmds.select(new_list, r=True)
+        return new_list
+
     # Derive object names directly from sel to guarantee name consistency
     objs = list(dict.fromkeys(s.split('.')[0] for s in sel))
     sel_set = set(sel)
@@ -391,14 +383,12 @@ def _grow_cv_selection(sel: List[str]) -> List[str]:
         result.append(f"{base}[{start}:{end}]")
     return result
 
-def __flatten(maya_sel, **kwargs):
-    return cmds.ls(maya_sel, flatten=True, **kwargs)
-
 def grow_component_selection(sel: list = None, select: bool = True) -> list:
     """Grow component selection by one topological step.
 
-    For mesh components (vtx / f / e): converts to vertices, expands via edge
-    connectivity (vtx → edge → vtx), then converts back to the original type.
+    For mesh components (vtx / f / e): expands through vertex connectivity
+    (same result as vtx → edge → vtx conversions) using the cached adjacency
+    of :class:`ComponentSet`.
     For NURBS curve CVs: expands each index range by ±1 (clamped).
 
     Args:
@@ -427,18 +417,9 @@ def grow_component_selection(sel: list = None, select: bool = True) -> list:
     if orig_type == 'cv':
         as_grow = _grow_cv_selection(sel)
 
-    else:
-        # Mesh: vtx → edge → vtx → original type
-        if orig_type != 'vtx':
-            as_init = __flatten(maya.cmds.polyListComponentConversion(sel, toVertex=True))
-        else:
-            as_init = __flatten(maya.cmds.polyListComponentConversion(sel, toEdge=True))
-        if orig_type == 'e':
-            as_grow = __flatten(maya.cmds.polyListComponentConversion(as_init, toEdge=True))
-        elif orig_type == 'f':
-            as_grow = __flatten(maya.cmds.polyListComponentConversion(as_init, toFace=True))
-        elif orig_type == 'vtx':
-            as_grow = __flatten(maya.cmds.polyListComponentConversion(as_init, toVertex=True))
+    elif orig_type in ('vtx', 'e', 'f'):
+        # Mesh: one pass over the cached adjacency instead of string conversions
+        as_grow = ComponentSet.from_strings(sel, kind=orig_type).grow().to_strings(flatten=True)
 
     if sel == as_grow:
         return sel
@@ -470,6 +451,14 @@ def grow_component_selection_max(sel: list = None, select: bool = True) -> list:
     if not sel:
         return []
 
+    m = _COMP_TYPE_RE.search(sel[0])
+    if m and m.group(1) in ('vtx', 'e', 'f'):
+        # Whole connected region == shells touched by the selection
+        result = ComponentSet.from_strings(sel, kind=m.group(1)).shell().to_strings(flatten=True)
+        if select and result:
+            maya.cmds.select(result, replace=True)
+        return result
+
     current = set(sel)
     while True:
         grown = grow_component_selection(list(current), select=False)
@@ -9,6 +9,11 @@ Features:
       their compensate-translate counterparts (rotatePivotTranslate,
       scalePivotTranslate) which Maya adds silently when a user moves a pivot.
     - Build a flat dict and a nested tree from a single DAG traversal.
+    - Bulk scanner: one traversal, one plug sweep per channel group into
+      numpy arrays, every rule (matrix, pivot, history, intermediate,
+      naming) evaluated as a vectorized mask, with a per-rule timing report.
+    - Batched fixes: pivots, orphan intermediate shapes and shape names go
+      through one MDagModifier registered as a single undo step.
     - Context manager that saves lock/keyable/channelBox state, temporarily
       unlocks attributes, runs the operation, then restores original state.
     - Freeze transforms (makeIdentity) and reset pivots per node.
@@ -31,11 +36,13 @@ dw_maya_nodes integration notes:
                                                                   → dw_maya_utils
 
 Classes:
-    None (plain dicts are used for dirty-reason reports)
+    DirtyScan : Per-rule masks, driven flags and timings of a bulk scan.
 
 Functions:
     get_dirty_reasons    : Inspect one DAG node, return dirty breakdown dict.
     build_dirty_cache    : Traverse DAG, return (flat, nested) caches.
+    scan_hierarchy       : Bulk-scan every rule under a root into a DirtyScan.
+    apply_scan_fixes     : Fix the rows of a DirtyScan in one undo step.
     get_subtree          : Navigate the nested cache by short node names.
     dirty_in_subtree     : Collect dirty fullpaths under a given ancestor.
     unlocked_attrs       : Context manager – unlock attrs, restore on exit.
@@ -60,6 +67,10 @@ Example:
 
     >>> report = dw_hierarchy.fix_hierarchy("|rig", fix_matrix=True, fix_pivot=True)
 
+    >>> scan = dw_hierarchy.scan_hierarchy("|asset")
+    >>> scan.log_timings()
+    >>> dw_hierarchy.apply_scan_fixes(scan, fix_intermediate=True, fix_naming=True)
+
 TODO:
     - Extend skip logic for boss-defined constraint cases (e.g. keep
       parentConstraint but still freeze scale).
@@ -70,10 +81,16 @@ Author: DrWeeny
 """
 
 import contextlib
+import time
 import maya.api.OpenMaya
+import numpy as np
 from maya import cmds
 from typing import Any, Dict, Generator, List, Optional, Tuple, Union
 
+from dw_logger import get_logger
+
+logger = get_logger()
+
 # ---------------------------------------------------------------------------
 # Attribute name constants
 # ---------------------------------------------------------------------------
@@ -221,14 +238,20 @@ def get_dirty_reasons(
 def build_dirty_cache(
     root: Optional[str] = None,
     tol: float = 1e-5,
+    rules: Optional[List[str]] = None,
 ) -> Tuple[Dict[str, Dict[str, bool]], Dict]:
     """
     Traverse the DAG and build flat + nested dirty caches in one pass.
 
+    Backed by scan_hierarchy: facts are read in bulk and every rule is a
+    vectorized mask, instead of one get_dirty_reasons call per transform.
+
     Args:
         root: Optional DAG fullpath string to limit the scan (e.g. '|rig').
               When None the entire scene is traversed.
-        tol: Tolerance forwarded to get_dirty_reasons.
+        tol: Floating-point comparison tolerance.
+        rules: Rules to evaluate (see DIRTY_RULES), defaults to
+               ['matrix', 'pivot'].
 
     Returns:
         Tuple (flat, nested):
@@ -240,32 +263,11 @@ def build_dirty_cache(
         >>> flat, nested = build_dirty_cache(root="|rig")
         >>> print([p for p, r in flat.items() if r["dirty"]])
     """
-    it = maya.api.OpenMaya.MItDag(
-        maya.api.OpenMaya.MItDag.kDepthFirst,
-        maya.api.OpenMaya.MFn.kTransform,
-    )
-
-    if root:
-        sel = maya.api.OpenMaya.MSelectionList()
-        sel.add(root)
-        it.reset(
-            sel.getDagPath(0),
-            maya.api.OpenMaya.MItDag.kDepthFirst,
-            maya.api.OpenMaya.MFn.kTransform,
-        )
-
-    flat: Dict[str, Dict[str, bool]] = {}
+    scan = scan_hierarchy(root, tol, rules or ["matrix", "pivot"])
+    flat = scan.flat()
     nested: Dict = {}
-
-    while not it.isDone():
-        dag      = it.getPath()
-        fullpath = dag.fullPathName()
-        reasons  = get_dirty_reasons(dag, tol)
-
-        flat[fullpath] = reasons
+    for fullpath, reasons in flat.items():
         _insert_nested(nested, fullpath, reasons)
-        it.next()
-
     return flat, nested
 
 
@@ -338,6 +340,409 @@ def _walk_dirty(node: Dict, prefix: str, acc: List[str]) -> None:
         _walk_dirty(val, fullpath, acc)
 
 
+# ---------------------------------------------------------------------------
+# Bulk scanner  (one traversal, numpy rule masks, one modifier for fixes)
+# ---------------------------------------------------------------------------
+
+# Rules evaluated by scan_hierarchy, in report order
+DIRTY_RULES: Tuple[str, ...] = ("matrix", "pivot", "history", "intermediate", "naming")
+
+# Channel group -> child attributes, read into one (N, 3) array per group
+_CHANNEL_GROUPS: Dict[str, Tuple[str, str, str]] = {
+    "translate"           : ("translateX", "translateY", "translateZ"),
+    "rotate"              : ("rotateX", "rotateY", "rotateZ"),
+    "scale"               : ("scaleX", "scaleY", "scaleZ"),
+    "shear"               : ("shearXY", "shearXZ", "shearYZ"),
+    "rotatePivot"         : ("rotatePivotX", "rotatePivotY", "rotatePivotZ"),
+    "scalePivot"          : ("scalePivotX", "scalePivotY", "scalePivotZ"),
+    "rotatePivotTranslate": ("rotatePivotTranslateX", "rotatePivotTranslateY",
+                             "rotatePivotTranslateZ"),
+    "scalePivotTranslate" : ("scalePivotTranslateX", "scalePivotTranslateY",
+                             "scalePivotTranslateZ"),
+}
+
+# Channel groups each value rule needs
+_RULE_GROUPS: Dict[str, Tuple[str, ...]] = {
+    "matrix": ("translate", "rotate", "scale", "shear"),
+    "pivot" : ("rotatePivot", "scalePivot", "rotatePivotTranslate", "scalePivotTranslate"),
+}
+
+# Axis sequence per rotateOrder enum value (xyz, yzx, zxy, xzy, yxz, zyx)
+_ROTATE_ORDERS: Tuple[Tuple[int, int, int], ...] = (
+    (0, 1, 2), (1, 2, 0), (2, 0, 1), (0, 2, 1), (1, 0, 2), (2, 1, 0),
+)
+
+# Geometry input plug per shape type: connected means construction history
+_GEOMETRY_INPUTS: Dict[int, str] = {
+    om.MFn.kMesh        : "inMesh",
+    om.MFn.kNurbsCurve  : "create",
+    om.MFn.kNurbsSurface: "create",
+}
+
+
+class DirtyScan:
+    """
+    Result of scan_hierarchy: one row per transform, depth-first order.
+
+    Attributes:
+        paths   : Transform fullpaths (parents before children).
+        masks   : Rule name -> bool array aligned with paths.
+        driven  : Bool array, True when translate / rotate has an input.
+        timings : Step name -> milliseconds ('traverse', 'read:<group>',
+                  then one entry per rule).
+    """
+
+    def __init__(self, paths: List[str], objects: List[om.MObject]):
+        self.paths = paths
+        self.masks: Dict[str, np.ndarray] = {}
+        self.driven = np.zeros(len(paths), dtype=bool)
+        self.timings: Dict[str, float] = {}
+        self._objects = objects
+        # (transform row, shape MObject) of intermediate shapes nothing reads
+        self._orphans: List[Tuple[int, om.MObject]] = []
+        # (transform row, shape MObject, expected name) of misnamed shapes
+        self._renames: List[Tuple[int, om.MObject, str]] = []
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    @property
+    def dirty(self) -> np.ndarray:
+        """Bool array, True where any scanned rule fired."""
+        result = np.zeros(len(self.paths), dtype=bool)
+        for mask in self.masks.values():
+            result |= mask
+        return result
+
+    def dirty_paths(self, rule: Optional[str] = None) -> List[str]:
+        """Fullpaths flagged by ``rule`` (any rule when None)."""
+        mask = self.dirty if rule is None else self.masks[rule]
+        return [self.paths[i] for i in np.flatnonzero(mask)]
+
+    def reasons(self, row: int) -> Dict[str, bool]:
+        """Dirty-reasons dict for one row, same layout as get_dirty_reasons."""
+        result = {rule: bool(mask[row]) for rule, mask in self.masks.items()}
+        result["dirty"] = any(result.values())
+        return result
+
+    def flat(self) -> Dict[str, Dict[str, bool]]:
+        """{fullpath: reasons} for every scanned transform."""
+        return {path: self.reasons(row) for row, path in enumerate(self.paths)}
+
+    def log_timings(self) -> None:
+        """Log the per-step timing report, slowest first."""
+        total = sum(self.timings.values())
+        logger.info(f"scan_hierarchy: {len(self.paths)} transforms in {total:.1f} ms")
+        for step, ms in sorted(self.timings.items(), key=lambda item: -item[1]):
+            flagged = ""
+            if step in self.masks:
+                flagged = f"  ({int(self.masks[step].sum())} flagged)"
+            logger.info(f"  {step:<28} {ms:8.1f} ms{flagged}")
+
+
+def _traverse(root: Optional[str]) -> Tuple[List[str], List[om.MObject], List[Tuple[int, om.MObject, str, bool]]]:
+    """
+    Walk the DAG once, collecting transforms and the shapes under them.
+
+    Returns:
+        (paths, objects, shapes) where shapes holds
+        (transform row, shape MObject, short name, is intermediate).
+    """
+    it = om.MItDag(om.MItDag.kDepthFirst, om.MFn.kInvalid)
+    if root:
+        sel = om.MSelectionList()
+        sel.add(root)
+        it.reset(sel.getDagPath(0), om.MItDag.kDepthFirst, om.MFn.kInvalid)
+
+    paths: List[str] = []
+    objects: List[om.MObject] = []
+    shapes: List[Tuple[int, om.MObject, str, bool]] = []
+    rows: Dict[str, int] = {}
+
+    while not it.isDone():
+        obj = it.currentItem()
+        if obj.hasFn(om.MFn.kTransform):
+            path = it.fullPathName()
+            rows[path] = len(paths)
+            paths.append(path)
+            objects.append(obj)
+        elif obj.hasFn(om.MFn.kShape):
+            parent, _, name = it.fullPathName().rpartition("|")
+            row = rows.get(parent)
+            if row is not None:
+                shapes.append((row, obj, name, om.MFnDagNode(obj).isIntermediateObject))
+        it.next()
+
+    return paths, objects, shapes
+
+
+def _read_channels(objects: List[om.MObject], group: str) -> np.ndarray:
+    """Read one channel group of every transform into an (N, 3) array."""
+    node_class = om.MNodeClass("transform")
+    attrs = [node_class.attribute(name) for name in _CHANNEL_GROUPS[group]]
+    values = np.fromiter(
+        (om.MPlug(obj, attr).asDouble() for obj in objects for attr in attrs),
+        dtype=np.float64,
+        count=3 * len(objects),
+    )
+    return values.reshape(-1, 3)
+
+
+def _rotation_dirty(angles: np.ndarray, orders: np.ndarray, tol: float) -> np.ndarray:
+    """
+    Vectorized non-identity test for Euler rotations (radians).
+
+    Builds the rotation matrix of every row in its own rotate order and
+    compares it to identity, so 360° turns or (180, 180, 180) count as clean
+    like the quaternion test of get_dirty_reasons.
+    """
+    count = len(angles)
+    cos, sin = np.cos(angles), np.sin(angles)
+    axes = np.zeros((3, count, 3, 3))
+    for axis in range(3):
+        i, j = [k for k in range(3) if k != axis]
+        axes[axis, :, axis, axis] = 1.0
+        axes[axis, :, i, i] = cos[:, axis]
+        axes[axis, :, j, j] = cos[:, axis]
+        axes[axis, :, i, j] = sin[:, axis]
+        axes[axis, :, j, i] = -sin[:, axis]
+
+    matrices = np.empty((count, 3, 3))
+    for order, (first, second, third) in enumerate(_ROTATE_ORDERS):
+        rows = orders == order
+        if rows.any():
+            matrices[rows] = axes[first, rows] @ axes[second, rows] @ axes[third, rows]
+    return np.abs(matrices - np.eye(3)).max(axis=(1, 2)) > tol
+
+
+def scan_hierarchy(
+    root: Optional[str] = None,
+    tol: float = 1e-5,
+    rules: Optional[List[str]] = None,
+) -> DirtyScan:
+    """
+    Scan every transform under ``root`` for all dirty rules in one pass.
+
+    Facts are gathered in bulk – one DAG traversal (transforms, shapes and
+    intermediate flags), one plug sweep per channel group into numpy arrays,
+    one input-connection sweep for history – and each rule is then evaluated
+    as a vectorized mask over all transforms.
+
+    Rules:
+        matrix       – translate / rotate / scale / shear off identity.
+        pivot        – pivots or pivot compensate-translates non-zero.
+        history      – a visible shape has an incoming geometry connection.
+        intermediate – an intermediate shape is not read by anything.
+        naming       – short name used twice, or the single visible shape is
+                       not named '<transform>Shape'.
+
+    Args:
+        root: Optional DAG fullpath limiting the scan; whole scene when None.
+        tol: Floating-point tolerance for the value rules.
+        rules: Subset of DIRTY_RULES to evaluate, all of them when None.
+
+    Returns:
+        DirtyScan holding the masks and a per-step timing report.
+
+    Example:
+        >>> scan = scan_hierarchy("|asset", rules=["matrix", "history"])
+        >>> scan.dirty_paths("history")
+        >>> scan.log_timings()
+    """
+    rules = list(DIRTY_RULES) if rules is None else list(rules)
+    unknown = set(rules) - set(DIRTY_RULES)
+    if unknown:
+        raise ValueError(f"Unknown dirty rules {sorted(unknown)}, expected {DIRTY_RULES}")
+
+    start = time.perf_counter()
+    paths, objects, shapes = _traverse(root)
+    scan = DirtyScan(paths, objects)
+    scan.timings["traverse"] = (time.perf_counter() - start) * 1000.0
+    count = len(paths)
+
+    # Driven translate / rotate (constraint targets) – needed to skip fixes
+    start = time.perf_counter()
+    node_class = om.MNodeClass("transform")
+    driven_attrs = [node_class.attribute(name) for name in _DRIVEN_ATTRS]
+    scan.driven = np.fromiter(
+        (any(om.MPlug(obj, attr).isDestination for attr in driven_attrs) for obj in objects),
+        dtype=bool,
+        count=count,
+    )
+    scan.timings["read:driven"] = (time.perf_counter() - start) * 1000.0
+
+    channels: Dict[str, np.ndarray] = {}
+    for rule in rules:
+        for group in _RULE_GROUPS.get(rule, ()):
+            if group not in channels:
+                start = time.perf_counter()
+                channels[group] = _read_channels(objects, group)
+                scan.timings[f"read:{group}"] = (time.perf_counter() - start) * 1000.0
+
+    for rule in rules:
+        start = time.perf_counter()
+
+        if rule == "matrix":
+            order_attr = node_class.attribute("rotateOrder")
+            orders = np.fromiter((om.MPlug(obj, order_attr).asInt() for obj in objects),
+                                 dtype=np.int64, count=count)
+            mask = (
+                (np.abs(channels["translate"]) > tol).any(axis=1)
+                | (np.abs(channels["scale"] - 1.0) > tol).any(axis=1)
+                | (np.abs(channels["shear"]) > tol).any(axis=1)
+            )
+            # Only rows not already dirty pay for the rotation matrices
+            pending = ~mask
+            if pending.any():
+                mask[pending] = _rotation_dirty(channels["rotate"][pending], orders[pending], tol)
+
+        elif rule == "pivot":
+            mask = np.zeros(count, dtype=bool)
+            for group in _RULE_GROUPS["pivot"]:
+                mask |= (np.abs(channels[group]) > tol).any(axis=1)
+
+        elif rule == "history":
+            rows = []
+            for row, obj, _, intermediate in shapes:
+                attr = _GEOMETRY_INPUTS.get(obj.apiType())
+                if intermediate or attr is None:
+                    continue
+                if om.MFnDependencyNode(obj).findPlug(attr, False).isDestination:
+                    rows.append(row)
+            mask = np.bincount(np.asarray(rows, dtype=np.int64), minlength=count) > 0
+
+        elif rule == "intermediate":
+            scan._orphans = [
+                (row, obj) for row, obj, _, intermediate in shapes
+                if intermediate and not any(
+                    plug.isSource for plug in om.MFnDependencyNode(obj).getConnections())
+            ]
+            mask = np.zeros(count, dtype=bool)
+            mask[[row for row, _ in scan._orphans]] = True
+
+        else:  # naming
+            short = [path.rpartition("|")[2] for path in paths]
+            _, inverse, counts = np.unique(np.array(short, dtype=str),
+                                           return_inverse=True, return_counts=True)
+            mask = counts[inverse] > 1
+
+            visible = [(row, obj, name) for row, obj, name, intermediate in shapes if not intermediate]
+            per_transform = np.bincount(np.asarray([row for row, _, _ in visible], dtype=np.int64),
+                                        minlength=count)
+            scan._renames = []
+            for row, obj, name in visible:
+                expected = f"{short[row]}Shape"
+                if per_transform[row] == 1 and name != expected:
+                    scan._renames.append((row, obj, expected))
+            mask[[row for row, _, _ in scan._renames]] = True
+
+        scan.masks[rule] = mask
+        scan.timings[rule] = (time.perf_counter() - start) * 1000.0
+
+    return scan
+
+
+def apply_scan_fixes(
+    scan: DirtyScan,
+    fix_matrix: bool = True,
+    fix_pivot: bool = True,
+    fix_intermediate: bool = False,
+    fix_naming: bool = False,
+    skip_constrained: bool = True,
+) -> Dict[str, Dict[str, bool]]:
+    """
+    Fix the rows flagged by a DirtyScan, in one undo step.
+
+    Freezing bakes geometry, so it still runs makeIdentity per node (parents
+    first).  Everything else – pivot zeroing, orphan intermediate deletion
+    and shape renames – is queued on one MDagModifier and executed at once;
+    locked pivot plugs are unlocked around the modifier and relocked.
+    History is reported by the scan but never removed automatically.
+
+    Args:
+        scan: Result of scan_hierarchy (rules not scanned are not fixed).
+        fix_matrix: Freeze transforms on rows with a dirty matrix.
+        fix_pivot: Zero pivots and compensate-translates on dirty rows.
+        fix_intermediate: Delete intermediate shapes nothing reads.
+        fix_naming: Rename single visible shapes to '<transform>Shape'.
+        skip_constrained: Leave rows with driven translate / rotate alone.
+
+    Returns:
+        dict mapping fullpath -> {fix name: success} for every touched row.
+
+    Example:
+        >>> scan = scan_hierarchy("|asset")
+        >>> report = apply_scan_fixes(scan, fix_intermediate=True)
+    """
+    from dw_maya.dw_decorators.dw_generic_undo import push_undo
+
+    allowed = ~scan.driven if skip_constrained else np.ones(len(scan), dtype=bool)
+    if skip_constrained:
+        for row in np.flatnonzero(scan.dirty & scan.driven):
+            cmds.warning(f"apply_scan_fixes: skipping constrained node '{scan.paths[row]}'")
+
+    report: Dict[str, Dict[str, bool]] = {}
+    modifier = om.MDagModifier()
+    locked: List[om.MPlug] = []
+    queued: List[Tuple[str, str]] = []
+
+    if fix_pivot and "pivot" in scan.masks:
+        node_class = om.MNodeClass("transform")
+        attrs = [node_class.attribute(name)
+                 for group in _RULE_GROUPS["pivot"] for name in _CHANNEL_GROUPS[group]]
+        for row in np.flatnonzero(scan.masks["pivot"] & allowed):
+            obj = scan._objects[row]
+            for attr in attrs:
+                plug = om.MPlug(obj, attr)
+                if plug.isLocked:
+                    locked.append(plug)
+                modifier.newPlugValueDouble(plug, 0.0)
+            queued.append((scan.paths[row], "pivot"))
+
+    if fix_intermediate:
+        for row, obj in scan._orphans:
+            if allowed[row]:
+                modifier.deleteNode(obj)
+                queued.append((scan.paths[row], "intermediate"))
+
+    if fix_naming:
+        for row, obj, name in scan._renames:
+            if allowed[row]:
+                modifier.renameNode(obj, name)
+                queued.append((scan.paths[row], "naming"))
+
+    def _run(method) -> None:
+        for plug in locked:
+            plug.isLocked = False
+        try:
+            method()
+        finally:
+            for plug in locked:
+                plug.isLocked = True
+
+    cmds.undoInfo(openChunk=True)
+    try:
+        # Freeze first, parents before children (rows are depth-first)
+        if fix_matrix and "matrix" in scan.masks:
+            for row in np.flatnonzero(scan.masks["matrix"] & allowed):
+                path = scan.paths[row]
+                report.setdefault(path, {})["matrix"] = freeze_node(path)
+
+        if queued:
+            success = True
+            try:
+                push_undo(lambda: _run(modifier.doIt), lambda: _run(modifier.undoIt))
+            except Exception as exc:
+                cmds.warning(f"apply_scan_fixes: batched fixes failed: {exc}")
+                success = False
+            for path, fix in queued:
+                report.setdefault(path, {})[fix] = success
+    finally:
+        cmds.undoInfo(closeChunk=True)
+
+    return report
+
+
 # ---------------------------------------------------------------------------
 # Attribute state context manager
 # ---------------------------------------------------------------------------
@@ -761,24 +1166,6 @@ def fix_hierarchy(
         >>> fix_hierarchy(dwn.MayaNode("|rig"))
     """
     root_path = _resolve_transform(root) if root is not None else None
-    flat, _   = build_dirty_cache(root_path, tol)
-    report: Dict[str, Dict[str, bool]] = {}
-
-    # flat is ordered depth-first (parent before child) because MItDag is
-    # kDepthFirst and Python 3.7+ dicts preserve insertion order.
-    for fullpath, reasons in flat.items():
-        if not reasons["dirty"]:
-            continue
-
-        if skip_constrained and is_constrained(fullpath):
-            cmds.warning(f"fix_hierarchy: skipping constrained node '{fullpath}'")
-            continue
-
-        needs_matrix = fix_matrix and reasons["matrix"]
-        needs_pivot  = fix_pivot  and reasons["pivot"]
-
-        if needs_matrix or needs_pivot:
-            report[fullpath] = fix_node(fullpath, needs_matrix, needs_pivot)
-
-    return report
-
+    scan = scan_hierarchy(root_path, tol, ["matrix", "pivot"])
+    fixed = apply_scan_fixes(scan, fix_matrix, fix_pivot, skip_constrained=skip_constrained)
+    return {path: {"matrix": True, "pivot": True, **result} for path, result in fixed.items()}
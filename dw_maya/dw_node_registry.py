@@ -1,13 +1,40 @@
-from typing import Type, Callable, Dict, List, Tuple
+"""Node-type -> MayaNode subclass registry.
+
+Classes register by node type (``register_type``) or by condition
+(``register_condition``); ``resolve`` picks the most specific class for a live
+node: exact type -> inherited type walk -> conditions -> MayaNode.
+
+Resolution is cached at two levels so wrapping thousands of nodes costs one
+lookup per node instead of several cmds round trips:
+
+    type cache : node type -> registered class (steps 1-2). Scene independent,
+                 cleared when the registry changes.
+    node cache : MObjectHandle hash -> class, for nodes resolved by the
+                 condition step. Cleared by scene callbacks (node added /
+                 removed / renamed, connection made or broken, file new /
+                 open) since conditions inspect the live graph.
+
+``resolve_many`` resolves a whole list with one ``cmds.ls(showType=True)``.
+"""
+
+from typing import Type, Callable, Dict, List, Optional, Sequence, Tuple
 from maya import cmds
+import maya.api.OpenMaya as om
 
 _NODE_CLASSES: Dict[str, Type] = {}
 _CONDITION_CLASSES: List[Tuple[Callable, Type]] = []
 
+# node type -> registered class, None when only conditions can decide
+_TYPE_CACHE: Dict[str, Optional[Type]] = {}
+# MObjectHandle.hashCode() -> (handle, class) for condition-resolved nodes
+_NODE_CACHE: Dict[int, Tuple[om.MObjectHandle, Type]] = {}
+_CALLBACK_IDS: List[int] = []
+
 
 def register_type(node_type: str, cls: Type) -> None:
     """Register by Maya node type string."""
     _NODE_CLASSES[node_type] = cls
+    clear_cache()
 
 
 def register_condition(condition: Callable, cls: Type) -> None:
@@ -28,31 +55,155 @@ def register_condition(condition: Callable, cls: Type) -> None:
         register_condition(_is_bounding, BoundingMesh)
     """
     _CONDITION_CLASSES.append((condition, cls))
+    clear_cache()
 
 
-def resolve(node: str) -> Type:
-    from dw_maya.dw_maya_nodes import MayaNode
+# ---------------------------------------------------------------------------
+# Cache management
+# ---------------------------------------------------------------------------
+
+def clear_cache() -> None:
+    """Drop every cached resolution (type and node level)."""
+    _TYPE_CACHE.clear()
+    _NODE_CACHE.clear()
+
 
-    node_type = cmds.nodeType(node)
+def _clear_nodes(*_args) -> None:
+    _NODE_CACHE.clear()
 
-    # 1. exact match → highest priority
-    if node_type in _NODE_CLASSES:
-        return _NODE_CLASSES[node_type]
 
-    # 2. walk the inheritance chain
-    # cmds.nodeType(node, inherited=True) → ['containerBase', ..., 'geometryFilter', 'cluster']
-    inherited = cmds.nodeType(node, inherited=True) or []
-    for parent_type in reversed(inherited):  # most specific first
-        if parent_type in _NODE_CLASSES:
-            return _NODE_CLASSES[parent_type]
+def _install_callbacks() -> None:
+    """Register the scene callbacks invalidating the node cache (once)."""
+    if _CALLBACK_IDS:
+        return
+    try:
+        _CALLBACK_IDS.extend([
+            om.MDGMessage.addNodeAddedCallback(_clear_nodes, 'dependNode'),
+            om.MDGMessage.addNodeRemovedCallback(_clear_nodes, 'dependNode'),
+            om.MNodeMessage.addNameChangedCallback(om.MObject(), _clear_nodes),
+            om.MDGMessage.addConnectionCallback(_clear_nodes),
+            om.MSceneMessage.addCallback(om.MSceneMessage.kBeforeNew, _clear_nodes),
+            om.MSceneMessage.addCallback(om.MSceneMessage.kBeforeOpen, _clear_nodes),
+        ])
+    except RuntimeError:
+        # Callbacks unavailable (e.g. batch init): keep resolving uncached
+        remove_callbacks()
+
+
+def remove_callbacks() -> None:
+    """Unregister the invalidation callbacks and clear the node cache."""
+    if _CALLBACK_IDS:
+        om.MMessage.removeCallbacks(list(_CALLBACK_IDS))
+        del _CALLBACK_IDS[:]
+    _NODE_CACHE.clear()
+
+
+def _type_class(node_type: str) -> Optional[Type]:
+    """Registered class for ``node_type`` (steps 1-2), cached; None if none."""
+    if node_type in _TYPE_CACHE:
+        return _TYPE_CACHE[node_type]
+
+    # 1. exact match -> highest priority
+    cls = _NODE_CLASSES.get(node_type)
+    if cls is None:
+        # 2. walk the inheritance chain
+        # cmds.nodeType(type, inherited=True, isTypeName=True) -> ['containerBase', ..., 'geometryFilter', 'cluster']
+        try:
+            inherited = cmds.nodeType(node_type, inherited=True, isTypeName=True) or []
+        except Exception:
+            inherited = []
+        for parent_type in reversed(inherited):  # most specific first
+            if parent_type in _NODE_CLASSES:
+                cls = _NODE_CLASSES[parent_type]
+                break
+
+    _TYPE_CACHE[node_type] = cls
+    return cls
+
+
+def _handle(node: str) -> Optional[om.MObjectHandle]:
+    sel = om.MSelectionList()
+    try:
+        sel.add(node)
+        return om.MObjectHandle(sel.getDependNode(0))
+    except RuntimeError:
+        return None
+
+
+def _condition_class(node: str, handle: Optional[om.MObjectHandle] = None) -> Type:
+    """Step 3 (conditions) with the per-node cache in front of it."""
+    from dw_maya.dw_maya_nodes import MayaNode
+
+    if handle is None:
+        handle = _handle(node)
+    if handle is not None and _CALLBACK_IDS:
+        cached = _NODE_CACHE.get(handle.hashCode())
+        if cached is not None and cached[0].isAlive() and cached[0] == handle:
+            return cached[1]
 
     # 3. condition-based (ClothNode etc.)
-    instance = MayaNode(node)
-    for condition, cls in _CONDITION_CLASSES:
-        if condition(instance):
-            return cls
+    cls = MayaNode
+    if _CONDITION_CLASSES:
+        instance = MayaNode(node)
+        for condition, candidate in _CONDITION_CLASSES:
+            if condition(instance):
+                cls = candidate
+                break
+
+    if handle is not None and _CALLBACK_IDS:
+        _NODE_CACHE[handle.hashCode()] = (handle, cls)
+    return cls
+
+
+# ---------------------------------------------------------------------------
+# Resolution
+# ---------------------------------------------------------------------------
 
-    return MayaNode
+def resolve(node: str) -> Type:
+    _install_callbacks()
+    handle = _handle(node)
+    if handle is not None:
+        node_type = om.MFnDependencyNode(handle.object()).typeName
+    else:
+        node_type = cmds.nodeType(node)
+
+    cls = _type_class(node_type)
+    if cls is not None:
+        return cls
+    return _condition_class(node, handle)
+
+
+def resolve_many(nodes: Sequence[str], node_types: Optional[Sequence[str]] = None) -> List[Type]:
+    """Resolve classes for many nodes at once, aligned with ``nodes``.
+
+    Types come from ``node_types`` when the caller already has them (e.g. from
+    its own ``cmds.ls(showType=True)``), otherwise from one
+    ``cmds.ls(nodes, showType=True)`` call. Each distinct type is resolved
+    once; only nodes whose type has no registered class go through the
+    (cached) condition step.
+
+    Args:
+        nodes: Node names.
+        node_types: Optional node types aligned with ``nodes``.
+
+    Returns:
+        list: One class per input node.
+    """
+    nodes = list(nodes)
+    if not nodes:
+        return []
+    _install_callbacks()
+
+    if node_types is None:
+        pairs = cmds.ls(nodes, showType=True) or []
+        if len(pairs) == 2 * len(nodes):
+            node_types = pairs[1::2]
+        else:
+            # Missing / duplicated names break the positional match
+            node_types = [cmds.nodeType(n) if cmds.objExists(n) else '' for n in nodes]
+
+    return [_type_class(node_type) or _condition_class(node)
+            for node, node_type in zip(nodes, node_types)]
 
 
 def resolve_type(node_type: str) -> Type:
@@ -68,17 +219,4 @@ def resolve_type(node_type: str) -> Type:
     if not node_type:
         return MayaNode
 
-    # 1. exact match
-    if node_type in _NODE_CLASSES:
-        return _NODE_CLASSES[node_type]
-
-    # 2. walk the inheritance chain of the type name
-    try:
-        inherited = cmds.nodeType(node_type, inherited=True, isTypeName=True) or []
-    except Exception:
-        inherited = []
-    for parent_type in reversed(inherited):  # most specific first
-        if parent_type in _NODE_CLASSES:
-            return _NODE_CLASSES[parent_type]
-
-    return MayaNode
\ No newline at end of file
+    return _type_class(node_type) or MayaNode
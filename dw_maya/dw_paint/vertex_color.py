@@ -87,9 +87,10 @@ Author: DrWeeny
 """
 
 from __future__ import annotations
-import re
+import time
+from collections import deque
 
-from typing import List, Optional, Set
+from typing import Deque, Dict, List, Optional, Tuple
 
 from maya import cmds
 from dw_maya.dw_paint.protocol import WeightSource, WeightList
@@ -120,6 +121,14 @@ _CHANNELS = {
 # only truly unassigned vertices, so no clamping happens anywhere.
 _UNSET_VALUE = 0.0
 
+# Per-sample (during_stroke_cmd) latency budget, in milliseconds. While a
+# flush costs more than this, intermediate flushes are spaced out so the
+# brush keeps up with the cursor; values still accumulate every sample and
+# final_cmd always flushes.
+LATENCY_BUDGET_MS = 16.0
+# Number of recent samples kept for ChannelPaintController.latency_stats
+_LATENCY_WINDOW = 256
+
 # ---------------------------------------------------------------------------
 # MEL callback installation
 # ---------------------------------------------------------------------------
@@ -258,6 +267,39 @@ def _ensure_scratch_colorset(mesh: str) -> None:
         MeshDataFactory.get(mesh).refresh()
 
 
+def _poly_color_ranges(mesh: str, ids: np.ndarray, values: np.ndarray,
+                       flag: Optional[str] = None) -> None:
+    """Write *values* on vertices *ids* of the current colorSet with cmds.
+
+    One (undoable) ``polyColorPerVertex`` per distinct value and vertex
+    range, so a big stroke costs a handful of commands instead of one per
+    vertex. *flag* ('r', 'g', 'b' or 'a') writes a single channel; None
+    writes grayscale RGB with alpha 1 (the scratch preview set).
+    """
+    from dw_maya.dw_maya_utils.dw_component_set import maya_ranges
+
+    if not len(ids):
+        return
+    order = np.argsort(values, kind='stable')  # ids stay sorted within a value
+    sorted_values = values[order]
+    bounds = np.flatnonzero(sorted_values[1:] != sorted_values[:-1]) + 1
+    for group, val in zip(np.split(ids[order], bounds),
+                          sorted_values[np.concatenate(([0], bounds))].tolist()):
+        for rng in maya_ranges(group):
+            if flag is None:
+                cmds.polyColorPerVertex(
+                    f'{mesh}.vtx[{rng}]',
+                    r=val, g=val, b=val, a=1.0,
+                    colorDisplayOption=True, representation=4,
+                )
+            else:
+                cmds.polyColorPerVertex(
+                    f'{mesh}.vtx[{rng}]',
+                    colorDisplayOption=True, representation=4,
+                    **{flag: val},
+                )
+
+
 # ---------------------------------------------------------------------------
 # Artisan paint controller — stored in __main__ for MEL access
 # ---------------------------------------------------------------------------
@@ -271,6 +313,13 @@ class ChannelPaintController:
 
     The channel is captured at construction time (the source's active map);
     the whole session paints that channel only, RGB(A) siblings are preserved.
+
+    Working state is kept as flat numpy arrays indexed by vertex id: the
+    channel values, a dirty bitmask (pending flush) and a stroke bitmask
+    (pending undo commit), the selection mask and a CSR neighbour table.
+    Stamps and smooths are masked vector ops and every flush is one
+    ``setVertexColors`` upload per colorSet. Per-sample latency is recorded
+    (see ``latency_stats``) and bounded by ``LATENCY_BUDGET_MS``.
     """
 
     def __init__(self, source: 'VertexColorSet') -> None:
@@ -284,24 +333,29 @@ class ChannelPaintController:
         # Read current channel values as our working buffer (numpy array for fast ops)
         self._values = np.array(source.get_weights(), dtype=np.float64)
 
-        self._stamp_hits = {}
-        self._dirty_verts = set()
+        self._stamp_hits: Dict[int, float] = {}
+        # Vertices changed in memory but not yet written to Maya
+        self._dirty = np.zeros(len(self._values), dtype=bool)
         self._stroke_completed = False
-        # Neighbour cache delegated to MeshDataFactory (shared, already built)
-        self._neighbour_cache = {}
+        # Vertex -> neighbours CSR (indptr, indices), built on first smooth
+        self._neighbours: Optional[Tuple[np.ndarray, np.ndarray]] = None
         self._batch_mode = False
-        # Vertex selection mask — None means all vertices are paintable
-        self._vtx_mask: Optional[Set[int]] = None
+        # Vertex selection mask (bool per vertex) — None means all paintable
+        self._vtx_mask: Optional[np.ndarray] = None
         # Whole-stroke undo tracking: _flush_dirty writes live (raw API, not
         # undoable per-call, needed for viewport feedback during the drag) —
         # one single undo entry covering the whole stroke is pushed instead,
         # from the values snapshotted here at stroke start.
         self._stroke_start_values: Optional[np.ndarray] = None
-        self._stroke_dirty_verts: Set[int] = set()
+        self._stroke_dirty = np.zeros(len(self._values), dtype=bool)
         # Sibling (non-active) channel snapshot of the REAL colorSet, read
         # ONCE per stroke in before_stroke_cmd — see _flush_dirty for why
         # this must never come from re-reading Maya's 'current' mid-stroke.
         self._sibling_snapshot: Optional[np.ndarray] = None
+        # Latency of the last samples (ms) and flush throttling state
+        self._sample_ms: Deque[float] = deque(maxlen=_LATENCY_WINDOW)
+        self._flush_ms = 0.0
+        self._last_flush = 0.0
 
     def _pin_target(self) -> str:
         """Where 'current' should rest right now: scratch in BW mode, real colorSet otherwise.
@@ -354,14 +408,25 @@ class ChannelPaintController:
         except Exception as e:
             logger.warning(f"Could not restore colorSet on tool deactivation: {e}")
 
+    def reset_stroke_state(self) -> None:
+        """Drop any in-flight stamp / flush / undo state (sized to ``_values``)."""
+        n = len(self._values)
+        self._stamp_hits = {}
+        self._dirty = np.zeros(n, dtype=bool)
+        self._stroke_dirty = np.zeros(n, dtype=bool)
+        self._stroke_start_values = None
+        self._sibling_snapshot = None
+
     def before_stroke_cmd(self) -> None:
         """Click — before first stamp projection."""
-        self._stamp_hits = {}
+        self.reset_stroke_state()
         self._stroke_completed = False
         self._vtx_mask = self._read_selection_mask()
         self._stroke_start_values = self._values.copy()
-        self._stroke_dirty_verts = set()
         self._sibling_snapshot = self._read_sibling_snapshot()
+        self._sample_ms.clear()
+        self._flush_ms = 0.0
+        self._last_flush = 0.0
 
     def _read_sibling_snapshot(self) -> 'np.ndarray':
         """Read the real colorSet's full RGBA once, before any stamp can taint it.
@@ -383,29 +448,45 @@ class ChannelPaintController:
         colors = fn_mesh.getVertexColors(self.color_set, unset)
         return np.array([[c.r, c.g, c.b, c.a] for c in colors], dtype=np.float64)
 
-    def _read_selection_mask(self) -> Optional[Set[int]]:
+    def _read_selection_mask(self) -> Optional[np.ndarray]:
         """Read current vertex selection on this mesh.
 
-        Returns a set of vertex indices if a component selection exists,
+        Returns a bool mask over the vertices if a component selection
+        exists on this mesh (edges / faces are converted to their vertices),
         or None if nothing is selected (all vertices are paintable).
         """
-        sel_all = cmds.ls(sl=True, fl=True) or []
-        vtx_components = [s for s in sel_all if '.' in s]
-        if not vtx_components:
+        import maya.api.OpenMaya as om2
+        from dw_maya.dw_maya_utils.dw_component_set import ComponentSet
+
+        mesh_dag = om2.MDagPath(MeshDataFactory.get(self.mesh)._dag)
+        if mesh_dag.hasFn(om2.MFn.kTransform):
+            mesh_dag.extendToShape()
+        sel = om2.MGlobal.getActiveSelectionList()
+        own = om2.MSelectionList()
+        for i in range(sel.length()):
+            try:
+                dag, comp = sel.getComponent(i)
+            except (RuntimeError, TypeError):
+                continue
+            if comp.isNull():
+                continue
+            if dag.hasFn(om2.MFn.kTransform):
+                dag.extendToShape()
+            if dag == mesh_dag:
+                own.add((dag, comp))
+        if own.isEmpty():
             return None
-        vtx = cmds.polyListComponentConversion(vtx_components, toVertex=True)
-        vtx = cmds.ls(vtx, fl=True) or []
-        if not vtx:
+
+        # only this mesh is left in the list: at most one block of indices
+        ids = next((ids for _, ids in ComponentSet.from_selection_list(own, 'vtx').items()), None)
+        if ids is None:
+            return None
+        ids = ids[ids < len(self._values)]
+        if not ids.size:
             return None
-        # Filter to vertices belonging to this mesh (namespace-safe)
-        mesh_base = self.mesh.split('|')[-1]
-        indices: Set[int] = set()
-        for v in vtx:
-            if mesh_base in v:
-                m = re.search(r'\[(\d+)\]', v)
-                if m:
-                    indices.add(int(m.group(1)))
-        return indices if indices else None
+        mask = np.zeros(len(self._values), dtype=bool)
+        mask[ids] = True
+        return mask
 
     def init_cmd(self, shape: str) -> str:
         """First stamp hits a shape — must return '-path 1' for artisan."""
@@ -417,9 +498,44 @@ class ChannelPaintController:
         self._stamp_hits[v_id] = value
 
     def during_stroke_cmd(self) -> None:
-        """After each stamp during a drag — apply and flush dirty verts."""
+        """After each stamp during a drag — apply and flush dirty verts.
+
+        When the last flush cost more than ``LATENCY_BUDGET_MS``, the next
+        one waits until at least that long has passed since it, so slow
+        uploads (huge brush on a dense mesh) never stack up behind the
+        cursor. Skipped samples stay dirty and go out with the next flush.
+        """
+        start = time.perf_counter()
         self._apply_stamp()
-        self._flush_dirty()
+        if (self._flush_ms <= LATENCY_BUDGET_MS
+                or (start - self._last_flush) * 1000.0 >= self._flush_ms):
+            self._timed_flush()
+        self._sample_ms.append((time.perf_counter() - start) * 1000.0)
+
+    def _timed_flush(self) -> None:
+        start = time.perf_counter()
+        if self._dirty.any():
+            self._flush_dirty()
+            self._flush_ms = (time.perf_counter() - start) * 1000.0
+            self._last_flush = start
+
+    def latency_stats(self) -> Dict[str, float]:
+        """Latency of the recent stroke samples, in milliseconds.
+
+        Returns:
+            dict: ``count``, ``mean``, ``p95``, ``max`` and ``over_budget``
+            (number of samples slower than ``LATENCY_BUDGET_MS``).
+        """
+        if not self._sample_ms:
+            return {'count': 0, 'mean': 0.0, 'p95': 0.0, 'max': 0.0, 'over_budget': 0}
+        samples = np.fromiter(self._sample_ms, dtype=np.float64, count=len(self._sample_ms))
+        return {
+            'count': int(samples.size),
+            'mean': float(samples.mean()),
+            'p95': float(np.percentile(samples, 95)),
+            'max': float(samples.max()),
+            'over_budget': int((samples > LATENCY_BUDGET_MS).sum()),
+        }
 
     def after_stroke_cmd(self) -> None:
         """Click/drag release — mark stroke as complete for undo."""
@@ -443,6 +559,10 @@ class ChannelPaintController:
         self._apply_stamp()
         self._flush_dirty()
         self._commit_stroke_undo()
+        if self._sample_ms:
+            stats = self.latency_stats()
+            logger.debug(f"Stroke samples: {stats['count']}, mean {stats['mean']:.2f} ms, "
+                         f"p95 {stats['p95']:.2f} ms, max {stats['max']:.2f} ms")
 
         target = self._pin_target()
         if target == _PREVIEW_SET:
@@ -475,81 +595,57 @@ class ChannelPaintController:
         the same way (rewind + undoable write) so Ctrl+Z reverts what the
         viewport actually shows.
         """
-        if not self._stroke_dirty_verts or self._stroke_start_values is None:
+        if not self._stroke_dirty.any() or self._stroke_start_values is None:
             return
 
-        source = self.source
         mesh = self.mesh
         color_set = self.color_set
         idx = self._channel_idx
         flag = self._channel_flag
-        dirty = list(self._stroke_dirty_verts)
-        final_values = self._values.copy()
-        start_values = self._stroke_start_values.copy()
-        preview = bool(getattr(source, '_preview_active', False))
+        dirty = np.flatnonzero(self._stroke_dirty)
+        dirty_list = dirty.tolist()
+        final_values = np.round(self._values[dirty], 5)
+        start_values = self._stroke_start_values[dirty]
+        preview = bool(getattr(self.source, '_preview_active', False))
 
-        self._stroke_dirty_verts = set()
+        self._stroke_dirty[:] = False
         self._stroke_start_values = None
 
         def _commit():
             try:
                 import maya.api.OpenMaya as om2
-                from collections import defaultdict
-                from dw_maya.dw_maya_utils.dw_maya_components import create_maya_ranges
 
                 fn_mesh = MeshDataFactory.get(mesh)._fn_mesh
                 unset = om2.MColor((_UNSET_VALUE,) * 4)
 
-                def _paint_cmds(values, is_scratch):
-                    # One undoable polyColorPerVertex per distinct value,
-                    # ranges compressed. Grouping keeps the command count low
-                    # even for a big stroke.
-                    groups = defaultdict(list)
-                    for i in dirty:
-                        groups[round(float(values[i]), 5)].append(i)
-                    for val, ids in groups.items():
-                        for rng in create_maya_ranges(ids):
-                            if is_scratch:
-                                cmds.polyColorPerVertex(
-                                    f'{mesh}.vtx[{rng}]',
-                                    r=val, g=val, b=val, a=1.0,
-                                    colorDisplayOption=True, representation=4,
-                                )
-                            else:
-                                cmds.polyColorPerVertex(
-                                    f'{mesh}.vtx[{rng}]',
-                                    colorDisplayOption=True, representation=4,
-                                    **{flag: val},
-                                )
-
                 cmds.undoInfo(openChunk=True)
                 try:
                     # -- real colorSet ---------------------------------
                     base = fn_mesh.getVertexColors(color_set, unset)
-                    rewind = om2.MColorArray()
-                    for i in dirty:
-                        c = base[i] if i < len(base) else unset
-                        rgba = [c.r, c.g, c.b, c.a]
-                        rgba[idx] = float(start_values[i])
-                        rewind.append(om2.MColor(rgba))
+                    rewind = np.full((len(dirty_list), 4), _UNSET_VALUE)
+                    for row, i in enumerate(dirty_list):
+                        if i < len(base):
+                            c = base[i]
+                            rewind[row] = (c.r, c.g, c.b, c.a)
+                    rewind[:, idx] = start_values
                     fn_mesh.setCurrentColorSetName(color_set)
-                    fn_mesh.setVertexColors(rewind, dirty)  # silent rewind
+                    fn_mesh.setVertexColors(om2.MColorArray(rewind.tolist()), dirty_list)  # silent rewind
 
                     cmds.polyColorSet(mesh, currentColorSet=True, colorSet=color_set)
-                    _paint_cmds(final_values, is_scratch=False)  # undoable
+                    # One undoable polyColorPerVertex per distinct value,
+                    # ranges compressed: few commands even for a big stroke.
+                    _poly_color_ranges(mesh, dirty, final_values, flag)  # undoable
 
                     # -- B&W scratch set (what the viewport shows) -----
                     if preview:
                         _ensure_scratch_colorset(mesh)
-                        srewind = om2.MColorArray()
-                        for i in dirty:
-                            v = float(start_values[i])
-                            srewind.append(om2.MColor((v, v, v, 1.0)))
+                        srewind = np.ones((len(dirty_list), 4))
+                        srewind[:, :3] = start_values[:, None]
                         fn_mesh.setCurrentColorSetName(_PREVIEW_SET)
-                        fn_mesh.setVertexColors(srewind, dirty)  # silent rewind
+                        fn_mesh.setVertexColors(om2.MColorArray(srewind.tolist()), dirty_list)  # silent rewind
 
                         cmds.polyColorSet(mesh, currentColorSet=True, colorSet=_PREVIEW_SET)
-                        _paint_cmds(final_values, is_scratch=True)  # undoable
+                        _poly_color_ranges(mesh, dirty, final_values)  # undoable
                         # leave 'current' on scratch -- BW-mode invariant
                 finally:
                     cmds.undoInfo(closeChunk=True)
@@ -566,6 +662,19 @@ class ChannelPaintController:
         # hit that no-op and only one stroke of two appeared to revert.
         _commit()
 
+    def _stamp_targets(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Accumulated stamp hits as (vertex ids, opacities), in range and unmasked."""
+        count = len(self._stamp_hits)
+        ids = np.fromiter(self._stamp_hits.keys(), dtype=np.int64, count=count)
+        opacities = np.fromiter(self._stamp_hits.values(), dtype=np.float64, count=count)
+        self._stamp_hits.clear()
+
+        keep = (ids >= 0) & (ids < min(len(self._values), len(self._dirty)))
+        if self._vtx_mask is not None:
+            keep &= ids < len(self._vtx_mask)
+            keep[keep] = self._vtx_mask[ids[keep]]
+        return ids[keep], opacities[keep]
+
     def _apply_stamp(self) -> None:
         """Apply accumulated stamp hits to the in-memory channel buffer."""
         if not self._stamp_hits:
@@ -588,22 +697,18 @@ class ChannelPaintController:
         except Exception:
             pass
 
-        for v_id, opacity in self._stamp_hits.items():
-            if self._vtx_mask is not None and v_id not in self._vtx_mask:
-                continue
-            if 0 <= v_id < len(self._values):
-                old = self._values[v_id]
-                effective_opacity = 1.0 if (abs(artisan_value) < 1e-6 and opacity == 0.0) else opacity
-                # No 0-1 clamp: colorSets can hold out-of-range data
-                # (negative debug values, HDR) and painting must not eat it.
-                self._values[v_id] = old + (artisan_value - old) * effective_opacity
-                self._dirty_verts.add(v_id)
-
-        self._stamp_hits.clear()
+        ids, opacities = self._stamp_targets()
+        if abs(artisan_value) < 1e-6:
+            opacities[opacities == 0.0] = 1.0
+        old = self._values[ids]
+        # No 0-1 clamp: colorSets can hold out-of-range data
+        # (negative debug values, HDR) and painting must not eat it.
+        self._values[ids] = old + (artisan_value - old) * opacities
+        self._dirty[ids] = True
 
     def _apply_smooth(self) -> None:
         """Smooth the channel values for hit vertices using neighbour averaging."""
-        if not self._neighbour_cache:
+        if self._neighbours is None:
             self._build_neighbour_cache()
 
         opacity = 1.0
@@ -612,61 +717,50 @@ class ChannelPaintController:
         except Exception:
             pass
 
-        hit_verts = list(self._stamp_hits.keys())
-        # numpy copy is faster than list() for the snapshot
-        snapshot = self._values.copy()
-
-        for v_id in hit_verts:
-            if self._vtx_mask is not None and v_id not in self._vtx_mask:
-                continue
-            if 0 <= v_id < len(self._values):
-                neighbours = self._neighbour_cache.get(v_id, [])
-                avg = float(np.mean(snapshot[neighbours])) if neighbours else float(snapshot[v_id])
-                old = float(snapshot[v_id])
-                # No 0-1 clamp — see _apply_stamp
-                self._values[v_id] = old + (avg - old) * opacity
-                self._dirty_verts.add(v_id)
+        ids, _ = self._stamp_targets()
+        indptr, neighbours = self._neighbours
+        ids = ids[ids < len(indptr) - 1]
+        if not ids.size:
+            return
 
-        self._stamp_hits.clear()
+        # Ragged gather of the hit rows: every neighbour entry of every hit
+        # vertex, tagged with its row so sums come from one bincount.
+        starts = indptr[ids]
+        counts = indptr[ids + 1] - starts
+        rows = np.repeat(np.arange(ids.size), counts)
+        offsets = np.arange(rows.size) - np.repeat(np.cumsum(counts) - counts, counts)
+        gathered = self._values[neighbours[np.repeat(starts, counts) + offsets]]
+        sums = np.bincount(rows, weights=gathered, minlength=ids.size)
+
+        # Averages read the pre-smooth values: every neighbour is gathered
+        # before any hit vertex is written below.
+        old = self._values[ids]
+        avg = np.where(counts > 0, sums / np.maximum(counts, 1), old)
+        # No 0-1 clamp — see _apply_stamp
+        self._values[ids] = old + (avg - old) * opacity
+        self._dirty[ids] = True
 
     def _build_neighbour_cache(self) -> None:
-        """Delegate neighbour map to MeshDataFactory (shared, cached across sessions)."""
-        md = MeshDataFactory.get(self.mesh)
-        cached = md.neighbors
-        if cached:
-            self._neighbour_cache = cached
-            return
+        """Build the vertex -> neighbours CSR table used by smoothing.
 
-        # MeshData cache was empty (mesh not in cache yet) — build via API directly
-        # and let MeshDataFactory hold it for future calls.
-        import maya.api.OpenMaya as om2
+        Comes from the shared mesh topology cache (one vectorised pass over
+        the face vertices); when the API path fails, an already built
+        MeshDataFactory neighbour dict is packed instead.
+        """
         try:
-            it_vtx = om2.MItMeshVertex(md._dag)
-            cache = {}
-            while not it_vtx.isDone():
-                cache[it_vtx.index()] = list(it_vtx.getConnectedVertices())
-                it_vtx.next()
-            # Store back so MeshData.neighbors is populated
-            md._neighbors = cache
-            self._neighbour_cache = cache
+            from dw_maya.dw_maya_utils.dw_component_set import vertex_neighbours
+            self._neighbours = vertex_neighbours(self.mesh)
+            return
         except Exception as e:
-            logger.warning(f"API neighbour cache failed: {e}. Falling back to cmds.")
-            n = len(self._values)
-            mesh = self.mesh
-            cache = {}
-            for i in range(n):
-                edges = cmds.polyListComponentConversion(f'{mesh}.vtx[{i}]', toEdge=True) or []
-                edges = cmds.ls(edges, fl=True) or []
-                neighbours = set()
-                for edge in edges:
-                    verts = cmds.polyListComponentConversion(edge, toVertex=True) or []
-                    for v in cmds.ls(verts, fl=True) or []:
-                        vid = int(v.split('[')[-1].rstrip(']'))
-                        if vid != i:
-                            neighbours.add(vid)
-                cache[i] = list(neighbours)
-            md._neighbors = cache
-            self._neighbour_cache = cache
+            logger.warning(f"API neighbour table failed: {e}. Falling back to MeshData neighbours.")
+
+        cached = MeshDataFactory.get(self.mesh).neighbors
+        n = len(self._values)
+        lists = [cached.get(i, []) for i in range(n)]
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum([len(nb) for nb in lists], out=indptr[1:])
+        indices = np.fromiter((v for nb in lists for v in nb), dtype=np.int64, count=int(indptr[-1]))
+        self._neighbours = (indptr, indices)
 
     def _flush_dirty(self) -> None:
         """Write only the changed vertices to Maya (incremental update).
@@ -689,39 +783,39 @@ class ChannelPaintController:
         uniform grayscale, or real data Maya's own paint feedback already
         bled into, depending on timing.
         """
-        if not self._dirty_verts:
+        dirty = np.flatnonzero(self._dirty)
+        if not dirty.size:
             return
+        self._dirty[:] = False
 
         if self._batch_mode:
-            self._dirty_verts.clear()
             return
 
         mesh = self.mesh
         color_set = self.color_set
-        dirty_list = list(self._dirty_verts)
         idx = self._channel_idx
-        self._stroke_dirty_verts.update(dirty_list)
+        self._stroke_dirty[dirty] = True
+        values = self._values[dirty]
+        dirty_list = dirty.tolist()
         bw_mode = self.source._preview_active
 
+        # Merged RGBA rows: snapshot siblings + the painted channel
+        rgba = np.full((dirty.size, 4), _UNSET_VALUE)
+        snapshot = self._sibling_snapshot
+        if snapshot is not None:
+            inside = dirty < len(snapshot)
+            rgba[inside] = snapshot[dirty[inside]]
+            # Keep the snapshot in sync so a later flush in this same
+            # stroke builds on this write, not stale pre-stroke data.
+            snapshot[dirty[inside], idx] = values[inside]
+        rgba[:, idx] = values
+
         try:
             import maya.api.OpenMaya as om2
             fn_mesh = MeshDataFactory.get(mesh)._fn_mesh
 
-            new_colors = om2.MColorArray()
-            for i in dirty_list:
-                if self._sibling_snapshot is not None and i < len(self._sibling_snapshot):
-                    rgba = list(self._sibling_snapshot[i])
-                else:
-                    rgba = [_UNSET_VALUE] * 4
-                rgba[idx] = float(self._values[i])
-                new_colors.append(om2.MColor(rgba))
-                # Keep the snapshot in sync so a later flush in this same
-                # stroke builds on this write, not stale pre-stroke data.
-                if self._sibling_snapshot is not None and i < len(self._sibling_snapshot):
-                    self._sibling_snapshot[i][idx] = float(self._values[i])
-
             fn_mesh.setCurrentColorSetName(color_set)
-            fn_mesh.setVertexColors(new_colors, dirty_list)
+            fn_mesh.setVertexColors(om2.MColorArray(rgba.tolist()), dirty_list)
 
             if bw_mode:
                 fn_mesh.setCurrentColorSetName(_PREVIEW_SET)
@@ -729,11 +823,9 @@ class ChannelPaintController:
                 # Live grayscale feedback on the scratch/preview colorSet --
                 # this is what the viewport shows during the drag (if
                 # displayColors is on), independent of the preview toggle.
-                preview_colors = om2.MColorArray()
-                for i in dirty_list:
-                    v = float(self._values[i])
-                    preview_colors.append(om2.MColor((v, v, v, 1.0)))
-                fn_mesh.setVertexColors(preview_colors, dirty_list)
+                gray = np.ones((dirty.size, 4))
+                gray[:, :3] = values[:, None]
+                fn_mesh.setVertexColors(om2.MColorArray(gray.tolist()), dirty_list)
             # else: direct mode -- 'current' stays on color_set, real RGBA
             # is already what just got written, nothing more to show.
 
@@ -741,25 +833,11 @@ class ChannelPaintController:
             logger.warning(f"API flush failed, falling back to cmds. Error: {e}")
 
             cmds.polyColorSet(mesh, currentColorSet=True, colorSet=color_set)
-            flag = self._channel_flag
-            for i in dirty_list:
-                cmds.polyColorPerVertex(
-                    f'{mesh}.vtx[{i}]',
-                    colorDisplayOption=True, representation=4,
-                    **{flag: float(self._values[i])},
-                )
+            _poly_color_ranges(mesh, dirty, values, self._channel_flag)
 
             if bw_mode:
                 cmds.polyColorSet(mesh, currentColorSet=True, colorSet=_PREVIEW_SET)
-                for i in dirty_list:
-                    v = float(self._values[i])
-                    cmds.polyColorPerVertex(
-                        f'{mesh}.vtx[{i}]',
-                        r=v, g=v, b=v, a=1.0,
-                        colorDisplayOption=True, representation=4,
-                    )
-
-        self._dirty_verts.clear()
+                _poly_color_ranges(mesh, dirty, values)
 
 
 def _has_active_paint_session(mesh: str) -> bool:
@@ -915,11 +993,7 @@ class VertexColorSet(WeightSource):
             _ensure_scratch_colorset(self.mesh_name)
         MeshDataFactory.get(self.mesh_name)._fn_mesh.setCurrentColorSetName(target)
         # Any in-flight stroke/undo state belongs to the OLD channel.
-        controller._stamp_hits = {}
-        controller._dirty_verts = set()
-        controller._stroke_dirty_verts = set()
-        controller._stroke_start_values = None
-        controller._sibling_snapshot = None
+        controller.reset_stroke_state()
         logger.info(f"Paint brush retargeted to channel '{self.channel}'.")
 
     def _resolve_attr(self, map_name: str) -> str:
@@ -33,6 +33,11 @@ Key Components:
         - Weight mapping and transfer
         - Multi-connection support
 
+    dw_weight_store.py:
+        - Binary container for named numpy arrays
+        - float16 / quantized precision, zstd / zlib compression
+        - Sparse maps, lazy memory-mapped loading
+
 Example Usage:
     >>> # Save node attributes
     >>> preset = createAttrPreset(['pCube1'])
@@ -1,10 +1,15 @@
 import os
 import re
+import numpy as np
 from maya import cmds
 import dw_maya.dw_decorators as dwdeco
 from typing import Any, Dict, Optional, List
 from dw_maya.dw_maya_utils.dw_maya_data import merge_two_dicts
 from . import get_folder, make_dir, save_json, load_json
+from . import dw_weight_store
+
+# Metadata marker written in binary deformer files
+DEFORMER_FORMAT = 'dw_deformer_weights'
 
 @dwdeco.acceptString('deformer_list')
 def get_list_of_deformer_weights(deformer_list: List[str]) -> Dict[str, Dict]:
@@ -30,7 +35,8 @@ def get_deformer_weights(deformer: str) -> dict:
     Get a dictionary containing all weights for a given deformer by index.
 
     :param deformer: str - The name of the deformer.
-    :return: dict - The key is 'deformerName_deformerType_index_meshTransform', and the value is a list of weight values.
+    :return: dict - The key is 'deformerName_deformerType_index_meshTransform', and the value is a float32
+        numpy array of weight values.
     """
     # Attribute to query for the deformer
     attr = 'weightList'
@@ -59,23 +65,29 @@ def get_deformer_weights(deformer: str) -> dict:
             key = f'{deformer}_{deformer_type}_{index}_{connected_shape[0]}'
 
             # Store the weights in the dictionary
-            connection_dict[key] = weights
+            connection_dict[key] = np.atleast_1d(np.asarray(weights, dtype=np.float32))
 
     return connection_dict
 
 
 # save the deformer dictionnary
-def saveDeformerJson(name: str, myWeightsDic: dict, fpath=None):
+def saveDeformerJson(name: str, myWeightsDic: dict, fpath=None, binary: bool = True,
+                     precision: str = 'float32', compression: Optional[str] = None):
     """
-    Save a deformer weights dictionary to a JSON file.
+    Save a deformer weights dictionary to a weight store (or a JSON file).
 
     Args:
-        name (str): The name of the JSON file (without extension).
+        name (str): The name of the file (without extension).
         myWeightsDic (dict): The dictionary containing deformer weights.
         fpath (str, optional): Custom folder path. If not provided, defaults to project folder.
+        binary (bool): Write a compressed binary weight store (``.dww``). When False,
+            write the legacy JSON float lists (``.json``).
+        precision (str): Stored precision of binary weights ('float32', 'float16',
+            'uint16', 'uint8'), see dw_weight_store.PRECISIONS.
+        compression (str, optional): 'zstd', 'zlib' or 'none' (default: zstd if available).
 
     Returns:
-        str: The full file path of the saved JSON file.
+        str: The full file path of the saved file.
     """
 
     # Get the folder path (either custom or default)
@@ -84,51 +96,93 @@ def saveDeformerJson(name: str, myWeightsDic: dict, fpath=None):
     # Create the folder if it doesn't exist
     path = make_dir(folder)
 
-    # Create the full path for the JSON file
-    file_fullpath = os.path.join(path, f'{name}.json')
-
-    # Save the JSON file
-    save_json(file_fullpath, myWeightsDic)
+    if binary:
+        file_fullpath = os.path.join(path, f'{name}{dw_weight_store.EXTENSION}')
+        dw_weight_store.write_arrays(file_fullpath, myWeightsDic,
+                                     meta={'format': DEFORMER_FORMAT},
+                                     precision=precision, compression=compression)
+    else:
+        file_fullpath = os.path.join(path, f'{name}.json')
+        save_json(file_fullpath, _to_json_weights(myWeightsDic))
 
     print(f'Successfully saved the deformer file: {name} at {folder}')
 
     return file_fullpath
 
 
+def _to_json_weights(weights_dic: dict) -> dict:
+    """Weights as 6-decimal float lists, the legacy JSON layout."""
+    return {k: np.round(np.atleast_1d(np.asarray(v, dtype=np.float64)), 6).tolist()
+            for k, v in weights_dic.items()}
+
+
+def _load_weights_file(path: str) -> Optional[dict]:
+    if dw_weight_store.is_weight_store(path):
+        return dw_weight_store.read_arrays(path)
+    return load_json(path)
+
+
 # load the deformer dictionnary
 def loadDeformerJson(_file: str):
     """
-    Load a deformer weights dictionary from a JSON file.
+    Load a deformer weights dictionary from a weight store or a JSON file.
 
     Args:
-        _file (str): The full file path or name of the JSON file (without extension).
+        _file (str): The full file path, or a name looked up in the default folder
+            (``name.dww`` first, then ``name.json``).
 
     Returns:
-        dict or None: The loaded deformer weights dictionary or None if the file is not found.
+        dict or None: The loaded deformer weights dictionary (numpy arrays for
+        weight stores, float lists for JSON) or None if the file is not found.
     """
 
     # If the provided _file is a full path
-    if os.path.exists(_file) and _file.endswith('.json'):
-        if os.path.exists(_file):
-            return load_json(_file)
-        else:
-            cmds.warning('json file path missing to load deformer :\n{}'.format(_file))
+    if os.path.isfile(_file) and _file.endswith(('.json', dw_weight_store.EXTENSION)):
+        return _load_weights_file(_file)
     elif not '/' in _file:
         # If the file path is just a name (without a full path), look in the default folder
         folder = get_folder()
         # Ensure the filename has no extension, then build the full path
         if '.' in _file:
             _file = _file.split('.')[0]
-        file_fullpath = os.path.join(folder, f'{_file}.json')
-        if os.path.exists(file_fullpath):
-            return load_json(file_fullpath)
-        else:
-            cmds.warning(f'JSON file not found at path: {file_fullpath}')
+        for ext in (dw_weight_store.EXTENSION, '.json'):
+            file_fullpath = os.path.join(folder, f'{_file}{ext}')
+            if os.path.exists(file_fullpath):
+                return _load_weights_file(file_fullpath)
+        cmds.warning(f'Deformer file not found at path: {os.path.join(folder, _file)}')
 
     else:
         cmds.warning(f'Invalid file path or unsupported file format: {_file}')
 
 
+def convertDeformerFile(src: str, dst: Optional[str] = None, **options) -> str:
+    """
+    Convert a deformer file between JSON and the binary weight store.
+
+    The direction follows ``src``: JSON files become ``.dww`` stores, stores are
+    exported back to legacy JSON.
+
+    Args:
+        src (str): Existing deformer file.
+        dst (str, optional): Output path, defaults to ``src`` with the other extension.
+        **options: ``precision`` / ``compression`` forwarded to the store writer.
+
+    Returns:
+        str: The written path.
+    """
+    data = _load_weights_file(src)
+    if not data:
+        raise ValueError(f"No deformer weights found in '{src}'")
+    root = os.path.splitext(src)[0]
+    if dw_weight_store.is_weight_store(src):
+        dst = dst or f'{root}.json'
+        save_json(dst, _to_json_weights(data))
+    else:
+        dst = dst or f'{root}{dw_weight_store.EXTENSION}'
+        dw_weight_store.write_arrays(dst, data, meta={'format': DEFORMER_FORMAT}, **options)
+    return dst
+
+
 # fuction to set the deformer weights, one connection index at the time
 def setDeformerWeights(deformerName: str, weights_list: list, connection_index=0, target_checker=None):
     """
@@ -143,6 +197,9 @@ def setDeformerWeights(deformerName: str, weights_list: list, connection_index=0
     Returns:
         None
     """
+    # Plain floats for cmds.setAttr (weights may come as numpy arrays)
+    weights_list = np.asarray(weights_list, dtype=np.float64).tolist()
+
     # Get the number of weights
     nb = len(weights_list)
 
@@ -65,13 +65,16 @@ def createAttrPreset(nodeName: list,
                      stripNamespace: bool = True,
                      filter_match:list=None,
                      filter_exclude:list=None,
-                     in_channelbox:bool=False) -> dict:
+                     in_channelbox:bool=False,
+                     bulk:bool=True) -> dict:
     """
     Derived from a Maya procedure to create attribute presets for the given nodes.
 
     Args:
         nodeName (list): List of node names to create presets for.
         stripNamespace (bool): Whether to strip namespaces from node names (default: True).
+        bulk (bool): Read values through MPlugs (preset_bulk.capture_nodes)
+            instead of one cmds.getAttr per attribute (default: True).
 
     Returns:
 
@@ -82,6 +85,27 @@ def createAttrPreset(nodeName: list,
 
     attr_data = {}
 
+    if bulk:
+        from dw_maya.dw_presets_io import preset_bulk
+        captured = preset_bulk.capture_nodes(nodeName,
+                                             filter_match=filter_match,
+                                             filter_exclude=filter_exclude,
+                                             in_channelbox=in_channelbox)
+        for n, values in captured.items():
+            key_n = n.split(':')[-1] if stripNamespace else n
+            node_type = cmds.nodeType(n)
+            attr_data[key_n] = {}
+            if filter_match or filter_exclude:
+                _node_type = filter_attributes(node_type,
+                                               filter_match=filter_match,
+                                               filter_exclude=filter_exclude)
+                if _node_type:
+                    attr_data[key_n]['nodeType'] = _node_type[0]
+            else:
+                attr_data[key_n]['nodeType'] = node_type
+            attr_data[key_n].update(values)
+        return attr_data
+
     for n in nodeName:
         # Strip namespace if necessary
         key_n = n.split(':')[-1] if stripNamespace else n
@@ -334,42 +358,24 @@ def blend_attr_dic(src_node:str, target_node:str=None, preset:dict=None, blend_v
     # Get node type to determine whether to use transform or shape
     node_type = preset[src_node].get('nodeType')
 
-    # Process attributes
-    for attr, value in preset[src_node].items():
-        # Skip nodeType and legacy *_nodeType attributes
-        if attr == 'nodeType' or attr.endswith('_nodeType'):
-            continue
-
-        # Determine the correct target node (transform or shape)
-        if node_type == "transform":
-            # For transform attributes, use the transform node
-            target_obj = target_node
-        else:
-            # For shape or other node types, try to get the shape
-            shapes = cmds.listRelatives(target_node, shapes=True)
-            target_obj = shapes[0] if shapes else target_node
-
-        targetAttr = f"{target_obj}.{attr}"
-
-        # Check if value is a special token that needs evaluation
-        from dw_maya.dw_constants import SPECIAL_TOKENS
-        if isinstance(value, str) and value in SPECIAL_TOKENS:
-            value = SPECIAL_TOKENS[value]()
-
-        # Check if attribute exists and is settable
-        if cmds.objExists(targetAttr) and cmds.getAttr(targetAttr, se=True):
-            # Check for and delete any existing animation keys
-            if rm_keyframe:
-                if cmds.keyframe(targetAttr, query=True, keyframeCount=True):
-                    cmds.cutKey(targetAttr)
-
-            attrType = cmds.getAttr(targetAttr, type=True)
-
-            # Handle blending for numeric values
-            if blend_value < 0.999 and isinstance(value, (int, float, bool)):
-                blendNumericAttr(targetAttr, value, attrType, blend_value)
-            else:
-                applyAttrDirectly(targetAttr, value, attrType)
+    # Determine the correct target node (transform or shape)
+    if node_type == "transform":
+        target_obj = target_node
+    else:
+        shapes = cmds.listRelatives(target_node, shapes=True)
+        target_obj = shapes[0] if shapes else target_node
+
+    # One MDGModifier for the whole entry, unchanged plugs are skipped
+    from dw_maya.dw_presets_io import preset_bulk
+    report = preset_bulk.apply_values({target_obj: preset[src_node]},
+                                      blend=blend_value,
+                                      rm_keyframe=rm_keyframe)
+
+    # String attributes missing on the target (e.g. 'notes') are created here
+    for targetAttr in report.skipped:
+        value = preset[src_node].get(targetAttr.split('.', 1)[-1])
+        if isinstance(value, str) and not cmds.objExists(targetAttr):
+            applyAttrDirectly(targetAttr, value, None)
 
 def blendNumericAttr(targetAttr, value, attrType, blendValue):
     """
@@ -0,0 +1,422 @@
+"""Binary container for per-vertex weight maps and positions.
+
+JSON float lists are slow to parse and several times bigger than the data
+they hold: a full character storage easily reaches hundreds of MB. This module
+stores named numpy arrays in one versioned file instead:
+
+    [MAGIC | version | flags]              16 bytes
+    [array blob][pad] [array blob][pad]    one blob per array, 64-byte aligned
+    [header json]                          array table + free-form metadata
+    [header offset | header size | MAGIC]  20-byte trailer
+
+Arrays are streamed to disk as they are added (the header is written last),
+so a writer never holds more than one encoded array in memory. The reader
+only parses the trailer and the header on open; arrays are decoded on demand.
+
+Features:
+    - Precision per array: float32 (default), float16, float64, or uniform
+      quantization to uint8 / uint16 over the array's [min, max] range.
+    - Compression per array: zstd (when ``zstandard`` is installed), zlib or none.
+    - Sparse encoding (indices + values) for mostly-zero maps, chosen
+      automatically below ``SPARSE_RATIO`` non-zero values.
+    - Uncompressed dense arrays load as read-only memory maps.
+    - Atomic writes (temp file + replace).
+    - Plain JSON export for debugging and external tools.
+
+Classes:
+    WeightStoreWriter: Streaming writer (context manager).
+    WeightStore: Lazy reader (context manager).
+
+Functions:
+    is_weight_store: True when a path holds this container.
+    write_arrays: Write a {name: array} dict in one call.
+    read_arrays: Read some or all arrays into a {name: array} dict.
+    export_json: Dump a container as {"meta": ..., "arrays": {name: list}}.
+
+Example:
+    >>> with WeightStoreWriter('/tmp/maps.dww', meta={'mesh': 'body'}) as w:
+    ...     w.add('thickness', weights, precision='uint16')
+    ...     w.add('positions', points, compression='none')
+    >>> with WeightStore('/tmp/maps.dww') as store:
+    ...     store.names()
+    ...     pts = store.load('positions')    # np.memmap, nothing read yet
+
+Author: DrWeeny
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+import threading
+import zlib
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+try:
+    import zstandard as _zstd
+except ImportError:
+    _zstd = None
+
+MAGIC = b'DWWSTORE'
+VERSION = 1
+EXTENSION = '.dww'
+
+# Fraction of non-zero values under which arrays are stored sparse
+SPARSE_RATIO = 0.3
+
+_PREFIX = struct.Struct('<8sHH4x')      # magic, version, flags
+_TRAILER = struct.Struct('<QI8s')       # header offset, header size, magic
+_ALIGN = 64
+
+PRECISIONS = ('float32', 'float16', 'float64', 'uint8', 'uint16')
+COMPRESSIONS = ('none', 'zlib', 'zstd')
+_QUANTIZED = {'uint8': 0xFF, 'uint16': 0xFFFF}
+
+
+def default_compression() -> str:
+    """zstd when the ``zstandard`` module is importable, zlib otherwise."""
+    return 'zstd' if _zstd is not None else 'zlib'
+
+
+def is_weight_store(path: str) -> bool:
+    """Return True when ``path`` starts with the container magic."""
+    try:
+        with open(path, 'rb') as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+# ---------------------------------------------------------------------------
+# Encoding
+# ---------------------------------------------------------------------------
+
+def _compress(data: bytes, method: str, level: Optional[int]) -> bytes:
+    if method == 'none':
+        return data
+    if method == 'zlib':
+        return zlib.compress(data, 6 if level is None else level)
+    if method == 'zstd':
+        if _zstd is None:
+            raise ImportError("zstd compression requires the 'zstandard' module")
+        return _zstd.ZstdCompressor(level=3 if level is None else level).compress(data)
+    raise ValueError(f"Unknown compression '{method}', expected one of {COMPRESSIONS}")
+
+
+def _decompress(data: bytes, method: str, size: int) -> bytes:
+    if method == 'none':
+        return data
+    if method == 'zlib':
+        return zlib.decompress(data)
+    if method == 'zstd':
+        if _zstd is None:
+            raise ImportError("this store uses zstd compression, install the 'zstandard' module")
+        return _zstd.ZstdDecompressor().decompress(data, max_output_size=size)
+    raise ValueError(f"Unknown compression '{method}'")
+
+
+def _encode_values(values: np.ndarray, precision: str, entry: Dict[str, Any]) -> np.ndarray:
+    """Cast float values to the stored precision, quantizing when requested."""
+    if precision in _QUANTIZED:
+        lo = float(values.min()) if values.size else 0.0
+        hi = float(values.max()) if values.size else 0.0
+        scale = (hi - lo) or 1.0
+        steps = _QUANTIZED[precision]
+        entry['quant'] = [lo, hi]
+        return np.rint((values - lo) / scale * steps).astype(precision)
+    return values.astype(precision)
+
+
+def _decode_values(stored: np.ndarray, entry: Dict[str, Any]) -> np.ndarray:
+    quant = entry.get('quant')
+    dtype = np.dtype(entry['dtype'])
+    if quant is None:
+        return stored.astype(dtype, copy=False)
+    lo, hi = quant
+    steps = _QUANTIZED[entry['stored']]
+    return (lo + stored.astype(np.float64) * ((hi - lo) / steps)).astype(dtype)
+
+
+# ---------------------------------------------------------------------------
+# Writer
+# ---------------------------------------------------------------------------
+
+class WeightStoreWriter:
+    """Stream named arrays into a container file.
+
+    Args:
+        path: Destination file. Written to ``path + '.tmp'`` and moved into
+            place on close, so readers never see a half-written store.
+        meta: JSON-serializable metadata stored in the header.
+        precision: Default precision for floating arrays (see PRECISIONS).
+        compression: Default compression (see COMPRESSIONS); None picks
+            ``default_compression()``.
+        level: Compression level forwarded to zlib / zstd.
+    """
+
+    def __init__(self, path: str, meta: Optional[Dict[str, Any]] = None,
+                 precision: str = 'float32', compression: Optional[str] = None,
+                 level: Optional[int] = None):
+        if precision not in PRECISIONS:
+            raise ValueError(f"Unknown precision '{precision}', expected one of {PRECISIONS}")
+        self.path = path
+        self.meta = dict(meta or {})
+        self.precision = precision
+        self.compression = compression or default_compression()
+        self.level = level
+        self._arrays: Dict[str, Dict[str, Any]] = {}
+
+        folder = os.path.dirname(os.path.abspath(path))
+        os.makedirs(folder, exist_ok=True)
+        self._tmp = f'{path}.tmp'
+        self._file = open(self._tmp, 'wb')
+        self._file.write(_PREFIX.pack(MAGIC, VERSION, 0))
+
+    def add(self, name: str, array: Any,
+            precision: Optional[str] = None,
+            compression: Optional[str] = None,
+            sparse: Optional[bool] = None) -> Dict[str, Any]:
+        """Encode ``array`` and append it to the file.
+
+        Args:
+            name: Unique array name.
+            array: Anything ``np.asarray`` accepts. Floating arrays are stored
+                at ``precision``; integer / bool arrays are stored as-is.
+            precision: Override the writer precision for this array.
+            compression: Override the writer compression for this array.
+            sparse: Force (True) or forbid (False) sparse encoding. None stores
+                sparse when fewer than ``SPARSE_RATIO`` values are non-zero.
+
+        Returns:
+            dict: The header entry describing the stored array.
+        """
+        if name in self._arrays:
+            raise ValueError(f"Array '{name}' already written")
+        arr = np.asarray(array)
+        is_float = np.issubdtype(arr.dtype, np.floating)
+        precision = (precision or self.precision) if is_float else arr.dtype.str
+        compression = compression or self.compression
+        if is_float and precision not in PRECISIONS:
+            raise ValueError(f"Unknown precision '{precision}', expected one of {PRECISIONS}")
+
+        flat = arr.reshape(-1)
+        if sparse is None:
+            sparse = arr.size > 0 and np.count_nonzero(flat) <= SPARSE_RATIO * arr.size
+
+        entry: Dict[str, Any] = {
+            'shape': list(arr.shape),
+            'dtype': ('float64' if precision == 'float64' else 'float32') if is_float else arr.dtype.str,
+            'stored': precision,
+            'compression': compression,
+        }
+        if sparse:
+            idx = np.flatnonzero(flat).astype('<u4')
+            values = flat[idx]
+            entry['nnz'] = int(idx.size)
+            payload = idx.tobytes()
+        else:
+            values = flat
+            payload = b''
+        if is_float:
+            values = _encode_values(values, precision, entry)
+        payload += np.ascontiguousarray(values).tobytes()
+
+        entry['size'] = len(payload)
+        blob = _compress(payload, compression, self.level)
+
+        offset = self._file.tell()
+        pad = -offset % _ALIGN
+        if pad:
+            self._file.write(b'\0' * pad)
+            offset += pad
+        self._file.write(blob)
+        entry['offset'] = offset
+        entry['nbytes'] = len(blob)
+        self._arrays[name] = entry
+        return entry
+
+    def close(self) -> str:
+        """Write the header and trailer, then move the file into place."""
+        if self._file is None:
+            return self.path
+        header = json.dumps({'version': VERSION, 'meta': self.meta,
+                             'arrays': self._arrays}).encode('utf-8')
+        offset = self._file.tell()
+        self._file.write(header)
+        self._file.write(_TRAILER.pack(offset, len(header), MAGIC))
+        self._file.close()
+        self._file = None
+        os.replace(self._tmp, self.path)
+        return self.path
+
+    def abort(self) -> None:
+        """Drop the partially written file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            os.remove(self._tmp)
+
+    def __enter__(self) -> 'WeightStoreWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+# ---------------------------------------------------------------------------
+# Reader
+# ---------------------------------------------------------------------------
+
+class WeightStore:
+    """Lazy reader: only the header is parsed on open.
+
+    ``load`` is safe to call from several threads: blob reads share one file
+    handle behind a lock, decoding runs outside it.
+
+    Args:
+        path: Container file.
+
+    Raises:
+        ValueError: When ``path`` is not a container or has a newer version.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, 'rb')
+        try:
+            prefix = self._file.read(_PREFIX.size)
+            if len(prefix) < _PREFIX.size or prefix[:len(MAGIC)] != MAGIC:
+                raise ValueError(f"'{path}' is not a weight store")
+            _magic, version, _flags = _PREFIX.unpack(prefix)
+            if version > VERSION:
+                raise ValueError(f"'{path}' is version {version}, this reader supports {VERSION}")
+            self._file.seek(-_TRAILER.size, os.SEEK_END)
+            offset, size, magic = _TRAILER.unpack(self._file.read(_TRAILER.size))
+            if magic != MAGIC:
+                raise ValueError(f"'{path}' is truncated (no trailer)")
+            self._file.seek(offset)
+            header = json.loads(self._file.read(size).decode('utf-8'))
+        except Exception:
+            self._file.close()
+            raise
+        self.version = version
+        self.meta: Dict[str, Any] = header.get('meta', {})
+        self._arrays: Dict[str, Dict[str, Any]] = header['arrays']
+
+    def names(self) -> List[str]:
+        """Array names, in write order."""
+        return list(self._arrays)
+
+    def info(self, name: str) -> Dict[str, Any]:
+        """Header entry of ``name`` (shape, dtype, encoding, byte sizes)."""
+        return dict(self._arrays[name])
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._arrays
+
+    def __iter__(self):
+        return iter(self._arrays)
+
+    def __len__(self) -> int:
+        return len(self._arrays)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.load(name)
+
+    def _read_blob(self, entry: Dict[str, Any]) -> bytes:
+        with self._lock:
+            self._file.seek(entry['offset'])
+            return self._file.read(entry['nbytes'])
+
+    def load(self, name: str, mmap: bool = True) -> np.ndarray:
+        """Decode one array.
+
+        Args:
+            name: Array name.
+            mmap: Return a read-only ``np.memmap`` when the array is stored
+                dense, uncompressed and unquantized (no bytes read until used).
+
+        Returns:
+            np.ndarray: The array with its original shape, float32/float64 for
+            floating data, the original dtype otherwise.
+        """
+        entry = self._arrays[name]
+        shape = tuple(entry['shape'])
+        stored = np.dtype(entry['stored'])
+        count = int(np.prod(shape)) if shape else 1
+        plain = ('nnz' not in entry and entry['compression'] == 'none'
+                 and 'quant' not in entry and stored == np.dtype(entry['dtype']))
+        if mmap and plain and count:
+            return np.memmap(self.path, dtype=stored, mode='r', offset=entry['offset'], shape=shape)
+
+        data = _decompress(self._read_blob(entry), entry['compression'], entry['size'])
+        if 'nnz' in entry:
+            nnz = entry['nnz']
+            idx = np.frombuffer(data, dtype='<u4', count=nnz)
+            values = _decode_values(np.frombuffer(data, dtype=stored, offset=nnz * 4), entry)
+            out = np.zeros(count, dtype=values.dtype)
+            out[idx] = values
+            return out.reshape(shape)
+        values = _decode_values(np.frombuffer(data, dtype=stored), entry)
+        if not values.flags.writeable:
+            values = values.copy()
+        return values.reshape(shape)
+
+    def load_all(self, names: Optional[Iterable[str]] = None, mmap: bool = False) -> Dict[str, np.ndarray]:
+        """Decode ``names`` (all arrays by default) into a dict."""
+        return {n: self.load(n, mmap=mmap) for n in (self._arrays if names is None else names)}
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self) -> 'WeightStore':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+# ---------------------------------------------------------------------------
+# One-call helpers
+# ---------------------------------------------------------------------------
+
+def write_arrays(path: str, arrays: Dict[str, Any], meta: Optional[Dict[str, Any]] = None,
+                 **options) -> str:
+    """Write ``{name: array}`` to ``path``; options go to WeightStoreWriter."""
+    with WeightStoreWriter(path, meta=meta, **options) as writer:
+        for name, array in arrays.items():
+            writer.add(name, array)
+    return path
+
+
+def read_arrays(path: str, names: Optional[Iterable[str]] = None) -> Dict[str, np.ndarray]:
+    """Read ``names`` (all by default) from ``path`` into memory."""
+    with WeightStore(path) as store:
+        return store.load_all(names)
+
+
+def export_json(path: str, json_path: str, decimals: int = 6) -> str:
+    """Dump a container as ``{"meta": ..., "arrays": {name: nested list}}``."""
+    arrays = {}
+    with WeightStore(path) as store:
+        for name in store:
+            arr = store.load(name, mmap=False)
+            if np.issubdtype(arr.dtype, np.floating):
+                arr = np.round(arr, decimals)
+            arrays[name] = arr.tolist()
+        data = {'meta': store.meta, 'arrays': arrays}
+    with open(json_path, 'w') as f:
+        json.dump(data, f)
+    return json_path
@@ -0,0 +1,460 @@
+"""Bulk attribute capture / apply engine for presets.
+
+Replaces the per-attribute ``cmds.getAttr`` / ``cmds.setAttr`` round trips of
+``dw_preset.createAttrPreset`` and ``preset_components.apply_attr`` with
+OpenMaya plug access:
+
+    capture : one ``listAttr`` per node, then one MPlug read per attribute.
+              The attribute kind (bool / int / enum / double / angle /
+              distance / time / string) and the preset validity filter are
+              resolved once per (node type, attribute) and cached.
+    apply   : values are resolved to MPlugs, blended against the current
+              value, and plugs already holding the target value are skipped.
+              Everything left is pushed through one MDGModifier registered as
+              a single undo entry.
+
+Values are read and written in UI units (degrees, scene linear unit, scene
+time unit) so captured dictionaries are interchangeable with the ones the
+cmds path produces.
+
+Features:
+    - Per-node-type attribute schema cache (``clear_schema_cache`` to reset).
+    - Same blend rules as ``apply_attr``: enum switches at 0.5, int-like
+      rounds down, float-like lerps, strings are never blended.
+    - SPECIAL_TOKENS ($RFSTART / $RFEND / ...) resolved at apply time.
+    - ``batch()`` context groups every apply inside it into one MDGModifier.
+    - ``benchmark`` compares the cmds and bulk paths on generated nodes.
+
+Classes:
+    ApplyReport: Counters returned by apply_values.
+
+Functions:
+    capture_nodes: Capture scalar and string attributes of many nodes.
+    apply_values: Apply {node: {attr: value}} through one MDGModifier.
+    batch: Context manager merging nested apply_values calls.
+    clear_schema_cache: Drop the per-node-type schema cache.
+    benchmark: Time cmds vs bulk capture / apply on N generated nodes.
+
+Example:
+    >>> import dw_maya.dw_presets_io.preset_bulk as preset_bulk
+    >>> data = preset_bulk.capture_nodes(['nucleus1', 'nClothShape1'])
+    >>> report = preset_bulk.apply_values({'nClothShape1': data['nClothShape1']}, blend=0.5)
+    >>> print(report)
+
+Author: DrWeeny
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import maya.api.OpenMaya as om
+from maya import cmds
+
+from dw_maya.dw_decorators.dw_generic_undo import push_undo
+from dw_logger import get_logger
+
+logger = get_logger()
+
+_TOLERANCE = 1e-6
+_INDEX_RE = re.compile(r'\[\d*\]')
+
+# Attribute kinds
+_SKIP = 'skip'
+_BOOL, _INT, _ENUM, _DOUBLE = 'bool', 'int', 'enum', 'double'
+_ANGLE, _DISTANCE, _TIME, _STRING = 'angle', 'distance', 'time', 'string'
+_INT_KINDS = (_BOOL, _INT)
+_FLOAT_KINDS = (_DOUBLE, _ANGLE, _DISTANCE, _TIME)
+
+_INT_NUMERIC = (om.MFnNumericData.kByte, om.MFnNumericData.kChar, om.MFnNumericData.kShort,
+                om.MFnNumericData.kInt, om.MFnNumericData.kInt64)
+_FLOAT_NUMERIC = (om.MFnNumericData.kFloat, om.MFnNumericData.kDouble)
+
+# {(node_type, attr without indices): (kind, valid_for_preset)}
+_SCHEMA_CACHE: Dict[Tuple[str, str], Tuple[str, bool]] = {}
+
+# Active batch() modifier, if any
+_BATCH: List['_PendingApply'] = []
+
+
+def clear_schema_cache() -> None:
+    """Forget every cached attribute kind (e.g. after loading a plugin)."""
+    _SCHEMA_CACHE.clear()
+
+
+# ---------------------------------------------------------------------------
+# Plug helpers
+# ---------------------------------------------------------------------------
+
+def _attr_kind(plug: om.MPlug) -> str:
+    """Classify a plug into one of the kinds this module reads/writes."""
+    obj = plug.attribute()
+    if obj.hasFn(om.MFn.kEnumAttribute):
+        return _ENUM
+    if obj.hasFn(om.MFn.kUnitAttribute):
+        unit = om.MFnUnitAttribute(obj).unitType()
+        return {om.MFnUnitAttribute.kAngle: _ANGLE,
+                om.MFnUnitAttribute.kDistance: _DISTANCE,
+                om.MFnUnitAttribute.kTime: _TIME}.get(unit, _SKIP)
+    if obj.hasFn(om.MFn.kNumericAttribute):
+        numeric = om.MFnNumericAttribute(obj).numericType()
+        if numeric == om.MFnNumericData.kBoolean:
+            return _BOOL
+        if numeric in _INT_NUMERIC:
+            return _INT
+        if numeric in _FLOAT_NUMERIC:
+            return _DOUBLE
+        return _SKIP
+    if obj.hasFn(om.MFn.kTypedAttribute):
+        if om.MFnTypedAttribute(obj).attrType() == om.MFnData.kString:
+            return _STRING
+    return _SKIP
+
+
+def _schema(node_type: str, attr: str, plug: om.MPlug) -> Tuple[str, bool]:
+    """Cached (kind, valid_for_preset) of a node-type attribute.
+
+    Dynamic attributes are classified per plug: two nodes of the same type can
+    carry a user attribute with the same name and different types.
+    """
+    from dw_maya.dw_presets_io.dw_preset import validNodeTypeAttrForCurrentPreset
+
+    key = (node_type, _INDEX_RE.sub('', attr))
+    cached = _SCHEMA_CACHE.get(key)
+    if cached is not None:
+        return cached
+    entry = (_attr_kind(plug), validNodeTypeAttrForCurrentPreset(node_type, attr))
+    if not om.MFnAttribute(plug.attribute()).dynamic:
+        _SCHEMA_CACHE[key] = entry
+    return entry
+
+
+def _find_plug(fn: om.MFnDependencyNode, node: str, attr: str) -> Optional[om.MPlug]:
+    """Resolve ``attr`` on ``node``; indexed paths go through MSelectionList."""
+    try:
+        if '[' not in attr and '.' not in attr:
+            return fn.findPlug(attr, False)
+        sel = om.MSelectionList()
+        sel.add(f'{node}.{attr}')
+        return sel.getPlug(0)
+    except (RuntimeError, ValueError):
+        return None
+
+
+def _depend_fn(node: str) -> Optional[om.MFnDependencyNode]:
+    sel = om.MSelectionList()
+    try:
+        sel.add(node)
+    except RuntimeError:
+        return None
+    return om.MFnDependencyNode(sel.getDependNode(0))
+
+
+def _read(plug: om.MPlug, kind: str) -> Any:
+    """Read a plug in UI units, the way ``cmds.getAttr`` would return it."""
+    if kind == _BOOL:
+        return plug.asBool()
+    if kind in (_INT, _ENUM):
+        return plug.asInt()
+    if kind == _DOUBLE:
+        return plug.asDouble()
+    if kind == _ANGLE:
+        return plug.asMAngle().asUnits(om.MAngle.uiUnit())
+    if kind == _DISTANCE:
+        return plug.asMDistance().asUnits(om.MDistance.uiUnit())
+    if kind == _TIME:
+        return plug.asMTime().asUnits(om.MTime.uiUnit())
+    if kind == _STRING:
+        return plug.asString()
+    return None
+
+
+def _write(modifier: om.MDGModifier, plug: om.MPlug, kind: str, value: Any) -> None:
+    if kind == _BOOL:
+        modifier.newPlugValueBool(plug, bool(value))
+    elif kind in (_INT, _ENUM):
+        modifier.newPlugValueInt(plug, int(value))
+    elif kind == _DOUBLE:
+        modifier.newPlugValueDouble(plug, float(value))
+    elif kind == _ANGLE:
+        modifier.newPlugValueMAngle(plug, om.MAngle(float(value), om.MAngle.uiUnit()))
+    elif kind == _DISTANCE:
+        modifier.newPlugValueMDistance(plug, om.MDistance(float(value), om.MDistance.uiUnit()))
+    elif kind == _TIME:
+        modifier.newPlugValueMTime(plug, om.MTime(float(value), om.MTime.uiUnit()))
+    elif kind == _STRING:
+        modifier.newPlugValueString(plug, str(value))
+
+
+def _same(kind: str, a: Any, b: Any) -> bool:
+    if kind == _STRING:
+        return a == b
+    return abs(float(a) - float(b)) <= _TOLERANCE * max(1.0, abs(float(b)))
+
+
+def _settable(plug: om.MPlug) -> bool:
+    return plug.isFreeToChange() == om.MPlug.kFreeToChange
+
+
+# ---------------------------------------------------------------------------
+# Capture
+# ---------------------------------------------------------------------------
+
+def capture_nodes(nodes: Sequence[str],
+                  filter_match: Optional[List[str]] = None,
+                  filter_exclude: Optional[List[str]] = None,
+                  in_channelbox: bool = False) -> Dict[str, Dict[str, Any]]:
+    """Capture the preset attributes of ``nodes`` with MPlug reads.
+
+    Selects the same attributes as ``createAttrPreset``: readable, non-null
+    string attributes plus writable scalar attributes that pass
+    ``validNodeTypeAttrForCurrentPreset``, both filtered by
+    ``filter_match`` / ``filter_exclude`` (fnmatch patterns).
+
+    Args:
+        nodes: Node names.
+        filter_match: Only keep attributes matching one of these patterns.
+        filter_exclude: Drop attributes matching one of these patterns.
+        in_channelbox: Restrict to channel-box attributes (keyable, unlocked).
+
+    Returns:
+        dict: ``{node: {attr: value}}`` in node order; missing nodes are skipped.
+    """
+    from dw_maya.dw_presets_io.dw_preset import filter_attributes, filter_channelbox_attrs
+
+    result: Dict[str, Dict[str, Any]] = {}
+    for node in nodes:
+        fn = _depend_fn(node)
+        if fn is None:
+            logger.warning(f"capture_nodes: '{node}' not found, skipping")
+            continue
+        node_type = fn.typeName
+
+        match = list(filter_match or [])
+        if in_channelbox:
+            match.extend(filter_channelbox_attrs(node) or [])
+
+        attrs = cmds.listAttr(node, multi=True, write=True, visible=True, hasData=True) or []
+        if match or filter_exclude:
+            attrs = filter_attributes(attrs, filter_match=match, filter_exclude=filter_exclude)
+
+        values = {}
+        for attr in attrs:
+            plug = _find_plug(fn, node, attr)
+            if plug is None:
+                continue
+            kind, valid = _schema(node_type, attr, plug)
+            if kind == _SKIP:
+                continue
+            if kind == _STRING:
+                # Mirrors the cmds path: readable and not null data
+                if not om.MFnAttribute(plug.attribute()).readable or plug.asMObject().isNull():
+                    continue
+            elif not valid:
+                continue
+            values[attr] = _read(plug, kind)
+        result[node] = values
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Apply
+# ---------------------------------------------------------------------------
+
+@dataclass
+class ApplyReport:
+    """What an apply pass did."""
+    changed: int = 0
+    unchanged: int = 0
+    skipped: List[str] = field(default_factory=list)
+    keys_removed: int = 0
+
+    def __iadd__(self, other: 'ApplyReport') -> 'ApplyReport':
+        self.changed += other.changed
+        self.unchanged += other.unchanged
+        self.skipped.extend(other.skipped)
+        self.keys_removed += other.keys_removed
+        return self
+
+    def __str__(self):
+        return (f"{self.changed} changed, {self.unchanged} unchanged, "
+                f"{len(self.skipped)} skipped, {self.keys_removed} keyed plugs cleared")
+
+
+class _PendingApply:
+    """MDGModifier being filled, flushed as one undo entry."""
+
+    def __init__(self):
+        self.modifier = om.MDGModifier()
+        self.count = 0
+
+    def flush(self) -> None:
+        if not self.count:
+            return
+        modifier = self.modifier
+        push_undo(modifier.doIt, modifier.undoIt)
+        self.modifier = om.MDGModifier()
+        self.count = 0
+
+
+def _remove_keys(plugs: List[om.MPlug]) -> int:
+    """Cut the animation keys driving ``plugs``; returns how many were cleared."""
+    keyed = []
+    for plug in plugs:
+        src = plug.source()
+        if not src.isNull and src.node().hasFn(om.MFn.kAnimCurve):
+            keyed.append(plug.name())
+    if keyed:
+        cmds.cutKey(keyed)
+    return len(keyed)
+
+
+def apply_values(values: Dict[str, Dict[str, Any]],
+                 blend: float = 1.0,
+                 rm_keyframe: bool = False) -> ApplyReport:
+    """Apply ``{node: {attr: value}}`` through one MDGModifier (one undo entry).
+
+    Args:
+        values: Target node -> attribute -> stored value. ``nodeType`` and
+            legacy ``*_nodeType`` keys are ignored.
+        blend: 1.0 sets values outright; < 1.0 blends with current values.
+        rm_keyframe: Cut animation keys on the target plugs first (keyed
+            plugs are otherwise not settable and get skipped).
+
+    Returns:
+        ApplyReport: Changed / unchanged counts and skipped ``node.attr``
+        paths (missing, locked, connected or unsupported). String values on
+        missing attributes are listed too - callers creating attributes on
+        the fly (e.g. ``notes``) fall back to the cmds path for those.
+    """
+    from dw_maya.dw_constants import SPECIAL_TOKENS
+
+    report = ApplyReport()
+    resolved: List[Tuple[om.MPlug, str, Any]] = []
+    for node, attrs in values.items():
+        fn = _depend_fn(node)
+        if fn is None:
+            report.skipped.extend(f'{node}.{a}' for a in attrs)
+            continue
+        node_type = fn.typeName
+        for attr, value in attrs.items():
+            if attr == 'nodeType' or attr.endswith('_nodeType'):
+                continue
+            plug = _find_plug(fn, node, attr)
+            kind = _schema(node_type, attr, plug)[0] if plug is not None else _SKIP
+            if kind == _SKIP:
+                report.skipped.append(f'{node}.{attr}')
+                continue
+            if isinstance(value, str) and value in SPECIAL_TOKENS:
+                value = SPECIAL_TOKENS[value]()
+            resolved.append((plug, kind, value))
+
+    if rm_keyframe:
+        report.keys_removed = _remove_keys([plug for plug, _, _ in resolved])
+
+    pending = _BATCH[-1] if _BATCH else _PendingApply()
+    for plug, kind, value in resolved:
+        if not _settable(plug):
+            report.skipped.append(plug.name())
+            continue
+        if (kind == _STRING) != isinstance(value, str):
+            report.skipped.append(plug.name())
+            continue
+        current = _read(plug, kind)
+        if kind != _STRING and blend < 0.999:
+            if kind == _ENUM:
+                value = current if blend < 0.5 else value
+            elif kind in _INT_KINDS:
+                value = int(value * blend + current * (1 - blend))
+            elif kind in _FLOAT_KINDS:
+                value = value * blend + current * (1 - blend)
+        if _same(kind, current, value):
+            report.unchanged += 1
+            continue
+        _write(pending.modifier, plug, kind, value)
+        pending.count += 1
+        report.changed += 1
+
+    if not _BATCH:
+        pending.flush()
+    return report
+
+
+@contextmanager
+def batch():
+    """Merge every ``apply_values`` call inside the block into one undo entry.
+
+    Values are written when the outermost block exits, so reads inside the
+    block still see the pre-batch scene.
+
+    Example:
+        >>> with preset_bulk.batch():
+        ...     for node, attrs in preset.items():
+        ...         preset_bulk.apply_values({node: attrs})
+    """
+    if _BATCH:
+        yield _BATCH[-1]
+        return
+    pending = _PendingApply()
+    _BATCH.append(pending)
+    try:
+        yield pending
+    finally:
+        _BATCH.pop()
+        pending.flush()
+
+
+# ---------------------------------------------------------------------------
+# Benchmark
+# ---------------------------------------------------------------------------
+
+def benchmark(count: int = 1000, node_type: str = 'transform', blend: float = 0.5) -> Dict[str, float]:
+    """Time the cmds path against the bulk path on ``count`` generated nodes.
+
+    Creates the nodes, captures them both ways, then re-applies the captured
+    values (offset so every plug changes) both ways. Nodes are deleted
+    afterwards.
+
+    Returns:
+        dict: Milliseconds per phase ('cmds_capture', 'bulk_capture',
+        'cmds_apply', 'bulk_apply') and the attribute count.
+    """
+    from dw_maya.dw_presets_io.dw_preset import createAttrPreset
+    from dw_maya.dw_presets_io.preset_components import apply_attr
+
+    nodes = [cmds.createNode(node_type, name=f'dwBulkBench{i}#') for i in range(count)]
+    timings: Dict[str, float] = {}
+    try:
+        start = time.perf_counter()
+        for node in nodes:
+            createAttrPreset(node, stripNamespace=False, bulk=False)
+        timings['cmds_capture'] = (time.perf_counter() - start) * 1000.0
+
+        start = time.perf_counter()
+        captured = capture_nodes(nodes)
+        timings['bulk_capture'] = (time.perf_counter() - start) * 1000.0
+
+        shifted = {n: {a: v + 1 for a, v in attrs.items()
+                       if isinstance(v, float) and a.startswith(('translate', 'scale'))}
+                   for n, attrs in captured.items()}
+        timings['attributes'] = float(sum(len(v) for v in shifted.values()))
+
+        start = time.perf_counter()
+        for node, attrs in shifted.items():
+            for attr, value in attrs.items():
+                apply_attr(f'{node}.{attr}', value, blend)
+        timings['cmds_apply'] = (time.perf_counter() - start) * 1000.0
+
+        start = time.perf_counter()
+        apply_values(shifted, blend=blend)
+        timings['bulk_apply'] = (time.perf_counter() - start) * 1000.0
+    finally:
+        cmds.delete(nodes)
+
+    report = ', '.join(f'{k} {v:.1f}' for k, v in timings.items())
+    logger.info(f"preset_bulk benchmark ({count} {node_type}): {report}")
+    return timings
@@ -58,6 +58,7 @@ from maya import cmds
 
 import dw_maya.dw_presets_io.dw_preset as dw_preset
 import dw_maya.dw_presets_io.dw_json as dw_json
+import dw_maya.dw_presets_io.preset_bulk as preset_bulk
 from dw_logger import get_logger
 
 logger = get_logger()
@@ -246,13 +247,16 @@ class AttributeComponent(PresetComponent):
         return out or None
 
     def apply(self, node: "Any", data: Dict, ctx: PresetContext) -> None:
+        # All roles go through one MDGModifier (one undo entry); plugs already
+        # holding the stored value are left untouched.
         roles = {"transform": node.tr, "shape": node.sh, "node": node.node}
+        values: Dict[str, Dict[str, Any]] = {}
         for role, attrs in data.items():
             target = roles.get(role)
-            if not target:
-                continue
-            for attr, value in attrs.items():
-                apply_attr(f"{target}.{attr}", value, ctx.blend)
+            if target:
+                values.setdefault(target, {}).update(attrs)
+        if values:
+            preset_bulk.apply_values(values, blend=ctx.blend)
 
 
 # ---------------------------------------------------------------------------
@@ -4,6 +4,7 @@ import dw_maya.dw_alembic_utils as dwabc
 import maya.cmds as cmds
 import maya.mel as mel
 import dw_maya.dw_decorators as dwdeco
+from dw_maya.dw_maya_utils import dw_proximity
 
 def makeTextureReferenceObject(sel: List[str]) -> List[str]:
     """===========================================================================
@@ -502,6 +503,38 @@ def addYetiCurveAttr(curves: list, **kwargs):
                 if con_attr:
                     cmds.connectAttr(f'{s}.{a}', con_attr[0], f=True)
 
+def guides_by_component(components: List[str], guide_sets: List[str],
+                        threshold: float = 0.1, closest: bool = False,
+                        tip: bool = False) -> List[str]:
+    """
+    Find the Yeti guide curves whose root (or tip) lies near mesh components.
+
+    Guide positions are extracted once for every curve of the guide sets and
+    matched through a single KD-tree (see ``dw_maya_utils.dw_proximity``).
+
+    Args:
+        components (list): Mesh components (vertices, edges or faces).
+        guide_sets (list): Yeti guide objectSets.
+        threshold (float): Maximum distance between a component and a guide.
+        closest (bool): Keep only the closest guide per face instead of every
+            guide within the threshold of a vertex.
+        tip (bool): Test the guide tips instead of the roots.
+
+    Returns:
+        list: Guide curve shapes.
+    """
+    sets_nodes = cmds.ls(guide_sets, type='objectSet')
+    curves = [c for s in sets_nodes for c in (cmds.sets(s, q=True) or [])]
+    if not components or not curves:
+        cmds.warning("No components or guide curves provided.")
+        return []
+
+    cv_index = -1 if tip else 0
+    if closest:
+        return dw_proximity.closest_curve_per_face(components, curves, threshold, cv_index)
+    return dw_proximity.curves_near_components(components, curves, threshold, cv_index)
+
+
 @dwdeco.acceptString('set_nodes')
 def saveGuidesRestPosition(set_nodes: list):
     """
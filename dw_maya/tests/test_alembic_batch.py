@@ -0,0 +1,123 @@
+"""Tests for the parallel Alembic export orchestration (dw_alembic_batch).
+
+Runs outside Maya: jobs are executed by StubRunner, which writes placeholder
+files instead of launching mayapy.
+
+Classes:
+    TestPlanner:   plan_shot_export ordering, cost estimate and dry-run report.
+    TestRunJobs:   parallel execution, progress stream and retries.
+    TestManifest:  manifest merge across partial re-runs.
+
+Example:
+    python -m unittest dw_maya.tests.test_alembic_batch
+
+Author: DrWeeny
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import dw_maya.dw_alembic_batch as abc_batch
+
+
+_ASSETS = {
+    "charA": ["charA:geo_grp"],
+    "charB": ["charB:geo_grp"],
+    "propC": ["propC:geo_grp"],
+}
+_COUNTS = {"charA": 20000, "charB": 80000, "propC": 500}
+
+
+class _TmpDirCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp(prefix="dw_abc_batch_")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def plan(self):
+        return abc_batch.plan_shot_export(_ASSETS, self.tmp, (1001, 1100),
+                                          scene="/shots/sh010.ma", vertex_counts=_COUNTS)
+
+
+class TestPlanner(_TmpDirCase):
+
+    def test_heaviest_first(self):
+        jobs = self.plan()
+        self.assertEqual([j.name for j in jobs], ["charB", "charA", "propC"])
+        self.assertEqual(jobs[0].cost, 80000 * 100)
+
+    def test_outputs(self):
+        jobs = self.plan()
+        self.assertTrue(all(j.output.endswith(f"{j.name}.abc") for j in jobs))
+
+    def test_unknown_kind(self):
+        with self.assertRaises(ValueError):
+            abc_batch.plan_shot_export(_ASSETS, self.tmp, (1, 2), scene="x.ma",
+                                       kind="usd", vertex_counts=_COUNTS)
+
+    def test_format_plan(self):
+        report = abc_batch.format_plan(self.plan(), max_workers=2)
+        self.assertIn("3 jobs, 2 workers", report)
+        self.assertIn("speed-up", report)
+
+
+class TestRunJobs(_TmpDirCase):
+
+    def test_all_succeed(self):
+        events = []
+        results = abc_batch.run_jobs(self.plan(), abc_batch.StubRunner(), max_workers=3,
+                                     progress=lambda n, f, m: events.append((n, f)))
+        self.assertTrue(all(r.success for r in results))
+        self.assertTrue(all(os.path.isfile(r.output) for r in results))
+        for name in _ASSETS:
+            self.assertIn((name, 1.0), events)
+
+    def test_retry(self):
+        runner = abc_batch.StubRunner(fail_times={"charA": 1})
+        results = {r.name: r for r in abc_batch.run_jobs(self.plan(), runner, retries=1)}
+        self.assertTrue(results["charA"].success)
+        self.assertEqual(results["charA"].attempts, 2)
+        self.assertEqual(runner.calls.count("charA"), 2)
+
+    def test_retry_exhausted(self):
+        runner = abc_batch.StubRunner(fail_times={"propC": 5})
+        results = {r.name: r for r in abc_batch.run_jobs(self.plan(), runner, retries=2)}
+        self.assertFalse(results["propC"].success)
+        self.assertEqual(results["propC"].attempts, 3)
+        self.assertIn("stub failure", results["propC"].error)
+
+
+class TestManifest(_TmpDirCase):
+
+    def test_merge(self):
+        jobs = self.plan()
+        path = os.path.join(self.tmp, "manifest.json")
+        runner = abc_batch.StubRunner(fail_times={"propC": 5})
+        abc_batch.write_manifest(abc_batch.run_jobs(jobs, runner, retries=0), path, jobs)
+        with open(path) as f:
+            self.assertEqual(json.load(f)["failed"], ["propC"])
+
+        # Re-run only the failed asset, the others must be kept
+        rerun = [j for j in jobs if j.name == "propC"]
+        manifest = abc_batch.write_manifest(
+            abc_batch.run_jobs(rerun, abc_batch.StubRunner()), path, rerun)
+        self.assertEqual(manifest["failed"], [])
+        self.assertEqual(sorted(manifest["assets"]), sorted(_ASSETS))
+        self.assertEqual(manifest["assets"]["charB"]["frame_range"], [1001, 1100])
+
+    def test_export_shot_dry_run(self):
+        jobs = abc_batch.export_shot(_ASSETS, self.tmp, (1, 10), dry_run=True,
+                                     scene="x.ma", vertex_counts=_COUNTS)
+        self.assertEqual(len(jobs), 3)
+        self.assertFalse(os.path.isfile(os.path.join(self.tmp, "manifest.json")))
+
+
+if __name__ == "__main__":
+    unittest.main()
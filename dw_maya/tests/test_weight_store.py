@@ -0,0 +1,158 @@
+"""Tests for the binary weight container (dw_presets_io.dw_weight_store).
+
+Pure numpy, no scene needed: arrays are written to a temporary folder and read
+back with every precision / compression / sparse combination.
+
+Classes:
+    TestRoundTrip:  dense, sparse, quantized and integer arrays.
+    TestLazyLoad:   memory-mapped access and header-only opening.
+    TestErrors:     invalid files, duplicate names, aborted writes.
+
+Example:
+    python -m unittest dw_maya.tests.test_weight_store
+
+Author: DrWeeny
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+
+def _load_weight_store():
+    """Import dw_weight_store without the dw_presets_io package __init__.
+
+    The package __init__ pulls in Maya (dw_folder); the container itself is
+    pure numpy, so load the module straight from its file.
+    """
+    name = "dw_maya.dw_presets_io.dw_weight_store"
+    if name in sys.modules:
+        return sys.modules[name]
+    path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                        "dw_presets_io", "dw_weight_store.py")
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+dw_weight_store = _load_weight_store()
+
+
+def _weights(count: int = 5000, zero_ratio: float = 0.0, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    weights = rng.random(count)
+    weights[rng.random(count) < zero_ratio] = 0.0
+    return weights
+
+
+class _TmpDirCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp(prefix="dw_weight_store_")
+        self.path = os.path.join(self.tmp, "maps.dww")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+
+class TestRoundTrip(_TmpDirCase):
+
+    def test_dense_float32(self):
+        weights = _weights()
+        dw_weight_store.write_arrays(self.path, {"w": weights}, meta={"mesh": "body"})
+        with dw_weight_store.WeightStore(self.path) as store:
+            self.assertEqual(store.meta, {"mesh": "body"})
+            self.assertNotIn("nnz", store.info("w"))
+            np.testing.assert_allclose(store["w"], weights, atol=1e-7)
+
+    def test_sparse_auto(self):
+        weights = _weights(zero_ratio=0.9)
+        dw_weight_store.write_arrays(self.path, {"w": weights})
+        with dw_weight_store.WeightStore(self.path) as store:
+            self.assertEqual(store.info("w")["nnz"], np.count_nonzero(weights))
+            np.testing.assert_allclose(store["w"], weights, atol=1e-7)
+
+    def test_precisions(self):
+        weights = _weights(zero_ratio=0.5)
+        tolerances = {"float16": 1e-3, "uint16": 1e-4, "uint8": 3e-3, "float64": 0.0}
+        with dw_weight_store.WeightStoreWriter(self.path) as writer:
+            for precision in tolerances:
+                writer.add(precision, weights, precision=precision)
+        with dw_weight_store.WeightStore(self.path) as store:
+            for precision, tol in tolerances.items():
+                np.testing.assert_allclose(store[precision], weights, atol=tol, err_msg=precision)
+
+    def test_positions_and_ints(self):
+        points = np.random.default_rng(1).random((300, 3)) * 100
+        ids = np.arange(50, dtype=np.int32)
+        dw_weight_store.write_arrays(self.path, {"pts": points, "ids": ids}, compression="zlib")
+        data = dw_weight_store.read_arrays(self.path)
+        self.assertEqual(data["pts"].shape, (300, 3))
+        np.testing.assert_allclose(data["pts"], points, rtol=1e-6)
+        np.testing.assert_array_equal(data["ids"], ids)
+
+    def test_compression_shrinks_sparse_maps(self):
+        weights = _weights(20000, zero_ratio=0.95)
+        dw_weight_store.write_arrays(self.path, {"w": weights})
+        self.assertLess(os.path.getsize(self.path), weights.astype(np.float32).nbytes / 4)
+
+    def test_export_json(self):
+        weights = _weights(10)
+        dw_weight_store.write_arrays(self.path, {"w": weights}, meta={"k": 1})
+        json_path = dw_weight_store.export_json(self.path, os.path.join(self.tmp, "maps.json"))
+        with open(json_path) as f:
+            data = json.load(f)
+        self.assertEqual(data["meta"], {"k": 1})
+        np.testing.assert_allclose(data["arrays"]["w"], weights, atol=1e-6)
+
+
+class TestLazyLoad(_TmpDirCase):
+
+    def test_memmap_when_plain(self):
+        weights = _weights()
+        with dw_weight_store.WeightStoreWriter(self.path, compression="none") as writer:
+            writer.add("plain", weights, sparse=False)
+            writer.add("packed", weights, compression="zlib")
+        with dw_weight_store.WeightStore(self.path) as store:
+            self.assertIsInstance(store.load("plain"), np.memmap)
+            self.assertNotIsInstance(store.load("packed"), np.memmap)
+            self.assertNotIsInstance(store.load("plain", mmap=False), np.memmap)
+
+    def test_partial_read(self):
+        arrays = {f"map{i}": _weights(seed=i) for i in range(5)}
+        dw_weight_store.write_arrays(self.path, arrays)
+        data = dw_weight_store.read_arrays(self.path, names=["map3"])
+        self.assertEqual(list(data), ["map3"])
+        np.testing.assert_allclose(data["map3"], arrays["map3"], atol=1e-7)
+
+
+class TestErrors(_TmpDirCase):
+
+    def test_not_a_store(self):
+        with open(self.path, "w") as f:
+            f.write("{}")
+        self.assertFalse(dw_weight_store.is_weight_store(self.path))
+        with self.assertRaises(ValueError):
+            dw_weight_store.WeightStore(self.path)
+
+    def test_duplicate_name(self):
+        with self.assertRaises(ValueError):
+            with dw_weight_store.WeightStoreWriter(self.path) as writer:
+                writer.add("w", [1.0])
+                writer.add("w", [2.0])
+        self.assertFalse(os.path.exists(self.path))
+        self.assertFalse(os.path.exists(f"{self.path}.tmp"))
+
+
+if __name__ == "__main__":
+    unittest.main()
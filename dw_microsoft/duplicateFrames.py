@@ -6,29 +6,29 @@ Created on 3 fevr. 2014
 
 import os
 import shutil
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from dw_utils import image_sequence
+
+
+def listExrFrames(directory):
+    "file names and sorted frame numbers of the .exr sequence in directory (one cached scan)"
+    sequences = [seq for seq in image_sequence.scan_directory(directory)
+                 if seq.extension == "exr"]
+    if not sequences:
+        return [], []
+    "the longest sequence wins when several share the folder"
+    sequence = max(sequences, key=len)
+    return list(sequence.names), list(sequence.frames)
+
 
 "Get The directory where is located the .py"
 myDir = os.getcwd()
 #myDir = "Y:\\_PROD\\EPISODES\\TEST\\Background"
 
-"list file in directory"
-try:
-    imageSeq = os.listdir(myDir)
-except:
-    imageSeq = []
-"find all .exr files in my list"
-imageSeq = [exrFile for exrFile in imageSeq if exrFile.endswith('.exr')]
-
-"empty variable to list image by number"    
-existingImage = []
-
-for imgPadd in imageSeq:
-    if imgPadd.endswith(".exr"):
-        myNum = imgPadd.split(".")[-2]
-        myNum = int(myNum)
-        existingImage.append(myNum)
-"sort my numbers"
-existingImage = sorted(existingImage)
+"list the exr images and their numbers"
+imageSeq, existingImage = listExrFrames(myDir)
 
 "trigger for while loop"
 chooseFrameTrigger = False
@@ -37,11 +37,11 @@ choosePasteTrigger = False
 "Frame to copy"  
 while chooseFrameTrigger == False:
     if imageSeq:
-        duplicatedFrame = raw_input(imageSeq[0].split(".")[0] + "\nChoose a frame to duplicate :")
+        duplicatedFrame = input(imageSeq[0].split(".")[0] + "\nChoose a frame to duplicate :")
     else:
-        duplicatedFrame = raw_input("WARNING, no Image Detected !\nPlease, drag and drop a frame to duplicate :")
+        duplicatedFrame = input("WARNING, no Image Detected !\nPlease, drag and drop a frame to duplicate :")
         if duplicatedFrame.split("\\") == 1:
-            print "Please, drag and drop a frame or copy/paste the full path !"
+            print("Please, drag and drop a frame or copy/paste the full path !")
             continue
     
     "try if integer is inputed" 
@@ -55,29 +55,16 @@ while chooseFrameTrigger == False:
             myDir = "\\".join(duplicatedFrame.split("\\")[:-1])
             duplicatedFrame = int(duplicatedFrame.split(".")[-2])
             
-            "list file in directory"
-            imageSeq = os.listdir(myDir)
-            "find all .exr files in my list"
-            imageSeq = [exrFile for exrFile in imageSeq if exrFile.endswith('.exr')]
-
-            "empty variable to list image by number"    
-            existingImage = []
-            
-            for imgPadd in imageSeq:
-                if imgPadd.endswith(".exr"):
-                    myNum = imgPadd.split(".")[-2]
-                    myNum = int(myNum)
-                    existingImage.append(myNum)
-            "sort my numbers"
-            existingImage = sorted(existingImage)
+            "list the exr images and their numbers"
+            imageSeq, existingImage = listExrFrames(myDir)
             
         else:
-            print ("Saisissez un nombre ou deposer une image!")
+            print("Saisissez un nombre ou deposer une image!")
             continue
     
     "find if this frame exists"
     if duplicatedFrame not in existingImage:
-        print "Choose an existing image"
+        print("Choose an existing image")
         continue
     
     "trigger the first while"
@@ -86,7 +73,7 @@ while chooseFrameTrigger == False:
     "input a frame range"
     while choosePasteTrigger == False:
         "raw input in order to have unicode"
-        frameRange = str(raw_input("Choose Frame Range to Copy :"))
+        frameRange = str(input("Choose Frame Range to Copy :"))
         
         if type(frameRange) == str:
             "remove space and find if the frame range is one frame or a frame range with '-'"
@@ -94,7 +81,7 @@ while chooseFrameTrigger == False:
                 "it is only one frame"
                 if os.path.exists(myDir + "\\" + imageSeq[0].split(".")[0] + "." + imageSeq[0].split(".")[1] + "." + str(frameRange).zfill(4) + ".exr") == True:
                     "find if the frame already exist in order to override it"
-                    override = raw_input("WARNING : this file already exists\nDo you want to override it.\n y/n ?")
+                    override = input("WARNING : this file already exists\nDo you want to override it.\n y/n ?")
                     if override.lower() == "y":
                         "override and rename it"
                         shutil.copy2((myDir + "\\" + imageSeq[0].split(".")[0] + "." + imageSeq[0].split(".")[1] + "." + str(duplicatedFrame).zfill(4) + ".exr"), (myDir + "\\" + imageSeq[0].split(".")[0] + "." + imageSeq[0].split(".")[1] + "." + str(frameRange).zfill(4) + ".exr"))
@@ -107,36 +94,36 @@ while chooseFrameTrigger == False:
             
             elif len(frameRange.replace(" ","").split("-")) > 1:
                 "if it is a frame range :"
-                print "from", frameRange.replace(" ","").split("-")[0], "to", frameRange.replace(" ","").split("-")[1]
+                print("from", frameRange.replace(" ","").split("-")[0], "to", frameRange.replace(" ","").split("-")[1])
                 
                 "iterate"
-                for i in xrange(int(frameRange.replace(" ","").split("-")[0]), int(frameRange.replace(" ","").split("-")[1]) + 1):
+                for i in range(int(frameRange.replace(" ","").split("-")[0]), int(frameRange.replace(" ","").split("-")[1]) + 1):
                     
                     "find it already exists"
                     if os.path.exists(myDir + "\\" + imageSeq[0].split(".")[0] + "." + imageSeq[0].split(".")[1] + "." + str(i).zfill(4) + ".exr") == True:
                         while True:
                             "prompt warning"
-                            override = raw_input("WARNING : this file already exists\nDo you want to override it :" + (imageSeq[0].split(".")[0] + "." + imageSeq[0].split(".")[1] + "." + str(i).zfill(4) + ".exr") + ".\n y/n ?")
+                            override = input("WARNING : this file already exists\nDo you want to override it :" + (imageSeq[0].split(".")[0] + "." + imageSeq[0].split(".")[1] + "." + str(i).zfill(4) + ".exr") + ".\n y/n ?")
                             if override.lower() == "y":                    
-                                print "copying :", imageSeq[0].split(".")[0] + "." + imageSeq[0].split(".")[1] + "." + str(i).zfill(4) + ".exr"
+                                print("copying :", imageSeq[0].split(".")[0] + "." + imageSeq[0].split(".")[1] + "." + str(i).zfill(4) + ".exr")
                                 shutil.copy2((myDir + "\\" + imageSeq[0].split(".")[0] + "." + imageSeq[0].split(".")[1] + "." + str(duplicatedFrame).zfill(4) + ".exr"), (myDir + "\\" + imageSeq[0].split(".")[0] + "." + imageSeq[0].split(".")[1] + "." + str(i).zfill(4) + ".exr"))
                                 break
                             elif override.lower() == "n":
                                 break
                             else:
-                                print "please, enter 'n' or 'y' !"
+                                print("please, enter 'n' or 'y' !")
                                 continue
                     else:
                         "no override, prompt copy iterration"
-                        print "copying :", imageSeq[0].split(".")[0] + "." + imageSeq[0].split(".")[1] + "." + str(i).zfill(4) + ".exr"
+                        print("copying :", imageSeq[0].split(".")[0] + "." + imageSeq[0].split(".")[1] + "." + str(i).zfill(4) + ".exr")
                         shutil.copy2((myDir + "\\" + imageSeq[0].split(".")[0] + "." + imageSeq[0].split(".")[1] + "." + str(duplicatedFrame).zfill(4) + ".exr"), (myDir + "\\" + imageSeq[0].split(".")[0] + "." + imageSeq[0].split(".")[1] + "." + str(i).zfill(4) + ".exr"))
                             
-                print "Finish !"
+                print("Finish !")
                 #shutil.copy2("D:\\test.txt", "D:\\temp\\test2.txt")
         
         choosePasteTrigger = True
         
-#     askQuit = str(raw_input("do you want to quit ?\n y/n ?")).lower()    
+#     askQuit = str(input("do you want to quit ?\n y/n ?")).lower()    
 #     if askQuit == "n":
 #         continue
 #     else:
@@ -4,6 +4,10 @@
 A script that figures out a file sequence from a single file name
 and loads up the whole sequence in RV.
 
+Version: 0.4
+-- sequence lookup goes through dw_utils.image_sequence (one cached directory
+   scan instead of a glob per call), python 3 prints
+
 Version: 0.3, 27.11.2012
 -- fixed an issue with reading sequences of different number of leading zeros denomination
 
@@ -17,12 +21,14 @@ Version: 0.1, 27.06.2012
 """
 
 import getopt
-import glob
 import os
 import re
 import sys
 import subprocess
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from dw_utils import image_sequence
+
 # this method searches the given file name and tries to find a match for the regular expression pattern.
 # if it finds one, it replaces it with a wildcard character, if not, it leaves it as it was
 def findSequence(selFile, rePattern, loadSingle):
@@ -30,13 +36,10 @@ def findSequence(selFile, rePattern, loadSingle):
 	
 	if reRes != None:
 		selFrame = int(reRes.group(0))
-		wildcardFileName = re.sub(rePattern, '*', selFile)
-		#firstFrame = int((rePattern.search((glob.glob(wildcardFileName))[0])).group(0))
-		#lastFrame = int((rePattern.search((glob.glob(wildcardFileName))[-1])).group(0))
-		#subString = r'{0}-{1}{2}'.format(firstFrame, lastFrame, ('@'*len(reRes.group(0))))
-		subString = '@'*len(reRes.group(0))
-		if len(glob.glob(wildcardFileName)) > 1 and loadSingle != True:
-			return (re.sub(rePattern, subString, selFile), selFrame)
+		# padding comes from the whole sequence, so mixed leading zeros still load
+		sequence = image_sequence.find_sequence(selFile)
+		if sequence is not None and len(sequence) > 1 and loadSingle != True:
+			return (sequence.pattern('@'), selFrame)
 		else:
 			return (selFile, None)
 	else:
@@ -45,7 +48,7 @@ def findSequence(selFile, rePattern, loadSingle):
 # this method takes the correctly formatted input file and fires up RV via RVPUSH passing it the selected file
 # or file sequence
 def callRV(seq, positionPlayer):
-	print "args:", seq, "position player:", positionPlayer
+	print("args:", seq, "position player:", positionPlayer)
 	startupinfo = subprocess.STARTUPINFO()
 	startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
 	#rvpush mu-eval 'rvui.clearEverything(); addSource("myMovie.mov"); setFrame(50);'
@@ -57,7 +60,7 @@ def usage():
 	frame you selected and -s for ignoring file sequences and loading up only the one selected file.
 	-h invokes this help explicitly"""
 	
-	print usageStr
+	print(usageStr)
 
 # the main method that gets executed at the begining.
 def main(args):
@@ -7,10 +7,11 @@ Inspired by RV and KeyframePro annotation workflows.
 
 import sys
 import os
-import re
 import json
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, List, Tuple, Dict
+from typing import Callable, Optional, List, Tuple, Dict
 from dataclasses import dataclass, field
 from enum import Enum
 import numpy as np
@@ -20,6 +21,11 @@ try:
 except ImportError:
     oiio = None
 
+try:
+    from dw_utils import image_sequence
+except ImportError:
+    import image_sequence  # run as a script from dw_utils/
+
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QSlider, QFileDialog, QSpinBox, QComboBox,
@@ -212,36 +218,29 @@ def read_exr(filepath: str) -> Optional[np.ndarray]:
 
 
 def find_sequence(filepath: str) -> Tuple[List[str], int, int]:
-    directory = os.path.dirname(filepath) or "."
-    filename = os.path.basename(filepath)
-
-    patterns = [
-        (r'^(.+?)\.(\d+)\.(\w+)$', '{}.{:0{}d}.{}'),
-        (r'^(.+?)_(\d+)\.(\w+)$', '{}_{:0{}d}.{}'),
-        (r'^(.+?)(\d+)\.(\w+)$', '{}{:0{}d}.{}'),
-    ]
-
-    for pattern, fmt in patterns:
-        match = re.match(pattern, filename)
-        if match:
-            prefix, frame_str, ext = match.groups()
-            files = []
-            for f in os.listdir(directory):
-                m = re.match(pattern, f)
-                if m and m.group(1) == prefix and m.group(3) == ext:
-                    files.append((int(m.group(2)), os.path.join(directory, f)))
-            files.sort(key=lambda x: x[0])
-            if files:
-                frames = [f[0] for f in files]
-                paths = [f[1] for f in files]
-                return paths, min(frames), max(frames)
-
-    return [filepath], 1, 1
+    seq = image_sequence.find_sequence(filepath)
+    if seq is None:
+        return [filepath], 1, 1
+    return seq.paths(), seq.first, seq.last
+
+
+def _tone_curve(img: np.ndarray, method: str, gamma: float) -> np.ndarray:
+    """Tone curve then display gamma, on exposed colour values."""
+    if method == "reinhard":
+        img = img / (1.0 + img)
+    elif method == "filmic":
+        a, b, c, d, e = 2.51, 0.03, 2.43, 0.59, 0.14
+        img = np.clip((img * (a * img + b)) / (img * (c * img + d) + e), 0, 1)
+    elif method == "linear":
+        img = np.clip(img, 0, 1)
+
+    return np.power(np.clip(img, 0, 1), 1.0 / gamma)
 
 
 def apply_tone_mapping(img: np.ndarray, exposure: float = 0.0,
                        gamma: float = 2.2, method: str = "reinhard") -> np.ndarray:
     img = img * (2.0 ** exposure)
+    alpha = None
 
     if len(img.shape) == 2:
         img = np.stack([img, img, img], axis=-1)
@@ -253,15 +252,7 @@ def apply_tone_mapping(img: np.ndarray, exposure: float = 0.0,
     else:
         alpha = None
 
-    if method == "reinhard":
-        img = img / (1.0 + img)
-    elif method == "filmic":
-        a, b, c, d, e = 2.51, 0.03, 2.43, 0.59, 0.14
-        img = np.clip((img * (a * img + b)) / (img * (c * img + d) + e), 0, 1)
-    elif method == "linear":
-        img = np.clip(img, 0, 1)
-
-    img = np.power(np.clip(img, 0, 1), 1.0 / gamma)
+    img = _tone_curve(img, method, gamma)
 
     if alpha is not None:
         img = np.concatenate([img, np.clip(alpha, 0, 1)], axis=-1)
@@ -269,6 +260,175 @@ def apply_tone_mapping(img: np.ndarray, exposure: float = 0.0,
     return img
 
 
+HALF_MAX = float(np.finfo(np.float16).max)  # 65504
+
+
+class DisplayLUT:
+    """apply_tone_mapping baked into lookup tables indexed by float16 bits.
+
+    Every half-float value maps to exactly one 8-bit display code, so a
+    frame stored as float16 is displayed with one table lookup per sample:
+    no exposure multiply, curve or np.power per pixel, and no full-size
+    temporaries. The tables are rebuilt only when a control changes.
+
+    Frames are processed in bands of TILE_ROWS rows written straight into
+    the output buffer, which keeps the working set in cache. float32 input
+    works but is cast band by band; store frames as float16 for full speed.
+    """
+
+    TILE_ROWS = 32
+
+    def __init__(self):
+        self._settings: Optional[Tuple[float, float, str]] = None
+        self._color: Optional[np.ndarray] = None
+        self._alpha: Optional[np.ndarray] = None
+        self.last_ms = 0.0  # cost of the latest apply()
+
+    @property
+    def settings(self) -> Optional[Tuple[float, float, str]]:
+        return self._settings
+
+    def update(self, exposure: float, gamma: float, method: str) -> bool:
+        """Rebuild the tables if a control changed. Returns True if rebuilt."""
+        settings = (exposure, gamma, method)
+        if settings == self._settings:
+            return False
+
+        values = np.arange(65536, dtype=np.uint16).view(np.float16).astype(np.float32)
+        # +-inf saturate like the largest half; only NaN maps to black
+        values = np.clip(values, -HALF_MAX, HALF_MAX)
+        with np.errstate(all="ignore"):
+            values = np.nan_to_num(values * (2.0 ** exposure), nan=0.0)
+            color = _tone_curve(values, method, gamma)
+            alpha = np.clip(values, 0, 1)
+        self._color = (np.nan_to_num(color, nan=0.0) * 255).astype(np.uint8)
+        self._alpha = (alpha * 255).astype(np.uint8)
+        self._settings = settings
+        return True
+
+    def apply(self, img: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Display-transform img into a contiguous uint8 RGB / RGBA array.
+
+        Args:
+            img: (h, w) or (h, w, c) float image, float16 preferred.
+            out: Buffer to reuse when its shape matches the result.
+        """
+        if self._color is None:
+            raise RuntimeError("DisplayLUT.update() must be called before apply()")
+
+        start = time.perf_counter()
+        if img.ndim == 2:
+            img = img[:, :, np.newaxis]
+        h, w, c = img.shape
+        channels = 4 if c == 4 else 3
+        if out is None or out.shape != (h, w, channels) or out.dtype != np.uint8:
+            out = np.empty((h, w, channels), dtype=np.uint8)
+
+        rows = self.TILE_ROWS
+        band_buffer = None
+        if img.dtype != np.float16:
+            band_buffer = np.empty((min(rows, h), w, c), dtype=np.float16)
+
+        for y in range(0, h, rows):
+            band = img[y:y + rows]
+            if band_buffer is not None:
+                half = band_buffer[:len(band)]
+                with np.errstate(over="ignore"):  # -> +-inf, saturated by the LUT
+                    half[...] = band
+                band = half
+            bits = band.view(np.uint16)
+            dst = out[y:y + rows]
+            if c < 3:
+                # grey (or grey + something): replicate the first channel
+                bits = np.broadcast_to(bits[:, :, :1], dst.shape)
+                np.take(self._color, bits, out=dst, mode="clip")
+            elif channels == 4:
+                np.take(self._color, bits, out=dst, mode="clip")
+                np.take(self._alpha, bits[:, :, 3], out=dst[:, :, 3], mode="clip")
+            else:
+                np.take(self._color, bits[:, :, :3], out=dst, mode="clip")
+
+        self.last_ms = (time.perf_counter() - start) * 1000.0
+        return out
+
+
+class OnionSkinCache:
+    """Onion-skin composites built from a ring of pre-transformed frames.
+
+    Neighbour frames are downsampled (to at most MAX_SIZE pixels on a side)
+    and display-transformed once, then kept in a ring of RING_SIZE frames, so
+    stepping through the sequence only transforms the one frame entering the
+    window. The layers of a frame are flattened into a single QPixmap, cached
+    per (frame, layers). Everything is display-setting dependent: call clear()
+    when the LUT changes or another sequence is loaded.
+    """
+
+    MAX_SIZE = 1024
+    RING_SIZE = 8
+    MAX_COMPOSITES = 16
+
+    def __init__(self, get_frame: Callable[[int], Optional[np.ndarray]],
+                 lut: DisplayLUT, to_qimage: Callable[[np.ndarray], Optional[QImage]]):
+        self._get_frame = get_frame
+        self._lut = lut
+        self._to_qimage = to_qimage
+        self._frames: "OrderedDict[int, np.ndarray]" = OrderedDict()
+        self._composites: "OrderedDict[tuple, QPixmap]" = OrderedDict()
+
+    def clear(self):
+        self._frames.clear()
+        self._composites.clear()
+
+    def frame(self, index: int) -> Optional[np.ndarray]:
+        """Downsampled uint8 display image of a frame (None if unreadable)."""
+        display = self._frames.get(index)
+        if display is not None:
+            self._frames.move_to_end(index)
+            return display
+
+        img = self._get_frame(index)
+        if img is None:
+            return None
+        step = max(1, -(-max(img.shape[:2]) // self.MAX_SIZE))
+        display = self._lut.apply(img[::step, ::step])
+
+        self._frames[index] = display
+        while len(self._frames) > self.RING_SIZE:
+            self._frames.popitem(last=False)
+        return display
+
+    def composite(self, index: int,
+                  layers: Tuple[Tuple[int, float], ...]) -> Optional[QPixmap]:
+        """The (offset, opacity) layers around index flattened into one pixmap."""
+        key = (index, layers)
+        pixmap = self._composites.get(key)
+        if pixmap is not None:
+            self._composites.move_to_end(key)
+            return pixmap
+
+        canvas = None
+        painter = None
+        for offset, opacity in layers:
+            display = self.frame(index + offset)
+            qimage = self._to_qimage(display) if display is not None else None
+            if qimage is None:
+                continue
+            if canvas is None:
+                canvas = QImage(qimage.size(), QImage.Format.Format_ARGB32_Premultiplied)
+                canvas.fill(Qt.GlobalColor.transparent)
+                painter = QPainter(canvas)
+            painter.setOpacity(opacity)
+            painter.drawImage(0, 0, qimage)
+        if painter is not None:
+            painter.end()
+        pixmap = QPixmap.fromImage(canvas) if canvas is not None else None
+
+        self._composites[key] = pixmap
+        while len(self._composites) > self.MAX_COMPOSITES:
+            self._composites.popitem(last=False)
+        return pixmap
+
+
 # =============================================================================
 # Drawing Canvas Widget
 # =============================================================================
@@ -298,7 +458,9 @@ class DrawingCanvas(QLabel):
         self.strokes: List[Stroke] = []
 
         self.onion_skin_enabled = False
-        self.onion_frames: List[Tuple[QPixmap, float]] = []
+        self.onion_pixmap: Optional[QPixmap] = None
+        self._onion_scaled: Optional[QPixmap] = None
+        self._onion_scaled_key: Optional[tuple] = None
 
     def set_image(self, qimage: QImage):
         self._base_pixmap = QPixmap.fromImage(qimage)
@@ -309,10 +471,26 @@ class DrawingCanvas(QLabel):
         self.strokes = strokes
         self.update()
 
-    def set_onion_frames(self, frames: List[Tuple[QImage, float]]):
-        self.onion_frames = [(QPixmap.fromImage(img), opacity) for img, opacity in frames]
+    def set_onion_composite(self, pixmap: Optional[QPixmap]):
+        """Show the flattened onion layers (see OnionSkinCache.composite)."""
+        if pixmap is self.onion_pixmap:
+            return
+        self.onion_pixmap = pixmap
         self.update()
 
+    def _scaled_onion(self) -> QPixmap:
+        # Repaints (strokes, hover) reuse the scaled pixmap of the composite
+        width, height = int(self._display_rect.width()), int(self._display_rect.height())
+        key = (self.onion_pixmap.cacheKey(), width, height)
+        if key != self._onion_scaled_key:
+            self._onion_scaled = self.onion_pixmap.scaled(
+                width, height,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation
+            )
+            self._onion_scaled_key = key
+        return self._onion_scaled
+
     def _update_display_rect(self):
         if self._base_pixmap is None:
             return
@@ -357,17 +535,10 @@ class DrawingCanvas(QLabel):
         if self._base_pixmap is None:
             return
 
-        # Onion skin
-        if self.onion_skin_enabled:
-            for pixmap, opacity in self.onion_frames:
-                painter.setOpacity(opacity)
-                scaled = pixmap.scaled(
-                    int(self._display_rect.width()),
-                    int(self._display_rect.height()),
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation
-                )
-                painter.drawPixmap(int(self._display_rect.x()), int(self._display_rect.y()), scaled)
+        # Onion skin (layer opacities are baked into the composite)
+        if self.onion_skin_enabled and self.onion_pixmap is not None:
+            painter.drawPixmap(int(self._display_rect.x()), int(self._display_rect.y()),
+                               self._scaled_onion())
 
         # Main image
         painter.setOpacity(1.0)
@@ -523,6 +694,14 @@ class EXRPlayer(QMainWindow):
         self.cache: dict = {}
         self.max_cache_size = 100
 
+        self.display_lut = DisplayLUT()
+        self._display_buffer: Optional[np.ndarray] = None
+        self.onion_layers: Tuple[Tuple[int, float], ...] = (
+            (-2, 0.15), (-1, 0.3), (1, 0.3), (2, 0.15)
+        )
+        self.onion_cache = OnionSkinCache(self.get_frame_image, self.display_lut,
+                                          self._create_qimage)
+
         self.annotations = AnnotationManager()
         self.global_drawing = False
 
@@ -644,6 +823,10 @@ class EXRPlayer(QMainWindow):
         self.setStatusBar(self.status)
         self.status.showMessage("Ready - Open an EXR file or sequence")
 
+        self.display_cost_label = QLabel()
+        self.display_cost_label.setToolTip("Display transform cost of the last frame")
+        self.status.addPermanentWidget(self.display_cost_label)
+
     def _setup_toolbar(self):
         toolbar = QToolBar("Drawing Tools")
         toolbar.setMovable(False)
@@ -836,6 +1019,7 @@ class EXRPlayer(QMainWindow):
     def load_sequence(self, filepath: str):
         self.stop_playback()
         self.cache.clear()
+        self.onion_cache.clear()
 
         self.sequence, self.start_frame, self.end_frame = find_sequence(filepath)
 
@@ -865,6 +1049,10 @@ class EXRPlayer(QMainWindow):
         img = read_exr(filepath)
 
         if img is not None:
+            # Half floats: half the memory, and DisplayLUT indexes them directly.
+            # Saturate first: beyond the half range the cast would give inf.
+            if img.dtype != np.float16:
+                img = np.clip(img, -HALF_MAX, HALF_MAX).astype(np.float16)
             if len(self.cache) >= self.max_cache_size:
                 oldest = min(self.cache.keys())
                 del self.cache[oldest]
@@ -894,10 +1082,13 @@ class EXRPlayer(QMainWindow):
         exposure = self.exposure_spin.value()
         gamma = self.gamma_spin.value()
         method = self.tonemap_combo.currentText()
+        if self.display_lut.update(exposure, gamma, method):
+            self.onion_cache.clear()
 
-        display = apply_tone_mapping(img, exposure, gamma, method)
-        display = (display * 255).astype(np.uint8)
-        display = np.ascontiguousarray(display)
+        # set_image copies into a QPixmap, so the buffer is reused every frame
+        display = self.display_lut.apply(img, out=self._display_buffer)
+        self._display_buffer = display
+        self.display_cost_label.setText(f"Display: {self.display_lut.last_ms:.1f} ms")
 
         qimage = self._create_qimage(display)
         if qimage:
@@ -909,21 +1100,13 @@ class EXRPlayer(QMainWindow):
 
         # Onion skin
         if self.canvas.onion_skin_enabled:
-            onion_frames = []
-            for offset, opacity in [(-2, 0.15), (-1, 0.3), (1, 0.3), (2, 0.15)]:
-                idx = self.current_frame + offset
-                if 0 <= idx < len(self.sequence):
-                    onion_img = self.get_frame_image(idx)
-                    if onion_img is not None:
-                        onion_display = apply_tone_mapping(onion_img, exposure, gamma, method)
-                        onion_display = (onion_display * 255).astype(np.uint8)
-                        onion_display = np.ascontiguousarray(onion_display)
-                        oq = self._create_qimage(onion_display)
-                        if oq:
-                            onion_frames.append((oq, opacity))
-            self.canvas.set_onion_frames(onion_frames)
+            # Ring the current frame too: it is a neighbour of the next one
+            self.onion_cache.frame(self.current_frame)
+            self.canvas.set_onion_composite(
+                self.onion_cache.composite(self.current_frame, self.onion_layers)
+            )
         else:
-            self.canvas.set_onion_frames([])
+            self.canvas.set_onion_composite(None)
 
         annotation_indicator = " ✏" if self.annotations.has_annotations(actual_frame) else ""
         self.frame_label.setText(f"Frame: {actual_frame}{annotation_indicator}")
@@ -25,12 +25,44 @@ Usage:
 
     # Clear a key
     hub.unpublish("my_key")
+
+Bursty keys:
+    # Publishes to "selection" within 30 ms reach listeners once, with
+    # (value before the burst, last value). 0 = flush on the next event-loop tick.
+    hub.set_coalescing("selection", 30)
+
+    # Non-UI listener called on the hub's worker thread
+    hub.subscribe("selection", write_log, threaded=True)
+
+    # Who is slow?
+    for stat in hub.get_listener_stats()[:5]:
+        print(stat.key, stat.listener, stat.calls, stat.total_ms, stat.max_ms)
 """
 
-from typing import Any, Callable, Dict, List, Optional, Set
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set, Tuple
+import threading
+import time
 import weakref
 from functools import wraps
 
+try:
+    from PySide6 import QtCore
+except ImportError:
+    try:
+        from PySide2 import QtCore
+    except ImportError:
+        QtCore = None  # no event loop: coalesced keys flush immediately
+
+
+class ListenerStats(NamedTuple):
+    """Accumulated call timings of one listener on one key."""
+    key: str
+    listener: str  # __qualname__, display only
+    calls: int
+    total_ms: float
+    max_ms: float
+
 
 class DataHubPub:
     """
@@ -65,6 +97,9 @@ class DataHubPub:
         if cls._Instance is not None:
             cls._Instance._data.clear()
             cls._Instance._listeners.clear()
+            cls._Instance._pending.clear()
+            if cls._Instance._executor is not None:
+                cls._Instance._executor.shutdown(wait=False)
         cls._Instance = None
 
     @classmethod
@@ -86,6 +121,17 @@ class DataHubPub:
         self._data: Dict[str, Any] = {}
         self._listeners: Dict[str, List[Callable]] = {}
         self._listener_refs: Dict[str, List[weakref.ref]] = {}  # For weak references
+        self._worker_listeners: Dict[str, List[Callable]] = {}  # threaded=True
+
+        # Coalescing: key -> window in ms, and the notification waiting for
+        # its flush as (old value before the burst, latest value).
+        self._coalesce: Dict[str, int] = {}
+        self._pending: Dict[str, Tuple[Any, Any]] = {}
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # (key, listener identity) -> [label, calls, total ms, max ms]
+        self._stats: Dict[Tuple[str, Tuple[int, int]], list] = {}
+        self._stats_lock = threading.Lock()
 
     def publish(self, key: str, value: Any, overwrite: bool = False, notify: bool = True) -> bool:
         """
@@ -123,7 +169,7 @@ class DataHubPub:
 
         # Notify listeners
         if notify:
-            self._notify_listeners(key, old_value, value)
+            self._changed(key, old_value, value)
 
         return True
 
@@ -139,7 +185,7 @@ class DataHubPub:
         """
         if key in self._data:
             old_value = self._data.pop(key)
-            self._notify_listeners(key, old_value, None)
+            self._changed(key, old_value, None)
 
             if self._debug:
                 print(f"[DataHub] Unpublished {key}")
@@ -160,7 +206,8 @@ class DataHubPub:
         """
         return self._data.get(key, default)
 
-    def subscribe(self, key: str, listener: Callable, weak: bool = False):
+    def subscribe(self, key: str, listener: Callable, weak: bool = False,
+                  threaded: bool = False):
         """
         Subscribe to changes for a specific key.
 
@@ -168,14 +215,25 @@ class DataHubPub:
             key: The key to subscribe to
             listener: Callback function(old_value, new_value)
             weak: If True, use weak reference (listener can be garbage collected)
+            threaded: If True, call the listener on the hub's worker thread
+                instead of the publisher's. For non-UI listeners only (logging,
+                disk writes...) - Qt widgets must not be touched from there.
+                Worker listeners are called in publish order, one at a time.
 
         Raises:
-            ValueError: If listener is not callable
+            ValueError: If listener is not callable, or weak and threaded
+                are both set
         """
         if not callable(listener):
             raise ValueError(f"Listener must be callable, got {type(listener)}")
 
-        if weak:
+        if threaded:
+            if weak:
+                raise ValueError("A threaded listener cannot be weak")
+            bucket = self._worker_listeners.setdefault(key, [])
+            if listener not in bucket:
+                bucket.append(listener)
+        elif weak:
             # Use weak references to prevent memory leaks
             if key not in self._listener_refs:
                 self._listener_refs[key] = []
@@ -210,6 +268,13 @@ class DataHubPub:
             except ValueError:
                 pass  # Listener not found
 
+        # Check worker-thread listeners
+        if key in self._worker_listeners:
+            try:
+                self._worker_listeners[key].remove(listener)
+            except ValueError:
+                pass
+
         # Check weak references
         if key in self._listener_refs:
             self._listener_refs[key] = [
@@ -217,6 +282,74 @@ class DataHubPub:
                 if ref() is not None and ref() != listener
             ]
 
+    # ------------------------------------------------------------------
+    # Coalescing
+    # ------------------------------------------------------------------
+
+    def set_coalescing(self, key: str, window_ms: Optional[int] = 0):
+        """
+        Batch the notifications of a bursty key.
+
+        Publishes inside the window are folded into one notification with
+        (value before the burst, last value) - last value wins. retrieve()
+        always returns the latest value, even before the flush.
+
+        Args:
+            key: The key to coalesce
+            window_ms: Delay before the flush, counted from the first publish
+                of the burst. 0 flushes on the next event-loop tick; None
+                turns coalescing off (and flushes anything pending).
+
+        Without a running Qt application there is no event loop to flush
+        from, and notifications are delivered immediately.
+        """
+        if window_ms is None:
+            self._coalesce.pop(key, None)
+            self.flush(key)
+        else:
+            self._coalesce[key] = max(0, int(window_ms))
+
+    def flush(self, key: Optional[str] = None):
+        """
+        Deliver pending coalesced notifications now.
+
+        Args:
+            key: The key to flush, or None for every pending key
+        """
+        keys = [key] if key is not None else list(self._pending)
+        for pending_key in keys:
+            if pending_key not in self._pending:
+                continue
+            old_value, new_value = self._pending.pop(pending_key)
+            self._notify_listeners(pending_key, old_value, new_value)
+
+    def _changed(self, key: str, old_value: Any, new_value: Any):
+        """Notify now, or fold the change into the key's pending flush."""
+        window_ms = self._coalesce.get(key)
+        if window_ms is None or not self._has_event_loop():
+            self._notify_listeners(key, old_value, new_value)
+            return
+
+        if key in self._pending:
+            # Keep the pre-burst old value; the flush is already scheduled
+            self._pending[key] = (self._pending[key][0], new_value)
+            return
+
+        self._pending[key] = (old_value, new_value)
+        QtCore.QTimer.singleShot(window_ms, lambda: self.flush(key))
+
+    @staticmethod
+    def _has_event_loop() -> bool:
+        """True when a QTimer fired from here would run (Qt app, its thread)."""
+        if QtCore is None:
+            return False
+        app = QtCore.QCoreApplication.instance()
+        return app is not None and QtCore.QThread.currentThread() is app.thread()
+
+    # ------------------------------------------------------------------
+    # Dispatch
+    # ------------------------------------------------------------------
+
     def _notify_listeners(self, key: str, old_value: Any, new_value: Any):
         """
         Notify all listeners of a value change.
@@ -226,13 +359,13 @@ class DataHubPub:
             old_value: Previous value
             new_value: New value
         """
-        # Notify regular listeners
-        for listener in self._listeners.get(key, []):
-            try:
-                listener(old_value, new_value)
-            except Exception as e:
-                if self._debug:
-                    print(f"[DataHub] Error in listener for {key}: {e}")
+        # Hand worker listeners off first so they overlap the UI ones
+        for listener in self._worker_listeners.get(key, []):
+            self._worker().submit(self._call, key, listener, old_value, new_value)
+
+        # Notify regular listeners (copy - a listener may unsubscribe)
+        for listener in list(self._listeners.get(key, [])):
+            self._call(key, listener, old_value, new_value)
 
         # Notify weak reference listeners (and clean up dead refs)
         if key in self._listener_refs:
@@ -241,14 +374,79 @@ class DataHubPub:
                 listener = ref()
                 if listener is not None:
                     live_refs.append(ref)
-                    try:
-                        listener(old_value, new_value)
-                    except Exception as e:
-                        if self._debug:
-                            print(f"[DataHub] Error in weak listener for {key}: {e}")
+                    self._call(key, listener, old_value, new_value)
 
             self._listener_refs[key] = live_refs
 
+    def _call(self, key: str, listener: Callable, old_value: Any, new_value: Any):
+        """Run one listener, recording how long it took."""
+        start = time.perf_counter()
+        try:
+            listener(old_value, new_value)
+        except Exception as e:
+            if self._debug:
+                print(f"[DataHub] Error in listener for {key}: {e}")
+        elapsed = (time.perf_counter() - start) * 1000.0
+
+        name = getattr(listener, "__qualname__", None) or repr(listener)
+        with self._stats_lock:
+            stat = self._stats.setdefault((key, self._listener_id(listener)),
+                                          [name, 0, 0.0, 0.0])
+            stat[1] += 1
+            stat[2] += elapsed
+            stat[3] = max(stat[3], elapsed)
+
+        if self._debug and elapsed > 50.0:
+            print(f"[DataHub] Slow listener for {key}: {name} took {elapsed:.1f} ms")
+
+    @staticmethod
+    def _listener_id(listener: Callable) -> Tuple[int, int]:
+        """Identity of a listener; a bound method is its (instance, function).
+
+        Bound methods are re-created on every attribute access, so their own
+        id() is meaningless. Ids, not the objects, keep weak listeners weak.
+        """
+        func = getattr(listener, "__func__", None)
+        if func is not None:
+            return id(getattr(listener, "__self__", None)), id(func)
+        return 0, id(listener)
+
+    def _worker(self) -> ThreadPoolExecutor:
+        # One thread keeps worker listeners ordered like the publishes
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1,
+                                                thread_name_prefix="DataHub")
+        return self._executor
+
+    # ------------------------------------------------------------------
+    # Listener timing
+    # ------------------------------------------------------------------
+
+    def get_listener_stats(self, key: Optional[str] = None) -> List[ListenerStats]:
+        """
+        Timing of every listener called so far, slowest (total time) first.
+        One row per listener: two lambdas, or the same method of two
+        instances, are reported separately under the same label.
+
+        Args:
+            key: Only report listeners of this key
+
+        Returns:
+            List of ListenerStats(key, listener, calls, total_ms, max_ms)
+        """
+        with self._stats_lock:
+            stats = [
+                ListenerStats(stat_key, name, calls, total, worst)
+                for (stat_key, _identity), (name, calls, total, worst) in self._stats.items()
+                if key is None or stat_key == key
+            ]
+        return sorted(stats, key=lambda stat: stat.total_ms, reverse=True)
+
+    def reset_listener_stats(self):
+        """Forget the accumulated listener timings."""
+        with self._stats_lock:
+            self._stats.clear()
+
     def clear_listeners(self, key: Optional[str] = None):
         """
         Clear listeners for a specific key or all keys.
@@ -259,11 +457,13 @@ class DataHubPub:
         if key is None:
             self._listeners.clear()
             self._listener_refs.clear()
+            self._worker_listeners.clear()
             if self._debug:
                 print("[DataHub] Cleared all listeners")
         else:
             self._listeners.pop(key, None)
             self._listener_refs.pop(key, None)
+            self._worker_listeners.pop(key, None)
             if self._debug:
                 print(f"[DataHub] Cleared listeners for {key}")
 
@@ -274,6 +474,7 @@ class DataHubPub:
     def get_listener_count(self, key: str) -> int:
         """Get number of listeners for a key."""
         count = len(self._listeners.get(key, []))
+        count += len(self._worker_listeners.get(key, []))
         count += len([r for r in self._listener_refs.get(key, []) if r() is not None])
         return count
 
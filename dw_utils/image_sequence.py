@@ -0,0 +1,205 @@
+"""
+image_sequence.py - one-pass image sequence detection with a directory cache.
+
+Every file whose name ends in <digits>.<ext> belongs to the sequence keyed by
+(prefix, extension), where prefix is everything before the trailing frame
+number (separator included: "shot.", "shot_", "shot"). A single os.scandir
+pass groups the whole directory, and the result is kept until the
+directory's mtime changes (any file added, removed or renamed in it), so the
+tools that share this module only pay for one scan per directory.
+
+Usage:
+    from dw_utils import image_sequence
+
+    seq = image_sequence.find_sequence("/renders/shot.1001.exr")
+    if seq:
+        print(seq.first, seq.last, seq.missing, seq.pattern("#"))
+        for path in seq.paths():
+            ...
+
+    for seq in image_sequence.scan_directory("/renders"):
+        print(seq)
+"""
+
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+# Trailing frame number right before the extension; the prefix is lazy so
+# the digit run is always the whole trailing number.
+_FRAME_RE = re.compile(r'^(.*?)(\d+)\.(\w+)$')
+
+# Directory mtimes this close to the scan time may still change within the
+# same timestamp tick (coarse network filesystems): such scans are not
+# trusted on the next lookup.
+_RACY_WINDOW = 2.0
+
+_MAX_DIRS = 64
+
+
+@dataclass(frozen=True)
+class Sequence:
+    """One image sequence in a directory.
+
+    Attributes:
+        directory: Folder holding the files.
+        prefix: File name up to the frame number, separator included.
+        extension: Extension without the dot.
+        padding: Width of the shortest frame number on disk.
+        frames: Frame numbers present, sorted.
+        names: File names, aligned with frames.
+    """
+    directory: str
+    prefix: str
+    extension: str
+    padding: int
+    frames: Tuple[int, ...]
+    names: Tuple[str, ...]
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def __str__(self) -> str:
+        return f"{self.pattern('#')} [{self.first}-{self.last}] ({len(self)} frames)"
+
+    @property
+    def first(self) -> int:
+        return self.frames[0]
+
+    @property
+    def last(self) -> int:
+        return self.frames[-1]
+
+    @property
+    def missing(self) -> List[int]:
+        """Frames absent between first and last."""
+        present = set(self.frames)
+        return [f for f in range(self.first, self.last + 1) if f not in present]
+
+    def paths(self) -> List[str]:
+        """Full paths of every frame, in frame order."""
+        return [os.path.join(self.directory, name) for name in self.names]
+
+    def path(self, frame: int) -> Optional[str]:
+        """Full path of one frame on disk, None when missing."""
+        try:
+            index = self.frames.index(frame)
+        except ValueError:
+            return None
+        return os.path.join(self.directory, self.names[index])
+
+    def pattern(self, token: str = "#") -> str:
+        """Full path with the frame number replaced by token * padding."""
+        name = f"{self.prefix}{token * self.padding}.{self.extension}"
+        return os.path.join(self.directory, name)
+
+
+# directory -> (mtime_ns, scanned_at, {(prefix, extension): Sequence})
+_DIRS: "OrderedDict[str, Tuple[int, float, Dict[Tuple[str, str], Sequence]]]" = OrderedDict()
+_LOCK = threading.Lock()
+
+
+def _scan(directory: str) -> Dict[Tuple[str, str], Sequence]:
+    """Group every numbered file of directory in one scandir pass."""
+    groups: Dict[Tuple[str, str], Dict[int, str]] = {}
+    widths: Dict[Tuple[str, str], int] = {}
+    with os.scandir(directory) as it:
+        for entry in it:
+            match = _FRAME_RE.match(entry.name)
+            if match is None or not entry.is_file():
+                continue
+            prefix, digits, extension = match.groups()
+            key = (prefix, extension)
+            frames = groups.setdefault(key, {})
+            frame = int(digits)
+            # Same frame with two paddings: keep the longer, canonical name
+            if frame not in frames or len(entry.name) > len(frames[frame]):
+                frames[frame] = entry.name
+            widths[key] = min(widths.get(key, len(digits)), len(digits))
+
+    sequences = {}
+    for key, frames in groups.items():
+        ordered = sorted(frames)
+        sequences[key] = Sequence(
+            directory=directory,
+            prefix=key[0],
+            extension=key[1],
+            padding=widths[key],
+            frames=tuple(ordered),
+            names=tuple(frames[f] for f in ordered),
+        )
+    return sequences
+
+
+def _sequences(directory: str) -> Dict[Tuple[str, str], Sequence]:
+    """Cached sequences of directory, rescanned when its mtime changed."""
+    directory = os.path.abspath(directory)
+    try:
+        mtime_ns = os.stat(directory).st_mtime_ns
+    except OSError:
+        forget(directory)
+        return {}
+
+    with _LOCK:
+        cached = _DIRS.get(directory)
+        if (cached is not None and cached[0] == mtime_ns
+                and cached[1] - mtime_ns / 1e9 >= _RACY_WINDOW):
+            _DIRS.move_to_end(directory)
+            return cached[2]
+
+    scanned_at = time.time()
+    try:
+        sequences = _scan(directory)
+    except OSError:
+        return {}
+
+    with _LOCK:
+        _DIRS[directory] = (mtime_ns, scanned_at, sequences)
+        _DIRS.move_to_end(directory)
+        while len(_DIRS) > _MAX_DIRS:
+            _DIRS.popitem(last=False)
+    return sequences
+
+
+def scan_directory(directory: str) -> List[Sequence]:
+    """Every sequence in directory, sorted by prefix then extension.
+
+    Args:
+        directory: Folder to scan (unreadable or missing: empty list).
+
+    Returns:
+        List of Sequence, single numbered files included.
+    """
+    sequences = _sequences(directory)
+    return [sequences[key] for key in sorted(sequences)]
+
+
+def find_sequence(filepath: str) -> Optional[Sequence]:
+    """The sequence filepath belongs to.
+
+    Args:
+        filepath: Any frame of the sequence (it does not need to exist).
+
+    Returns:
+        The Sequence, or None when the name has no frame number or no
+        matching file is on disk.
+    """
+    match = _FRAME_RE.match(os.path.basename(filepath))
+    if match is None:
+        return None
+    prefix, _digits, extension = match.groups()
+    directory = os.path.dirname(filepath) or "."
+    return _sequences(directory).get((prefix, extension))
+
+
+def forget(directory: Optional[str] = None):
+    """Drop the cached scan of one directory, or of every directory."""
+    with _LOCK:
+        if directory is None:
+            _DIRS.clear()
+        else:
+            _DIRS.pop(os.path.abspath(directory), None)
@@ -0,0 +1,6 @@
+"""
+dw_utils test suite — standalone tests, no Maya needed.
+
+Run from the repository root:
+    python -m unittest discover -s dw_utils/tests -t .
+"""
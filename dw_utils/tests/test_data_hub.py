@@ -0,0 +1,211 @@
+"""Tests for the publish/subscribe hub (dw_utils.data_hub).
+
+Runs without Qt: coalesced flushes are scheduled on a recording stand-in for
+QTimer.singleShot and fired by hand.
+
+Classes:
+    TestCoalescing:    burst folding, flush, and immediate delivery without
+                       an event loop.
+    TestThreaded:      worker-thread listeners.
+    TestListenerStats: per-listener timings.
+
+Example:
+    python -m unittest dw_utils.tests.test_data_hub
+
+Author: DrWeeny
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from dw_utils import data_hub
+from dw_utils.data_hub import DataHubPub
+
+
+class _HubCase(unittest.TestCase):
+
+    def setUp(self):
+        DataHubPub.Reset()
+        self.hub = DataHubPub.Get()
+        self.calls = []
+
+    def tearDown(self):
+        DataHubPub.Reset()
+
+    def record(self, old_value, new_value):
+        self.calls.append((old_value, new_value))
+
+
+class TestCoalescing(_HubCase):
+
+    def setUp(self):
+        super().setUp()
+        self.timers = []
+        timer = SimpleNamespace(singleShot=lambda ms, fn: self.timers.append((ms, fn)))
+        patches = [
+            mock.patch.object(data_hub, "QtCore", SimpleNamespace(QTimer=timer)),
+            mock.patch.object(DataHubPub, "_has_event_loop", staticmethod(lambda: True)),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def test_burst_is_folded(self):
+        self.hub.set_coalescing("sel", 30)
+        self.hub.subscribe("sel", self.record)
+        for value in ("a", "b", "c"):
+            self.hub.publish("sel", value, overwrite=True)
+
+        self.assertEqual(self.calls, [])
+        self.assertEqual(self.hub.retrieve("sel"), "c")
+        self.assertEqual([ms for ms, _fn in self.timers], [30])
+
+        self.timers[0][1]()
+        self.assertEqual(self.calls, [(None, "c")])
+
+    def test_explicit_flush_then_timer(self):
+        self.hub.set_coalescing("sel", 0)
+        self.hub.subscribe("sel", self.record)
+        self.hub.publish("sel", 1)
+        self.hub.publish("sel", 2, overwrite=True)
+
+        self.hub.flush()
+        self.assertEqual(self.calls, [(None, 2)])
+        self.timers[0][1]()  # nothing left pending
+        self.assertEqual(self.calls, [(None, 2)])
+
+        # Next burst starts from the delivered value
+        self.hub.publish("sel", 3, overwrite=True)
+        self.hub.flush("sel")
+        self.assertEqual(self.calls, [(None, 2), (2, 3)])
+
+    def test_disabling_flushes_pending(self):
+        self.hub.set_coalescing("sel", 50)
+        self.hub.subscribe("sel", self.record)
+        self.hub.publish("sel", 1)
+        self.hub.set_coalescing("sel", None)
+        self.assertEqual(self.calls, [(None, 1)])
+
+        self.hub.publish("sel", 2, overwrite=True)
+        self.assertEqual(self.calls, [(None, 1), (1, 2)])
+        self.assertEqual(len(self.timers), 1)
+
+    def test_uncoalesced_keys_are_immediate(self):
+        self.hub.set_coalescing("sel", 30)
+        self.hub.subscribe("other", self.record)
+        self.hub.publish("other", 1)
+        self.assertEqual(self.calls, [(None, 1)])
+        self.assertEqual(self.timers, [])
+
+    def test_no_event_loop_delivers_immediately(self):
+        with mock.patch.object(DataHubPub, "_has_event_loop", staticmethod(lambda: False)):
+            self.hub.set_coalescing("sel", 30)
+            self.hub.subscribe("sel", self.record)
+            self.hub.publish("sel", 1)
+            self.hub.publish("sel", 2, overwrite=True)
+        self.assertEqual(self.calls, [(None, 1), (1, 2)])
+        self.assertEqual(self.timers, [])
+
+
+class TestThreaded(_HubCase):
+
+    def test_called_in_order_on_worker(self):
+        done = threading.Event()
+        threads = []
+
+        def listener(old_value, new_value):
+            threads.append(threading.current_thread())
+            self.record(old_value, new_value)
+            if new_value == 3:
+                done.set()
+
+        self.hub.subscribe("log", listener, threaded=True)
+        for value in (1, 2, 3):
+            self.hub.publish("log", value, overwrite=True)
+
+        self.assertTrue(done.wait(5))
+        self.assertEqual(self.calls, [(None, 1), (1, 2), (2, 3)])
+        self.assertNotIn(threading.current_thread(), threads)
+        self.assertEqual(len(set(threads)), 1)
+
+    def test_threaded_listener_cannot_be_weak(self):
+        with self.assertRaises(ValueError):
+            self.hub.subscribe("log", self.record, weak=True, threaded=True)
+
+    def test_unsubscribe_and_count(self):
+        self.hub.subscribe("log", self.record, threaded=True)
+        self.assertEqual(self.hub.get_listener_count("log"), 1)
+        self.hub.unsubscribe("log", self.record)
+        self.assertEqual(self.hub.get_listener_count("log"), 0)
+
+
+class _Panel:
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+
+    def on_change(self, old_value, new_value):
+        time.sleep(self.delay)
+
+
+class TestListenerStats(_HubCase):
+
+    def test_distinct_lambdas_get_their_own_row(self):
+        self.hub.subscribe("k", lambda old, new: None)
+        self.hub.subscribe("k", lambda old, new: None)
+        self.hub.publish("k", 1)
+        self.hub.publish("k", 2, overwrite=True)
+
+        stats = self.hub.get_listener_stats("k")
+        self.assertEqual(len(stats), 2)
+        self.assertEqual([stat.calls for stat in stats], [2, 2])
+        self.assertTrue(all(stat.listener.endswith("<lambda>") for stat in stats))
+
+    def test_bound_methods_split_by_instance(self):
+        slow, fast = _Panel(delay=0.02), _Panel()
+        self.hub.subscribe("k", fast.on_change)
+        self.hub.subscribe("k", slow.on_change)
+        self.hub.publish("k", 1)
+
+        stats = self.hub.get_listener_stats()
+        self.assertEqual(len(stats), 2)
+        self.assertEqual({stat.listener for stat in stats}, {"_Panel.on_change"})
+        # Slowest first
+        self.assertGreaterEqual(stats[0].total_ms, 20.0)
+        self.assertLess(stats[1].total_ms, stats[0].total_ms)
+
+    def test_same_listener_accumulates(self):
+        self.hub.subscribe("a", self.record)
+        self.hub.subscribe("b", self.record)
+        for value in (1, 2, 3):
+            self.hub.publish("a", value, overwrite=True)
+        self.hub.publish("b", 1)
+
+        by_key = {stat.key: stat for stat in self.hub.get_listener_stats()}
+        self.assertEqual(by_key["a"].calls, 3)
+        self.assertEqual(by_key["b"].calls, 1)
+        self.assertGreaterEqual(by_key["a"].total_ms, by_key["a"].max_ms)
+        self.assertEqual([stat.key for stat in self.hub.get_listener_stats("b")], ["b"])
+
+        self.hub.reset_listener_stats()
+        self.assertEqual(self.hub.get_listener_stats(), [])
+
+    def test_failing_listener_is_timed_and_others_still_run(self):
+        def broken(old_value, new_value):
+            raise RuntimeError("boom")
+
+        self.hub.subscribe("k", broken)
+        self.hub.subscribe("k", self.record)
+        self.hub.publish("k", 1)
+
+        self.assertEqual(self.calls, [(None, 1)])
+        self.assertEqual(len(self.hub.get_listener_stats("k")), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
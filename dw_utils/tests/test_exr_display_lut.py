@@ -0,0 +1,89 @@
+"""Tests for the EXR player display transform (claude_exr_player.DisplayLUT).
+
+Headless: only the numpy side of the player is exercised, no window or
+QApplication is created (PySide6 must still be importable).
+
+Classes:
+    TestDisplayLUT: LUT output against apply_tone_mapping, in and out of the
+                    half-float range.
+
+Example:
+    python -m unittest dw_utils.tests.test_exr_display_lut
+
+Author: DrWeeny
+"""
+
+from __future__ import annotations
+
+import unittest
+
+import numpy as np
+
+try:
+    from dw_utils import claude_exr_player as player
+except ImportError:  # PySide6 / player dependencies missing
+    player = None
+
+
+_METHODS = ("reinhard", "filmic", "linear")
+
+
+def _reference(img, exposure, gamma, method):
+    """The display path the LUT replaces."""
+    display = player.apply_tone_mapping(img, exposure, gamma, method)
+    return (display * 255).astype(np.uint8)
+
+
+@unittest.skipIf(player is None, "claude_exr_player needs PySide6")
+class TestDisplayLUT(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        # Spread over the display-relevant range, negatives and zero included
+        img = rng.uniform(-0.5, 8.0, size=(37, 23, 4)).astype(np.float32)
+        img[0, :4, :3] = [[0.0] * 3, [1.0] * 3, [100.0] * 3, [60000.0] * 3]
+        self.img16 = img.astype(np.float16)
+        self.lut = player.DisplayLUT()
+
+    def test_matches_apply_tone_mapping(self):
+        for method in _METHODS:
+            for exposure, gamma in ((0.0, 2.2), (-2.5, 1.8), (3.0, 2.4)):
+                self.lut.update(exposure, gamma, method)
+                for img in (self.img16, self.img16[:, :, :3], self.img16[:, :, 0]):
+                    expected = _reference(img.astype(np.float32), exposure, gamma, method)
+                    np.testing.assert_array_equal(
+                        self.lut.apply(img), expected,
+                        err_msg=f"{method} exposure={exposure} gamma={gamma} shape={img.shape}")
+
+    def test_float32_input_is_cast_band_by_band(self):
+        self.lut.update(0.0, 2.2, "reinhard")
+        img32 = self.img16.astype(np.float32)
+        np.testing.assert_array_equal(self.lut.apply(img32), self.lut.apply(self.img16))
+
+    def test_out_of_half_range_stays_white(self):
+        # Sun / speculars in float32 EXRs: far above 65504, the half maximum
+        hot = np.full((4, 4, 3), 1.0e6, dtype=np.float32)
+        hot[1] = np.inf
+        for method in _METHODS:
+            self.lut.update(0.0, 2.2, method)
+            expected = _reference(np.full((4, 4, 3), 1.0e6, dtype=np.float32), 0.0, 2.2, method)
+            self.assertTrue((expected >= 254).all(), method)
+            # As cached by the player, then straight float32 / inf input
+            cached = np.clip(hot, -player.HALF_MAX, player.HALF_MAX).astype(np.float16)
+            for img in (cached, hot):
+                shown = self.lut.apply(img)
+                self.assertTrue((np.abs(shown.astype(int) - expected) <= 1).all(),
+                                f"{method}: {np.unique(shown)}")
+
+    def test_out_buffer_is_reused(self):
+        self.lut.update(0.0, 2.2, "reinhard")
+        out = self.lut.apply(self.img16)
+        self.assertIs(self.lut.apply(self.img16, out=out), out)
+
+    def test_apply_before_update_raises(self):
+        with self.assertRaises(RuntimeError):
+            player.DisplayLUT().apply(self.img16)
+
+
+if __name__ == "__main__":
+    unittest.main()
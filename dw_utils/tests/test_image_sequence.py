@@ -0,0 +1,176 @@
+"""Tests for image sequence detection (dw_utils.image_sequence).
+
+Placeholder frames are written to a temporary folder; no image library needed.
+
+Classes:
+    TestGrouping: prefixes, extensions, padding and missing frames.
+    TestLookup:   find_sequence on frames that exist or not.
+    TestCache:    directory cache reuse and invalidation.
+
+Example:
+    python -m unittest dw_utils.tests.test_image_sequence
+
+Author: DrWeeny
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from dw_utils import image_sequence
+
+
+class _TmpDirCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp(prefix="dw_image_sequence_")
+        image_sequence.forget()
+
+    def tearDown(self):
+        image_sequence.forget()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def touch(self, *names):
+        for name in names:
+            with open(os.path.join(self.tmp, name), "wb"):
+                pass
+
+    def age_directory(self, seconds=60.0):
+        """Move the folder mtime out of the racy window so scans are cached."""
+        stamp = time.time() - seconds
+        os.utime(self.tmp, (stamp, stamp))
+
+    def sequences(self):
+        return {(seq.prefix, seq.extension): seq
+                for seq in image_sequence.scan_directory(self.tmp)}
+
+
+class TestGrouping(_TmpDirCase):
+
+    def test_prefixes_and_extensions_are_separate(self):
+        self.touch("shot.0001.exr", "shot.0002.exr", "shot.0001.png",
+                   "shot_v2.0001.exr", "notes.txt", "shot.exr")
+        self.assertEqual(sorted(self.sequences()),
+                         [("shot.", "exr"), ("shot.", "png"), ("shot_v2.", "exr")])
+
+    def test_mixed_padding(self):
+        self.touch("shot.0998.exr", "shot.0999.exr", "shot.1000.exr", "shot.10000.exr")
+        seq = self.sequences()[("shot.", "exr")]
+        self.assertEqual(seq.frames, (998, 999, 1000, 10000))
+        self.assertEqual(seq.padding, 4)
+        self.assertEqual(seq.names[-1], "shot.10000.exr")
+
+    def test_same_frame_twice_keeps_the_padded_name(self):
+        self.touch("shot.1.exr", "shot.0001.exr", "shot.0002.exr")
+        seq = self.sequences()[("shot.", "exr")]
+        self.assertEqual(seq.frames, (1, 2))
+        self.assertEqual(seq.names, ("shot.0001.exr", "shot.0002.exr"))
+        self.assertEqual(seq.padding, 1)  # shortest frame number on disk
+
+    def test_unpadded(self):
+        self.touch("img1.png", "img2.png", "img10.png", "img12.png")
+        seq = self.sequences()[("img", "png")]
+        self.assertEqual(seq.frames, (1, 2, 10, 12))
+        self.assertEqual(seq.padding, 1)
+        self.assertEqual(seq.pattern("#"), os.path.join(self.tmp, "img#.png"))
+        self.assertEqual(seq.path(10), os.path.join(self.tmp, "img10.png"))
+
+    def test_missing(self):
+        self.touch("shot.0001.exr", "shot.0002.exr", "shot.0005.exr", "shot.0007.exr")
+        seq = self.sequences()[("shot.", "exr")]
+        self.assertEqual(seq.missing, [3, 4, 6])
+        self.assertEqual((seq.first, seq.last, len(seq)), (1, 7, 4))
+        self.assertIsNone(seq.path(3))
+
+    def test_pattern(self):
+        self.touch("shot_v2.0001.exr", "shot_v2.0002.exr")
+        seq = self.sequences()[("shot_v2.", "exr")]
+        self.assertEqual(seq.pattern("@"), os.path.join(self.tmp, "shot_v2.@@@@.exr"))
+        self.assertEqual(seq.pattern(), os.path.join(self.tmp, "shot_v2.####.exr"))
+
+    def test_paths_in_frame_order(self):
+        self.touch("a.0010.exr", "a.0002.exr", "a.0100.exr")
+        seq = self.sequences()[("a.", "exr")]
+        self.assertEqual([os.path.basename(p) for p in seq.paths()],
+                         ["a.0002.exr", "a.0010.exr", "a.0100.exr"])
+
+    def test_sub_folders_are_ignored(self):
+        os.mkdir(os.path.join(self.tmp, "cache.0001.exr"))
+        self.touch("cache.0002.exr")
+        self.assertEqual(self.sequences()[("cache.", "exr")].frames, (2,))
+
+
+class TestLookup(_TmpDirCase):
+
+    def setUp(self):
+        super().setUp()
+        self.touch("shot.1001.exr", "shot.1002.exr", "shot.1004.exr")
+
+    def test_existing_frame(self):
+        seq = image_sequence.find_sequence(os.path.join(self.tmp, "shot.1002.exr"))
+        self.assertEqual(seq.frames, (1001, 1002, 1004))
+
+    def test_frame_not_on_disk_finds_its_sequence(self):
+        seq = image_sequence.find_sequence(os.path.join(self.tmp, "shot.1003.exr"))
+        self.assertIsNotNone(seq)
+        self.assertEqual(seq.missing, [1003])
+
+    def test_unknown_files(self):
+        for name in ("other.1001.exr", "shot.1001.png", "shot.exr"):
+            self.assertIsNone(image_sequence.find_sequence(os.path.join(self.tmp, name)), name)
+
+    def test_missing_directory(self):
+        missing = os.path.join(self.tmp, "nope")
+        self.assertIsNone(image_sequence.find_sequence(os.path.join(missing, "shot.1001.exr")))
+        self.assertEqual(image_sequence.scan_directory(missing), [])
+
+
+class TestCache(_TmpDirCase):
+
+    def setUp(self):
+        super().setUp()
+        self.touch("shot.0001.exr", "shot.0002.exr")
+        self.path = os.path.join(self.tmp, "shot.0001.exr")
+
+    def test_unchanged_directory_is_not_rescanned(self):
+        self.age_directory()
+        first = image_sequence.find_sequence(self.path)
+        self.assertIs(image_sequence.find_sequence(self.path), first)
+
+    def test_racy_directory_is_rescanned(self):
+        # Just written: the mtime may not move again for a file added now
+        first = image_sequence.find_sequence(self.path)
+        self.assertIsNot(image_sequence.find_sequence(self.path), first)
+
+    def test_added_file_changes_mtime(self):
+        self.age_directory()
+        self.assertEqual(image_sequence.find_sequence(self.path).frames, (1, 2))
+        self.touch("shot.0003.exr")
+        self.assertEqual(image_sequence.find_sequence(self.path).frames, (1, 2, 3))
+
+    def test_forget(self):
+        self.age_directory()
+        stamp = os.stat(self.tmp).st_mtime_ns
+        self.assertEqual(image_sequence.find_sequence(self.path).frames, (1, 2))
+
+        # Coarse timestamps: a file added within the same tick
+        self.touch("shot.0003.exr")
+        os.utime(self.tmp, ns=(stamp, stamp))
+        self.assertEqual(image_sequence.find_sequence(self.path).frames, (1, 2))
+
+        image_sequence.forget(self.tmp)
+        self.assertEqual(image_sequence.find_sequence(self.path).frames, (1, 2, 3))
+
+    def test_forget_everything(self):
+        self.age_directory()
+        first = image_sequence.find_sequence(self.path)
+        image_sequence.forget()
+        self.assertIsNot(image_sequence.find_sequence(self.path), first)
+
+
+if __name__ == "__main__":
+    unittest.main()
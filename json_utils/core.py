@@ -44,17 +44,38 @@ Usage Examples:
 6. Remove a key safely (recommended to use locked version):
     remove_entry_locked("data.json", "obsolete_key")
 
+7. Coalesce many updates into one locked write per file:
+    with db.transaction():
+        for key, value in prefs.items():
+            db.update_entry("settings", key, value)
+        db.save("window", {"width": 800})
+
 Note:
 - All writes are atomic and protected with lock files.
-- Locks have a timeout and polling mechanism to avoid deadlocks.
+- Locks are advisory (fcntl.flock, msvcrt on Windows) with a timeout. The OS
+  drops them when the holder dies, so a crash never leaves a stale lock; the
+  empty ``.lock`` file itself stays next to the JSON.
+- Parsed documents are cached process-wide, keyed by (path, mtime, size): an
+  unchanged file is never re-read or re-parsed. load_json returns a copy;
+  pass ``copy=False`` to read_json_cached for a shared, read-only document.
 - Encoding is UTF-8 by default but can be configured per JSONDatabase.
 
 """
 
 import json
 import os, os.path
+import threading
 import time
 import tempfile
+from collections import OrderedDict
+from contextlib import contextmanager
+
+try:
+    import fcntl
+    msvcrt = None
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
 
 from dw_logger import get_logger
 logger = get_logger()
@@ -81,18 +102,118 @@ def update_json_modification_timestamp(json_path:str):
         logger.error(f"[touch_json] Could not update timestamp for {json_path}: {e}")
         return False
 
+# Process-wide parsed-document cache: abspath -> (mtime_ns, size, data).
+_DOC_CACHE_MAX = 128
+_DOC_CACHE = OrderedDict()
+_DOC_CACHE_LOCK = threading.Lock()
+
+
+def _json_key(key):
+    """Dict key as json.dump writes it (so cached writes match a re-parse)."""
+    if isinstance(key, str):
+        return key
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, float):
+        return float.__repr__(key)
+    return str(key)
+
+
+def _detached(data):
+    """Copy of the JSON containers of ``data``; immutable leaves are shared."""
+    if isinstance(data, dict):
+        return {_json_key(k): _detached(v) for k, v in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [_detached(v) for v in data]
+    return data
+
+
+def _parse(raw: bytes, encoding: str, path: str):
+    try:
+        text = raw.decode(encoding)
+    except UnicodeDecodeError:
+        if encoding != "utf-8":
+            raise
+        logger.debug(f"[load_json] {path} is not utf-8, retrying as cp932")
+        text = raw.decode("cp932")
+    return json.loads(text)
+
+
+def _remember_document(path: str, data):
+    """Cache what was just written to ``path`` so the next read skips the parse."""
+    key = os.path.abspath(path)
+    try:
+        st = os.stat(key)
+    except OSError:
+        return
+    with _DOC_CACHE_LOCK:
+        _DOC_CACHE[key] = (st.st_mtime_ns, st.st_size, _detached(data))
+        _DOC_CACHE.move_to_end(key)
+        while len(_DOC_CACHE) > _DOC_CACHE_MAX:
+            _DOC_CACHE.popitem(last=False)
+
+
+def forget_json_cache(path: str = None):
+    """Drop ``path`` (or every document when None) from the process-wide cache."""
+    with _DOC_CACHE_LOCK:
+        if path is None:
+            _DOC_CACHE.clear()
+        else:
+            _DOC_CACHE.pop(os.path.abspath(path), None)
+
+
+def read_json_cached(path: str, encoding="utf-8", copy=True):
+    """
+    Parsed content of ``path``, re-read only when its mtime or size changed.
+
+    The stat comes from the open descriptor, so the cached content always
+    matches the file it was read from even if it is replaced meanwhile.
+
+    Args:
+        path (str): JSON file.
+        encoding (str): Text encoding (utf-8 falls back to cp932).
+        copy (bool): Return a private copy. False returns the shared cached
+            document, which must be treated as read-only.
+
+    Returns:
+        The parsed document.
+
+    Raises:
+        FileNotFoundError: If ``path`` does not exist.
+        ValueError: If the file is not valid JSON.
+    """
+    key = os.path.abspath(path)
+    with open(key, "rb") as f:
+        st = os.fstat(f.fileno())
+        with _DOC_CACHE_LOCK:
+            entry = _DOC_CACHE.get(key)
+            if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+                _DOC_CACHE.move_to_end(key)
+                data = entry[2]
+            else:
+                entry = None
+        if entry is None:
+            data = _parse(f.read(), encoding, key)
+            with _DOC_CACHE_LOCK:
+                _DOC_CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+                while len(_DOC_CACHE) > _DOC_CACHE_MAX:
+                    _DOC_CACHE.popitem(last=False)
+    return _detached(data) if copy else data
+
+
 def load_json(path: str, encoding="utf-8") -> dict:
     try:
-        with open(path, "r", encoding=encoding) as f:
-            return json.load(f)
+        return read_json_cached(path, encoding)
     except FileNotFoundError:
         # A missing file is an expected, callable-checked case (callers guard
         # with `if not data`), so keep it quiet - not an error.
         logger.debug(f"[load_json] File not found: {path}")
         return {}
     except UnicodeDecodeError:
-        if encoding == "utf-8":
-            return load_json(path, encoding="cp932")
         raise
     except Exception as e:
         # Real problems (corrupt / unparseable JSON, permissions) stay loud.
@@ -105,21 +226,27 @@ def save_json(file_path: str, data: dict, indent=4) -> bool:
         os.makedirs(folder, exist_ok=True)
         with open(file_path, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=indent)
+        _remember_document(file_path, data)
         return True
     except Exception as e:
         logger.error(f"[save_json] Failed to save {file_path}: {e}")
         return False
 
-def save_json_atomic(file_path: str, data: dict, indent=2) -> bool:
+def _write_atomic(file_path: str, data, indent=2, encoding="utf-8"):
+    """Write to ``<file>.tmp``, fsync and rename over ``file_path``; raises on failure."""
     folder = os.path.dirname(file_path)
     os.makedirs(folder, exist_ok=True)
     temp_path = file_path + ".tmp"
+    with open(temp_path, "w", encoding=encoding) as f:
+        json.dump(data, f, indent=indent)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, file_path)  # atomic rename
+    _remember_document(file_path, data)
+
+def save_json_atomic(file_path: str, data: dict, indent=2) -> bool:
     try:
-        with open(temp_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=indent)
-            f.flush()
-            os.fsync(f.fileno())
-        os.replace(temp_path, file_path)  # atomic rename
+        _write_atomic(file_path, data, indent)
         return True
     except Exception as e:
         logger.error(f"[save_json_atomic] Failed to save {file_path}: {e}")
@@ -162,8 +289,10 @@ def remove_entry_locked(json_path: str, key: str) -> bool:
 
 def read_entry(path: str, key: str, default=None):
     try:
-        data = load_json(path)
-        return data.get(key, default)
+        data = read_json_cached(path, copy=False)
+        return _detached(data[key]) if key in data else default
+    except FileNotFoundError:
+        return default
     except Exception as e:
         logger.error(f"[read_entry] Failed to read {key} from {path}: {e}")
         return default
@@ -230,38 +359,101 @@ def ensure_json_exists(path: str, default: dict = None) -> bool:
     return True
 
 
-def acquire_lock(lock_path, timeout=30, poll_interval=0.5):
+class FileLock:
     """
-    Attempt to acquire a lock by creating a lock file.
-    Waits and retries if it already exists.
+    Advisory lock on ``lock_path`` (fcntl.flock, msvcrt.locking on Windows).
+
+    Acquisition is immediate when the lock is free; otherwise it retries with
+    a backoff capped at ``poll_interval`` until ``timeout``. The OS releases
+    the lock when its holder exits or crashes, so there is no stale lock to
+    clean up - the lock file is left in place on purpose (unlinking it would
+    let two processes lock two different inodes).
     """
-    start_time = time.time()
-    while True:
+
+    def __init__(self, lock_path, timeout=30, poll_interval=0.1):
+        self.lock_path = lock_path
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self._fd = None
+
+    @property
+    def locked(self):
+        return self._fd is not None
+
+    def _try_lock(self, fd):
         try:
-            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_RDWR)
-            os.close(fd)
-            logger.debug(f"Lock acquired: {lock_path}")
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            return False
+
+    def acquire(self):
+        if self._fd is not None:
+            return self
+        folder = os.path.dirname(self.lock_path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        fd = os.open(self.lock_path, os.O_CREAT | os.O_RDWR, 0o666)
+        start_time = time.time()
+        delay = 0.001
+        while not self._try_lock(fd):
+            if (time.time() - start_time) > self.timeout:
+                os.close(fd)
+                raise TimeoutError(f"Timeout waiting for lock: {self.lock_path}")
+            logger.debug(f"Waiting for lock: {self.lock_path}")
+            time.sleep(delay)
+            delay = min(delay * 2, self.poll_interval)
+        self._fd = fd
+        logger.debug(f"Lock acquired: {self.lock_path}")
+        return self
+
+    def release(self):
+        if self._fd is None:
             return
-        except FileExistsError:
-            if (time.time() - start_time) > timeout:
-                raise TimeoutError(f"Timeout waiting for lock: {lock_path}")
-            logger.error(f"Waiting for lock: {lock_path}")
-            time.sleep(poll_interval)
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+        logger.debug(f"Lock released: {self.lock_path}")
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+
+# Locks taken through the functional acquire_lock / release_lock API.
+_HELD_LOCKS = {}
+
+def acquire_lock(lock_path, timeout=30, poll_interval=0.5):
+    """
+    Acquire the advisory lock on ``lock_path``, waiting up to ``timeout``.
+    Release it with release_lock(lock_path).
+    """
+    lock = FileLock(lock_path, timeout, poll_interval).acquire()
+    _HELD_LOCKS[lock_path] = lock
 
 def release_lock(lock_path):
-    """Release the lock by removing the lock file."""
-    try:
-        os.remove(lock_path)
-        logger.debug(f"Lock released: {lock_path}")
-    except FileNotFoundError:
+    """Release a lock taken with acquire_lock."""
+    lock = _HELD_LOCKS.pop(lock_path, None)
+    if lock is None:
         logger.error(f"Lock already released: {lock_path}")
+        return
+    lock.release()
 
 def modify_json_locked(json_path, modify_fn):
     locked_json = LockedJSON(json_path)
     try:
         locked_json.acquire_lock()
-        if not os.path.exists(json_path):
-            save_json_atomic(json_path, {})
         data = locked_json.load()
         modify_fn(data)
         save_json_atomic(json_path, data)
@@ -274,7 +466,8 @@ class JSONDatabase:
     _files = []
 
     def __init__(self, folder_base_path: str, make_folder=False, extension="json"):
-        self._cache = {}
+        self._pending = OrderedDict()  # name -> edits buffered by transaction()
+        self._batch_depth = 0
         self.encoding = "utf-8"
         self.extension = extension
         if os.path.isdir(folder_base_path):
@@ -328,54 +521,108 @@ class JSONDatabase:
     def exists(self, name):
         return os.path.exists(self._get_path(name))
 
-    def load(self, name, cache=False):
-        if cache and name in self._cache:
-            return self._cache[name]
-
-        path = self._get_path(name)
-        if not os.path.exists(path):
+    def _read(self, name, copy=True):
+        try:
+            return read_json_cached(self._get_path(name), self.encoding, copy=copy)
+        except FileNotFoundError:
             return {}
 
-        with open(path, "r", encoding=self.encoding) as f:
-            data = json.load(f)
-            if cache:
-                self._cache[name] = data
+    def load(self, name, cache=False):
+        """
+        Content of ``name``. With ``cache`` the shared cached document is
+        returned (read-only); otherwise a private copy. Inside a transaction
+        the buffered edits are applied to the result.
+        """
+        edits = self._pending.get(name)
+        if edits:
+            data = self._read(name)
+            for edit in edits:
+                data = edit(data)
             return data
+        return self._read(name, copy=not cache)
 
     def save(self, name, data):
+        if self._batch_depth:
+            snapshot = _detached(data)
+            self._pending[name] = [lambda _old: _detached(snapshot)]
+            return True
         path = self._get_path(name)
-        locked_json = LockedJSON(path)
         try:
-            locked_json.acquire_lock()
-            # Use atomic save inside lock
-            folder = os.path.dirname(path)
-            os.makedirs(folder, exist_ok=True)
-            temp_path = path + ".tmp"
-            with open(temp_path, "w", encoding=self.encoding) as f:
-                json.dump(data, f, indent=2)
-                f.flush()
-                os.fsync(f.fileno())
-            os.replace(temp_path, path)
-            self._cache[name] = data  # Update cache
+            with LockedJSON(path):
+                _write_atomic(path, data, indent=2, encoding=self.encoding)
         except Exception as e:
             logger.error(f"[JSONDatabase.save] Failed to save {path}: {e}")
             return False
-        finally:
-            locked_json.release_lock()
         return True
 
     def update_entry(self, name, key, value):
+        if self._batch_depth:
+            value = _detached(value)
+
+            def _set(data):
+                data[key] = _detached(value)
+                return data
+            self._pending.setdefault(name, []).append(_set)
+            return
+
         def _update(data):
             data[key] = value
         path = self._get_path(name)
         modify_json_locked(path, _update)
-        self._cache.pop(name, None)  # Clear cache after update
 
-    def get_entry(self, name, key, default=None, cache=True):
-        return self.load(name, cache=cache).get(key, default)
+    def get_entry(self, name, key, default=None, cache=False):
+        """
+        Value of ``key`` in ``name``. Only that value is copied out of the
+        cached document; with ``cache`` the shared value is returned (read-only).
+        """
+        data = self.load(name, cache=True)
+        if key not in data:
+            return default
+        return data[key] if cache else _detached(data[key])
+
+    @contextmanager
+    def transaction(self):
+        """
+        Buffer save / update_entry calls and write each touched file once.
+
+        On exit every file is re-read under its lock, the edits are replayed
+        in order (so keys written meanwhile by other processes survive) and
+        the result is written with a single atomic rename. An exception
+        discards the edits. Nested transactions join the outermost one.
+        """
+        outermost = not self._batch_depth
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            if outermost:
+                self._pending.clear()
+            raise
+        finally:
+            self._batch_depth -= 1
+        if outermost:
+            self.commit()
+
+    def commit(self):
+        """Write the edits buffered by transaction(). Returns False if a file failed."""
+        pending, self._pending = self._pending, OrderedDict()
+        success = True
+        for name, edits in pending.items():
+            path = self._get_path(name)
+            try:
+                with LockedJSON(path):
+                    data = self._read(name)
+                    for edit in edits:
+                        data = edit(data)
+                    _write_atomic(path, data, indent=2, encoding=self.encoding)
+            except Exception as e:
+                logger.error(f"[JSONDatabase.commit] Failed to save {path}: {e}")
+                success = False
+        return success
 
     def clear_cache(self):
-        self._cache.clear()
+        for name in self._files:
+            forget_json_cache(self._get_path(name))
 
     def _load_index_file(self):
         index_path = self._get_path("__index__")
@@ -399,7 +646,6 @@ class JSONFileProxy:
     def __init__(self, db: JSONDatabase, filename: str):
         self.db = db
         self.filename = filename
-        self._cache = None
 
     def exists(self):
         return self.db.exists(self.filename)
@@ -408,58 +654,32 @@ class JSONFileProxy:
         return self.db._get_path(self.filename)
 
     def load(self, cache=False):
-        if cache and self._cache is not None:
-            return self._cache
-
-        data = self.db.load(self.filename, cache=cache)
-        if cache:
-            self._cache = data
-        return data
+        return self.db.load(self.filename, cache=cache)
 
     def reload(self):
-        self._cache = None
-        return self.load(cache=True)
+        self.clear_cache()
+        return self.load()
 
     def save(self, data):
-        path = self.fullpath()
-        locked_json = LockedJSON(path)
-        try:
-            locked_json.acquire_lock()
-            folder = os.path.dirname(path)
-            os.makedirs(folder, exist_ok=True)
-            temp_path = path + ".tmp"
-            with open(temp_path, "w", encoding=self.db.encoding) as f:
-                json.dump(data, f, indent=2)
-                f.flush()
-                os.fsync(f.fileno())
-            os.replace(temp_path, path)
-            self._cache = data
-        except Exception as e:
-            logger.error(f"[JSONFileProxy.save] Failed to save {path}: {e}")
-            return False
-        finally:
-            locked_json.release_lock()
-        return True
+        return self.db.save(self.filename, data)
 
     def update_entry(self, key, value):
-        def _update(data):
-            data[key] = value
-        path = self.fullpath()
-        modify_json_locked(path, _update)
-        self._cache = None  # Clear cache after update
+        self.db.update_entry(self.filename, key, value)
+
+    def get_entry(self, key, default=None, cache=False):
+        return self.db.get_entry(self.filename, key, default, cache=cache)
 
-    def get_entry(self, key, default=None):
-        return self.load(cache=True).get(key, default)
+    def transaction(self):
+        return self.db.transaction()
 
     def clear_cache(self):
-        self._cache = None
+        forget_json_cache(self.fullpath())
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
         logger.debug(f"{self.filename} JSON access complete.")
-        self.clear_cache()
 
 class LockedJSON:
     def __init__(self, json_path, lock_timeout=30, poll_interval=0.1):
@@ -467,31 +687,20 @@ class LockedJSON:
         self.lock_path = json_path + ".lock"
         self.lock_timeout = lock_timeout
         self.poll_interval = poll_interval
-        self.lock_acquired = False
+        self._lock = FileLock(self.lock_path, lock_timeout, poll_interval)
+
+    @property
+    def lock_acquired(self):
+        return self._lock.locked
 
     def acquire_lock(self):
-        start_time = time.time()
-        while True:
-            try:
-                fd = os.open(self.lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
-                os.close(fd)
-                self.lock_acquired = True
-                logger.debug(f"Lock acquired: {self.lock_path}")
-                break
-            except FileExistsError:
-                if (time.time() - start_time) > self.lock_timeout:
-                    raise TimeoutError(f"Timeout waiting for lock: {self.lock_path}")
-                logger.debug(f"Waiting for lock: {self.lock_path}")
-                time.sleep(self.poll_interval)
+        self._lock.acquire()
 
     def release_lock(self):
-        if self.lock_acquired:
-            try:
-                os.remove(self.lock_path)
-                logger.debug(f"Lock released: {self.lock_path}")
-                self.lock_acquired = False
-            except Exception as e:
-                logger.warning(f"Failed to release lock: {e}")
+        try:
+            self._lock.release()
+        except Exception as e:
+            logger.warning(f"Failed to release lock: {e}")
 
     def __enter__(self):
         self.acquire_lock()
@@ -502,8 +711,7 @@ class LockedJSON:
 
     def load(self):
         try:
-            with open(self.json_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = read_json_cached(self.json_path)
             logger.debug(f"Loaded JSON from {self.json_path}")
             return data
         except FileNotFoundError:
@@ -520,4 +728,4 @@ class LockedJSON:
         with self:
             data = self.load()
             modify_fn(data)
-            self.save(data)
\ No newline at end of file
+            self.save(data)
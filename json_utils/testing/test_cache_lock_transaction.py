@@ -0,0 +1,108 @@
+"""
+Test the mtime-aware document cache, advisory locking and JSONDatabase transactions.
+"""
+
+import json
+import os
+import sys
+import tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+
+import json_utils.core as core
+from json_utils.core import FileLock, JSONDatabase, load_json, read_json_cached, save_json_atomic
+
+
+def test_document_cache():
+    folder = tempfile.mkdtemp()
+    path = os.path.join(folder, "cached.json")
+    save_json_atomic(path, {"a": 1, "nested": {"b": [1, 2]}, 3: "int key"})
+
+    print("[TEST] Written document is served from the cache, as a re-parse would see it...")
+    shared = read_json_cached(path, copy=False)
+    assert shared == {"a": 1, "nested": {"b": [1, 2]}, "3": "int key"}
+    assert read_json_cached(path, copy=False) is shared
+
+    print("[TEST] load_json returns a private copy...")
+    data = load_json(path)
+    data["nested"]["b"].append(3)
+    assert read_json_cached(path, copy=False)["nested"]["b"] == [1, 2]
+
+    print("[TEST] Changes made behind the cache's back are picked up...")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"a": 2, "extra": True}, f)
+    assert load_json(path) == {"a": 2, "extra": True}
+
+    os.remove(path)
+    assert load_json(path) == {}
+    os.rmdir(folder)
+
+
+def test_file_lock_timeout():
+    folder = tempfile.mkdtemp()
+    lock_path = os.path.join(folder, "data.json.lock")
+
+    print("[TEST] A held lock makes other acquirers time out...")
+    with FileLock(lock_path):
+        other = FileLock(lock_path, timeout=0.05, poll_interval=0.01)
+        try:
+            other.acquire()
+            raise AssertionError("Lock acquired twice")
+        except TimeoutError:
+            print("[PASS] Timed out as expected")
+        assert not other.locked
+
+    print("[TEST] A leftover lock file is not a stale lock...")
+    assert os.path.exists(lock_path)
+    with FileLock(lock_path, timeout=0.05) as lock:
+        assert lock.locked
+
+    os.remove(lock_path)
+    os.rmdir(folder)
+
+
+def test_transaction_coalesces_writes():
+    folder = tempfile.mkdtemp()
+    db = JSONDatabase(folder, make_folder=True)
+    db.save("prefs", {"keep": 1})
+
+    writes = []
+    write_atomic = core._write_atomic
+
+    def _counting(path, *args, **kwargs):
+        writes.append(path)
+        return write_atomic(path, *args, **kwargs)
+
+    core._write_atomic = _counting
+    try:
+        print("[TEST] 100 updates in a transaction write once...")
+        with db.transaction():
+            for i in range(100):
+                db.update_entry("prefs", f"key_{i}", i)
+            assert db.get_entry("prefs", "key_99") == 99  # reads see pending edits
+            assert not writes
+        assert writes == [db._get_path("prefs")]
+
+        loaded = db.load("prefs")
+        assert loaded["keep"] == 1 and loaded["key_42"] == 42 and len(loaded) == 101
+
+        print("[TEST] An exception discards the buffered edits...")
+        try:
+            with db.transaction():
+                db.save("prefs", {})
+                raise RuntimeError("abort")
+        except RuntimeError:
+            pass
+        assert len(writes) == 1
+        assert db.load("prefs")["key_42"] == 42
+    finally:
+        core._write_atomic = write_atomic
+
+    for name in os.listdir(folder):
+        os.remove(os.path.join(folder, name))
+    os.rmdir(folder)
+
+
+if __name__ == "__main__":
+    test_document_cache()
+    test_file_lock_timeout()
+    test_transaction_coalesces_writes()
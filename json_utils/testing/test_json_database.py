@@ -3,6 +3,7 @@ Test JSONDatabase and JSONFileProxy usage.
 """
 
 import os
+import shutil
 import sys
 sys.path.insert(0, "..")
 
@@ -33,8 +34,8 @@ def test_json_database():
     assert updated == 42
 
     # Clean up
-    os.remove(os.path.join(folder, filename + ".json"))
-    os.rmdir(folder)
+    # The FileLock leaves its .lock file next to the JSON on purpose
+    shutil.rmtree(folder)
     print("[TEST] Cleaned up database files")
 
 if __name__ == "__main__":